@@ -1,9 +1,13 @@
 from fastapi import Header, Cookie, HTTPException, status
+from starlette.requests import HTTPConnection
+from starlette.types import Scope
 
+from app.auth.infrastructure.cache.session_cache import session_cache
 from app.auth.infrastructure.repository.mysql_session_repository import MySqlSessionRepository
 from config.database import get_db_session
 
 from app.auth.application.port.session_repository_port import SessionRepositoryPort
+from app.shared.tracing import traced
 
 # Session repository - will be set via dependency injection
 _session_repository: SessionRepositoryPort | None = None
@@ -15,6 +19,7 @@ def set_session_repository(repo: SessionRepositoryPort) -> None:
     _session_repository = repo
 
 
+@traced("auth")
 def get_current_user_id(
     authorization: str | None = Header(default=None),
     session_id_cookie: str | None = Cookie(default=None, alias="session_id"),
@@ -52,6 +57,11 @@ def get_current_user_id(
     repo = _session_repository
     created_db = None
     if repo is None:
+        # 기본 DB 저장소는 캐시를 먼저 확인하여 DB 조회를 생략한다
+        cached_user_id = session_cache.get(session_id)
+        if cached_user_id is not None:
+            return cached_user_id
+
         created_db = get_db_session()
         repo = MySqlSessionRepository(created_db)
 
@@ -67,4 +77,32 @@ def get_current_user_id(
             detail="유효하지 않은 세션입니다",
         )
 
+    if created_db:
+        session_cache.put(session_id, session.user_id, session.expires_at)
+
     return session.user_id
+
+
+def rate_limit_identity(scope: Scope) -> str:
+    """
+    요청 수 제한에 쓸 요청자 식별자를 반환한다 (RateLimitMiddleware용, DB 조회 없음).
+
+    get_current_user_id와 같은 방식(Bearer 헤더 → session_id 쿠키)으로 세션을 찾아
+    세션 캐시에 검증된 사용자가 있으면 user_id, 그 밖에는 클라이언트 IP로 구분한다.
+    검증되지 않은 토큰을 key로 쓰면 요청마다 임의의 토큰을 보내 한도를 우회할 수 있기 때문이다.
+    """
+    connection = HTTPConnection(scope)
+    session_id = None
+    parts = connection.headers.get("authorization", "").split()
+    if len(parts) == 2 and parts[0].lower() == "bearer":
+        session_id = parts[1]
+    if session_id is None:
+        session_id = connection.cookies.get("session_id")
+
+    if session_id:
+        user_id = session_cache.get(session_id)
+        if user_id is not None:
+            return f"user:{user_id}"
+
+    host = connection.client.host if connection.client else "unknown"
+    return f"ip:{host}"
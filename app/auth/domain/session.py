@@ -1,10 +1,14 @@
+from datetime import datetime
+
+
 class Session:
     """세션 정보를 담는 도메인 객체"""
 
-    def __init__(self, session_id: str, user_id: str):
+    def __init__(self, session_id: str, user_id: str, expires_at: datetime | None = None):
         self._validate(session_id, user_id)
         self.session_id = session_id
         self.user_id = user_id
+        self.expires_at = expires_at
 
     def _validate(self, session_id: str, user_id: str) -> None:
         """Session 값의 유효성을 검증한다"""
@@ -0,0 +1,86 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable
+
+
+class SessionCache:
+    """
+    session_id → user_id 인메모리 캐시 (LRU + TTL).
+
+    인증이 필요한 모든 요청이 DB를 조회하지 않도록 프로세스 내에 검증 결과를 보관한다.
+    항목은 TTL과 세션 만료 시각(session_expires_at) 중 빠른 시점에 만료되며,
+    다른 프로세스에서의 로그아웃은 TTL이 지나야 반영되므로 TTL은 짧게 유지한다.
+    """
+
+    DEFAULT_MAX_SIZE = 10_000
+    DEFAULT_TTL_SECONDS = 60
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        ttl_seconds: int | None = None,
+        now: Callable[[], datetime] = datetime.now,
+    ):
+        self._max_size = max_size if max_size is not None else self.DEFAULT_MAX_SIZE
+        self._ttl = timedelta(
+            seconds=ttl_seconds if ttl_seconds is not None else self.DEFAULT_TTL_SECONDS
+        )
+        self._now = now
+        self._entries: OrderedDict[str, tuple[str, datetime]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, session_id: str) -> str | None:
+        """캐시된 user_id를 반환한다 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            user_id, expires_at = entry
+            if expires_at <= self._now():
+                del self._entries[session_id]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return user_id
+
+    def put(self, session_id: str, user_id: str, expires_at: datetime | None = None) -> None:
+        """검증된 세션을 캐시에 저장한다"""
+        cache_expires_at = self._now() + self._ttl
+        if expires_at is not None:
+            cache_expires_at = min(cache_expires_at, expires_at)
+
+        with self._lock:
+            self._entries[session_id] = (user_id, cache_expires_at)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str | None) -> None:
+        """세션을 캐시에서 제거한다 (로그아웃/세션 교체 시)"""
+        if not session_id:
+            return
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        """캐시와 통계를 초기화한다"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """hit/miss 통계를 반환한다"""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# 프로세스 전역 세션 캐시
+session_cache = SessionCache()
@@ -4,7 +4,9 @@ from sqlalchemy.orm import Session as DbSession
 
 from app.auth.application.port.session_repository_port import SessionRepositoryPort
 from app.auth.domain.session import Session
+from app.auth.infrastructure.cache.session_cache import session_cache
 from app.user.infrastructure.model.user_model import UserModel
+from app.shared.tracing import traced
 
 
 class MySqlSessionRepository(SessionRepositoryPort):
@@ -16,6 +18,7 @@ class MySqlSessionRepository(SessionRepositoryPort):
         self._db = db_session
         self._ttl = ttl_seconds if ttl_seconds is not None else self.DEFAULT_TTL_SECONDS
 
+    @traced("db.session.save")
     def save(self, session: Session) -> None:
         """세션을 저장한다"""
         user = self._db.query(UserModel).filter(
@@ -23,10 +26,13 @@ class MySqlSessionRepository(SessionRepositoryPort):
         ).first()
 
         if user:
+            # 이전 세션은 더 이상 유효하지 않으므로 캐시에서 제거
+            session_cache.invalidate(user.session_id)
             user.session_id = session.session_id
             user.session_expires_at = datetime.now() + timedelta(seconds=self._ttl)
             self._db.commit()
 
+    @traced("db.session.find_by_session_id")
     def find_by_session_id(self, session_id: str) -> Session | None:
         """session_id로 세션을 조회한다"""
         user = self._db.query(UserModel).filter(
@@ -44,10 +50,14 @@ class MySqlSessionRepository(SessionRepositoryPort):
         return Session(
             session_id=user.session_id,
             user_id=user.id,
+            expires_at=user.session_expires_at,
         )
 
+    @traced("db.session.delete")
     def delete(self, session_id: str) -> None:
         """세션을 삭제한다"""
+        session_cache.invalidate(session_id)
+
         user = self._db.query(UserModel).filter(
             UserModel.session_id == session_id
         ).first()
@@ -1,29 +1,104 @@
-from fastapi import APIRouter, HTTPException, Depends, status
+import asyncio
+import base64
+import json
+import logging
+import math
+from contextlib import nullcontext
+from datetime import datetime
+from typing import AsyncIterator, Callable, ContextManager
+
+import anyio
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy.orm import Session as DbSession
 
 from app.consult.application.use_case.start_consult_use_case import StartConsultUseCase
 from app.consult.application.use_case.send_message_use_case import SendMessageUseCase
 from app.user.application.port.user_repository_port import UserRepositoryPort
 from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
-from app.consult.application.port.ai_counselor_port import AICounselorPort
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.application.port.analysis_queue_port import (
+    AnalysisPendingElsewhereError,
+    AnalysisQueuePort,
+)
 from app.auth.adapter.input.web.auth_dependency import get_current_user_id
+from app.consult.domain.analysis import Analysis
+from app.consult.domain.consult_session import AnalysisStatus, ConsultSession
 from app.consult.domain.message import Message
+from app.consult.infrastructure.repository.mysql_consult_repository import (
+    MySQLConsultRepository,
+    mysql_consult_repository_scope,
+)
+from app.consult.infrastructure.repository.stream_write_behind import StreamWriteBehindBuffer
+from app.consult.infrastructure.cache.stream_replay_registry import (
+    StreamReplayBuffer,
+    StreamReplayRegistry,
+)
+from app.user.infrastructure.repository.mysql_user_repository import MySQLUserRepository
+from app.shared.llm.errors import LLMUnavailableError
+from app.shared.metrics import get_metrics
+from app.shared.sse import coalesce_chunks, format_sse_event
+from config.settings import get_settings
+from config.database import get_db
+
+logger = logging.getLogger(__name__)
 
 consult_router = APIRouter()
 
 # Global repository instances (will be injected in tests)
 _user_repository: UserRepositoryPort | None = None
 _consult_repository: ConsultRepositoryPort | None = None
-_ai_counselor: AICounselorPort | None = None
+_ai_counselor: AsyncAICounselorPort | None = None
+# 설정되면 마지막 턴의 분석을 백그라운드에서 생성한다 (없으면 응답과 함께 동기 생성)
+_analysis_queue: AnalysisQueuePort | None = None
+
+# 메시지 스트림 재전송 버퍼 (Last-Event-ID 이어 받기, 설정값으로 교체된다)
+_stream_registry: StreamReplayRegistry = StreamReplayRegistry()
+
+# 분석 대기 중일 때 클라이언트에 권장하는 재조회 간격(초)
+ANALYSIS_POLL_INTERVAL_SECONDS = 2
+
+# 클라이언트 연결 종료로 중단된 상담 스트림 수
+METRIC_STREAM_ABORTED = "consult.stream.aborted"
+
+# 히스토리 페이지 크기 (기본/최대)
+HISTORY_DEFAULT_LIMIT = 20
+HISTORY_MAX_LIMIT = 100
 
 
 class SendMessageRequest(BaseModel):
     content: str
 
 
+def get_user_repository(db: DbSession = Depends(get_db)) -> UserRepositoryPort:
+    """요청 단위 User 저장소 (주입된 fake/테스트 우선)"""
+    if _user_repository is not None:
+        return _user_repository
+    return MySQLUserRepository(db)
+
+
+def get_consult_repository(db: DbSession = Depends(get_db)) -> ConsultRepositoryPort:
+    """요청 단위 Consult 저장소 (주입된 fake/테스트 우선)"""
+    if _consult_repository is not None:
+        return _consult_repository
+    return MySQLConsultRepository(db)
+
+
+def get_consult_repository_scope() -> Callable[[], ContextManager[ConsultRepositoryPort]]:
+    """필요할 때만 짧게 여닫는 Consult 저장소 스코프 (주입된 fake/테스트 우선)"""
+    if _consult_repository is not None:
+        return lambda: nullcontext(_consult_repository)
+    return mysql_consult_repository_scope
+
+
 @consult_router.post("/start")
-def start_consult(user_id: str = Depends(get_current_user_id)):
+async def start_consult(
+    user_id: str = Depends(get_current_user_id),
+    user_repository: UserRepositoryPort = Depends(get_user_repository),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
+):
     """
     상담 세션을 시작한다.
 
@@ -33,14 +108,8 @@ def start_consult(user_id: str = Depends(get_current_user_id)):
     4. 세션 ID 반환
     """
     print("hello")
-    # User 조회
-    if not _user_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="User repository가 설정되지 않았습니다",
-        )
-
-    user = _user_repository.find_by_id(user_id)
+    # User 조회 (동기 DB 호출은 이벤트 루프를 막지 않도록 스레드 풀에서 실행)
+    user = await run_in_threadpool(user_repository.find_by_id, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -55,29 +124,24 @@ def start_consult(user_id: str = Depends(get_current_user_id)):
         )
 
     # Use case 실행
-    if not _consult_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Consult repository가 설정되지 않았습니다",
-        )
-
     if not _ai_counselor:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="AI counselor가 설정되지 않았습니다",
         )
 
-    use_case = StartConsultUseCase(_consult_repository, _ai_counselor)
-    result = use_case.execute(user_id=user_id, mbti=user.mbti, gender=user.gender)
+    use_case = StartConsultUseCase(consult_repository, _ai_counselor)
+    result = await use_case.execute(user_id=user_id, mbti=user.mbti, gender=user.gender)
 
     return result
 
 
 @consult_router.post("/{session_id}/message")
-def send_message(
+async def send_message(
     session_id: str,
     request: SendMessageRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
 ):
     """
     메시지를 전송하고 AI 응답을 받는다.
@@ -86,22 +150,16 @@ def send_message(
     2. 메시지 전송
     3. AI 응답 반환
     """
-    if not _consult_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Consult repository가 설정되지 않았습니다",
-        )
-
     if not _ai_counselor:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="AI counselor가 설정되지 않았습니다",
         )
 
-    use_case = SendMessageUseCase(_consult_repository, _ai_counselor)
+    use_case = SendMessageUseCase(consult_repository, _ai_counselor, _analysis_queue)
 
     try:
-        result = use_case.execute(
+        result = await use_case.execute(
             session_id=session_id,
             user_id=user_id,
             content=request.content
@@ -125,63 +183,267 @@ def send_message(
         )
 
 
+def _encode_history_cursor(created_at: datetime, session_id: str) -> str:
+    """히스토리 페이지 커서를 (created_at, id) 키로부터 만든다"""
+    raw = json.dumps([created_at.isoformat(), session_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_history_cursor(cursor: str) -> tuple[datetime, str]:
+    """히스토리 페이지 커서를 (created_at, id) 키로 복원한다"""
+    try:
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), str(session_id)
+    except (ValueError, TypeError):
+        raise ValueError("잘못된 커서입니다")
+
+
 @consult_router.get("/history")
-def get_history(user_id: str = Depends(get_current_user_id)):
+def get_history(
+    cursor: str | None = None,
+    limit: int = Query(default=HISTORY_DEFAULT_LIMIT, ge=1, le=HISTORY_MAX_LIMIT),
+    user_id: str = Depends(get_current_user_id),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
+):
     """
     완료된 상담 세션 히스토리를 조회한다.
 
+    분석 본문은 포함하지 않으며, 세션별로 GET /{session_id}/analysis 로 조회한다.
+
+    Args:
+        cursor: 이전 응답의 next_cursor (없으면 첫 페이지)
+        limit: 페이지 크기
+
     Returns:
-        완료된 상담 세션 목록 (최신순)
+        sessions: 완료된 상담 세션 요약 목록 (최신순)
+        next_cursor: 다음 페이지 커서 (마지막 페이지면 None)
     """
-    if not _consult_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Consult repository가 설정되지 않았습니다",
-        )
+    after = None
+    if cursor:
+        try:
+            after = _decode_history_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
 
-    sessions = _consult_repository.find_completed_by_user_id(user_id)
+    # 다음 페이지 존재 여부를 알기 위해 하나 더 조회한다
+    summaries = consult_repository.find_completed_summaries_by_user_id(
+        user_id, limit=limit + 1, after=after
+    )
+    next_cursor = None
+    if len(summaries) > limit:
+        summaries = summaries[:limit]
+        last = summaries[-1]
+        next_cursor = _encode_history_cursor(last.created_at, last.id)
 
     return {
         "sessions": [
             {
-                "id": session.id,
-                "created_at": session.created_at.isoformat(),
-                "mbti": session.mbti.value,
-                "gender": session.gender.value,
-                "analysis": session.get_analysis(),
+                "id": summary.id,
+                "created_at": summary.created_at.isoformat(),
+                "mbti": summary.mbti.value,
+                "gender": summary.gender.value,
+                "analysis_status": summary.analysis_status,
             }
-            for session in sessions
-        ]
+            for summary in summaries
+        ],
+        "next_cursor": next_cursor,
     }
 
 
-@consult_router.post("/{session_id}/message/stream")
-def send_message_stream(
+@consult_router.get("/{session_id}/analysis")
+def get_analysis(
     session_id: str,
-    request: SendMessageRequest,
-    user_id: str = Depends(get_current_user_id)
+    response: Response,
+    user_id: str = Depends(get_current_user_id),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
 ):
     """
-    메시지를 전송하고 AI 응답을 SSE 스트리밍으로 받는다.
+    상담 분석 결과를 조회한다 (백그라운드 생성 폴링용).
 
-    1. 세션 조회 및 소유자 검증
-    2. 메시지 저장
-    3. AI 응답 스트리밍 반환
+    Returns:
+        status: pending(생성 중) / ready(완료) / failed(실패) / not_requested(상담 미완료)
+        analysis: 완료된 경우 분석 결과
     """
-    if not _consult_repository:
+    session = consult_repository.find_by_id(session_id)
+    if not session:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Consult repository가 설정되지 않았습니다",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="세션을 찾을 수 없습니다",
+        )
+
+    if session.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 세션에 접근할 권한이 없습니다",
         )
 
+    analysis_status = session.get_analysis_status() or "not_requested"
+    if analysis_status == AnalysisStatus.PENDING:
+        response.headers["Retry-After"] = str(ANALYSIS_POLL_INTERVAL_SECONDS)
+
+    return {
+        "session_id": session.id,
+        "status": analysis_status,
+        "analysis": session.get_analysis(),
+    }
+
+
+async def _close_stream(stream: AsyncIterator) -> None:
+    """async generator 기반 스트림이면 닫는다 (업스트림 연결 해제)"""
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """이름 있는 SSE 이벤트 (data는 JSON 한 줄)"""
+    return format_sse_event(json.dumps(data, ensure_ascii=False), event=event)
+
+
+async def _replay_analysis(analysis: dict) -> AsyncIterator[tuple[str, str]]:
+    """저장된 분석 결과를 섹션 스트림으로 변환한다"""
+    for section in Analysis.SECTIONS:
+        if analysis.get(section):
+            yield section, analysis[section]
+
+
+async def _generate_and_save_analysis(
+    session: ConsultSession, consult_repository: ConsultRepositoryPort
+) -> AsyncIterator[tuple[str, str]]:
+    """분석을 섹션 스트림으로 생성하고, 끝나면 세션에 저장한다"""
+    sections: dict[str, str] = {}
+    async for section, content in _ai_counselor.generate_analysis_stream(session):
+        sections[section] = content
+        yield section, content
+
+    session.complete_with_analysis(Analysis.from_dict(sections).to_dict())
+    await run_in_threadpool(consult_repository.save, session)
+
+
+@consult_router.get("/{session_id}/analysis/stream")
+async def stream_analysis(
+    session_id: str,
+    user_id: str = Depends(get_current_user_id),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
+):
+    """
+    상담 분석 결과를 섹션 단위 SSE로 받는다.
+
+    - event: section  data: {"section": "situation", "content": "..."} (완성된 섹션부터 전송)
+    - event: done     data: {"status": "ready"} / event: error (생성 실패)
+    - event: pending  data: {"retry_after": 2} (다른 프로세스에서 생성 중, GET /analysis로 폴링)
+
+    분석이 이미 있으면 저장된 결과를, 백그라운드 생성 중이면 진행 중인 작업을 구독해 전달하고,
+    아직 생성되지 않았다면(동기 모드 또는 실패) 직접 스트리밍으로 생성해 저장한다.
+    """
+    session = await run_in_threadpool(consult_repository.find_by_id, session_id)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="세션을 찾을 수 없습니다",
+        )
+
+    if session.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 세션에 접근할 권한이 없습니다",
+        )
+
+    if not session.is_completed():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="상담이 완료되지 않았습니다",
+        )
+
+    analysis_status = session.get_analysis_status()
+    if analysis_status == AnalysisStatus.FAILED and _analysis_queue is not None:
+        # 실패한 분석은 백그라운드 작업으로 다시 생성한다
+        session.request_analysis()
+        await run_in_threadpool(consult_repository.save, session)
+        _analysis_queue.enqueue(session.id)
+        analysis_status = AnalysisStatus.PENDING
+
+    sections: AsyncIterator[tuple[str, str]] | None
+    if analysis_status == AnalysisStatus.READY:
+        sections = _replay_analysis(session.get_analysis())
+    elif analysis_status == AnalysisStatus.PENDING:
+        sections = _analysis_queue.subscribe(session.id) if _analysis_queue else None
+    else:
+        if not _ai_counselor:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="AI counselor가 설정되지 않았습니다",
+            )
+        sections = _generate_and_save_analysis(session, consult_repository)
+
+    async def event_generator():
+        if sections is None:
+            yield _sse_event("pending", {"retry_after": ANALYSIS_POLL_INTERVAL_SECONDS})
+            return
+
+        try:
+            async for section, content in sections:
+                yield _sse_event("section", {"section": section, "content": content})
+        except AnalysisPendingElsewhereError:
+            yield _sse_event("pending", {"retry_after": ANALYSIS_POLL_INTERVAL_SECONDS})
+            return
+        except Exception:
+            logger.exception("분석 스트리밍 실패 (session=%s)", session_id)
+            yield _sse_event("error", {"detail": "분석 생성에 실패했습니다"})
+            return
+
+        yield _sse_event("done", {"status": AnalysisStatus.READY})
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream"
+    )
+
+
+@consult_router.post("/{session_id}/message/stream")
+async def send_message_stream(
+    session_id: str,
+    request: SendMessageRequest,
+    http_request: Request,
+    last_event_id: str | None = Header(default=None),
+    user_id: str = Depends(get_current_user_id),
+    repository_scope: Callable[[], ContextManager[ConsultRepositoryPort]] = Depends(
+        get_consult_repository_scope
+    ),
+):
+    """
+    메시지를 전송하고 AI 응답을 SSE 스트리밍으로 받는다.
+
+    1. 세션 조회 및 소유자 검증 (짧은 저장소 스코프, 스트리밍 전에 커넥션 반납)
+    2. AI 응답을 백그라운드에서 생성해 재전송 버퍼에 쌓고, 번호 붙은 SSE 이벤트로 전달
+    3. 연결이 끊긴 뒤 유예 시간 안에 다시 붙는 클라이언트가 없으면 업스트림 생성을 중단
+    4. 스트림 종료/중단 시 사용자 메시지와 AI 응답을 한 번에 저장
+
+    Last-Event-ID 헤더와 함께 다시 호출하면 새로 생성하지 않고
+    마지막으로 받은 이벤트 다음부터 이어서 전달한다.
+    ID의 턴에 해당하는 스트림이 없으면(이전 턴의 오래된 ID) 본문을 새 메시지로 처리한다.
+    """
     if not _ai_counselor:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="AI counselor가 설정되지 않았습니다",
         )
 
+    settings = get_settings()
+    if last_event_id is not None:
+        resumable = _find_resumable_stream(session_id, user_id, last_event_id)
+        if resumable is not None:
+            stream, after_id = resumable
+            return StreamingResponse(
+                _stream_events(stream, after_id, http_request, settings.CONSULT_STREAM_RETRY_MS),
+                media_type="text/event-stream"
+            )
+
     # 세션 조회 및 소유자 검증
-    session = _consult_repository.find_by_id(session_id)
+    session = await run_in_threadpool(_find_session, repository_scope, session_id)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -201,24 +463,164 @@ def send_message_stream(
             detail="상담이 완료되었습니다. 추가 메시지를 보낼 수 없습니다.",
         )
 
-    # 사용자 메시지 저장
-    user_message = Message(role="user", content=request.content)
-    session.add_message(user_message)
-    _consult_repository.save(session)
-
-    # SSE 스트리밍 생성
-    def event_generator():
-        full_response = ""
-        for chunk in _ai_counselor.generate_response_stream(session, request.content):
-            full_response += chunk
-            yield f"data: {chunk}\n\n"
+    # 같은 세션의 응답이 아직 생성 중이면 새로 생성하지 않는다 (Last-Event-ID로 이어 받기)
+    # 첫 조각을 기다리는 동안 동시에 들어온 요청도 막도록 await 전에 이번 턴의 스트림을 예약한다
+    try:
+        stream = _stream_registry.reserve(session_id, user_id, session.get_user_turn_count() + 1)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 응답을 생성 중입니다. Last-Event-ID로 이어서 받아주세요.",
+        )
 
-        # AI 응답 저장
-        ai_message = Message(role="assistant", content=full_response)
-        session.add_message(ai_message)
-        _consult_repository.save(session)
+    # 사용자 메시지는 AI 응답과 함께 스트림이 끝난 뒤 저장한다
+    session.add_message(Message(role="user", content=request.content))
+    buffer = StreamWriteBehindBuffer(session, repository_scope, _analysis_queue)
 
+    # 회로 차단/호출 한도 초과는 응답 헤더를 보내기 전에 503으로 알린다
+    upstream = _ai_counselor.generate_response_stream(session, request.content)
+    try:
+        chunks = await _prefetch_first_chunk(upstream)
+    except BaseException:
+        _stream_registry.cancel_reservation(session_id, stream)
+        raise
+
+    async def generate_frames():
+        # 1글자 단위 델타를 시간 창/크기 단위로 묶어 프레임 수를 줄인다
+        frames = coalesce_chunks(
+            buffer.tap(chunks),
+            window_seconds=settings.CONSULT_STREAM_COALESCE_MS / 1000,
+            max_bytes=settings.CONSULT_STREAM_COALESCE_MAX_BYTES,
+        )
+        aborted = False
+        try:
+            async for text in frames:
+                yield text
+        except asyncio.CancelledError:
+            # 구독자가 모두 떠나 생성이 취소된 경우
+            aborted = True
+            raise
+        finally:
+            await frames.aclose()
+            await _close_stream(upstream)
+            if aborted:
+                get_metrics().increment(METRIC_STREAM_ABORTED)
+                logger.info("상담 스트림이 클라이언트 연결 종료로 중단되었습니다: %s", session.id)
+            # 정상 종료/생성 중단/생성 오류 모두 받은 만큼 저장한다 (받은 응답이 없으면 턴을 저장하지 않음)
+            await buffer.flush()
+
+    _stream_registry.run(session_id, stream, generate_frames())
     return StreamingResponse(
-        event_generator(),
+        _stream_events(stream, 0, http_request, settings.CONSULT_STREAM_RETRY_MS),
         media_type="text/event-stream"
     )
+
+
+def _find_session(
+    repository_scope: Callable[[], ContextManager[ConsultRepositoryPort]], session_id: str
+) -> ConsultSession | None:
+    """짧은 저장소 스코프 하나로 세션을 조회한다 (스레드 풀에서 실행)"""
+    with repository_scope() as consult_repository:
+        return consult_repository.find_by_id(session_id)
+
+
+async def _prefetch_first_chunk(upstream: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    업스트림의 첫 조각을 미리 받아 두고, 그 조각부터 이어서 내보내는 스트림을 반환한다.
+
+    첫 조각을 받기까지 호출 한도 대기와 서킷 브레이커 확인이 모두 끝나므로
+    LLMUnavailableError는 여기서 503 + Retry-After로 바꾼다.
+    그 밖의 오류는 스트림 안에서 다시 발생시킨다 (_stream_events가 error 이벤트로 전달).
+    """
+    first: list[str] = []
+    error: Exception | None = None
+    try:
+        first.append(await anext(upstream))
+    except StopAsyncIteration:
+        pass
+    except LLMUnavailableError as e:
+        await _close_stream(upstream)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+        )
+    except Exception as e:
+        error = e
+
+    async def chunks() -> AsyncIterator[str]:
+        for chunk in first:
+            yield chunk
+        if error is not None:
+            raise error
+        async for chunk in upstream:
+            yield chunk
+
+    return chunks()
+
+
+def _find_resumable_stream(
+    session_id: str, user_id: str, last_event_id: str
+) -> tuple[StreamReplayBuffer, int] | None:
+    """
+    Last-Event-ID("턴-번호")로 이어 받을 스트림과 마지막으로 받은 이벤트 번호를 찾는다.
+
+    그 턴의 스트림이 생성 중이거나 보관 중이 아니면 None을 반환한다.
+    """
+    try:
+        turn, after_id = (int(part) for part in last_event_id.split("-"))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 Last-Event-ID입니다",
+        )
+
+    stream = _stream_registry.get(session_id)
+    if stream is None or stream.turn != turn:
+        return None
+
+    if stream.owner_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 세션에 접근할 권한이 없습니다",
+        )
+
+    # 같은 턴이지만 재전송 버퍼에서 이미 밀려난 이벤트는 이어 줄 수 없다
+    if not stream.can_resume_from(after_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="이어서 받을 스트림이 없습니다",
+        )
+    return stream, after_id
+
+
+async def _stream_events(
+    stream: StreamReplayBuffer,
+    after_id: int,
+    http_request: Request,
+    retry_ms: int,
+) -> AsyncIterator[str]:
+    """
+    재전송 버퍼를 구독해 after_id 다음 이벤트부터 SSE 프레임으로 전달한다.
+
+    응답 생성이 실패하면 그때까지 받은 조각을 보낸 뒤 event: error로 알린다.
+    """
+    subscription = _stream_registry.subscribe(stream, after_id)
+    first = True
+    try:
+        async for event_id, text in subscription:
+            if await http_request.is_disconnected():
+                break
+            yield format_sse_event(
+                text,
+                id=f"{stream.turn}-{event_id}",
+                retry=retry_ms if first else None,
+            )
+            first = False
+    except Exception:
+        # 생성 실패 로그는 레지스트리가 남긴다
+        yield _sse_event("error", {"detail": "응답 생성에 실패했습니다"})
+    finally:
+        # 취소된 상태에서도 구독을 끝까지 정리한다 (마지막 구독자면 생성 취소 예약)
+        with anyio.CancelScope(shield=True):
+            await subscription.aclose()
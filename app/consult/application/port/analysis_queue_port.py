@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+
+class AnalysisPendingElsewhereError(Exception):
+    """다른 프로세스가 분석을 생성 중이라 이 구독으로는 결과를 받을 수 없다 (저장된 결과를 폴링해야 한다)"""
+
+
+class AnalysisQueuePort(ABC):
+    """
+    상담 분석 생성 작업 큐 포트 인터페이스.
+
+    마지막 턴의 응답이 분석 생성(LLM 호출)을 기다리지 않도록
+    분석 생성을 백그라운드 작업으로 넘긴다.
+    """
+
+    @abstractmethod
+    def enqueue(self, session_id: str) -> None:
+        """
+        세션의 분석 생성 작업을 등록한다.
+
+        세션은 분석 대기(pending) 상태로 저장된 뒤에 등록되어야 한다.
+
+        Args:
+            session_id: 분석할 상담 세션 id
+        """
+        pass
+
+    def subscribe(self, session_id: str) -> AsyncIterator[tuple[str, str]] | None:
+        """
+        진행 중인 분석 작업의 섹션 스트림을 구독한다.
+
+        기본 구현은 구독을 지원하지 않는다 (None).
+        섹션은 완성되는 순서대로 전달되며, 재시도 시 같은 섹션이 다시 올 수 있다.
+
+        Args:
+            session_id: 상담 세션 id
+
+        Returns:
+            (섹션 이름, 내용) 스트림. 이 프로세스에서 진행 중인 작업이 없으면 None
+
+        Raises:
+            AnalysisPendingElsewhereError: (스트림을 읽는 중) 다른 프로세스가 작업을 맡고 있는 경우
+        """
+        return None
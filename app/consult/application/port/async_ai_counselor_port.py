@@ -0,0 +1,92 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.analysis import Analysis
+
+
+class AsyncAICounselorPort(ABC):
+    """
+    비동기 AI 상담사 포트 인터페이스.
+
+    AICounselorPort의 asyncio 버전으로, LLM 응답을 기다리는 동안
+    워커 스레드를 점유하지 않는다.
+    """
+
+    @abstractmethod
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        """
+        사용자의 MBTI와 성별에 맞는 인사말을 생성한다.
+
+        Args:
+            mbti: 사용자의 MBTI
+            gender: 사용자의 성별
+
+        Returns:
+            AI가 생성한 인사말
+        """
+        pass
+
+    @abstractmethod
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        """
+        사용자 메시지에 대한 AI 응답을 생성한다.
+
+        Args:
+            session: 상담 세션 (MBTI, Gender, 대화 히스토리 포함)
+            user_message: 사용자가 보낸 메시지
+
+        Returns:
+            AI 응답 메시지
+        """
+        pass
+
+    @abstractmethod
+    def generate_response_stream(
+        self, session: ConsultSession, user_message: str
+    ) -> AsyncIterator[str]:
+        """
+        사용자 메시지에 대한 AI 응답을 스트리밍 방식으로 생성한다.
+
+        Args:
+            session: 상담 세션 (MBTI, Gender, 대화 히스토리 포함)
+            user_message: 사용자가 보낸 메시지
+
+        Returns:
+            AI 응답 메시지 스트림 (AsyncIterator)
+        """
+        pass
+
+    @abstractmethod
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        """
+        상담 세션을 기반으로 MBTI 관계 분석을 생성한다.
+
+        Args:
+            session: 상담 세션 (MBTI, Gender, 대화 히스토리 포함)
+
+        Returns:
+            Analysis: 분석 결과
+        """
+        pass
+
+    async def generate_analysis_stream(
+        self, session: ConsultSession
+    ) -> AsyncIterator[tuple[str, str]]:
+        """
+        상담 분석을 섹션 단위로 생성한다 (완성된 섹션부터 바로 반환).
+
+        기본 구현은 generate_analysis 결과를 섹션별로 나눠 반환한다.
+        스트리밍 응답을 지원하는 구현체는 이 메서드를 재정의한다.
+
+        Args:
+            session: 상담 세션 (MBTI, Gender, 대화 히스토리 포함)
+
+        Returns:
+            (섹션 이름, 내용) 스트림 (AsyncIterator)
+        """
+        analysis = await self.generate_analysis(session)
+        for section, content in analysis.to_dict().items():
+            yield section, content
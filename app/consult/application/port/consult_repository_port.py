@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.consult_session_summary import ConsultSessionSummary
 
 
 class ConsultRepositoryPort(ABC):
@@ -17,6 +19,34 @@ class ConsultRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def find_completed_by_user_id(self, user_id: str) -> list[ConsultSession]:
-        """user_id로 완료된 세션 목록을 조회한다"""
+    def find_completed_summaries_by_user_id(
+        self,
+        user_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[ConsultSessionSummary]:
+        """
+        user_id로 완료된 세션 요약을 최신순(created_at, id 내림차순)으로 조회한다.
+
+        after가 주어지면 그 (created_at, id) 키보다 뒤에 오는 세션만 최대 limit개 반환한다.
+        """
+        pass
+
+    @abstractmethod
+    def find_pending_analysis_session_ids(self) -> list[str]:
+        """분석 생성이 대기 중인 세션 id 목록을 조회한다 (재시작 시 재개용)"""
+        pass
+
+    @abstractmethod
+    def claim_pending_analysis(self, session_id: str, claimed_at: datetime, stale_before: datetime) -> bool:
+        """
+        대기 중인 분석 작업을 맡았다고 원자적으로 표시한다 (여러 워커 중 한 곳만 성공).
+
+        다른 워커가 stale_before 이후에 맡은 작업이거나 대기 중이 아니면 False를 반환한다.
+        """
+        pass
+
+    @abstractmethod
+    def release_analysis_claim(self, session_id: str) -> None:
+        """맡았던 분석 작업을 끝내지 못하고 내려놓는다 (다른 워커가 바로 맡을 수 있다)"""
         pass
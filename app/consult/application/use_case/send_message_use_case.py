@@ -1,6 +1,14 @@
+import asyncio
+
+from fastapi.concurrency import run_in_threadpool
+
 from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
-from app.consult.application.port.ai_counselor_port import AICounselorPort
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.application.port.analysis_queue_port import AnalysisQueuePort
+from app.consult.domain.analysis import Analysis
+from app.consult.domain.consult_session import AnalysisStatus, ConsultSession
 from app.consult.domain.message import Message
+from app.shared.tracing import traced
 
 
 class SendMessageUseCase:
@@ -9,12 +17,15 @@ class SendMessageUseCase:
     def __init__(
         self,
         repository: ConsultRepositoryPort,
-        ai_counselor: AICounselorPort
+        ai_counselor: AsyncAICounselorPort,
+        analysis_queue: AnalysisQueuePort | None = None,
     ):
         self._repository = repository
         self._ai_counselor = ai_counselor
+        self._analysis_queue = analysis_queue
 
-    def execute(self, session_id: str, user_id: str, content: str) -> dict:
+    @traced("consult.send_message")
+    async def execute(self, session_id: str, user_id: str, content: str) -> dict:
         """
         메시지를 전송하고 AI 응답을 받는다.
 
@@ -26,8 +37,8 @@ class SendMessageUseCase:
         6. AI 응답 저장
         7. 응답 반환
         """
-        # 1. 세션 조회
-        session = self._repository.find_by_id(session_id)
+        # 1. 세션 조회 (동기 저장소 호출은 이벤트 루프를 막지 않도록 스레드에서 실행)
+        session = await run_in_threadpool(self._repository.find_by_id, session_id)
         if not session:
             raise ValueError("세션을 찾을 수 없습니다")
 
@@ -43,18 +54,35 @@ class SendMessageUseCase:
         user_message = Message(role="user", content=content)
         session.add_message(user_message)
 
+        # 마지막 턴 여부 (사용자 메시지 기준)
+        is_completed = session.is_completed()
+        background_analysis = is_completed and self._analysis_queue is not None
+        speculative_analysis = is_completed and self._analysis_queue is None
+
         # 5. AI 응답 생성
-        ai_response = self._ai_counselor.generate_response(session, content)
+        #    동기 분석 모드의 마지막 턴은 응답과 분석을 동시에 생성한다.
+        #    분석은 사용자의 마지막 메시지까지의 히스토리로 만들며, 마무리 응답은 이후 세션에 더해진다.
+        analysis_dict = None
+        if speculative_analysis:
+            ai_response, analysis = await self._generate_response_with_analysis(session, content)
+            analysis_dict = analysis.to_dict()
+        else:
+            ai_response = await self._ai_counselor.generate_response(session, content)
 
         # 6. AI 응답 저장
         assistant_message = Message(role="assistant", content=ai_response)
         session.add_message(assistant_message)
 
+        # 마지막 턴은 분석 결과(동기) 또는 분석 대기 상태(백그라운드)와 함께 저장한다
+        if analysis_dict is not None:
+            session.complete_with_analysis(analysis_dict)
+        elif background_analysis:
+            session.request_analysis()
+
         # 7. 세션 저장 (업데이트)
-        self._repository.save(session)
+        await run_in_threadpool(self._repository.save, session)
 
-        # 8. 남은 턴 수 및 완료 여부 계산
-        is_completed = session.is_completed()
+        # 8. 남은 턴 수 계산
         remaining_turns = max(0, 5 - session.get_user_turn_count())
 
         result = {
@@ -63,14 +91,36 @@ class SendMessageUseCase:
             "is_completed": is_completed,
         }
 
-        # 9. 5턴 완료 시 분석 자동 생성 및 저장
-        if is_completed:
-            analysis = self._ai_counselor.generate_analysis(session)
-            analysis_dict = analysis.to_dict()
+        # 9. 5턴 완료 시 분석 결과 반환
+        #    - 분석 큐가 있으면 백그라운드에 넘기고 바로 반환한다 (GET /{session_id}/analysis로 조회)
+        #    - 없으면 응답과 함께 생성한 분석을 반환한다
+        if background_analysis:
+            self._analysis_queue.enqueue(session.id)
+            result["analysis_status"] = AnalysisStatus.PENDING
+        elif analysis_dict is not None:
             result["analysis"] = analysis_dict
-
-            # 분석 결과를 세션에 저장하고 DB에 반영
-            session.complete_with_analysis(analysis_dict)
-            self._repository.save(session)
+            result["analysis_status"] = AnalysisStatus.READY
 
         return result
+
+    async def _generate_response_with_analysis(
+        self, session: ConsultSession, content: str
+    ) -> tuple[str, Analysis]:
+        """
+        응답과 분석을 동시에 생성한다 (마지막 턴 대기 시간 = 두 호출 중 긴 쪽).
+
+        하나라도 실패하면 나머지를 취소하고 예외를 전파한다.
+        아무것도 저장되지 않으므로 사용자는 마지막 메시지를 다시 보낼 수 있다.
+        """
+        # 프롬프트는 각 태스크가 실행될 때 만들어지지만, 두 태스크가 끝날 때까지 세션에 메시지를 더하지 않으므로
+        # 둘 다 사용자의 마지막 메시지까지의 같은 히스토리를 본다
+        response_task = asyncio.create_task(
+            self._ai_counselor.generate_response(session, content)
+        )
+        analysis_task = asyncio.create_task(self._ai_counselor.generate_analysis(session))
+        try:
+            return await asyncio.gather(response_task, analysis_task)
+        except BaseException:
+            response_task.cancel()
+            analysis_task.cancel()
+            raise
@@ -1,8 +1,11 @@
 import uuid
 
+from fastapi.concurrency import run_in_threadpool
+
 from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
-from app.consult.application.port.ai_counselor_port import AICounselorPort
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
 from app.consult.domain.consult_session import ConsultSession
+from app.shared.tracing import traced
 from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
 
@@ -10,11 +13,12 @@ from app.shared.vo.gender import Gender
 class StartConsultUseCase:
     """상담 시작 유스케이스"""
 
-    def __init__(self, repository: ConsultRepositoryPort, ai_counselor: AICounselorPort):
+    def __init__(self, repository: ConsultRepositoryPort, ai_counselor: AsyncAICounselorPort):
         self._repository = repository
         self._ai_counselor = ai_counselor
 
-    def execute(self, user_id: str, mbti: MBTI, gender: Gender) -> dict:
+    @traced("consult.start")
+    async def execute(self, user_id: str, mbti: MBTI, gender: Gender) -> dict:
         """
         상담을 시작한다.
 
@@ -35,11 +39,11 @@ class StartConsultUseCase:
             gender=gender
         )
 
-        # 3. 세션 저장
-        self._repository.save(session)
+        # 3. 세션 저장 (동기 저장소 호출은 이벤트 루프를 막지 않도록 스레드에서 실행)
+        await run_in_threadpool(self._repository.save, session)
 
         # 4. AI 인사말 생성
-        greeting = self._ai_counselor.generate_greeting(mbti, gender)
+        greeting = await self._ai_counselor.generate_greeting(mbti, gender)
 
         # 5. 세션 ID와 인사말 반환
         return {"session_id": session_id, "greeting": greeting}
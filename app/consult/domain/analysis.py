@@ -1,6 +1,9 @@
 class Analysis:
     """상담 분석 결과 도메인"""
 
+    # 분석 섹션 (필수 4개 + 선택 2개)
+    SECTIONS = ("situation", "traits", "compatibility", "solutions", "scripts", "cautions")
+
     def __init__(
         self,
         situation: str,
@@ -41,3 +44,15 @@ class Analysis:
         if self.scripts:
             result["scripts"] = self.scripts
         return result
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Analysis":
+        """섹션 dict로부터 Analysis를 생성한다 (필수 섹션이 없으면 ValueError)"""
+        return cls(
+            situation=data.get("situation", ""),
+            traits=data.get("traits", ""),
+            solutions=data.get("solutions", ""),
+            cautions=data.get("cautions", ""),
+            compatibility=data.get("compatibility") or None,
+            scripts=data.get("scripts") or None,
+        )
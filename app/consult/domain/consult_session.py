@@ -4,6 +4,16 @@ from app.shared.vo.gender import Gender
 from app.consult.domain.message import Message
 
 
+class AnalysisStatus:
+    """상담 분석 생성 상태"""
+
+    PENDING = "pending"  # 백그라운드 생성 대기/진행 중
+    READY = "ready"      # 분석 결과 저장 완료
+    FAILED = "failed"    # 생성 실패
+
+    VALID_VALUES = (PENDING, READY, FAILED)
+
+
 class ConsultSession:
     """상담 세션 도메인 엔티티"""
 
@@ -17,8 +27,13 @@ class ConsultSession:
         messages: list[Message] | None = None,
         completed: bool = False,
         analysis: dict | None = None,
+        analysis_status: str | None = None,
+        history_summary: str | None = None,
+        summarized_message_count: int = 0,
     ):
         self._validate(id, user_id, mbti, gender)
+        if analysis_status is not None and analysis_status not in AnalysisStatus.VALID_VALUES:
+            raise ValueError(f"잘못된 분석 상태입니다: {analysis_status}")
         self.id = id
         self.user_id = user_id
         self.mbti = mbti
@@ -27,6 +42,13 @@ class ConsultSession:
         self._messages: list[Message] = messages or []
         self._completed = completed
         self._analysis = analysis
+        if analysis_status is None and analysis is not None:
+            analysis_status = AnalysisStatus.READY
+        self._analysis_status = analysis_status
+        self._history_summary = history_summary
+        self._summarized_message_count = summarized_message_count
+        self._persisted = False
+        self._persisted_message_count = 0
 
     def _validate(self, id: str, user_id: str, mbti: MBTI | None, gender: Gender | None) -> None:
         """ConsultSession 값의 유효성을 검증한다"""
@@ -47,6 +69,19 @@ class ConsultSession:
         """세션의 모든 메시지를 반환한다"""
         return list(self._messages)
 
+    def get_unsaved_messages(self) -> list[Message]:
+        """마지막 저장 이후 추가된 메시지를 반환한다"""
+        return self._messages[self._persisted_message_count:]
+
+    def is_persisted(self) -> bool:
+        """저장소에 한 번이라도 저장(또는 저장소에서 로드)되었는지 반환한다"""
+        return self._persisted
+
+    def mark_persisted(self) -> None:
+        """현재까지의 세션 상태와 메시지가 저장소에 반영되었음을 표시한다"""
+        self._persisted = True
+        self._persisted_message_count = len(self._messages)
+
     def get_user_turn_count(self) -> int:
         """유저 메시지(턴) 개수를 반환한다"""
         return sum(1 for msg in self._messages if msg.role == "user")
@@ -59,7 +94,42 @@ class ConsultSession:
         """세션을 완료하고 분석 결과를 저장한다"""
         self._completed = True
         self._analysis = analysis
+        self._analysis_status = AnalysisStatus.READY
+
+    def request_analysis(self) -> None:
+        """세션을 완료하고 분석 생성을 대기 상태로 표시한다 (백그라운드 생성용)"""
+        self._completed = True
+        self._analysis_status = AnalysisStatus.PENDING
+
+    def fail_analysis(self) -> None:
+        """분석 생성 실패를 표시한다"""
+        self._analysis_status = AnalysisStatus.FAILED
 
     def get_analysis(self) -> dict | None:
         """분석 결과를 반환한다"""
         return self._analysis
+
+    def get_analysis_status(self) -> str | None:
+        """분석 생성 상태를 반환한다 (분석을 요청하지 않았으면 None)"""
+        return self._analysis_status
+
+    def get_history_summary(self) -> str | None:
+        """오래된 대화의 누적 요약을 반환한다 (요약한 적 없으면 None)"""
+        return self._history_summary
+
+    def get_summarized_message_count(self) -> int:
+        """누적 요약에 반영된 앞쪽 메시지 수를 반환한다"""
+        return self._summarized_message_count
+
+    def get_unsummarized_messages(self) -> list[Message]:
+        """누적 요약에 반영되지 않은 메시지를 반환한다 (프롬프트에 원문 그대로 들어가는 부분)"""
+        return self._messages[self._summarized_message_count:]
+
+    def update_history_summary(self, summary: str, message_count: int) -> None:
+        """앞쪽 message_count개 메시지를 반영한 누적 요약으로 갱신한다"""
+        if not summary or not summary.strip():
+            raise ValueError("대화 요약은 비어있을 수 없습니다")
+        if not self._summarized_message_count <= message_count <= len(self._messages):
+            raise ValueError(f"잘못된 요약 메시지 수입니다: {message_count}")
+        self._history_summary = summary
+        self._summarized_message_count = message_count
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+
+class ConsultSessionSummary:
+    """상담 히스토리 목록용 세션 요약 (메시지/분석 본문 제외)"""
+
+    def __init__(
+        self,
+        id: str,
+        created_at: datetime,
+        mbti: MBTI,
+        gender: Gender,
+        analysis_status: str | None = None,
+    ):
+        self.id = id
+        self.created_at = created_at
+        self.mbti = mbti
+        self.gender = gender
+        self.analysis_status = analysis_status
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+from collections import deque
+from typing import AsyncIterator
+
+from app.shared.tracing import untraced_context
+
+logger = logging.getLogger(__name__)
+
+
+class StreamReplayBuffer:
+    """
+    진행 중인 스트리밍 응답 하나의 재전송 버퍼.
+
+    이벤트마다 1부터 증가하는 번호를 붙여 최근 max_events개를 보관하고,
+    구독자는 마지막으로 받은 번호 이후의 이벤트부터 이어서 받는다.
+    """
+
+    def __init__(self, owner_id: str, turn: int, max_events: int):
+        self.owner_id = owner_id
+        self.turn = turn
+        self._events: deque[tuple[int, str]] = deque(maxlen=max_events)
+        self._last_id = 0
+        self._finished = False
+        self._error: BaseException | None = None
+        self._changed = asyncio.Event()
+        self._subscribers = 0
+        self._task: asyncio.Task | None = None
+        self._expiry: asyncio.TimerHandle | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def can_resume_from(self, after_id: int) -> bool:
+        """after_id 다음 이벤트부터 빠짐없이 재전송할 수 있는지 반환한다"""
+        if after_id < 0 or after_id > self._last_id:
+            return False
+        oldest_id = self._events[0][0] if self._events else self._last_id + 1
+        return after_id + 1 >= oldest_id
+
+    def append(self, data: str) -> int:
+        """이벤트를 추가하고 번호를 반환한다"""
+        self._last_id += 1
+        self._events.append((self._last_id, data))
+        self._notify()
+        return self._last_id
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """스트림이 끝났음을 표시한다 (error가 있으면 구독자에게 전달)"""
+        self._finished = True
+        self._error = error
+        self._notify()
+
+    async def follow(self, after_id: int = 0) -> AsyncIterator[tuple[int, str]]:
+        """after_id 이후의 이벤트를 (번호, 데이터)로 반환하고, 스트림이 끝나면 종료한다"""
+        next_id = after_id + 1
+        while True:
+            changed = self._changed
+            if self._last_id < next_id and not self._finished:
+                await changed.wait()
+                continue
+
+            oldest_id = self._events[0][0] if self._events else self._last_id + 1
+            if next_id < oldest_id:
+                raise LookupError("재전송 가능한 범위를 벗어났습니다")
+
+            batch = [event for event in self._events if event[0] >= next_id]
+            for event_id, data in batch:
+                yield event_id, data
+                next_id = event_id + 1
+
+            if self._finished and self._last_id < next_id:
+                if self._error is not None:
+                    raise self._error
+                return
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+class StreamReplayRegistry:
+    """
+    세션 id별 진행 중 스트림 레지스트리 (인메모리).
+
+    응답 생성은 HTTP 응답과 분리된 태스크에서 돌며 StreamReplayBuffer에 쌓인다.
+    연결이 끊긴 클라이언트는 Last-Event-ID로 같은 버퍼에 다시 붙어 이어 받는다.
+    구독자가 모두 떠난 뒤 grace_seconds 안에 아무도 다시 붙지 않으면 생성을 취소하고,
+    끝난 스트림은 retention_seconds 동안 남겨 두어 늦은 재연결에도 나머지를 보낸다.
+    """
+
+    DEFAULT_MAX_EVENTS = 256
+    DEFAULT_RETENTION_SECONDS = 60.0
+    DEFAULT_GRACE_SECONDS = 5.0
+
+    def __init__(
+        self,
+        max_events: int | None = None,
+        retention_seconds: float | None = None,
+        grace_seconds: float | None = None,
+    ):
+        self._max_events = max_events if max_events is not None else self.DEFAULT_MAX_EVENTS
+        self._retention_seconds = (
+            retention_seconds if retention_seconds is not None else self.DEFAULT_RETENTION_SECONDS
+        )
+        self._grace_seconds = grace_seconds if grace_seconds is not None else self.DEFAULT_GRACE_SECONDS
+        self._buffers: dict[str, StreamReplayBuffer] = {}
+
+    def get(self, key: str) -> StreamReplayBuffer | None:
+        return self._buffers.get(key)
+
+    def is_active(self, key: str) -> bool:
+        """아직 생성 중인 스트림이 있는지 반환한다"""
+        buffer = self._buffers.get(key)
+        return buffer is not None and not buffer.finished
+
+    def start(
+        self,
+        key: str,
+        owner_id: str,
+        turn: int,
+        frames: AsyncIterator[str],
+    ) -> StreamReplayBuffer:
+        """frames를 백그라운드 태스크에서 소비해 새 재전송 버퍼에 쌓는다"""
+        buffer = self.reserve(key, owner_id, turn)
+        self.run(key, buffer, frames)
+        return buffer
+
+    def reserve(self, key: str, owner_id: str, turn: int) -> StreamReplayBuffer:
+        """
+        생성을 시작하기 전에 key의 새 재전송 버퍼를 잡아 둔다 (이미 생성 중이면 ValueError).
+
+        예약한 버퍼는 run으로 생성을 시작하거나 cancel_reservation으로 놓아야 한다.
+        예약 중에는 is_active가 True이므로 같은 key의 다른 요청은 생성을 시작하지 못한다.
+        """
+        if self.is_active(key):
+            raise ValueError(f"이미 생성 중인 스트림이 있습니다: {key}")
+
+        previous = self._buffers.get(key)
+        if previous is not None and previous._expiry is not None:
+            previous._expiry.cancel()
+
+        buffer = StreamReplayBuffer(owner_id, turn, self._max_events)
+        self._buffers[key] = buffer
+        return buffer
+
+    def run(self, key: str, buffer: StreamReplayBuffer, frames: AsyncIterator[str]) -> None:
+        """예약한 버퍼에 frames를 백그라운드 태스크에서 쌓기 시작한다"""
+        # 응답보다 오래 사는 생성 태스크가 이미 내보낸 요청 Trace에 구간을 쌓지 않게 한다
+        buffer._task = asyncio.create_task(self._produce(key, buffer, frames), context=untraced_context())
+
+    def cancel_reservation(self, key: str, buffer: StreamReplayBuffer) -> None:
+        """생성을 시작하지 못한 예약을 끝내고 버퍼를 버린다"""
+        buffer.finish()
+        self._discard(key, buffer)
+
+    async def subscribe(
+        self, buffer: StreamReplayBuffer, after_id: int = 0
+    ) -> AsyncIterator[tuple[int, str]]:
+        """버퍼를 구독한다 (구독이 끝났을 때 남은 구독자가 없으면 생성 취소를 예약)"""
+        buffer._subscribers += 1
+        try:
+            async for event in buffer.follow(after_id):
+                yield event
+        finally:
+            buffer._subscribers -= 1
+            if buffer._subscribers == 0 and not buffer.finished:
+                await self._release(buffer)
+
+    async def close(self) -> None:
+        """진행 중인 모든 생성 태스크를 취소한다 (애플리케이션 종료 시)"""
+        tasks = [b._task for b in self._buffers.values() if b._task is not None and not b._task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def _produce(self, key: str, buffer: StreamReplayBuffer, frames: AsyncIterator[str]) -> None:
+        try:
+            async for data in frames:
+                buffer.append(data)
+        except asyncio.CancelledError:
+            buffer.finish()
+            raise
+        except Exception as e:
+            logger.warning("스트림 생성에 실패했습니다: %s (%s)", key, e)
+            buffer.finish(e)
+        else:
+            buffer.finish()
+        finally:
+            buffer._expiry = asyncio.get_running_loop().call_later(
+                self._retention_seconds, self._discard, key, buffer
+            )
+
+    async def _release(self, buffer: StreamReplayBuffer) -> None:
+        if self._grace_seconds <= 0:
+            await self._cancel(buffer)
+            return
+        asyncio.get_running_loop().call_later(
+            self._grace_seconds, self._cancel_if_abandoned, buffer
+        )
+
+    def _cancel_if_abandoned(self, buffer: StreamReplayBuffer) -> None:
+        if buffer._subscribers == 0 and not buffer.finished and buffer._task is not None:
+            buffer._task.cancel()
+
+    async def _cancel(self, buffer: StreamReplayBuffer) -> None:
+        task = buffer._task
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.wait({task})
+
+    def _discard(self, key: str, buffer: StreamReplayBuffer) -> None:
+        if self._buffers.get(key) is buffer:
+            del self._buffers[key]
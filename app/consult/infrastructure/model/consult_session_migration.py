@@ -0,0 +1,90 @@
+import logging
+from typing import Callable
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel
+
+logger = logging.getLogger(__name__)
+
+_TABLE = ConsultSessionModel.__tablename__
+
+# create_all은 이미 있는 테이블을 바꾸지 않으므로, 모델에 나중에 추가한 컬럼/인덱스를 여기에 적는다
+_ADDED_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("analysis_status", "VARCHAR(10) NULL"),
+    ("analysis_claimed_at", "DATETIME NULL"),
+    ("history_summary", "TEXT NULL"),
+    ("summarized_message_count", "INTEGER NOT NULL DEFAULT 0"),
+)
+_ADDED_INDEXES: tuple[str, ...] = (
+    "ix_consult_sessions_analysis_status",
+    "ix_consult_sessions_user_completed_created",
+)
+# 새 컬럼이 생기기 전에 저장된 row의 값을 채운다 (채울 row가 없으면 아무것도 바꾸지 않는다)
+_BACKFILLS: tuple[tuple[str, str], ...] = (
+    (
+        "analysis_status of analyzed sessions",
+        f"UPDATE {_TABLE} SET analysis_status = 'ready' "
+        "WHERE analysis_status IS NULL AND analysis_json IS NOT NULL",
+    ),
+)
+
+
+def migrate_consult_sessions(engine: Engine) -> list[str]:
+    """
+    기존 consult_sessions 테이블에 빠진 컬럼/인덱스를 추가하고 기존 row 값을 채운 뒤, 적용한 변경 목록을 반환한다.
+
+    create_all 뒤에 호출한다. 이미 있는 컬럼/인덱스는 건너뛰므로 여러 번 실행해도 안전하고,
+    여러 워커가 동시에 기동해 다른 워커가 먼저 적용한 경우도 오류 없이 넘어간다.
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table(_TABLE):
+        return []
+
+    applied = []
+    columns = {column["name"] for column in inspector.get_columns(_TABLE)}
+    for name, definition in _ADDED_COLUMNS:
+        statement = text(f"ALTER TABLE {_TABLE} ADD COLUMN {name} {definition}")
+        if name not in columns and _apply(
+            engine,
+            lambda connection: connection.execute(statement),
+            lambda: name in {column["name"] for column in inspect(engine).get_columns(_TABLE)},
+        ):
+            applied.append(f"column {name}")
+
+    indexes = {index["name"] for index in inspector.get_indexes(_TABLE)}
+    model_indexes = {index.name: index for index in ConsultSessionModel.__table__.indexes}
+    for name in _ADDED_INDEXES:
+        if name not in indexes and _apply(
+            engine,
+            model_indexes[name].create,
+            lambda: name in {index["name"] for index in inspect(engine).get_indexes(_TABLE)},
+        ):
+            applied.append(f"index {name}")
+
+    for name, statement in _BACKFILLS:
+        with engine.begin() as connection:
+            if connection.execute(text(statement)).rowcount:
+                applied.append(f"backfill {name}")
+
+    for change in applied:
+        logger.info("consult_sessions 스키마 변경 적용: %s", change)
+    return applied
+
+
+def _apply(
+    engine: Engine,
+    change: Callable[[Connection], object],
+    already_applied: Callable[[], bool],
+) -> bool:
+    """DDL 하나를 적용한다 (다른 워커가 먼저 적용해 실패했으면 False)"""
+    try:
+        with engine.begin() as connection:
+            change(connection)
+        return True
+    except DBAPIError:
+        if already_applied():
+            return False
+        raise
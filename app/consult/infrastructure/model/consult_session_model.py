@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, Boolean
+from sqlalchemy import Column, String, DateTime, Text, Boolean, Index, Integer
 from config.database import Base
 
 
@@ -6,6 +6,10 @@ class ConsultSessionModel(Base):
     """상담 세션 ORM 모델"""
 
     __tablename__ = "consult_sessions"
+    __table_args__ = (
+        # 히스토리 keyset 페이지네이션용 (InnoDB는 보조 인덱스 끝에 PK id를 덧붙인다)
+        Index("ix_consult_sessions_user_completed_created", "user_id", "is_completed", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True)
     user_id = Column(String(255), nullable=False, index=True)
@@ -14,3 +18,7 @@ class ConsultSessionModel(Base):
     created_at = Column(DateTime, nullable=False)
     is_completed = Column(Boolean, default=False, nullable=False)
     analysis_json = Column(Text, nullable=True)  # JSON 형태로 분석 결과 저장
+    analysis_status = Column(String(10), nullable=True, index=True)  # pending/ready/failed
+    analysis_claimed_at = Column(DateTime, nullable=True)  # 분석 작업을 맡은 워커가 표시한 시각
+    history_summary = Column(Text, nullable=True)  # 오래된 대화의 누적 요약
+    summarized_message_count = Column(Integer, default=0, nullable=False)  # 요약에 반영된 앞쪽 메시지 수
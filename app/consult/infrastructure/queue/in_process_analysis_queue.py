@@ -0,0 +1,175 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, ContextManager
+
+from app.consult.application.port.analysis_queue_port import (
+    AnalysisPendingElsewhereError,
+    AnalysisQueuePort,
+)
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
+from app.consult.domain.analysis import Analysis
+from app.consult.domain.consult_session import AnalysisStatus, ConsultSession
+from app.shared.tracing import untraced_context
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessAnalysisQueue(AnalysisQueuePort):
+    """
+    asyncio 태스크 기반 인프로세스 분석 작업 큐.
+
+    작업 상태는 consult_sessions.analysis_status에 저장되므로,
+    프로세스가 재시작되어도 resume_pending()으로 대기 중인 작업을 이어서 처리한다.
+    여러 워커가 같은 작업을 재개하지 않도록 생성 전에 작업을 맡았다고 표시하고(claim_pending_analysis),
+    claim_timeout_seconds가 지나도록 끝나지 않은 표시는 죽은 워커의 것으로 보고 다시 맡는다.
+    LLM 호출 동안 DB 커넥션을 잡지 않도록 조회와 저장은 각각 짧은 저장소 스코프에서 수행한다.
+    분석은 섹션 단위 스트림으로 생성하며, 완성된 섹션은 subscribe()한 구독자에게 바로 전달된다.
+    """
+
+    # 구독자 큐에서 작업 종료를 알리는 표시 (뒤따르는 값은 최종 분석 상태)
+    _END = object()
+
+    DEFAULT_MAX_ATTEMPTS = 2
+    DEFAULT_CLAIM_TIMEOUT_SECONDS = 600
+
+    def __init__(
+        self,
+        ai_counselor: AsyncAICounselorPort,
+        repository_scope: Callable[[], ContextManager[ConsultRepositoryPort]],
+        max_attempts: int | None = None,
+        claim_timeout_seconds: float | None = None,
+    ):
+        self._ai_counselor = ai_counselor
+        self._repository_scope = repository_scope
+        self._max_attempts = max_attempts if max_attempts is not None else self.DEFAULT_MAX_ATTEMPTS
+        self._claim_timeout_seconds = (
+            claim_timeout_seconds if claim_timeout_seconds is not None else self.DEFAULT_CLAIM_TIMEOUT_SECONDS
+        )
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._sections: dict[str, list[tuple[str, str]]] = {}
+        self._subscribers: dict[str, list[asyncio.Queue]] = {}
+
+    def enqueue(self, session_id: str) -> None:
+        """분석 작업을 등록한다 (같은 세션의 작업이 진행 중이면 무시)"""
+        task = self._tasks.get(session_id)
+        if task is not None and not task.done():
+            return
+        # 요청 안에서 등록되어도 요청 Trace와 분리해 실행한다 (응답 뒤에 끝나는 작업)
+        task = asyncio.create_task(self._run(session_id), context=untraced_context())
+        self._tasks[session_id] = task
+        task.add_done_callback(lambda t: self._on_done(session_id, t))
+
+    def resume_pending(self) -> int:
+        """대기 중으로 남아 있는 분석 작업을 다시 등록하고 등록 건수를 반환한다"""
+        with self._repository_scope() as repository:
+            session_ids = repository.find_pending_analysis_session_ids()
+        for session_id in session_ids:
+            self.enqueue(session_id)
+        return len(session_ids)
+
+    def subscribe(self, session_id: str) -> AsyncIterator[tuple[str, str]] | None:
+        """진행 중인 작업의 섹션 스트림을 구독한다 (이미 생성된 섹션부터 전달)"""
+        task = self._tasks.get(session_id)
+        if task is None or task.done():
+            return None
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for section in self._sections.get(session_id, []):
+            queue.put_nowait(section)
+        self._subscribers.setdefault(session_id, []).append(queue)
+        return self._iterate(session_id, queue)
+
+    async def _iterate(
+        self, session_id: str, queue: asyncio.Queue
+    ) -> AsyncIterator[tuple[str, str]]:
+        try:
+            while True:
+                item = await queue.get()
+                if item[0] is self._END:
+                    if item[1] == AnalysisStatus.PENDING:
+                        # 다른 워커가 맡은 작업이라 이 프로세스에서는 생성하지 않았다
+                        raise AnalysisPendingElsewhereError(session_id)
+                    if item[1] != AnalysisStatus.READY:
+                        raise RuntimeError("분석 생성에 실패했습니다")
+                    return
+                yield item
+        finally:
+            subscribers = self._subscribers.get(session_id, [])
+            if queue in subscribers:
+                subscribers.remove(queue)
+
+    def _publish(self, session_id: str, item: tuple) -> None:
+        if item[0] is not self._END:
+            self._sections.setdefault(session_id, []).append(item)
+        for queue in self._subscribers.get(session_id, []):
+            queue.put_nowait(item)
+
+    async def join(self) -> None:
+        """등록된 작업이 모두 끝날 때까지 기다린다"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks.values()), return_exceptions=True)
+
+    async def close(self) -> None:
+        """진행 중인 작업을 취소한다 (맡은 표시를 지우고 pending 상태로 남겨 다음 시작 시 재개됨)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _on_done(self, session_id: str, task: asyncio.Task) -> None:
+        if self._tasks.get(session_id) is task:
+            del self._tasks[session_id]
+            self._sections.pop(session_id, None)
+            final_status = None
+            if not task.cancelled() and task.exception() is None:
+                final_status = task.result()
+            self._publish(session_id, (self._END, final_status))
+            self._subscribers.pop(session_id, None)
+
+    async def _run(self, session_id: str) -> str | None:
+        """세션을 조회해 분석을 생성하고 결과(또는 실패)를 저장한다 (최종 분석 상태 반환)"""
+        with self._repository_scope() as repository:
+            session = repository.find_by_id(session_id)
+            if session is None or session.get_analysis_status() != AnalysisStatus.PENDING:
+                return session.get_analysis_status() if session else None
+            now = datetime.now()
+            stale_before = now - timedelta(seconds=self._claim_timeout_seconds)
+            if not repository.claim_pending_analysis(session_id, now, stale_before):
+                logger.info("다른 워커가 맡은 분석 작업이라 건너뜁니다: %s", session_id)
+                return AnalysisStatus.PENDING
+
+        analysis = None
+        try:
+            for attempt in range(1, self._max_attempts + 1):
+                try:
+                    analysis = await self._generate(session_id, session)
+                    break
+                except Exception:
+                    logger.exception(
+                        "상담 분석 생성 실패 (session=%s, attempt=%d/%d)",
+                        session_id, attempt, self._max_attempts,
+                    )
+        except asyncio.CancelledError:
+            # 종료로 취소되면 다음 기동 때 바로 재개할 수 있도록 맡은 표시를 지운다
+            with self._repository_scope() as repository:
+                repository.release_analysis_claim(session_id)
+            raise
+
+        if analysis is None:
+            session.fail_analysis()
+        else:
+            session.complete_with_analysis(analysis.to_dict())
+
+        with self._repository_scope() as repository:
+            repository.save(session)
+        return session.get_analysis_status()
+
+    async def _generate(self, session_id: str, session: ConsultSession) -> Analysis:
+        """분석을 섹션 스트림으로 생성하며 구독자에게 전달한다"""
+        sections: dict[str, str] = {}
+        async for section, content in self._ai_counselor.generate_analysis_stream(session):
+            sections[section] = content
+            self._publish(session_id, (section, content))
+        return Analysis.from_dict(sections)
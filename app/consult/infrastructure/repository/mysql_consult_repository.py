@@ -1,13 +1,63 @@
 import json
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.orm import Session
 
 from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
-from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.consult_session import AnalysisStatus, ConsultSession
+from app.consult.domain.consult_session_summary import ConsultSessionSummary
 from app.consult.domain.message import Message
 from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel
 from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel
+from app.shared.tracing import traced
 from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
+from config.database import SessionLocal
+
+
+# find_by_id JOIN 조회에서 읽는 컬럼 (ORM 엔티티 대신 row로 받는다)
+_SESSION_COLUMNS = (
+    ConsultSessionModel.id,
+    ConsultSessionModel.user_id,
+    ConsultSessionModel.mbti,
+    ConsultSessionModel.gender,
+    ConsultSessionModel.created_at,
+    ConsultSessionModel.is_completed,
+    ConsultSessionModel.analysis_json,
+    ConsultSessionModel.analysis_status,
+    ConsultSessionModel.history_summary,
+    ConsultSessionModel.summarized_message_count,
+)
+_MESSAGE_COLUMNS = (
+    ConsultMessageModel.role.label("message_role"),
+    ConsultMessageModel.content.label("message_content"),
+    ConsultMessageModel.created_at.label("message_created_at"),
+)
+
+
+def _to_domain(row, messages: list[Message]) -> ConsultSession:
+    """세션 컬럼을 가진 row를 도메인 세션으로 변환한다"""
+    # 분석 결과 파싱
+    analysis = None
+    if row.analysis_json:
+        analysis = json.loads(row.analysis_json)
+
+    return ConsultSession(
+        id=row.id,
+        user_id=row.user_id,
+        mbti=MBTI(row.mbti),
+        gender=Gender(row.gender),
+        created_at=row.created_at,
+        messages=messages,
+        completed=row.is_completed or False,
+        analysis=analysis,
+        analysis_status=row.analysis_status,
+        history_summary=row.history_summary,
+        summarized_message_count=row.summarized_message_count or 0,
+    )
 
 
 class MySQLConsultRepository(ConsultRepositoryPort):
@@ -16,104 +66,202 @@ class MySQLConsultRepository(ConsultRepositoryPort):
     def __init__(self, db_session: Session):
         self._db = db_session
 
+    @traced("db.consult.save")
     def save(self, session: ConsultSession) -> None:
-        """세션을 저장한다 (insert 또는 update)"""
+        """
+        세션을 저장한다.
+
+        - 처음 저장되는 세션: 세션 row를 merge하고 메시지 전체를 기록한다
+        - 이미 저장된(또는 조회된) 세션: 상태/분석 결과만 UPDATE하고 새 메시지만 INSERT한다
+
+        따라서 턴마다 쓰기 비용이 대화 길이와 무관하게 일정하다.
+        """
         # 분석 결과를 JSON으로 변환
         analysis_json = None
         if session.get_analysis():
             analysis_json = json.dumps(session.get_analysis(), ensure_ascii=False)
 
-        # 세션 저장 (merge로 insert/update 처리)
-        session_model = ConsultSessionModel(
-            id=session.id,
-            user_id=session.user_id,
-            mbti=session.mbti.value,
-            gender=session.gender.value,
-            created_at=session.created_at,
-            is_completed=session.is_completed(),
-            analysis_json=analysis_json,
-        )
-        self._db.merge(session_model)
+        if session.is_persisted():
+            # 세션 상태/분석 결과만 갱신
+            self._db.query(ConsultSessionModel).filter(
+                ConsultSessionModel.id == session.id
+            ).update(
+                {
+                    ConsultSessionModel.is_completed: session.is_completed(),
+                    ConsultSessionModel.analysis_json: analysis_json,
+                    ConsultSessionModel.analysis_status: session.get_analysis_status(),
+                    ConsultSessionModel.history_summary: session.get_history_summary(),
+                    ConsultSessionModel.summarized_message_count: session.get_summarized_message_count(),
+                },
+                synchronize_session=False,
+            )
+        else:
+            # 세션 저장 (merge로 insert/update 처리)
+            session_model = ConsultSessionModel(
+                id=session.id,
+                user_id=session.user_id,
+                mbti=session.mbti.value,
+                gender=session.gender.value,
+                created_at=session.created_at,
+                is_completed=session.is_completed(),
+                analysis_json=analysis_json,
+                analysis_status=session.get_analysis_status(),
+                history_summary=session.get_history_summary(),
+                summarized_message_count=session.get_summarized_message_count(),
+            )
+            self._db.merge(session_model)
 
-        # 기존 메시지 삭제 후 새로 저장 (단순한 구현)
-        self._db.query(ConsultMessageModel).filter(
-            ConsultMessageModel.session_id == session.id
-        ).delete()
+            # 저장소 밖에서 만들어진 세션이므로 기존 메시지를 대체한다
+            self._db.query(ConsultMessageModel).filter(
+                ConsultMessageModel.session_id == session.id
+            ).delete()
 
-        # 메시지 저장
-        for msg in session.get_messages():
-            message_model = ConsultMessageModel(
+        # 마지막 저장 이후 추가된 메시지만 저장
+        self._db.add_all([
+            ConsultMessageModel(
                 session_id=session.id,
                 role=msg.role,
                 content=msg.content,
                 created_at=msg.timestamp,
             )
-            self._db.add(message_model)
+            for msg in session.get_unsaved_messages()
+        ])
 
         self._db.commit()
+        session.mark_persisted()
 
+    @traced("db.consult.find_by_id")
     def find_by_id(self, session_id: str) -> ConsultSession | None:
-        """id로 세션을 조회한다"""
-        session_model = self._db.query(ConsultSessionModel).filter(
-            ConsultSessionModel.id == session_id
-        ).first()
+        """
+        id로 세션을 조회한다.
 
-        if session_model is None:
-            return None
+        세션과 메시지를 OUTER JOIN 한 번으로 가져온다. ORM 엔티티 대신 컬럼 row만
+        읽으므로 identity map 등록/변경 추적 비용 없이 바로 도메인 객체로 변환한다.
+        """
+        rows = self._db.execute(
+            select(*_SESSION_COLUMNS, *_MESSAGE_COLUMNS)
+            .select_from(ConsultSessionModel)
+            .outerjoin(
+                ConsultMessageModel,
+                ConsultMessageModel.session_id == ConsultSessionModel.id,
+            )
+            .where(ConsultSessionModel.id == session_id)
+            .order_by(ConsultMessageModel.id)
+        ).all()
 
-        # 메시지 조회 (생성 시간순)
-        message_models = self._db.query(ConsultMessageModel).filter(
-            ConsultMessageModel.session_id == session_id
-        ).order_by(ConsultMessageModel.id).all()
+        if not rows:
+            return None
 
+        # 메시지가 없는 세션은 메시지 컬럼이 NULL인 row 하나로 조회된다
         messages = [
             Message(
-                role=m.role,
-                content=m.content,
-                timestamp=m.created_at,
+                role=row.message_role,
+                content=row.message_content,
+                timestamp=row.message_created_at,
             )
-            for m in message_models
+            for row in rows
+            if row.message_role is not None
         ]
 
-        # 분석 결과 파싱
-        analysis = None
-        if session_model.analysis_json:
-            analysis = json.loads(session_model.analysis_json)
-
-        return ConsultSession(
-            id=session_model.id,
-            user_id=session_model.user_id,
-            mbti=MBTI(session_model.mbti),
-            gender=Gender(session_model.gender),
-            created_at=session_model.created_at,
-            messages=messages,
-            completed=session_model.is_completed or False,
-            analysis=analysis,
-        )
+        session = _to_domain(rows[0], messages)
+        session.mark_persisted()
+        return session
+
+    @traced("db.consult.find_completed_summaries")
+    def find_completed_summaries_by_user_id(
+        self,
+        user_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[ConsultSessionSummary]:
+        """
+        user_id로 완료된 세션 요약을 최신순으로 조회한다 (keyset 페이지네이션).
 
-    def find_completed_by_user_id(self, user_id: str) -> list[ConsultSession]:
-        """user_id로 완료된 세션 목록을 조회한다 (최신순)"""
-        session_models = self._db.query(ConsultSessionModel).filter(
+        (user_id, is_completed, created_at) 인덱스를 따라 커서 위치부터 limit개만 읽고,
+        분석 JSON 본문은 읽지 않는다. mbti/gender/analysis_status는 인덱스에 없으므로
+        인덱스만으로 끝나지는 않고, 찾은 limit개 row를 PK로 한 번씩 더 읽는다.
+        """
+        query = select(
+            ConsultSessionModel.id,
+            ConsultSessionModel.created_at,
+            ConsultSessionModel.mbti,
+            ConsultSessionModel.gender,
+            ConsultSessionModel.analysis_status,
+        ).where(
             ConsultSessionModel.user_id == user_id,
-            ConsultSessionModel.is_completed == True
-        ).order_by(ConsultSessionModel.created_at.desc()).all()
-
-        sessions = []
-        for session_model in session_models:
-            # 분석 결과 파싱
-            analysis = None
-            if session_model.analysis_json:
-                analysis = json.loads(session_model.analysis_json)
-
-            sessions.append(ConsultSession(
-                id=session_model.id,
-                user_id=session_model.user_id,
-                mbti=MBTI(session_model.mbti),
-                gender=Gender(session_model.gender),
-                created_at=session_model.created_at,
-                messages=[],  # 히스토리에서는 메시지 로드 안함
-                completed=True,
-                analysis=analysis,
-            ))
-
-        return sessions
+            ConsultSessionModel.is_completed == True,
+        )
+        if after is not None:
+            after_created_at, after_id = after
+            query = query.where(
+                or_(
+                    ConsultSessionModel.created_at < after_created_at,
+                    and_(
+                        ConsultSessionModel.created_at == after_created_at,
+                        ConsultSessionModel.id < after_id,
+                    ),
+                )
+            )
+        rows = self._db.execute(
+            query.order_by(
+                ConsultSessionModel.created_at.desc(),
+                ConsultSessionModel.id.desc(),
+            ).limit(limit)
+        ).all()
+
+        return [
+            ConsultSessionSummary(
+                id=row.id,
+                created_at=row.created_at,
+                mbti=MBTI(row.mbti),
+                gender=Gender(row.gender),
+                analysis_status=row.analysis_status,
+            )
+            for row in rows
+        ]
+
+    @traced("db.consult.find_pending_analysis")
+    def find_pending_analysis_session_ids(self) -> list[str]:
+        """분석 생성이 대기 중인 세션 id 목록을 조회한다"""
+        rows = self._db.query(ConsultSessionModel.id).filter(
+            ConsultSessionModel.analysis_status == AnalysisStatus.PENDING
+        ).all()
+        return [row.id for row in rows]
+
+    @traced("db.consult.claim_analysis")
+    def claim_pending_analysis(self, session_id: str, claimed_at: datetime, stale_before: datetime) -> bool:
+        """조건부 UPDATE 한 번으로 맡으므로 동시에 시도한 워커 중 한 곳만 갱신 건수 1을 받는다"""
+        result = self._db.execute(
+            update(ConsultSessionModel)
+            .where(
+                ConsultSessionModel.id == session_id,
+                ConsultSessionModel.analysis_status == AnalysisStatus.PENDING,
+                or_(
+                    ConsultSessionModel.analysis_claimed_at.is_(None),
+                    ConsultSessionModel.analysis_claimed_at < stale_before,
+                ),
+            )
+            .values(analysis_claimed_at=claimed_at)
+        )
+        self._db.commit()
+        return result.rowcount == 1
+
+    @traced("db.consult.release_analysis")
+    def release_analysis_claim(self, session_id: str) -> None:
+        """맡았던 분석 작업 표시를 지운다"""
+        self._db.execute(
+            update(ConsultSessionModel)
+            .where(ConsultSessionModel.id == session_id)
+            .values(analysis_claimed_at=None)
+        )
+        self._db.commit()
+
+
+@contextmanager
+def mysql_consult_repository_scope() -> Iterator[ConsultRepositoryPort]:
+    """요청 밖(백그라운드 작업)에서 사용할 짧은 수명의 저장소를 연다"""
+    db = SessionLocal()
+    try:
+        yield MySQLConsultRepository(db)
+    finally:
+        db.close()
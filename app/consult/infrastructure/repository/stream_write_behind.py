@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Callable, ContextManager
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.consult.application.port.analysis_queue_port import AnalysisQueuePort
+from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+
+logger = logging.getLogger(__name__)
+
+
+class StreamWriteBehindBuffer:
+    """
+    스트리밍 턴의 write-behind 버퍼.
+
+    사용자 메시지가 추가된 세션과 스트리밍되는 AI 응답 조각을 메모리에 모아 두었다가,
+    스트림이 끝나거나 중단되면 flush()에서 짧은 저장소 스코프 하나로 한 번에 저장한다.
+    스트리밍 중에는 DB 커넥션을 잡지 않는다.
+    """
+
+    def __init__(
+        self,
+        session: ConsultSession,
+        repository_scope: Callable[[], ContextManager[ConsultRepositoryPort]],
+        analysis_queue: AnalysisQueuePort | None = None,
+    ):
+        self._session = session
+        self._repository_scope = repository_scope
+        self._analysis_queue = analysis_queue
+        self._chunks: list[str] = []
+        self._flushed = False
+
+    def append(self, chunk: str) -> None:
+        """스트리밍된 AI 응답 조각을 버퍼에 추가한다"""
+        self._chunks.append(chunk)
+
+    async def tap(self, chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+        """조각을 버퍼에 쌓으면서 그대로 흘려보낸다 (뒤에서 묶이거나 전송 전에 끊겨도 유실되지 않게)"""
+        async for chunk in chunks:
+            self.append(chunk)
+            yield chunk
+
+    @property
+    def content(self) -> str:
+        """지금까지 버퍼에 쌓인 AI 응답"""
+        return "".join(self._chunks)
+
+    async def flush(self) -> None:
+        """
+        버퍼를 저장한다 (여러 번 호출해도 한 번만 저장).
+
+        스트림이 중간에 끊겼더라도 받은 만큼의 응답을 저장하고, 마지막 턴이면 분석 생성을 요청한다.
+        받은 응답이 없으면(업스트림 오류, 빈 응답) 사용자 메시지도 저장하지 않는다.
+        턴이 소모되지 않으므로 마지막 턴이어도 세션이 완료되거나 분석이 요청되지 않는다.
+        저장은 이벤트 루프를 막지 않도록 스레드에서 실행하며, 스트림이 취소되어도 끝까지 마친다.
+        """
+        if self._flushed:
+            return
+        self._flushed = True
+
+        content = self.content
+        if not content.strip():
+            logger.info("AI 응답을 받지 못해 이번 턴을 저장하지 않습니다: %s", self._session.id)
+            return
+        self._session.add_message(Message(role="assistant", content=content))
+
+        background_analysis = self._session.is_completed() and self._analysis_queue is not None
+        if background_analysis:
+            self._session.request_analysis()
+
+        await asyncio.shield(self._persist(background_analysis))
+
+    async def _persist(self, background_analysis: bool) -> None:
+        await run_in_threadpool(self._save)
+        if background_analysis:
+            self._analysis_queue.enqueue(self._session.id)
+
+    def _save(self) -> None:
+        with self._repository_scope() as repository:
+            repository.save(self._session)
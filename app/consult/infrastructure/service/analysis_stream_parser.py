@@ -0,0 +1,91 @@
+import json
+
+
+class IncrementalJSONObjectParser:
+    """
+    스트리밍으로 들어오는 JSON 객체에서 완성된 최상위 필드를 순서대로 꺼내는 파서.
+
+    {"situation": "...", "traits": "...", ...} 형태의 응답을 조각 단위로 feed()하면,
+    값이 끝난 필드(쉼표 또는 닫는 중괄호를 만난 필드)를 (key, value)로 반환한다.
+    문자열/배열/객체 값 모두 지원하며, 필드 텍스트만 json.loads로 해석한다.
+    """
+
+    def __init__(self):
+        self._member: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        """최상위 객체가 닫혔는지 여부"""
+        return self._finished
+
+    def feed(self, chunk: str) -> list[tuple[str, object]]:
+        """
+        응답 조각을 추가하고 새로 완성된 필드 목록을 반환한다.
+
+        Raises:
+            ValueError: 완성된 필드가 올바른 JSON이 아닌 경우
+        """
+        completed: list[tuple[str, object]] = []
+        for char in chunk:
+            if self._finished:
+                break
+
+            if self._in_string:
+                self._member.append(char)
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if self._depth == 0:
+                # 최상위 객체 시작 전 (앞쪽 공백/코드 블록 표시 무시)
+                if char == "{":
+                    self._depth = 1
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._member.append(char)
+            elif char in "{[":
+                self._depth += 1
+                self._member.append(char)
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._finished = True
+                    self._flush(completed)
+                else:
+                    self._member.append(char)
+            elif char == "," and self._depth == 1:
+                self._flush(completed)
+            else:
+                self._member.append(char)
+        return completed
+
+    def close(self) -> None:
+        """
+        입력이 끝났음을 알린다.
+
+        Raises:
+            ValueError: 최상위 객체가 닫히지 않은 경우 (응답이 중간에 끊겨 마지막 필드를 잃음)
+        """
+        if not self._finished:
+            raise ValueError("분석 응답이 중간에 끊겼습니다")
+
+    def _flush(self, completed: list[tuple[str, object]]) -> None:
+        member = "".join(self._member).strip()
+        self._member = []
+        if not member:
+            return
+        try:
+            parsed = json.loads("{" + member + "}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"분석 응답 형식이 올바르지 않습니다: {e}")
+        completed.extend(parsed.items())
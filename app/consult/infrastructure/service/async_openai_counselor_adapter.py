@@ -0,0 +1,169 @@
+import logging
+from typing import AsyncIterator
+from openai import AsyncOpenAI
+
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.analysis import Analysis
+from app.consult.infrastructure.service.analysis_stream_parser import IncrementalJSONObjectParser
+from app.consult.infrastructure.service.conversation_context import ConversationContextWindow
+from app.consult.infrastructure.service.counselor_prompt_builder import (
+    MODEL,
+    CounselorPromptBuilder,
+)
+from app.shared.llm.gateway import (
+    OPERATION_ANALYSIS,
+    OPERATION_GREETING,
+    OPERATION_RESPONSE,
+    OPERATION_SUMMARY,
+    AsyncLLMGateway,
+)
+from app.shared.prompt_cache import record_prompt_usage
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOpenAICounselorAdapter(AsyncAICounselorPort):
+    """AsyncOpenAI를 사용하는 AI 상담사 구현체 (비동기)"""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        client: AsyncOpenAI | None = None,
+        context_window: ConversationContextWindow | None = None,
+        gateway: AsyncLLMGateway | None = None,
+    ):
+        # 재시도/마감 시간/서킷 브레이커는 게이트웨이가 맡는다
+        self._llm = gateway or AsyncLLMGateway(client or AsyncOpenAI(api_key=api_key, max_retries=0))
+        self._prompt = CounselorPromptBuilder()
+        self._context_window = context_window or ConversationContextWindow()
+
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        """사용자의 MBTI와 성별에 맞는 인사말을 생성한다"""
+        response = await self._llm.create(
+            OPERATION_GREETING,
+            model=MODEL,
+            messages=self._prompt.build_greeting_messages(mbti, gender),
+            temperature=0.7,
+            max_tokens=200
+        )
+        record_prompt_usage(response.usage)
+
+        return response.choices[0].message.content.strip()
+
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        """
+        사용자 메시지에 대한 AI 응답을 생성한다.
+        주의: session에 이미 user_message가 추가된 상태로 호출되어야 함
+        """
+        await self._refresh_history_summary(session)
+        response = await self._llm.create(
+            OPERATION_RESPONSE,
+            model=MODEL,
+            messages=self._prompt.build_messages(session),
+            temperature=0.7,
+            max_tokens=500
+        )
+        record_prompt_usage(response.usage)
+
+        return response.choices[0].message.content.strip()
+
+    async def generate_response_stream(
+        self, session: ConsultSession, user_message: str
+    ) -> AsyncIterator[str]:
+        """
+        사용자 메시지에 대한 AI 응답을 스트리밍 방식으로 생성한다.
+        주의: session에 이미 user_message가 추가된 상태로 호출되어야 함
+        """
+        await self._refresh_history_summary(session)
+        stream = await self._llm.create(
+            OPERATION_RESPONSE,
+            model=MODEL,
+            messages=self._prompt.build_messages(session),
+            temperature=0.7,
+            max_tokens=500,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+
+        # 소비자가 중간에 닫으면(aclose) 업스트림 HTTP 스트림도 바로 닫아 생성을 중단시킨다
+        async with stream:
+            async for chunk in stream:
+                # usage는 choices가 빈 마지막 청크로 온다
+                record_prompt_usage(chunk.usage)
+                if chunk.choices and chunk.choices[0].delta.content is not None:
+                    yield chunk.choices[0].delta.content
+
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        """상담 세션을 기반으로 MBTI 관계 분석을 생성한다"""
+        response = await self._llm.create(
+            OPERATION_ANALYSIS,
+            model=MODEL,
+            messages=self._prompt.build_analysis_messages(session),
+            temperature=0.7,
+            max_tokens=1500,
+            response_format={"type": "json_object"}
+        )
+        record_prompt_usage(response.usage)
+
+        return self._prompt.parse_analysis(response.choices[0].message.content)
+
+    async def generate_analysis_stream(
+        self, session: ConsultSession
+    ) -> AsyncIterator[tuple[str, str]]:
+        """
+        상담 분석을 스트리밍으로 생성하고, JSON 섹션이 완성될 때마다 반환한다.
+
+        응답이 JSON 객체가 닫히기 전에 끝나면(토큰 한도, 연결 끊김) 마지막 섹션을 버리지 않고
+        모든 섹션을 보낸 뒤 ValueError를 발생시킨다.
+        """
+        stream = await self._llm.create(
+            OPERATION_ANALYSIS,
+            model=MODEL,
+            messages=self._prompt.build_analysis_messages(session),
+            temperature=0.7,
+            max_tokens=1500,
+            response_format={"type": "json_object"},
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+
+        parser = IncrementalJSONObjectParser()
+        async with stream:
+            async for chunk in stream:
+                record_prompt_usage(chunk.usage)
+                if not chunk.choices or chunk.choices[0].delta.content is None:
+                    continue
+                for section, value in parser.feed(chunk.choices[0].delta.content):
+                    if section in Analysis.SECTIONS:
+                        yield section, self._prompt.format_section(value)
+        parser.close()
+
+    async def _refresh_history_summary(self, session: ConsultSession) -> None:
+        """
+        최근 턴 창 밖으로 밀려난 대화를 세션의 누적 요약에 반영한다.
+
+        새로 밀려난 턴과 이전 요약만 보내므로 요약 비용은 대화 길이와 무관하게 일정하다.
+        요약에 실패하면 요약하지 못한 대화를 원문 그대로 보낸다.
+        """
+        pending = self._context_window.pending_messages(session)
+        if not pending:
+            return
+
+        try:
+            response = await self._llm.create(
+                OPERATION_SUMMARY,
+                model=MODEL,
+                messages=self._prompt.build_summary_messages(session.get_history_summary(), pending),
+                temperature=0.3,
+                max_tokens=400
+            )
+            record_prompt_usage(response.usage)
+            summary = response.choices[0].message.content.strip()
+            session.update_history_summary(
+                summary, session.get_summarized_message_count() + len(pending)
+            )
+        except Exception as e:
+            logger.warning("대화 요약 갱신에 실패했습니다: %s (%s)", session.id, e)
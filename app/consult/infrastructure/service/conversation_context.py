@@ -0,0 +1,49 @@
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.shared.llm.token_estimate import MESSAGE_OVERHEAD_TOKENS, estimate_tokens
+
+
+class ConversationContextWindow:
+    """
+    프롬프트에 원문으로 보낼 대화 범위를 정한다.
+
+    최근 keep_turns개 턴은 원문 그대로 두고, 그보다 오래된 턴은 세션의 누적 요약으로 대체한다.
+    최근 턴만으로도 token_budget을 넘으면 가장 최근 턴이 남을 때까지 오래된 턴부터 요약으로 넘긴다.
+    따라서 턴 수가 keep_turns 이하여도 메시지가 길면 요약이 생긴다.
+    """
+
+    DEFAULT_KEEP_TURNS = 5
+    DEFAULT_TOKEN_BUDGET = 3000
+
+    def __init__(self, keep_turns: int | None = None, token_budget: int | None = None):
+        self._keep_turns = keep_turns if keep_turns is not None else self.DEFAULT_KEEP_TURNS
+        self._token_budget = token_budget if token_budget is not None else self.DEFAULT_TOKEN_BUDGET
+        if self._keep_turns < 1:
+            raise ValueError("keep_turns는 1 이상이어야 합니다")
+
+    def window_start(self, session: ConsultSession) -> int:
+        """원문으로 보낼 첫 메시지의 위치를 반환한다 (항상 사용자 턴의 시작)"""
+        messages = session.get_messages()
+        turn_starts = [i for i, msg in enumerate(messages) if msg.role == "user"]
+        if len(turn_starts) <= 1:
+            return 0
+
+        # 인사말 등 첫 사용자 메시지 앞부분은 첫 턴에 포함한다
+        candidates = [0] + turn_starts[1:]
+        start_index = max(len(candidates) - self._keep_turns, 0)
+        # 토큰 예산을 넘으면 가장 최근 턴만 남을 때까지 한 턴씩 줄인다
+        while (
+            start_index < len(candidates) - 1
+            and self._tokens(messages[candidates[start_index]:]) > self._token_budget
+        ):
+            start_index += 1
+        return candidates[start_index]
+
+    def pending_messages(self, session: ConsultSession) -> list[Message]:
+        """창 밖으로 밀려났지만 아직 누적 요약에 반영되지 않은 메시지를 반환한다"""
+        start = self.window_start(session)
+        summarized = session.get_summarized_message_count()
+        return session.get_messages()[summarized:start] if start > summarized else []
+
+    def _tokens(self, messages: list[Message]) -> int:
+        return sum(estimate_tokens(msg.content) + MESSAGE_OVERHEAD_TOKENS for msg in messages)
@@ -1,170 +1,28 @@
 import json
-from typing import Iterator
-from openai import OpenAI
+from itertools import product
 
-from app.consult.application.port.ai_counselor_port import AICounselorPort
 from app.consult.domain.consult_session import ConsultSession
 from app.consult.domain.analysis import Analysis
+from app.consult.domain.message import Message
 from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
 
+MODEL = "gpt-4o-mini"
 
-class OpenAICounselorAdapter(AICounselorPort):
-    """OpenAI API를 사용하는 AI 상담사 구현체"""
+GREETING_SYSTEM_PROMPT = "당신은 10년 경력의 MBTI 전문 상담사입니다. 따뜻하고 공감적이며, 각 MBTI 유형의 특성을 깊이 이해하고 있습니다."
 
-    def __init__(self, api_key: str):
-        self._client = OpenAI(api_key=api_key)
+ANALYSIS_SYSTEM_PROMPT = "당신은 10년 경력의 MBTI 전문 상담사입니다. 대화 내용을 분석하여 MBTI 기반 관계 조언을 제공합니다. 반드시 JSON 형식으로만 응답하세요."
 
-    def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
-        """
-        사용자의 MBTI와 성별에 맞는 인사말을 생성한다.
-
-        MBTI 특성을 반영하여:
-        - E/I: 외향적/내향적 톤 조절
-        - S/N: 구체적/추상적 표현 선택
-        - T/F: 논리적/감정적 접근
-        - J/P: 체계적/유연한 대화 방식
-        """
-        prompt = self._build_greeting_prompt(mbti, gender)
-
-        response = self._client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 10년 경력의 MBTI 전문 상담사입니다. 따뜻하고 공감적이며, 각 MBTI 유형의 특성을 깊이 이해하고 있습니다."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.7,
-            max_tokens=200
-        )
-
-        return response.choices[0].message.content.strip()
-
-    def _build_greeting_prompt(self, mbti: MBTI, gender: Gender) -> str:
-        """MBTI 특성을 반영한 인사말 생성 프롬프트"""
-
-        # MBTI 차원별 특성 분석
-        ei = mbti.energy        # E 또는 I
-        sn = mbti.information   # S 또는 N
-        tf = mbti.decision      # T 또는 F
-        jp = mbti.lifestyle     # J 또는 P
-
-        # 차원별 가이드라인
-        ei_guide = {
-            "E": "활발하고 친근하게, 에너지 넘치는 톤으로",
-            "I": "차분하고 부드럽게, 편안한 분위기를 만드는 톤으로"
-        }
-
-        sn_guide = {
-            "S": "구체적이고 실용적인 표현을 사용하여",
-            "N": "개방적이고 가능성에 초점을 맞춘 표현을 사용하여"
-        }
-
-        tf_guide = {
-            "T": "논리적이고 명확하게, 문제 해결 지향적으로",
-            "F": "공감적이고 따뜻하게, 감정을 이해하는 태도로"
-        }
-
-        jp_guide = {
-            "J": "체계적이고 목표 지향적인 대화를 시작하며",
-            "P": "유연하고 탐색적인 대화를 시작하며"
-        }
-
-        return f"""사용자가 MBTI 관계 상담을 시작해.
-
-사용자 정보:
-- MBTI: {mbti.value}
-- 성별: {gender.value}
-
-첫 인사말을 생성해줘.
-
-MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
-- E/I ({ei}): {ei_guide[ei]}
-- S/N ({sn}): {sn_guide[sn]}
-- T/F ({tf}): {tf_guide[tf]}
-- J/P ({jp}): {jp_guide[jp]}
-
-요구사항:
-1. 2-3문장으로 자연스럽게
-2. MBTI 특성 칭찬 금지 (어색함)
-3. 관계 고민 + 상대방 MBTI를 함께 물어보기
-4. 이모지 사용 금지
-5. 반말만 사용 (친구처럼 편하게)
-
-좋은 예시:
-- "안녕! 나는 MBTI 전문 상담사야. 무슨 관계 고민이 있어? 고민 상대의 MBTI도 알면 말해줘!"
-- "반가워! 오늘 어떤 관계 이야기야? 상대방 MBTI 알아?"
-
-나쁜 예시 (금지):
-- "INTJ인 너의 논리적인 사고방식이 멋져!" (과한 칭찬, 어색함)
-- "무슨 고민이야?" (상대방 MBTI 안 물어봄)
-
-인사말:"""
+MAX_TURNS = 5
 
-    def generate_response(self, session: ConsultSession, user_message: str) -> str:
-        """
-        사용자 메시지에 대한 AI 응답을 생성한다.
-        주의: session에 이미 user_message가 추가된 상태로 호출되어야 함
-        """
-        messages = self._build_messages(session)
-        # session.get_messages()에 이미 user_message가 포함되어 있으므로 추가하지 않음
-
-        response = self._client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            temperature=0.7,
-            max_tokens=500
-        )
+SUMMARY_SYSTEM_PROMPT = "당신은 상담 기록을 정리하는 보조자입니다. 이전 요약과 새 대화를 합쳐 하나의 요약으로 갱신합니다."
 
-        return response.choices[0].message.content.strip()
+# 누적 요약 최대 길이(글자 수) 안내값
+SUMMARY_MAX_CHARS = 600
 
-    def generate_response_stream(self, session: ConsultSession, user_message: str) -> Iterator[str]:
-        """
-        사용자 메시지에 대한 AI 응답을 스트리밍 방식으로 생성한다.
-        주의: session에 이미 user_message가 추가된 상태로 호출되어야 함
-        """
-        messages = self._build_messages(session)
-        # session.get_messages()에 이미 user_message가 포함되어 있으므로 추가하지 않음
-
-        stream = self._client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            temperature=0.7,
-            max_tokens=500,
-            stream=True
-        )
-
-        for chunk in stream:
-            if chunk.choices[0].delta.content is not None:
-                yield chunk.choices[0].delta.content
-
-    def _build_messages(self, session: ConsultSession) -> list[dict]:
-        """대화 히스토리를 기반으로 OpenAI 메시지 형식을 생성한다"""
-        turn_count = session.get_user_turn_count()
-
-        # 턴 수에 따른 상담 전략
-        strategy_guide = self._get_strategy_by_turn(turn_count)
-
-        # T/F 차원에 따른 대화 스타일
-        tf_style = self._get_tf_style(session.mbti)
-
-        messages = [
-            {
-                "role": "system",
-                "content": f"""당신은 10년 경력의 MBTI 전문 상담사입니다. 따뜻하고 공감적이며, 각 MBTI 유형의 특성을 깊이 이해하고 있습니다.
-
-사용자 정보:
-- MBTI: {session.mbti.value}
-- 성별: {session.gender.value}
-
-⚠️ 현재 {turn_count}턴 / 총 5턴 ({"마지막 턴 - 반드시 마무리만!" if turn_count >= 5 else f"남은 턴: {5 - turn_count}"})
-
-{tf_style}
+# 모든 상담 요청에 공통인 시스템 프롬프트 앞부분.
+# 업스트림 프롬프트 캐시는 앞부분이 같은 요청끼리 적중하므로 변하지 않는 내용을 가장 앞에 둔다.
+COUNSEL_SYSTEM_PREFIX = """당신은 10년 경력의 MBTI 전문 상담사입니다. 따뜻하고 공감적이며, 각 MBTI 유형의 특성을 깊이 이해하고 있습니다.
 
 상담 원칙:
 1. 턴 1-4에서는 MBTI 분석/설명 절대 금지! 오직 질문으로 정보 수집만
@@ -173,8 +31,6 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
 4. 2-3문장으로 간결하게 응답하기
 5. 반말만 사용 (존댓말 금지)
 
-{strategy_guide}
-
 금지사항:
 - MBTI 특성 설명하기 (예: "INFJ는 감정이 풍부해서...", "그건 ENTP의 특성이야")
 - "더 자세히 말해줄 수 있어?" 같은 일반적인 질문 반복
@@ -182,22 +38,10 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
 - 너무 긴 응답 (2-3문장 준수)
 - 조언이나 해결책 제시 (분석 결과에서만 제공)
 """
-            }
-        ]
 
-        # 대화 히스토리 추가
-        for msg in session.get_messages():
-            messages.append({
-                "role": msg.role,
-                "content": msg.content
-            })
-
-        return messages
-
-    def _get_tf_style(self, mbti: MBTI) -> str:
-        """T/F 차원에 따른 대화 스타일 가이드"""
-        if mbti.decision == "T":
-            return """🎯 이 사용자는 T(사고형)입니다. 대화 스타일:
+# T/F 차원에 따른 대화 스타일
+TF_STYLES = {
+    "T": """🎯 이 사용자는 T(사고형)입니다. 대화 스타일:
 - 핵심을 빠르게 파악하는 질문 선호 (예: '정확히 어떤 상황이었어?', '그래서 뭐가 문제야?')
 - 감정보다 상황/원인 분석에 초점
 - 간결하고 직접적인 톤 사용
@@ -207,9 +51,8 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
 예시 응답:
 - 상황 파악됐어. 그래서 그 사람은 뭐라고 했어?
 - 그랬구나. 그때 너는 어떻게 대응했어?
-- 음, 그 전에 비슷한 일 있었어?"""
-        else:
-            return """💚 이 사용자는 F(감정형)입니다. 대화 스타일:
+- 음, 그 전에 비슷한 일 있었어?""",
+    "F": """💚 이 사용자는 F(감정형)입니다. 대화 스타일:
 - 감정을 먼저 알아주고 공감하기 (예: '그거 진짜 속상했겠다', '많이 힘들었겠네')
 - 상황보다 느낌/감정에 초점을 맞춘 질문
 - 따뜻하고 부드러운 톤 사용
@@ -219,12 +62,12 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
 예시 응답:
 - 아 그거 진짜 서운했겠다... 그때 어떤 기분이었어?
 - 힘들었겠네. 그 순간 어떤 생각이 들었어?
-- 그랬구나, 속상했겠다. 그 친구한테 어떤 마음이 들어?"""
+- 그랬구나, 속상했겠다. 그 친구한테 어떤 마음이 들어?""",
+}
 
-    def _get_strategy_by_turn(self, turn_count: int) -> str:
-        """턴 수에 따른 상담 전략 가이드 (turn_count는 1부터 시작)"""
-        strategies = {
-            1: """[1턴 - 상황 & 상대방 파악]
+# 턴 수에 따른 상담 전략 (turn_count는 1부터 시작)
+TURN_STRATEGIES = {
+    1: """[1턴 - 상황 & 상대방 파악]
 🎯 목표: 고민의 핵심 인물, 관계, 상대방 MBTI 파악
 
 ⚠️ 먼저 확인: 사용자가 이미 제공한 정보를 꼼꼼히 읽어!
@@ -242,7 +85,7 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
 ❌ 금지: 사용자가 이미 말한 정보를 다시 묻기
 ✅ 필수: 빠진 정보만 자연스럽게 파악
 """,
-            2: """[2턴 - 상대방 탐색]
+    2: """[2턴 - 상대방 탐색]
 🎯 목표: 상대방의 행동/성격/반응 파악
 📌 반드시 물어볼 것 (택1):
 - "그 사람은 평소에 어떤 성격이야?"
@@ -253,7 +96,7 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
 ❌ 금지: 사용자 감정만 계속 묻기
 ✅ 필수: 상대방에 대한 정보 수집
 """,
-            3: """[3턴 - 패턴 분석]
+    3: """[3턴 - 패턴 분석]
 🎯 목표: 반복되는 문제 패턴 발견
 📌 반드시 물어볼 것 (택1):
 - "비슷한 상황이 전에도 있었어?"
@@ -264,7 +107,7 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
 ❌ 금지: 이미 들은 내용 다시 묻기
 ✅ 필수: 과거 경험이나 행동 패턴 탐색
 """,
-            4: """[4턴 - 욕구 파악]
+    4: """[4턴 - 욕구 파악]
 🎯 목표: 사용자가 진짜 원하는 것 파악
 📌 반드시 물어볼 것 (택1):
 - "이 관계에서 가장 바라는 게 뭐야?"
@@ -275,7 +118,7 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
 ❌ 금지: 해결책 바로 제시
 ✅ 필수: 사용자의 니즈/욕구 명확히 하기
 """,
-            5: """[5턴 - 마무리]
+    5: """[5턴 - 마무리]
 🎯 목표: 상담 마무리 및 프리미엄 안내
 📌 필수 포함 내용:
 1. 짧은 마무리 인사 (1문장: "오늘 상담은 여기까지야!")
@@ -289,50 +132,211 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
 
 ✅ 필수: 3문장 이내로 간결하게 마무리만
 """
+}
+
+
+def _render_system_prompt(mbti: str, gender: str) -> str:
+    """상담 시스템 프롬프트를 생성한다 (공통 → T/F → 사용자 정보, 세션 내내 바뀌지 않는 내용만)"""
+    return f"""{COUNSEL_SYSTEM_PREFIX}
+{TF_STYLES[mbti[2]]}
+
+사용자 정보:
+- MBTI: {mbti}
+- 성별: {gender}"""
+
+
+def _render_turn_guidance(turn_count: int) -> str:
+    """턴마다 바뀌는 진행 상황/상담 전략 안내를 생성한다 (대화 히스토리 뒤에 붙는다)"""
+    remaining = "마지막 턴 - 반드시 마무리만!" if turn_count >= MAX_TURNS else f"남은 턴: {MAX_TURNS - turn_count}"
+    strategy = TURN_STRATEGIES.get(turn_count, TURN_STRATEGIES[MAX_TURNS])
+    return f"""⚠️ 현재 {turn_count}턴 / 총 {MAX_TURNS}턴 ({remaining})
+
+{strategy}"""
+
+
+def _build_system_prompt_table() -> dict[tuple[str, str], str]:
+    """(MBTI, 성별) 모든 조합의 시스템 프롬프트를 미리 생성한다 (16 x 2)"""
+    mbti_values = ["".join(dims) for dims in product("EI", "SN", "TF", "JP")]
+    return {
+        (mbti, gender): _render_system_prompt(mbti, gender)
+        for mbti in mbti_values
+        for gender in ("MALE", "FEMALE")
+    }
+
+
+_SYSTEM_PROMPT_TABLE = _build_system_prompt_table()
+_TURN_GUIDANCE_TABLE = {turn: _render_turn_guidance(turn) for turn in range(MAX_TURNS + 1)}
+
+
+def get_system_prompt(mbti: MBTI, gender: Gender) -> str:
+    """미리 생성된 상담 시스템 프롬프트를 반환한다
+
+    같은 조합은 항상 같은 문자열 객체를 반환하므로 요청마다 프롬프트를 다시 만들지 않는다.
+    """
+    return _SYSTEM_PROMPT_TABLE[(mbti.value, gender.value)]
+
+
+def get_turn_guidance(turn_count: int) -> str:
+    """미리 생성된 턴 안내를 반환한다 (5턴 이후는 마지막 턴 안내)"""
+    return _TURN_GUIDANCE_TABLE[min(max(turn_count, 0), MAX_TURNS)]
+
+
+class CounselorPromptBuilder:
+    """AI 상담사 프롬프트 생성기 (동기/비동기 어댑터 공용)"""
+
+    def build_greeting_messages(self, mbti: MBTI, gender: Gender) -> list[dict]:
+        """인사말 생성용 OpenAI 메시지를 생성한다"""
+        return [
+            {"role": "system", "content": GREETING_SYSTEM_PROMPT},
+            {"role": "user", "content": self.build_greeting_prompt(mbti, gender)},
+        ]
+
+    def build_analysis_messages(self, session: ConsultSession) -> list[dict]:
+        """분석 생성용 OpenAI 메시지를 생성한다"""
+        return [
+            {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+            {"role": "user", "content": self.build_analysis_prompt(session)},
+        ]
+
+    def parse_analysis(self, content: str) -> Analysis:
+        """분석 JSON 응답을 Analysis 도메인으로 변환한다"""
+        result = json.loads(content)
+
+        return Analysis(
+            situation=self.format_section(result["situation"]),
+            traits=self.format_section(result["traits"]),
+            solutions=self.format_section(result["solutions"]),
+            cautions=self.format_section(result["cautions"]),
+            compatibility=self.format_section(result.get("compatibility", "")),
+            scripts=self.format_section(result.get("scripts", "")),
+        )
+
+    def format_section(self, value) -> str:
+        """분석 섹션 값을 문자열로 변환한다 (OpenAI가 list로 반환할 경우 번호 목록으로)"""
+        if isinstance(value, list):
+            return "\n".join(f"{i+1}. {item}" for i, item in enumerate(value))
+        return value
+
+    def build_greeting_prompt(self, mbti: MBTI, gender: Gender) -> str:
+        """MBTI 특성을 반영한 인사말 생성 프롬프트"""
+
+        # MBTI 차원별 특성 분석
+        ei = mbti.energy        # E 또는 I
+        sn = mbti.information   # S 또는 N
+        tf = mbti.decision      # T 또는 F
+        jp = mbti.lifestyle     # J 또는 P
+
+        # 차원별 가이드라인
+        ei_guide = {
+            "E": "활발하고 친근하게, 에너지 넘치는 톤으로",
+            "I": "차분하고 부드럽게, 편안한 분위기를 만드는 톤으로"
         }
-        return strategies.get(turn_count, strategies[5])
 
-    def generate_analysis(self, session: ConsultSession) -> Analysis:
+        sn_guide = {
+            "S": "구체적이고 실용적인 표현을 사용하여",
+            "N": "개방적이고 가능성에 초점을 맞춘 표현을 사용하여"
+        }
+
+        tf_guide = {
+            "T": "논리적이고 명확하게, 문제 해결 지향적으로",
+            "F": "공감적이고 따뜻하게, 감정을 이해하는 태도로"
+        }
+
+        jp_guide = {
+            "J": "체계적이고 목표 지향적인 대화를 시작하며",
+            "P": "유연하고 탐색적인 대화를 시작하며"
+        }
+
+        return f"""사용자가 MBTI 관계 상담을 시작해.
+
+사용자 정보:
+- MBTI: {mbti.value}
+- 성별: {gender.value}
+
+첫 인사말을 생성해줘.
+
+MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
+- E/I ({ei}): {ei_guide[ei]}
+- S/N ({sn}): {sn_guide[sn]}
+- T/F ({tf}): {tf_guide[tf]}
+- J/P ({jp}): {jp_guide[jp]}
+
+요구사항:
+1. 2-3문장으로 자연스럽게
+2. MBTI 특성 칭찬 금지 (어색함)
+3. 관계 고민 + 상대방 MBTI를 함께 물어보기
+4. 이모지 사용 금지
+5. 반말만 사용 (친구처럼 편하게)
+
+좋은 예시:
+- "안녕! 나는 MBTI 전문 상담사야. 무슨 관계 고민이 있어? 고민 상대의 MBTI도 알면 말해줘!"
+- "반가워! 오늘 어떤 관계 이야기야? 상대방 MBTI 알아?"
+
+나쁜 예시 (금지):
+- "INTJ인 너의 논리적인 사고방식이 멋져!" (과한 칭찬, 어색함)
+- "무슨 고민이야?" (상대방 MBTI 안 물어봄)
+
+인사말:"""
+
+    def build_messages(self, session: ConsultSession) -> list[dict]:
         """
-        상담 세션을 기반으로 MBTI 관계 분석을 생성한다.
+        대화 히스토리를 기반으로 OpenAI 메시지 형식을 생성한다.
+
+        업스트림 프롬프트 캐시가 적중하도록 앞에서부터 바이트 단위로 같은 순서로 쌓는다.
+        세션 내내 같은 시스템 프롬프트 → 누적 요약 → 대화 히스토리(턴마다 뒤에만 추가) 순으로 두고,
+        턴마다 바뀌는 진행 상황/전략은 마지막 시스템 메시지로 붙인다.
         """
-        prompt = self._build_analysis_prompt(session)
-
-        response = self._client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 10년 경력의 MBTI 전문 상담사입니다. 대화 내용을 분석하여 MBTI 기반 관계 조언을 제공합니다. 반드시 JSON 형식으로만 응답하세요."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.7,
-            max_tokens=1500,
-            response_format={"type": "json_object"}
-        )
+        messages = [
+            {
+                "role": "system",
+                "content": get_system_prompt(session.mbti, session.gender),
+            }
+        ]
 
-        result = json.loads(response.choices[0].message.content)
+        # 오래된 대화는 누적 요약으로 대체한다
+        summary = session.get_history_summary()
+        if summary:
+            messages.append({
+                "role": "system",
+                "content": f"지금까지의 대화 요약:\n{summary}",
+            })
 
-        # OpenAI가 list로 반환할 경우 string으로 변환
-        def to_string(value):
-            if isinstance(value, list):
-                return "\n".join(f"{i+1}. {item}" for i, item in enumerate(value))
-            return value
+        # 요약에 반영되지 않은 대화 히스토리만 원문으로 추가
+        for msg in session.get_unsummarized_messages():
+            messages.append({
+                "role": msg.role,
+                "content": msg.content
+            })
 
-        return Analysis(
-            situation=to_string(result["situation"]),
-            traits=to_string(result["traits"]),
-            solutions=to_string(result["solutions"]),
-            cautions=to_string(result["cautions"]),
-            compatibility=to_string(result.get("compatibility", "")),
-            scripts=to_string(result.get("scripts", "")),
+        # 턴마다 바뀌는 안내는 맨 뒤에 둔다
+        messages.append({
+            "role": "system",
+            "content": get_turn_guidance(session.get_user_turn_count()),
+        })
+
+        return messages
+
+    def build_summary_messages(self, previous_summary: str | None, messages: list[Message]) -> list[dict]:
+        """이전 요약에 새로 밀려난 대화를 합쳐 누적 요약을 갱신하는 OpenAI 메시지를 생성한다"""
+        conversation = "\n".join(
+            f"{'사용자' if msg.role == 'user' else 'AI'}: {msg.content}" for msg in messages
         )
+        return [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": f"""이전 요약:
+{previous_summary or "(없음)"}
+
+새 대화:
+{conversation}
+
+이전 요약과 새 대화를 합쳐 {SUMMARY_MAX_CHARS}자 이내로 요약해줘.
+사용자의 고민, 관계 상대, 구체적인 사건과 감정, 이미 나온 조언을 빠짐없이 남기고 요약문만 출력해.""",
+            },
+        ]
 
-    def _build_analysis_prompt(self, session: ConsultSession) -> str:
+    def build_analysis_prompt(self, session: ConsultSession) -> str:
         """분석을 위한 프롬프트 생성"""
         conversation = "\n".join([
             f"{'사용자' if msg.role == 'user' else 'AI'}: {msg.content}"
@@ -364,4 +368,4 @@ MBTI 특성 고려사항 (톤 조절용, 내용에 직접 언급하지 마):
     "solutions": "관계 개선 솔루션 (구체적이고 실천 가능한 행동 조언 3가지. 각 조언은 2문장 이상으로 '이렇게 해봐', '~하는 게 좋겠어' 같은 친근한 톤으로)",
     "scripts": "대화 스크립트 (이 상황에서 상대방에게 실제로 할 수 있는 말 3가지. 각각 따옴표로 감싸서 실제 대화처럼. 예: '나 요즘 네가 연락 안 하면 좀 서운해. 바쁜 건 알지만...')",
     "cautions": "주의사항 ({session.mbti.value} 유형이 이 상황에서 특히 조심해야 할 점 2가지. 각 항목은 2문장 이상으로 구체적인 상황 예시와 함께)"
-}}"""
\ No newline at end of file
+}}"""
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import random
+from functools import partial
+from itertools import product
+from typing import AsyncIterator, Callable
+
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.analysis import Analysis
+from app.consult.domain.consult_session import ConsultSession
+from app.shared.tracing import untraced_context
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+
+logger = logging.getLogger(__name__)
+
+ALL_MBTI_VALUES = ["".join(dims) for dims in product("EI", "SN", "TF", "JP")]
+ALL_GENDER_VALUES = ["MALE", "FEMALE"]
+
+
+class GreetingPoolCounselor(AsyncAICounselorPort):
+    """
+    인사말 풀을 사용하는 AI 상담사 데코레이터.
+
+    인사말의 입력은 (MBTI, 성별) 32가지뿐이므로 조합마다 pool_size개의 인사말을 미리 생성해 두고,
+    /consult/start에서는 풀에서 무작위로 하나를 꺼내 LLM 호출 없이 반환한다.
+    꺼낸 만큼은 백그라운드에서 다시 채우며, 풀이 비어 있으면 기존처럼 직접 생성한다.
+    인사말 외의 기능은 감싼 상담사에 그대로 위임한다.
+    """
+
+    DEFAULT_POOL_SIZE = 3
+    DEFAULT_CONCURRENCY = 8
+
+    def __init__(
+        self,
+        counselor: AsyncAICounselorPort,
+        pool_size: int | None = None,
+        concurrency: int | None = None,
+        choice: Callable[[list], object] = random.choice,
+    ):
+        self._counselor = counselor
+        self._pool_size = pool_size if pool_size is not None else self.DEFAULT_POOL_SIZE
+        self._concurrency = concurrency if concurrency is not None else self.DEFAULT_CONCURRENCY
+        self._choice = choice
+        self._pool: dict[tuple[str, str], list[str]] = {}
+        self._refilling: dict[tuple[str, str], asyncio.Task] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+        self.hits = 0
+        self.misses = 0
+
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        """풀에서 인사말을 꺼내 반환한다 (비어 있으면 직접 생성)"""
+        key = (mbti.value, gender.value)
+        greetings = self._pool.get(key)
+        if greetings:
+            greeting = self._choice(greetings)
+            greetings.remove(greeting)
+            self.hits += 1
+            self._schedule_refill(key)
+            return greeting
+
+        self.misses += 1
+        self._schedule_refill(key)
+        return await self._counselor.generate_greeting(mbti, gender)
+
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        return await self._counselor.generate_response(session, user_message)
+
+    def generate_response_stream(
+        self, session: ConsultSession, user_message: str
+    ) -> AsyncIterator[str]:
+        return self._counselor.generate_response_stream(session, user_message)
+
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        return await self._counselor.generate_analysis(session)
+
+    def generate_analysis_stream(
+        self, session: ConsultSession
+    ) -> AsyncIterator[tuple[str, str]]:
+        return self._counselor.generate_analysis_stream(session)
+
+    async def warm_up(self) -> None:
+        """모든 (MBTI, 성별) 조합의 풀을 채운다 (애플리케이션 시작 시 백그라운드 실행)"""
+        keys = list(product(ALL_MBTI_VALUES, ALL_GENDER_VALUES))
+        for key in keys:
+            self._schedule_refill(key)
+        await asyncio.gather(*self._refilling.values(), return_exceptions=True)
+        logger.info("인사말 풀 준비 완료: %d개 조합", len(keys))
+
+    async def close(self) -> None:
+        """진행 중인 보충 작업을 취소한다 (애플리케이션 종료 시)"""
+        tasks = list(self._refilling.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refilling.clear()
+
+    def size(self, mbti: MBTI, gender: Gender) -> int:
+        """(MBTI, 성별) 조합의 남은 인사말 수"""
+        return len(self._pool.get((mbti.value, gender.value), []))
+
+    def _schedule_refill(self, key: tuple[str, str]) -> None:
+        """조합별로 하나의 보충 작업만 실행한다"""
+        task = self._refilling.get(key)
+        if task is not None and not task.done():
+            return
+        # 인사말을 꺼낸 요청의 Trace와 분리해 실행한다 (응답 뒤에 끝나는 작업)
+        task = asyncio.create_task(self._refill(key), context=untraced_context())
+        self._refilling[key] = task
+        task.add_done_callback(partial(self._on_refill_done, key))
+
+    def _on_refill_done(self, key: tuple[str, str], task: asyncio.Task) -> None:
+        if self._refilling.get(key) is task:
+            del self._refilling[key]
+
+    async def _refill(self, key: tuple[str, str]) -> None:
+        """풀이 pool_size가 될 때까지 인사말을 생성한다 (실패 시 다음 요청에서 재시도)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+
+        mbti, gender = MBTI(key[0]), Gender(key[1])
+        greetings = self._pool.setdefault(key, [])
+        while len(greetings) < self._pool_size:
+            try:
+                async with self._semaphore:
+                    greeting = await self._counselor.generate_greeting(mbti, gender)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("인사말 풀 보충 실패: %s/%s", key[0], key[1])
+                return
+            greetings.append(greeting)
@@ -1,6 +1,9 @@
 """Converter Router"""
 
-from fastapi import APIRouter, status
+from functools import lru_cache
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from app.converter.adapter.input.web.request.convert_request import ConvertRequest
 from app.converter.adapter.input.web.request.convert_three_tones_request import (
@@ -10,17 +13,74 @@ from app.converter.adapter.input.web.response.convert_response import ConvertRes
 from app.converter.adapter.input.web.response.convert_three_tones_response import (
     ConvertThreeTonesResponse,
 )
+from app.converter.application.port.message_converter_port import MessageConverterPort
 from app.converter.application.use_case.convert_message_use_case import (
     ConvertMessageUseCase,
 )
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.cache.tone_conversion_cache import ToneConversionCache
+from app.converter.infrastructure.repository.sql_tone_conversion_store import (
+    SqlToneConversionStore,
+)
+from app.converter.infrastructure.service.cached_message_converter import (
+    CachedMessageConverter,
+)
 from app.converter.infrastructure.service.openai_message_converter import (
+    PROMPT_VERSION,
     OpenAIMessageConverter,
 )
 from app.shared.vo.mbti import MBTI
+from config.database import SessionLocal
+from config.openai_client import get_llm_gateway
+from config.settings import get_settings
 
 converter_router = APIRouter()
 
 
+@lru_cache()
+def get_tone_conversion_cache() -> ToneConversionCache:
+    """프로세스 전역 톤 변환 인메모리 캐시"""
+    settings = get_settings()
+    return ToneConversionCache(
+        max_size=settings.CONVERTER_CACHE_MAX_SIZE,
+        ttl_seconds=settings.CONVERTER_CACHE_TTL_SECONDS,
+    )
+
+
+def get_tone_conversion_store() -> SqlToneConversionStore | None:
+    """톤 변환 영속 캐시 저장소 (영속 캐시를 쓰지 않으면 None)"""
+    settings = get_settings()
+    if not (settings.CONVERTER_CACHE_ENABLED and settings.CONVERTER_CACHE_PERSISTENT):
+        return None
+    return SqlToneConversionStore(
+        SessionLocal, ttl_seconds=settings.CONVERTER_CACHE_PERSISTENT_TTL_SECONDS
+    )
+
+
+def get_message_converter() -> MessageConverterPort:
+    """프로세스 전역 OpenAI 클라이언트(LLM 게이트웨이)를 공유하는 MessageConverter (설정 시 결과 캐시 적용)"""
+    converter = OpenAIMessageConverter(gateway=get_llm_gateway())
+    if not get_settings().CONVERTER_CACHE_ENABLED:
+        return converter
+
+    return CachedMessageConverter(
+        converter,
+        cache=get_tone_conversion_cache(),
+        prompt_version=PROMPT_VERSION,
+        store=get_tone_conversion_store(),
+    )
+
+
+def _cache_status(tone_messages: List[ToneMessage]) -> str:
+    """X-Cache 헤더 값 (HIT: 전부 캐시, PARTIAL: 일부 캐시, MISS: 캐시 없음)"""
+    cached_count = sum(1 for tm in tone_messages if tm.cached)
+    if tone_messages and cached_count == len(tone_messages):
+        return "HIT"
+    if cached_count:
+        return "PARTIAL"
+    return "MISS"
+
+
 @converter_router.post(
     "/convert",
     response_model=ConvertResponse,
@@ -28,18 +88,21 @@ converter_router = APIRouter()
     summary="메시지 변환",
     description="원본 메시지를 특정 톤으로 변환합니다 (MBTI 기반)",
 )
-def convert_message(request: ConvertRequest) -> ConvertResponse:
+def convert_message(
+    request: ConvertRequest,
+    response: Response,
+    converter: MessageConverterPort = Depends(get_message_converter),
+) -> ConvertResponse:
     """메시지를 특정 톤으로 변환
 
     Args:
         request: 변환 요청 (원본 메시지, MBTI, 톤)
+        response: 캐시 적중 여부(X-Cache 헤더)를 설정할 응답
+        converter: 공유 클라이언트 기반 MessageConverter
 
     Returns:
         ConvertResponse: 변환된 메시지
     """
-    # MessageConverter 인스턴스 생성
-    converter = OpenAIMessageConverter()
-
     # MBTI 값 객체 생성
     sender_mbti = MBTI(request.sender_mbti)
     receiver_mbti = MBTI(request.receiver_mbti)
@@ -52,6 +115,8 @@ def convert_message(request: ConvertRequest) -> ConvertResponse:
         tone=request.tone,
     )
 
+    response.headers["X-Cache"] = _cache_status([tone_message])
+
     # 응답 DTO로 변환
     return ConvertResponse.from_domain(tone_message)
 
@@ -65,31 +130,42 @@ def convert_message(request: ConvertRequest) -> ConvertResponse:
 )
 def convert_message_three_tones(
     request: ConvertThreeTonesRequest,
+    response: Response,
+    converter: MessageConverterPort = Depends(get_message_converter),
 ) -> ConvertThreeTonesResponse:
     """메시지를 3가지 톤으로 변환
 
     Args:
         request: 변환 요청 (원본 메시지, MBTI)
+        response: 캐시 적중 여부(X-Cache 헤더)를 설정할 응답
+        converter: 공유 클라이언트 기반 MessageConverter
 
     Returns:
         ConvertThreeTonesResponse: 3가지 톤으로 변환된 메시지
     """
-    # MessageConverter 인스턴스 생성
-    converter = OpenAIMessageConverter()
-
     # UseCase 생성
-    use_case = ConvertMessageUseCase(converter=converter)
+    use_case = ConvertMessageUseCase(
+        converter=converter, batch_mode=get_settings().CONVERTER_BATCH_MODE
+    )
 
     # MBTI 값 객체 생성
     sender_mbti = MBTI(request.sender_mbti)
     receiver_mbti = MBTI(request.receiver_mbti)
 
-    # 3가지 톤으로 변환
-    tone_messages = use_case.execute(
-        original_message=request.original_message,
-        sender_mbti=sender_mbti,
-        receiver_mbti=receiver_mbti,
-    )
+    # 3가지 톤으로 변환 (일부 톤 실패 시 성공한 톤만 반환)
+    try:
+        tone_messages = use_case.execute(
+            original_message=request.original_message,
+            sender_mbti=sender_mbti,
+            receiver_mbti=receiver_mbti,
+        )
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=str(e),
+        )
+
+    response.headers["X-Cache"] = _cache_status(tone_messages)
 
     # 응답 DTO로 변환
     return ConvertThreeTonesResponse.from_domain(tone_messages)
@@ -1,6 +1,7 @@
 """MessageConverterPort 인터페이스"""
 
 from abc import ABC, abstractmethod
+from typing import List
 
 from app.converter.domain.tone_message import ToneMessage
 from app.shared.vo.mbti import MBTI
@@ -32,3 +33,35 @@ class MessageConverterPort(ABC):
             ToneMessage: 변환된 메시지
         """
         pass
+
+    def convert_batch(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> List[ToneMessage]:
+        """메시지를 여러 톤으로 한 번에 변환
+
+        기본 구현은 톤마다 convert를 호출합니다.
+        한 번의 요청으로 여러 톤을 생성할 수 있는 구현체는 이 메서드를 재정의합니다.
+        응답이 일부 톤을 누락할 수 있으므로 호출자는 누락된 톤을 확인해야 합니다.
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tones: 변환할 톤 목록
+
+        Returns:
+            List[ToneMessage]: 변환된 메시지 목록
+        """
+        return [
+            self.convert(
+                original_message=original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tone=tone,
+            )
+            for tone in tones
+        ]
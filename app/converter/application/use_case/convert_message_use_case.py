@@ -1,24 +1,50 @@
 """ConvertMessageUseCase - 3가지 톤 동시 생성"""
 
-from typing import List
+import contextvars
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List
 
 from app.converter.application.port.message_converter_port import MessageConverterPort
 from app.converter.domain.tone_message import ToneMessage
 from app.shared.vo.mbti import MBTI
 
+logger = logging.getLogger(__name__)
+
+# 톤 변환 전용 스레드 풀 (프로세스 전역, 동시 LLM 호출 수 상한)
+_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="tone-convert")
+
+
+def _submit(fn: Callable, **kwargs) -> Future:
+    """호출한 스레드의 컨텍스트(요청 Trace 등)를 복사해 톤 변환 스레드 풀에서 실행한다"""
+    return _executor.submit(contextvars.copy_context().run, fn, **kwargs)
+
 
 class ConvertMessageUseCase:
     """메시지를 3가지 톤으로 동시에 변환하는 유스케이스"""
 
     TONES = ["공손한", "캐주얼한", "간결한"]
+    DEFAULT_TONE_TIMEOUT_SECONDS = 20.0
 
-    def __init__(self, converter: MessageConverterPort):
+    def __init__(
+        self,
+        converter: MessageConverterPort,
+        tone_timeout: float | None = None,
+        batch_mode: bool = False,
+    ):
         """초기화
 
         Args:
             converter: MessageConverterPort 구현체
+            tone_timeout: 변환 제한 시간(초, batch_mode면 일괄 변환과 톤별 보완을 합친 시간)
+            batch_mode: True면 한 번의 요청으로 모든 톤을 먼저 변환 시도
         """
         self.converter = converter
+        self.tone_timeout = (
+            tone_timeout if tone_timeout is not None else self.DEFAULT_TONE_TIMEOUT_SECONDS
+        )
+        self.batch_mode = batch_mode
 
     def execute(
         self,
@@ -28,23 +54,101 @@ class ConvertMessageUseCase:
     ) -> List[ToneMessage]:
         """메시지를 3가지 톤으로 변환
 
+        batch_mode면 한 번의 요청으로 모든 톤을 변환하고, 누락되거나 실패한 톤만
+        톤별 변환으로 보완한다. 톤별 변환은 동시에 실행되며, 제한 시간을 넘기거나
+        실패한 톤은 결과에서 제외된다. 보완은 일괄 변환이 쓰고 남은 시간 안에서만
+        하므로 요청 전체가 tone_timeout을 넘기지 않는다.
+
         Args:
             original_message: 원본 메시지
             sender_mbti: 발신자 MBTI
             receiver_mbti: 수신자 MBTI
 
         Returns:
-            List[ToneMessage]: 3가지 톤으로 변환된 메시지 목록
+            List[ToneMessage]: 변환에 성공한 톤 메시지 목록 (TONES 순서)
+
+        Raises:
+            RuntimeError: 모든 톤 변환에 실패한 경우
         """
-        results = []
+        converted: dict[str, ToneMessage] = {}
+        deadline = time.monotonic() + self.tone_timeout
+
+        if self.batch_mode:
+            converted.update(
+                self._convert_batch(original_message, sender_mbti, receiver_mbti, deadline)
+            )
+
+        remaining_tones = [tone for tone in self.TONES if tone not in converted]
+        if remaining_tones and time.monotonic() >= deadline:
+            logger.warning("제한 시간이 지나 톤별 변환을 생략: %s", remaining_tones)
+        elif remaining_tones:
+            converted.update(
+                self._convert_each(
+                    original_message, sender_mbti, receiver_mbti, remaining_tones, deadline
+                )
+            )
+
+        if not converted:
+            raise RuntimeError("모든 톤 변환에 실패했습니다")
+
+        return [converted[tone] for tone in self.TONES if tone in converted]
 
-        for tone in self.TONES:
-            tone_message = self.converter.convert(
+    def _convert_batch(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        deadline: float,
+    ) -> dict[str, ToneMessage]:
+        """한 번의 요청으로 모든 톤을 변환 (실패/마감 시각 초과 시 빈 결과)"""
+        future = _submit(
+            self.converter.convert_batch,
+            original_message=original_message,
+            sender_mbti=sender_mbti,
+            receiver_mbti=receiver_mbti,
+            tones=list(self.TONES),
+        )
+        try:
+            tone_messages = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except Exception as e:
+            future.cancel()
+            logger.warning("일괄 톤 변환 실패, 톤별 변환으로 대체: %r", e)
+            return {}
+
+        return {
+            tone_message.tone: tone_message
+            for tone_message in tone_messages
+            if tone_message.tone in self.TONES
+        }
+
+    def _convert_each(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+        deadline: float,
+    ) -> dict[str, ToneMessage]:
+        """톤별 변환을 동시에 실행 (실패/마감 시각 초과 톤 제외)"""
+        futures = {
+            tone: _submit(
+                self.converter.convert,
                 original_message=original_message,
                 sender_mbti=sender_mbti,
                 receiver_mbti=receiver_mbti,
                 tone=tone,
             )
-            results.append(tone_message)
+            for tone in tones
+        }
+
+        # 모든 톤이 동시에 시작하므로 요청 전체의 마감 시각을 그대로 쓴다
+        converted = {}
+
+        for tone, future in futures.items():
+            try:
+                converted[tone] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception as e:
+                future.cancel()
+                logger.warning("톤 변환 실패 (%s): %r", tone, e)
 
-        return results
+        return converted
@@ -1,6 +1,6 @@
 """ToneMessage 도메인 객체"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -11,10 +11,12 @@ class ToneMessage:
         tone: 메시지의 톤 (예: "공손한", "캐주얼한", "간결한")
         content: 변환된 메시지 내용
         explanation: 왜 이 표현이 효과적인지에 대한 설명
+        cached: 캐시에서 꺼낸 결과인지 여부 (비교 대상 아님)
     """
     tone: str
     content: str
     explanation: str
+    cached: bool = field(default=False, compare=False)
 
     def __post_init__(self):
         """유효성 검증"""
@@ -0,0 +1,101 @@
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable
+
+from app.converter.domain.tone_message import ToneMessage
+from app.shared.vo.mbti import MBTI
+
+
+def normalize_message(message: str) -> str:
+    """캐시 키용 메시지 정규화 (유니코드 NFC, 앞뒤/연속 공백 정리)"""
+    return " ".join(unicodedata.normalize("NFC", message).split())
+
+
+def build_cache_key(
+    original_message: str,
+    sender_mbti: MBTI,
+    receiver_mbti: MBTI,
+    tone: str,
+    prompt_version: str,
+) -> str:
+    """(메시지, 발신자 MBTI, 수신자 MBTI, 톤, 프롬프트 버전)의 sha256 키를 만든다
+
+    프롬프트가 바뀌면 prompt_version을 올려 이전 결과가 재사용되지 않게 한다.
+    """
+    parts = [
+        prompt_version,
+        sender_mbti.value,
+        receiver_mbti.value,
+        tone.strip(),
+        normalize_message(original_message),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class ToneConversionCache:
+    """
+    cache_key → ToneMessage 인메모리 캐시 (LRU + TTL).
+
+    같은 메시지/MBTI/톤 조합의 재시도가 LLM을 다시 호출하지 않도록 프로세스 내에 변환 결과를 보관한다.
+    영속 계층(SqlToneConversionStore)이 설정된 경우 그 앞단의 1차 캐시로 동작한다.
+    """
+
+    DEFAULT_MAX_SIZE = 5_000
+    DEFAULT_TTL_SECONDS = 60 * 60 * 24  # 24시간
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        ttl_seconds: int | None = None,
+        now: Callable[[], datetime] = datetime.now,
+    ):
+        self._max_size = max_size if max_size is not None else self.DEFAULT_MAX_SIZE
+        self._ttl = timedelta(
+            seconds=ttl_seconds if ttl_seconds is not None else self.DEFAULT_TTL_SECONDS
+        )
+        self._now = now
+        self._entries: OrderedDict[str, tuple[ToneMessage, datetime]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> ToneMessage | None:
+        """캐시된 변환 결과를 반환한다 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            tone_message, expires_at = entry
+            if expires_at <= self._now():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return tone_message
+
+    def put(self, key: str, tone_message: ToneMessage) -> None:
+        """변환 결과를 캐시에 저장한다 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        with self._lock:
+            self._entries[key] = (tone_message, self._now() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시와 통계를 초기화한다"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """hit/miss 통계를 반환한다"""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime, Text
+from config.database import Base
+
+
+class ToneConversionModel(Base):
+    """톤 변환 결과 캐시 ORM 모델"""
+
+    __tablename__ = "tone_conversion_cache"
+
+    cache_key = Column(String(64), primary_key=True)  # sha256 hex
+    tone = Column(String(20), nullable=False)
+    content = Column(Text, nullable=False)
+    explanation = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as DbSession
+
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.model.tone_conversion_model import ToneConversionModel
+
+
+class SqlToneConversionStore:
+    """
+    톤 변환 결과 영속 캐시 (MySQL/SQLite).
+
+    프로세스 재시작이나 여러 인스턴스 사이에서도 변환 결과를 재사용하기 위한 2차 캐시다.
+    변환은 스레드 풀에서 실행되므로 요청 세션을 공유하지 않고 조회/저장마다 짧은 세션을 연다.
+    """
+
+    DEFAULT_TTL_SECONDS = 60 * 60 * 24 * 7  # 7일
+
+    def __init__(
+        self,
+        session_factory: Callable[[], DbSession],
+        ttl_seconds: int | None = None,
+        now: Callable[[], datetime] = datetime.now,
+    ):
+        self._session_factory = session_factory
+        self._ttl = timedelta(
+            seconds=ttl_seconds if ttl_seconds is not None else self.DEFAULT_TTL_SECONDS
+        )
+        self._now = now
+
+    def get(self, key: str) -> ToneMessage | None:
+        """저장된 변환 결과를 반환한다 (없거나 만료되면 None)"""
+        db = self._session_factory()
+        try:
+            model = db.get(ToneConversionModel, key)
+            if model is None or model.expires_at <= self._now():
+                return None
+            return ToneMessage(
+                tone=model.tone, content=model.content, explanation=model.explanation
+            )
+        finally:
+            db.close()
+
+    def put(self, key: str, tone_message: ToneMessage) -> None:
+        """변환 결과를 저장한다 (같은 키가 있으면 갱신)"""
+        now = self._now()
+        db = self._session_factory()
+        try:
+            db.merge(
+                ToneConversionModel(
+                    cache_key=key,
+                    tone=tone_message.tone,
+                    content=tone_message.content,
+                    explanation=tone_message.explanation,
+                    created_at=now,
+                    expires_at=now + self._ttl,
+                )
+            )
+            db.commit()
+        except IntegrityError:
+            # 다른 요청이 같은 키를 먼저 저장한 경우 (결과는 동일하므로 무시)
+            db.rollback()
+        finally:
+            db.close()
+
+    def purge_expired(self) -> int:
+        """만료된 항목을 삭제하고 삭제 건수를 반환한다"""
+        db = self._session_factory()
+        try:
+            deleted = (
+                db.query(ToneConversionModel)
+                .filter(ToneConversionModel.expires_at <= self._now())
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return deleted
+        finally:
+            db.close()
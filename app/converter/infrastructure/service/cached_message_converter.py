@@ -0,0 +1,153 @@
+"""캐시를 적용한 메시지 변환 어댑터"""
+
+import logging
+from dataclasses import replace
+from typing import List
+
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.cache.tone_conversion_cache import (
+    ToneConversionCache,
+    build_cache_key,
+)
+from app.converter.infrastructure.repository.sql_tone_conversion_store import (
+    SqlToneConversionStore,
+)
+from app.shared.vo.mbti import MBTI
+
+logger = logging.getLogger(__name__)
+
+
+class CachedMessageConverter(MessageConverterPort):
+    """변환 결과를 캐시하는 MessageConverter 데코레이터
+
+    인메모리 LRU(1차) → 영속 저장소(2차, 선택) → 실제 변환기 순으로 조회하고,
+    캐시에서 꺼낸 결과는 cached=True로 표시합니다.
+    영속 저장소 오류는 로그만 남기고 변환을 계속합니다.
+    """
+
+    def __init__(
+        self,
+        converter: MessageConverterPort,
+        cache: ToneConversionCache,
+        prompt_version: str,
+        store: SqlToneConversionStore | None = None,
+    ):
+        """
+        Args:
+            converter: 실제 변환을 수행할 MessageConverter
+            cache: 인메모리 캐시
+            prompt_version: 캐시 키에 포함할 프롬프트 버전
+            store: 영속 캐시 저장소 (없으면 인메모리만 사용)
+        """
+        self._converter = converter
+        self._cache = cache
+        self._prompt_version = prompt_version
+        self._store = store
+
+    def convert(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> ToneMessage:
+        """캐시된 결과가 있으면 반환하고, 없으면 변환 후 캐시에 저장
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tone: 변환할 톤
+
+        Returns:
+            ToneMessage: 변환된 메시지 (캐시 적중 시 cached=True)
+        """
+        key = self._key(original_message, sender_mbti, receiver_mbti, tone)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        tone_message = self._converter.convert(
+            original_message=original_message,
+            sender_mbti=sender_mbti,
+            receiver_mbti=receiver_mbti,
+            tone=tone,
+        )
+        self._store_result(key, tone_message)
+        return tone_message
+
+    def convert_batch(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> List[ToneMessage]:
+        """캐시에 없는 톤만 실제 변환기에 일괄 요청
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tones: 변환할 톤 목록
+
+        Returns:
+            List[ToneMessage]: 변환된 메시지 목록 (tones 순서, 누락된 톤 제외)
+        """
+        keys = {
+            tone: self._key(original_message, sender_mbti, receiver_mbti, tone)
+            for tone in tones
+        }
+        results: dict[str, ToneMessage] = {}
+        for tone in tones:
+            cached = self._lookup(keys[tone])
+            if cached is not None:
+                results[tone] = cached
+
+        missing = [tone for tone in tones if tone not in results]
+        if missing:
+            converted = self._converter.convert_batch(
+                original_message=original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tones=missing,
+            )
+            for tone_message in converted:
+                if tone_message.tone in keys:
+                    self._store_result(keys[tone_message.tone], tone_message)
+                    results[tone_message.tone] = tone_message
+
+        return [results[tone] for tone in tones if tone in results]
+
+    def _key(
+        self, original_message: str, sender_mbti: MBTI, receiver_mbti: MBTI, tone: str
+    ) -> str:
+        return build_cache_key(
+            original_message, sender_mbti, receiver_mbti, tone, self._prompt_version
+        )
+
+    def _lookup(self, key: str) -> ToneMessage | None:
+        """1차 → 2차 캐시 순으로 조회 (2차 적중 시 1차에 채움)"""
+        tone_message = self._cache.get(key)
+        if tone_message is None and self._store is not None:
+            try:
+                tone_message = self._store.get(key)
+            except Exception:
+                logger.exception("톤 변환 영속 캐시 조회 실패")
+                tone_message = None
+            if tone_message is not None:
+                self._cache.put(key, tone_message)
+
+        if tone_message is None:
+            return None
+        return replace(tone_message, cached=True)
+
+    def _store_result(self, key: str, tone_message: ToneMessage) -> None:
+        """변환 결과를 1차/2차 캐시에 저장"""
+        self._cache.put(key, replace(tone_message, cached=False))
+        if self._store is not None:
+            try:
+                self._store.put(key, tone_message)
+            except Exception:
+                logger.exception("톤 변환 영속 캐시 저장 실패")
@@ -1,21 +1,38 @@
 """OpenAI 기반 메시지 변환 어댑터"""
 
 import json
+from typing import List
+
 from openai import OpenAI
 
 from app.converter.application.port.message_converter_port import MessageConverterPort
 from app.converter.domain.tone_message import ToneMessage
+from app.shared.llm.gateway import OPERATION_CONVERT, LLMGateway
 from app.shared.vo.mbti import MBTI
 from config.settings import get_settings
 
+# 프롬프트/모델을 바꾸면 올려서 이전 캐시 결과가 재사용되지 않게 한다
+PROMPT_VERSION = "1"
+
 
 class OpenAIMessageConverter(MessageConverterPort):
     """OpenAI API를 사용한 메시지 변환 구현체"""
 
-    def __init__(self):
-        """OpenAI 클라이언트 초기화"""
-        settings = get_settings()
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    def __init__(self, client: OpenAI | None = None, gateway: LLMGateway | None = None):
+        """OpenAI 클라이언트 초기화
+
+        Args:
+            client: 재사용할 OpenAI 클라이언트 (없으면 새로 생성)
+            gateway: 재시도/마감 시간/서킷 브레이커를 적용할 LLM 게이트웨이 (없으면 client로 생성)
+        """
+        if gateway is None:
+            if client is None:
+                settings = get_settings()
+                # 재시도는 게이트웨이가 맡는다
+                client = OpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
+            gateway = LLMGateway(client)
+        self._llm = gateway
+        self.client = gateway.client
 
     def convert(
         self,
@@ -37,7 +54,8 @@ class OpenAIMessageConverter(MessageConverterPort):
         """
         prompt = self._build_prompt(original_message, sender_mbti, receiver_mbti, tone)
 
-        response = self.client.chat.completions.create(
+        response = self._llm.create(
+            OPERATION_CONVERT,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -50,19 +68,90 @@ class OpenAIMessageConverter(MessageConverterPort):
             response_format={"type": "json_object"},
         )
 
-        # JSON 응답 파싱
-        content = response.choices[0].message.content.strip()
+        result = self._parse_json(response.choices[0].message.content)
+
+        return ToneMessage(
+            tone=tone, content=result["content"], explanation=result["explanation"]
+        )
+
+    def convert_batch(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> List[ToneMessage]:
+        """메시지를 여러 톤으로 한 번의 요청으로 변환
+
+        수신자 MBTI 특성을 한 번만 포함한 프롬프트로 {"tones": [...]} JSON을 요청하고,
+        올바른 항목만 ToneMessage로 변환합니다. 누락되거나 형식이 잘못된 톤은
+        결과에서 빠지므로 호출자가 톤별 변환으로 보완합니다.
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tones: 변환할 톤 목록
+
+        Returns:
+            List[ToneMessage]: 변환에 성공한 톤 메시지 목록 (tones 순서)
+
+        Raises:
+            ValueError: 응답이 JSON이 아니거나 "tones" 목록이 없는 경우
+        """
+        prompt = self._build_batch_prompt(original_message, sender_mbti, receiver_mbti, tones)
+
+        response = self._llm.create(
+            OPERATION_CONVERT,
+            model="gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "당신은 MBTI 기반 커뮤니케이션 전문가입니다. 메시지를 지정된 톤들로 변환하고 JSON 형식으로만 응답하세요.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.7,
+            response_format={"type": "json_object"},
+        )
+
+        try:
+            items = self._parse_json(response.choices[0].message.content)["tones"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"일괄 변환 응답 형식이 올바르지 않습니다: {e}")
+        if not isinstance(items, list):
+            raise ValueError("일괄 변환 응답의 tones가 목록이 아닙니다")
+
+        converted: dict[str, ToneMessage] = {}
+        for item in items:
+            try:
+                tone_message = ToneMessage(
+                    tone=item["tone"], content=item["content"], explanation=item["explanation"]
+                )
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+            if tone_message.tone in tones:
+                converted.setdefault(tone_message.tone, tone_message)
+
+        return [converted[tone] for tone in tones if tone in converted]
+
+    def _parse_json(self, content: str) -> dict:
+        """JSON 응답 파싱 (markdown 코드 블록 제거)
+
+        Args:
+            content: OpenAI 응답 본문
+
+        Returns:
+            dict: 파싱된 JSON
+        """
+        content = content.strip()
         # markdown 코드 블록 제거
         if content.startswith("```"):
             content = content.split("```")[1]
             if content.startswith("json"):
                 content = content[4:]
             content = content.strip()
-        result = json.loads(content)
-
-        return ToneMessage(
-            tone=tone, content=result["content"], explanation=result["explanation"]
-        )
+        return json.loads(content)
 
     def _build_prompt(
         self, original_message: str, sender_mbti: MBTI, receiver_mbti: MBTI, tone: str
@@ -111,6 +200,62 @@ JSON:
     "explanation": "{receiver_mbti.value}는 ~해서 이렇게 표현했어 (1문장, 반말)"
 }}"""
 
+    def _build_batch_prompt(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> str:
+        """여러 톤을 한 번에 요청하는 프롬프트 생성
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tones: 변환할 톤 목록
+
+        Returns:
+            str: 생성된 프롬프트
+        """
+        receiver_characteristics = self._get_mbti_characteristics(receiver_mbti)
+        tone_sections = "\n\n".join(
+            f"[{tone} 스타일]\n{self._get_tone_guidelines(tone).strip()}" for tone in tones
+        )
+        tone_list = ", ".join(f"'{tone}'" for tone in tones)
+        json_items = ",\n".join(
+            f'''        {{"tone": "{tone}", "content": "{receiver_mbti.value}에게 맞춤 변환된 메시지", "explanation": "{receiver_mbti.value}는 ~해서 이렇게 표현했어 (1문장, 반말)"}}'''
+            for tone in tones
+        )
+
+        return f"""'{receiver_mbti.value}' 유형한테 보내는 메시지를 {tone_list} 스타일로 각각 변환해.
+
+수신자 MBTI: {receiver_mbti.value}
+{receiver_characteristics}
+
+원본: {original_message}
+
+{tone_sections}
+
+★ 핵심: {receiver_mbti.value} 특성에 맞게 변환! ★
+- E: 활발하고 에너지있게 / I: 차분하고 조용하게
+- S: 구체적 사실 위주 / N: 가능성, 아이디어 위주
+- T: 논리적, 직접적으로 / F: 감정 공감하며 부드럽게
+- J: 명확하고 결론 먼저 / P: 유연하고 여유있게
+
+규칙:
+1. {receiver_mbti.value}가 좋아하는 방식으로 표현 (이게 제일 중요!)
+2. 원본 톤 유지 (반말→반말, 존댓말→존댓말)
+3. 카톡처럼 자연스럽게, AI티 금지
+4. 스타일마다 서로 다른 메시지로 작성
+
+JSON:
+{{
+    "tones": [
+{json_items}
+    ]
+}}"""
+
     def _get_tone_guidelines(self, tone: str) -> str:
         """톤별 변환 가이드라인을 반환
 
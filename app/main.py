@@ -1,14 +1,50 @@
-from fastapi import FastAPI
+import asyncio
+import math
+
+from fastapi import FastAPI, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
+from app.auth.adapter.input.web.auth_dependency import rate_limit_identity
 from app.consult.adapter.input.web.consult_router import consult_router
-from app.converter.adapter.input.web.converter_router import converter_router
+from app.consult.adapter.input.web import consult_router as consult_router_module
+from app.consult.infrastructure.model.consult_session_migration import migrate_consult_sessions
+from app.consult.infrastructure.service.greeting_pool import GreetingPoolCounselor
+from app.consult.infrastructure.queue.in_process_analysis_queue import InProcessAnalysisQueue
+from app.converter.adapter.input.web.converter_router import (
+    converter_router,
+    get_tone_conversion_store,
+)
+from app.converter.infrastructure.repository.sql_tone_conversion_store import (
+    SqlToneConversionStore,
+)
 from app.router import setup_routers
+from app.shared.llm.errors import LLMUnavailableError
+from app.shared.prompt_cache import prompt_cache_hit_ratio
+from app.shared.rate_limit.middleware import RateLimitMiddleware
+from app.shared.tracing import TracingMiddleware
 from app.user.adapter.input.web.user_router import user_router
 from config.database import engine, Base
+from config.openai_client import close_openai_clients
+from config.rate_limit import get_rate_limit_rules, get_rate_limit_store
+from config.settings import get_settings
+from config.tracing import get_span_exporter
 from fastapi.middleware.cors import CORSMiddleware
 
 
+async def _purge_expired_tone_conversions(store: SqlToneConversionStore, interval_seconds: float):
+    """만료된 톤 변환 영속 캐시를 기동 직후 한 번, 이후 interval_seconds마다 삭제한다"""
+    while True:
+        try:
+            deleted = await run_in_threadpool(store.purge_expired)
+            print(f"[+] Expired tone conversions purged: {deleted}")
+        except Exception as e:
+            # 삭제 실패는 다음 주기에 다시 시도한다
+            print(f"[!] Failed to purge expired tone conversions: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 시 실행되는 로직"""
@@ -19,12 +55,54 @@ async def lifespan(app: FastAPI):
     Base.metadata.create_all(bind=engine)
     print("[+] Database tables created")
 
+    # create_all이 바꾸지 않는 기존 테이블에 새 컬럼/인덱스를 추가한다
+    applied = migrate_consult_sessions(engine)
+    print(f"[+] Database schema migrated: {', '.join(applied) or 'up to date'}")
+
+    # 인사말 풀은 서버 기동을 막지 않도록 백그라운드에서 채운다
+    greeting_pool = consult_router_module._ai_counselor
+    warm_up_task = None
+    if isinstance(greeting_pool, GreetingPoolCounselor):
+        warm_up_task = asyncio.create_task(greeting_pool.warm_up())
+
+    # 이전 실행에서 끝나지 못한 분석 작업 재개
+    analysis_queue = consult_router_module._analysis_queue
+    if isinstance(analysis_queue, InProcessAnalysisQueue):
+        try:
+            resumed = analysis_queue.resume_pending()
+            print(f"[+] Pending analysis jobs resumed: {resumed}")
+        except Exception as e:
+            # 재개 실패가 서버 기동을 막지 않도록 한다 (다음 기동 시 다시 시도)
+            print(f"[!] Failed to resume pending analysis jobs: {e}")
+
+    # 영속 캐시의 만료된 변환 결과는 조회에서만 걸러지므로 주기적으로 지운다
+    purge_task = None
+    tone_conversion_store = get_tone_conversion_store()
+    if tone_conversion_store is not None:
+        purge_task = asyncio.create_task(
+            _purge_expired_tone_conversions(
+                tone_conversion_store, get_settings().CONVERTER_CACHE_PURGE_INTERVAL_SECONDS
+            )
+        )
+
     yield
 
     # Shutdown
     print("[-] Shutting down HexaCore AI Server...")
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+        await greeting_pool.close()
+    if purge_task is not None:
+        purge_task.cancel()
+    # 스트림을 먼저 닫아야 중단된 마지막 턴의 저장/분석 등록이 열려 있는 분석 큐로 들어간다
+    await consult_router_module._stream_registry.close()
+    if isinstance(analysis_queue, InProcessAnalysisQueue):
+        await analysis_queue.close()
+    print(f"[+] Prompt cache hit ratio: {prompt_cache_hit_ratio():.1%}")
     engine.dispose()
     print("[+] Database connections closed")
+    await close_openai_clients()
+    print("[+] OpenAI connections closed")
 
 
 app = FastAPI(
@@ -40,15 +118,43 @@ origins = [
     "https://hexa-frontend-chi.vercel.app",  # Vercel 배포 URL (chi)
 ]
 
+# 한도를 넘은 요청은 인증/DB/LLM 작업 전에 429로 끝낸다 (CORS 안쪽이라 429 응답에도 CORS 헤더가 붙는다)
+if get_settings().RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=get_rate_limit_rules(),
+        identify=rate_limit_identity,
+        store=get_rate_limit_store(),
+    )
+
+# 요청별 구간(인증, 유스케이스, DB, LLM) 소요 시간을 Server-Timing 헤더로 알려준다 (429 응답 포함, 개발 환경만)
+if get_settings().TRACING_ENABLED:
+    app.add_middleware(
+        TracingMiddleware,
+        exporter=get_span_exporter(),
+        server_timing=not get_settings().is_production,
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,       # 정확한 origin만 허용
     allow_credentials=True,      # 쿠키 허용
     allow_methods=["*"],         # 모든 HTTP 메서드 허용
     allow_headers=["*"],         # 모든 헤더 허용
+    expose_headers=["Server-Timing", "Retry-After", "X-Cache"],  # 프론트에서 읽을 수 있는 응답 헤더
 )
 
 
+@app.exception_handler(LLMUnavailableError)
+async def llm_unavailable_handler(request: Request, exc: LLMUnavailableError):
+    """LLM을 지금 호출할 수 없으면(회로 열림, 호출 대기열 마감 초과) 503과 Retry-After로 응답한다"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
+
+
 # app.include_router(google_oauth_router, prefix="/oauth")
 app.include_router(consult_router, prefix="/consult")
 app.include_router(converter_router, prefix="/converter")
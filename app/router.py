@@ -11,15 +11,16 @@ from app.consult.infrastructure.model.consult_session_model import ConsultSessio
 from app.consult.adapter.input.web.consult_router import consult_router
 from app.consult.adapter.input.web import consult_router as consult_router_module
 from app.converter.adapter.input.web.converter_router import converter_router
-from app.auth.adapter.input.web import auth_dependency
 from app.user.adapter.input.web.user_router import user_router
-from app.user.adapter.input.web import user_router as user_router_module
 
-from config.database import get_db_session
+from config.openai_client import get_async_llm_gateway
 from config.settings import get_settings
-from app.user.infrastructure.repository.mysql_user_repository import MySQLUserRepository
-from app.consult.infrastructure.repository.mysql_consult_repository import MySQLConsultRepository
-from app.consult.infrastructure.service.openai_counselor_adapter import OpenAICounselorAdapter
+from app.consult.infrastructure.service.async_openai_counselor_adapter import AsyncOpenAICounselorAdapter
+from app.consult.infrastructure.service.greeting_pool import GreetingPoolCounselor
+from app.consult.infrastructure.service.conversation_context import ConversationContextWindow
+from app.consult.infrastructure.queue.in_process_analysis_queue import InProcessAnalysisQueue
+from app.consult.infrastructure.repository.mysql_consult_repository import mysql_consult_repository_scope
+from app.consult.infrastructure.cache.stream_replay_registry import StreamReplayRegistry
 
 
 def setup_routers(app: FastAPI) -> None:
@@ -33,12 +34,31 @@ def setup_routers(app: FastAPI) -> None:
     app.include_router(converter_router, prefix="/converter")
 
     # Consult router with real implementations
+    # 저장소는 요청마다 get_db 세션으로 생성된다 (consult_router.get_*_repository)
+    # 인사말은 (MBTI, 성별) 조합별 풀에서 제공한다 (main.lifespan에서 warm-up)
     settings = get_settings()
-    db_session = get_db_session()
+    # 오래된 턴은 누적 요약으로 대체해 턴이 늘어도 프롬프트 크기를 일정하게 유지한다
+    context_window = ConversationContextWindow(
+        keep_turns=settings.CONSULT_CONTEXT_KEEP_TURNS,
+        token_budget=settings.CONSULT_CONTEXT_TOKEN_BUDGET,
+    )
+    ai_counselor = AsyncOpenAICounselorAdapter(
+        gateway=get_async_llm_gateway(), context_window=context_window
+    )
+    if settings.CONSULT_GREETING_POOL_SIZE > 0:
+        ai_counselor = GreetingPoolCounselor(ai_counselor, pool_size=settings.CONSULT_GREETING_POOL_SIZE)
+    consult_router_module._ai_counselor = ai_counselor
 
-    user_repository = MySQLUserRepository(db_session)
-    consult_router_module._user_repository = user_repository
-    consult_router_module._consult_repository = MySQLConsultRepository(db_session)
-    consult_router_module._ai_counselor = OpenAICounselorAdapter(api_key=settings.OPENAI_API_KEY)
-    user_router_module._user_repository = user_repository
+    # 마지막 턴 분석은 백그라운드 큐에서 생성한다 (main.lifespan에서 대기 작업 재개)
+    if settings.CONSULT_BACKGROUND_ANALYSIS:
+        consult_router_module._analysis_queue = InProcessAnalysisQueue(
+            ai_counselor, mysql_consult_repository_scope
+        )
+
+    # 메시지 스트림은 끊겨도 유예 시간 동안 생성을 유지해 Last-Event-ID로 이어 받게 한다
+    consult_router_module._stream_registry = StreamReplayRegistry(
+        max_events=settings.CONSULT_STREAM_REPLAY_MAX_EVENTS,
+        retention_seconds=settings.CONSULT_STREAM_REPLAY_TTL_SECONDS,
+        grace_seconds=settings.CONSULT_STREAM_RESUME_GRACE_SECONDS,
+    )
     app.include_router(consult_router, prefix="/consult")
\ No newline at end of file
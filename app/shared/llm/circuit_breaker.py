@@ -0,0 +1,111 @@
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from app.shared.llm.errors import LLMUnavailableError
+
+
+class CircuitOpenError(LLMUnavailableError):
+    """업스트림 오류율이 높아 회로가 열려 있어 호출하지 않고 바로 실패한다"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("LLM 업스트림 오류가 많아 잠시 요청을 보내지 않습니다", retry_after)
+
+
+class CircuitBreaker:
+    """
+    최근 호출의 오류율 기반 서킷 브레이커 (스레드 안전, 동기/비동기 게이트웨이 공용).
+
+    - closed: 최근 window_size번 호출 중 min_calls번 이상 기록되고 오류율이 failure_rate 이상이면 연다
+    - open: open_seconds 동안 호출하지 않고 CircuitOpenError로 바로 실패한다
+    - half_open: open_seconds가 지나면 한 번만 시험 호출을 보내 성공하면 닫고 실패하면 다시 연다
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    DEFAULT_WINDOW_SIZE = 20
+    DEFAULT_MIN_CALLS = 10
+    DEFAULT_FAILURE_RATE = 0.5
+    DEFAULT_OPEN_SECONDS = 30.0
+
+    def __init__(
+        self,
+        window_size: int | None = None,
+        min_calls: int | None = None,
+        failure_rate: float | None = None,
+        open_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        window_size = window_size if window_size is not None else self.DEFAULT_WINDOW_SIZE
+        self._min_calls = min_calls if min_calls is not None else self.DEFAULT_MIN_CALLS
+        self._failure_rate = failure_rate if failure_rate is not None else self.DEFAULT_FAILURE_RATE
+        self._open_seconds = open_seconds if open_seconds is not None else self.DEFAULT_OPEN_SECONDS
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window_size)  # True = 실패
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._open_elapsed():
+                return self.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """호출 전에 확인한다 (회로가 열려 있으면 CircuitOpenError)"""
+        with self._lock:
+            if self._state == self.OPEN:
+                if not self._open_elapsed():
+                    raise CircuitOpenError(self._opened_at + self._open_seconds - self._clock())
+                self._state = self.HALF_OPEN
+                self._probing = False
+            if self._state == self.HALF_OPEN:
+                if self._probing:
+                    raise CircuitOpenError(self._open_seconds)
+                self._probing = True
+
+    def cancel_call(self) -> None:
+        """before_call 뒤 호출하지 않고 포기했음을 알린다 (half_open 시험 호출 자리를 돌려준다)"""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probing = False
+
+    def record_success(self) -> None:
+        """업스트림이 정상 응답했음을 기록한다"""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._close()
+                return
+            self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        """업스트림 장애(연결 실패, 타임아웃, 429/5xx)를 기록한다"""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._open()
+                return
+            self._outcomes.append(True)
+            if len(self._outcomes) >= self._min_calls and (
+                sum(self._outcomes) / len(self._outcomes) >= self._failure_rate
+            ):
+                self._open()
+
+    def _open_elapsed(self) -> bool:
+        return self._clock() - self._opened_at >= self._open_seconds
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = self._clock()
+        self._probing = False
+        self._outcomes.clear()
+
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._probing = False
+        self._outcomes.clear()
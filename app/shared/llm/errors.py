@@ -0,0 +1,6 @@
+class LLMUnavailableError(RuntimeError):
+    """LLM 업스트림을 지금 호출할 수 없다 (retry_after초 뒤 다시 시도)"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,243 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from openai import APITimeoutError, AsyncOpenAI, OpenAI
+
+from app.shared.llm.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.shared.llm.rate_scheduler import LLMRateScheduler
+from app.shared.llm.retry_policy import RetryPolicy, is_retryable
+from app.shared.llm.token_estimate import estimate_request_tokens
+from app.shared.metrics import MetricsRegistry, get_metrics
+from app.shared.tracing import span
+
+logger = logging.getLogger(__name__)
+
+OPERATION_GREETING = "greeting"
+OPERATION_RESPONSE = "response"
+OPERATION_ANALYSIS = "analysis"
+OPERATION_SUMMARY = "summary"
+OPERATION_CONVERT = "convert"
+
+# 호출 결과별 메트릭: llm.<operation>.<outcome>
+OUTCOME_SUCCESS = "success"
+OUTCOME_RETRY = "retry"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_FAILURE = "failure"
+OUTCOME_REJECTED = "rejected"  # 회로가 열려 호출하지 않음
+
+# 스케줄러 우선순위 (작을수록 먼저): 진행 중인 상담 턴이 새 상담 인사말/메시지 변환보다 먼저 나간다
+PRIORITY_CONSULT_TURN = 0
+PRIORITY_DEFAULT = 1
+OPERATION_PRIORITIES = {
+    OPERATION_RESPONSE: PRIORITY_CONSULT_TURN,
+    OPERATION_ANALYSIS: PRIORITY_CONSULT_TURN,
+    OPERATION_SUMMARY: PRIORITY_CONSULT_TURN,
+}
+
+
+def metric_name(operation: str, outcome: str) -> str:
+    return f"llm.{operation}.{outcome}"
+
+
+class _LLMGatewayBase:
+    """동기/비동기 게이트웨이 공용 정책 (마감 시간, 재시도 판단, 서킷 브레이커, 호출 스케줄러, 메트릭)"""
+
+    DEFAULT_DEADLINES = {
+        OPERATION_GREETING: 10.0,
+        OPERATION_RESPONSE: 30.0,
+        OPERATION_ANALYSIS: 60.0,
+        OPERATION_SUMMARY: 20.0,
+        OPERATION_CONVERT: 20.0,
+    }
+    DEFAULT_DEADLINE_SECONDS = 30.0
+
+    def __init__(
+        self,
+        client,
+        retry_policy: RetryPolicy | None,
+        circuit_breaker: CircuitBreaker | None,
+        deadlines: dict[str, float] | None,
+        scheduler: LLMRateScheduler | None,
+        metrics: MetricsRegistry | None,
+        clock: Callable[[], float],
+    ):
+        self._client = client
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._deadlines = {**self.DEFAULT_DEADLINES, **(deadlines or {})}
+        self._scheduler = scheduler
+        self._metrics = metrics or get_metrics()
+        self._clock = clock
+
+    @property
+    def client(self):
+        return self._client
+
+    def _start(self, operation: str) -> float:
+        """작업의 마감 시각을 계산한다 (재시도와 대기 시간을 모두 포함)"""
+        return self._clock() + self._deadlines.get(operation, self.DEFAULT_DEADLINE_SECONDS)
+
+    def _before_attempt(self, operation: str, deadline: float) -> float:
+        """회로 상태를 확인하고 이번 시도에 쓸 수 있는 남은 시간을 반환한다"""
+        try:
+            self._circuit_breaker.before_call()
+        except CircuitOpenError:
+            self._metrics.increment(metric_name(operation, OUTCOME_REJECTED))
+            raise
+        return self._remaining(deadline)
+
+    def _estimate_cost(self, request: dict) -> int:
+        return estimate_request_tokens(request) if self._scheduler is not None else 0
+
+    def _priority(self, operation: str) -> int:
+        return OPERATION_PRIORITIES.get(operation, PRIORITY_DEFAULT)
+
+    def _remaining(self, deadline: float) -> float:
+        return max(0.0, deadline - self._clock())
+
+    def _on_success(self, operation: str, response: Any, cost: int) -> None:
+        self._circuit_breaker.record_success()
+        self._metrics.increment(metric_name(operation, OUTCOME_SUCCESS))
+        # 스트림이 아니면 실제 사용량을 알 수 있으므로 과하게 잡은 토큰 한도를 돌려준다
+        total_tokens = getattr(getattr(response, "usage", None), "total_tokens", None)
+        if self._scheduler is not None and isinstance(total_tokens, int):
+            self._scheduler.settle(cost, total_tokens)
+
+    def _on_error(self, operation: str, attempt: int, error: Exception, deadline: float) -> float | None:
+        """
+        실패한 시도를 기록하고 재시도 전 대기 시간을 반환한다 (재시도하지 않으면 None).
+
+        업스트림 장애만 서킷 브레이커의 실패로 센다. 요청이 잘못된 4xx는 업스트림이 정상 응답한 것이다.
+        """
+        retryable = is_retryable(error)
+        if retryable:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+        if isinstance(error, APITimeoutError):
+            self._metrics.increment(metric_name(operation, OUTCOME_TIMEOUT))
+
+        if retryable and attempt < self._retry_policy.max_retries:
+            delay = self._retry_policy.delay_for(attempt, error)
+            # 대기 후 마감 시각을 넘기면 기다리지 않고 바로 실패시킨다
+            if self._clock() + delay < deadline:
+                self._metrics.increment(metric_name(operation, OUTCOME_RETRY))
+                logger.info("LLM 호출 재시도 (%s, %d회째, %.2f초 후): %r", operation, attempt + 1, delay, error)
+                return delay
+
+        self._metrics.increment(metric_name(operation, OUTCOME_FAILURE))
+        return None
+
+
+class LLMGateway(_LLMGatewayBase):
+    """
+    OpenAI 동기 클라이언트 호출 정책 계층.
+
+    모든 chat.completions.create 호출에 작업별 마감 시간, 지수 백오프 + jitter 재시도(Retry-After 준수),
+    서킷 브레이커, 결과별 메트릭을 적용한다. 재시도는 게이트웨이가 맡으므로 클라이언트는 max_retries=0으로 만든다.
+    scheduler가 있으면 시도마다 RPM/TPM 한도 안에서 차례를 기다린 뒤 호출한다 (대기도 마감 시간에 포함).
+    """
+
+    def __init__(
+        self,
+        client: OpenAI,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        deadlines: dict[str, float] | None = None,
+        scheduler: LLMRateScheduler | None = None,
+        metrics: MetricsRegistry | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(client, retry_policy, circuit_breaker, deadlines, scheduler, metrics, clock)
+        self._sleep = sleep
+
+    def create(self, operation: str, **kwargs: Any) -> Any:
+        """chat.completions.create를 정책을 적용해 호출한다 (stream=True면 스트림 연결까지 재시도)"""
+        with span(f"llm.{operation}"):
+            return self._create(operation, kwargs)
+
+    def _create(self, operation: str, kwargs: dict) -> Any:
+        deadline = self._start(operation)
+        cost = self._estimate_cost(kwargs)
+        attempt = 0
+        while True:
+            remaining = self._before_attempt(operation, deadline)
+            if self._scheduler is not None:
+                try:
+                    with span("llm.queue"):
+                        self._scheduler.acquire(self._priority(operation), cost, timeout=remaining)
+                except BaseException:
+                    self._circuit_breaker.cancel_call()
+                    raise
+                remaining = self._remaining(deadline)
+            try:
+                response = self._client.chat.completions.create(timeout=remaining, **kwargs)
+            except Exception as error:
+                delay = self._on_error(operation, attempt, error, deadline)
+                if delay is None:
+                    raise
+                self._sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                # 취소(클라이언트 연결 종료, 종료 처리)는 업스트림 결과가 아니므로 시험 호출 자리만 돌려준다
+                self._circuit_breaker.cancel_call()
+                raise
+            self._on_success(operation, response, cost)
+            return response
+
+
+class AsyncLLMGateway(_LLMGatewayBase):
+    """OpenAI 비동기 클라이언트 호출 정책 계층 (LLMGateway와 같은 정책, 대기는 이벤트 루프에 양보)"""
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        deadlines: dict[str, float] | None = None,
+        scheduler: LLMRateScheduler | None = None,
+        metrics: MetricsRegistry | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(client, retry_policy, circuit_breaker, deadlines, scheduler, metrics, clock)
+        self._sleep = sleep
+
+    async def create(self, operation: str, **kwargs: Any) -> Any:
+        """chat.completions.create를 정책을 적용해 호출한다 (stream=True면 스트림 연결까지 재시도)"""
+        with span(f"llm.{operation}"):
+            return await self._create(operation, kwargs)
+
+    async def _create(self, operation: str, kwargs: dict) -> Any:
+        deadline = self._start(operation)
+        cost = self._estimate_cost(kwargs)
+        attempt = 0
+        while True:
+            remaining = self._before_attempt(operation, deadline)
+            if self._scheduler is not None:
+                try:
+                    with span("llm.queue"):
+                        await self._scheduler.acquire_async(self._priority(operation), cost, timeout=remaining)
+                except BaseException:
+                    self._circuit_breaker.cancel_call()
+                    raise
+                remaining = self._remaining(deadline)
+            try:
+                response = await self._client.chat.completions.create(timeout=remaining, **kwargs)
+            except Exception as error:
+                delay = self._on_error(operation, attempt, error, deadline)
+                if delay is None:
+                    raise
+                await self._sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                # 취소(클라이언트 연결 종료, 종료 처리)는 업스트림 결과가 아니므로 시험 호출 자리만 돌려준다
+                self._circuit_breaker.cancel_call()
+                raise
+            self._on_success(operation, response, cost)
+            return response
@@ -0,0 +1,209 @@
+import asyncio
+import bisect
+import itertools
+import threading
+import time
+from typing import Callable
+
+from app.shared.llm.errors import LLMUnavailableError
+from app.shared.metrics import MetricsRegistry, get_metrics
+
+METRIC_QUEUE_DEPTH = "llm.scheduler.queue_depth"
+METRIC_ADMITTED = "llm.scheduler.admitted"
+METRIC_WAIT_SECONDS = "llm.scheduler.wait_seconds"  # 누적 대기 시간 (admitted로 나누면 평균)
+METRIC_TIMED_OUT = "llm.scheduler.timed_out"
+
+
+class SchedulerTimeoutError(LLMUnavailableError):
+    """RPM/TPM 한도 때문에 마감 시간 안에 호출 차례가 오지 않았다"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("LLM 호출 한도를 초과해 잠시 후 다시 시도해야 합니다", retry_after)
+
+
+class TokenBucket:
+    """초당 refill_per_second씩 채워지고 capacity까지 쌓이는 토큰 버킷 (잠금은 호출자가 담당)"""
+
+    def __init__(self, capacity: float, refill_per_second: float, clock: Callable[[], float]):
+        self.capacity = capacity
+        self._refill_per_second = refill_per_second
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+
+    def available(self) -> float:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self._refill_per_second)
+        self._updated_at = now
+        return self._tokens
+
+    def time_until(self, amount: float) -> float:
+        """amount만큼 쌓일 때까지 남은 시간 (초)"""
+        missing = amount - self.available()
+        return max(0.0, missing / self._refill_per_second)
+
+    def consume(self, amount: float) -> None:
+        self.available()
+        self._tokens -= amount
+
+    def refund(self, amount: float) -> None:
+        self.available()
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class _Ticket:
+    """대기 중인 호출 하나 (priority가 작을수록, 같으면 먼저 온 순서로 먼저 들어간다)"""
+
+    __slots__ = ("priority", "seq", "cost", "wake")
+
+    def __init__(self, priority: int, seq: int, cost: int):
+        self.priority = priority
+        self.seq = seq
+        self.cost = cost
+        self.wake: Callable[[], None] = lambda: None
+
+    def __lt__(self, other: "_Ticket") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class LLMRateScheduler:
+    """
+    프로세스 전역 LLM 호출 스케줄러 (RPM/TPM 토큰 버킷 + 우선순위 대기열).
+
+    요청 수 버킷과 토큰 버킷 모두에 여유가 있을 때만 호출을 들여보낸다.
+    대기열 맨 앞(가장 높은 우선순위, 같으면 먼저 온 호출)만 한도를 차지할 수 있으므로
+    진행 중인 상담 턴이 새 인사말/변환 호출보다 먼저 나가고, 큰 요청이 작은 요청에 계속 밀리지도 않는다.
+    동기(스레드)와 비동기(이벤트 루프) 호출이 같은 대기열을 공유한다.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        metrics: MetricsRegistry | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if requests_per_minute <= 0 or tokens_per_minute <= 0:
+            raise ValueError("requests_per_minute와 tokens_per_minute는 1 이상이어야 합니다")
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute / 60, clock)
+        self._tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60, clock)
+        self._metrics = metrics or get_metrics()
+        self._clock = clock
+        self._queue: list[_Ticket] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def acquire(self, priority: int, cost: int, timeout: float | None = None) -> None:
+        """차례가 올 때까지 현재 스레드를 막고 기다린다 (timeout 초과 시 SchedulerTimeoutError)"""
+        event = threading.Event()
+        ticket = self._enqueue(priority, cost, event.set)
+        started_at = self._clock()
+        try:
+            while True:
+                event.clear()
+                admitted, wait = self._try_admit(ticket, started_at, timeout)
+                if admitted:
+                    return
+                event.wait(wait)
+        except BaseException:
+            self._abandon(ticket)
+            raise
+
+    async def acquire_async(self, priority: int, cost: int, timeout: float | None = None) -> None:
+        """차례가 올 때까지 이벤트 루프를 막지 않고 기다린다 (timeout 초과 시 SchedulerTimeoutError)"""
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+
+        def wake() -> None:
+            # 다른 스레드에서 앞 순서 호출이 빠져도 깨울 수 있도록 루프에 넘긴다
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass
+
+        ticket = self._enqueue(priority, cost, wake)
+        started_at = self._clock()
+        try:
+            while True:
+                event.clear()
+                admitted, wait = self._try_admit(ticket, started_at, timeout)
+                if admitted:
+                    return
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            self._abandon(ticket)
+            raise
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """응답의 실제 사용량이 추정보다 적으면 차이만큼 토큰 한도를 돌려준다"""
+        if actual_tokens >= estimated_tokens:
+            return
+        with self._lock:
+            self._tokens.refund(estimated_tokens - actual_tokens)
+            head = self._queue[0] if self._queue else None
+        if head is not None:
+            head.wake()
+
+    def _enqueue(self, priority: int, cost: int, wake: Callable[[], None]) -> _Ticket:
+        # 한 번에 버킷보다 큰 요청도 언젠가는 들어갈 수 있도록 버킷 크기로 자른다
+        ticket = _Ticket(priority, next(self._seq), min(cost, int(self._tokens.capacity)))
+        ticket.wake = wake
+        with self._lock:
+            bisect.insort(self._queue, ticket)
+            self._metrics.set(METRIC_QUEUE_DEPTH, len(self._queue))
+        return ticket
+
+    def _try_admit(
+        self, ticket: _Ticket, started_at: float, timeout: float | None
+    ) -> tuple[bool, float | None]:
+        """
+        차례가 됐고 한도에 여유가 있으면 들여보내고 (True, None)을 반환한다.
+
+        아니면 (False, 다시 확인할 때까지 기다릴 시간)을 반환한다.
+        기다릴 시간이 None이면 깨울 때까지 기다린다 (맨 앞이 아니면 앞 순서가 빠질 때 깨어난다).
+        """
+        with self._lock:
+            waited = self._clock() - started_at
+            if self._queue[0] is ticket:
+                ready_in = max(self._requests.time_until(1), self._tokens.time_until(ticket.cost))
+                if ready_in == 0:
+                    self._requests.consume(1)
+                    self._tokens.consume(ticket.cost)
+                    self._queue.pop(0)
+                    self._metrics.set(METRIC_QUEUE_DEPTH, len(self._queue))
+                    self._metrics.increment(METRIC_ADMITTED)
+                    self._metrics.increment(METRIC_WAIT_SECONDS, waited)
+                    next_head = self._queue[0] if self._queue else None
+                    if next_head is not None:
+                        next_head.wake()
+                    return True, None
+            else:
+                ready_in = None
+
+            if timeout is None:
+                return False, ready_in
+            remaining = timeout - waited
+            if remaining <= 0:
+                self._metrics.increment(METRIC_TIMED_OUT)
+                raise SchedulerTimeoutError(ready_in if ready_in is not None else timeout)
+            return False, remaining if ready_in is None else min(ready_in, remaining)
+
+    def _abandon(self, ticket: _Ticket) -> None:
+        """기다리다 포기한 호출을 대기열에서 빼고, 맨 앞이었다면 다음 호출을 깨운다"""
+        with self._lock:
+            if ticket not in self._queue:
+                return
+            was_head = self._queue[0] is ticket
+            self._queue.remove(ticket)
+            self._metrics.set(METRIC_QUEUE_DEPTH, len(self._queue))
+            next_head = self._queue[0] if was_head and self._queue else None
+        if next_head is not None:
+            next_head.wake()
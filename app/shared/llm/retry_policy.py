@@ -0,0 +1,90 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+from openai import APIConnectionError, APIStatusError
+
+# 요청 자체가 잘못된 4xx는 재시도해도 같은 결과이므로 일시적인 상태 코드만 재시도한다
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def is_retryable(error: BaseException) -> bool:
+    """재시도하면 성공할 수 있는 업스트림 오류인지 (연결/타임아웃, 408/409/429, 5xx)"""
+    if isinstance(error, APIConnectionError):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500
+    return False
+
+
+def retry_after_seconds(error: BaseException, now: Callable[[], float] = time.time) -> float | None:
+    """
+    오류 응답의 Retry-After(또는 retry-after-ms) 헤더를 초 단위로 반환한다.
+
+    Retry-After는 초 또는 HTTP 날짜 형식이며, 헤더가 없거나 해석할 수 없으면 None.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - now())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    지수 백오프 + full jitter 재시도 정책.
+
+    attempt번째 재시도 대기 시간은 [0, min(max_delay, base_delay * 2^attempt)] 구간의 무작위 값이다.
+    서버가 Retry-After를 보냈으면 그보다 먼저 재시도하지 않는다.
+    """
+
+    DEFAULT_MAX_RETRIES = 2
+    DEFAULT_BASE_DELAY_SECONDS = 0.5
+    DEFAULT_MAX_DELAY_SECONDS = 8.0
+
+    def __init__(
+        self,
+        max_retries: int | None = None,
+        base_delay_seconds: float | None = None,
+        max_delay_seconds: float | None = None,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.max_retries = max_retries if max_retries is not None else self.DEFAULT_MAX_RETRIES
+        self._base_delay = (
+            base_delay_seconds if base_delay_seconds is not None else self.DEFAULT_BASE_DELAY_SECONDS
+        )
+        self._max_delay = (
+            max_delay_seconds if max_delay_seconds is not None else self.DEFAULT_MAX_DELAY_SECONDS
+        )
+        self._rng = rng
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째(0부터) 재시도 전 대기 시간 (jitter 적용)"""
+        return self._rng() * min(self._max_delay, self._base_delay * (2 ** attempt))
+
+    def delay_for(self, attempt: int, error: BaseException) -> float:
+        """오류의 Retry-After를 반영한 재시도 전 대기 시간"""
+        delay = self.backoff(attempt)
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
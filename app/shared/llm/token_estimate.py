@@ -0,0 +1,31 @@
+import math
+
+# 메시지 하나당 역할/구분자에 드는 대략적인 토큰 수
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# max_tokens 없이 호출할 때 응답 토큰 수 추정치
+DEFAULT_COMPLETION_TOKENS = 500
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 대략 추정한다 (토크나이저 없이 UTF-8 바이트 기준).
+
+    gpt-4o 계열 토크나이저에서 한글 1글자(3바이트)는 대략 1토큰 안팎, 영문은 4글자에 1토큰이다.
+    """
+    return math.ceil(len(text.encode("utf-8")) / 4)
+
+
+def estimate_message_tokens(messages: list[dict]) -> int:
+    """OpenAI 메시지 목록의 토큰 수를 대략 추정한다"""
+    return sum(estimate_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+def estimate_request_tokens(request: dict) -> int:
+    """
+    chat.completions.create 요청 하나가 TPM 한도에서 차지할 토큰 수를 추정한다.
+
+    OpenAI는 요청 시점에 프롬프트 토큰 + max_tokens를 한도에서 미리 차감하므로 같은 방식으로 센다.
+    """
+    prompt_tokens = estimate_message_tokens(request.get("messages") or [])
+    return prompt_tokens + (request.get("max_tokens") or DEFAULT_COMPLETION_TOKENS)
@@ -0,0 +1,44 @@
+import threading
+from functools import lru_cache
+
+
+class MetricsRegistry:
+    """
+    프로세스 내 카운터/게이지 메트릭 저장소.
+
+    이름별 현재값만 보관하는 가벼운 구현으로, 외부 수집기가 snapshot()을 읽어 간다.
+    """
+
+    def __init__(self):
+        self._counters: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """카운터를 value만큼 증가시킨다"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set(self, name: str, value: float) -> None:
+        """게이지를 value로 설정한다 (대기열 길이처럼 오르내리는 값)"""
+        with self._lock:
+            self._counters[name] = value
+
+    def get(self, name: str) -> float:
+        """메트릭 현재값을 반환한다 (기록된 적 없으면 0)"""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict[str, float]:
+        """모든 메트릭의 현재값을 반환한다"""
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+@lru_cache
+def get_metrics() -> MetricsRegistry:
+    """프로세스 공용 메트릭 저장소"""
+    return MetricsRegistry()
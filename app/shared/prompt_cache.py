@@ -0,0 +1,34 @@
+import logging
+
+from app.shared.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+METRIC_PROMPT_TOKENS = "openai.prompt_tokens"
+METRIC_CACHED_PROMPT_TOKENS = "openai.prompt_tokens.cached"
+
+
+def record_prompt_usage(usage, metrics: MetricsRegistry | None = None) -> None:
+    """
+    OpenAI 응답 usage에서 프롬프트 토큰과 프롬프트 캐시 적중 토큰 수를 기록한다.
+
+    usage.prompt_tokens_details.cached_tokens가 없으면(캐시 미적중/미지원) 0으로 센다.
+    """
+    if usage is None:
+        return
+    metrics = metrics or get_metrics()
+    prompt_tokens = usage.prompt_tokens or 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", None) or 0
+    metrics.increment(METRIC_PROMPT_TOKENS, prompt_tokens)
+    metrics.increment(METRIC_CACHED_PROMPT_TOKENS, cached_tokens)
+    logger.debug("프롬프트 캐시 적중: %d / %d 토큰", cached_tokens, prompt_tokens)
+
+
+def prompt_cache_hit_ratio(metrics: MetricsRegistry | None = None) -> float:
+    """지금까지 보낸 프롬프트 토큰 중 캐시에서 처리된 비율 (보낸 적 없으면 0)"""
+    metrics = metrics or get_metrics()
+    prompt_tokens = metrics.get(METRIC_PROMPT_TOKENS)
+    if not prompt_tokens:
+        return 0.0
+    return metrics.get(METRIC_CACHED_PROMPT_TOKENS) / prompt_tokens
@@ -0,0 +1,102 @@
+import json
+import logging
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Callable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.shared.metrics import get_metrics
+from app.shared.rate_limit.store import InMemoryRateLimitStore, RateLimitStore
+
+logger = logging.getLogger(__name__)
+
+METRIC_RATE_LIMITED = "http.rate_limited"
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    경로별 요청 수 제한 규칙.
+
+    같은 name의 규칙은 카운터를 공유하며, cost는 요청 하나가 차지하는 양이다
+    (예: 톤 3개를 변환하는 요청은 LLM 호출 3번이므로 cost=3).
+    """
+
+    name: str
+    path_pattern: str
+    limit: int
+    window_seconds: int = 60
+    methods: frozenset[str] = field(default_factory=lambda: frozenset({"POST"}))
+    cost: int = 1
+
+    def __post_init__(self):
+        if self.cost > self.limit:
+            raise ValueError(f"{self.name}: cost({self.cost})가 limit({self.limit})보다 큽니다")
+
+    def matches(self, method: str, path: str) -> bool:
+        return method in self.methods and re.fullmatch(self.path_pattern, path) is not None
+
+
+class RateLimitMiddleware:
+    """
+    사용자별 요청 수 제한 ASGI 미들웨어.
+
+    라우팅/의존성보다 먼저 실행되므로 한도를 넘은 요청은 DB 조회나 LLM 호출 없이 429와 Retry-After로 끝난다.
+    응답을 감싸지 않는 순수 ASGI 미들웨어라 스트리밍 응답에도 영향이 없다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: list[RateLimitRule],
+        identify: Callable[[Scope], str],
+        store: RateLimitStore | None = None,
+    ):
+        self.app = app
+        self._rules = rules
+        self._identify = identify
+        self._store = store or InMemoryRateLimitStore()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rule = next((r for r in self._rules if r.matches(scope["method"], scope["path"])), None)
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        identity = self._identify(scope)
+        try:
+            allowed, retry_after = await self._store.hit(
+                f"{rule.name}:{identity}", rule.limit, rule.window_seconds, rule.cost
+            )
+        except Exception as e:
+            # 저장소 장애로 서비스 전체를 막지 않는다 (제한 없이 통과)
+            logger.warning("요청 수 제한 저장소 오류, 제한 없이 처리합니다: %r", e)
+            allowed, retry_after = True, 0.0
+
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+
+        get_metrics().increment(f"{METRIC_RATE_LIMITED}.{rule.name}")
+        await self._reject(send, retry_after)
+
+    async def _reject(self, send: Send, retry_after: float) -> None:
+        body = json.dumps(
+            {"detail": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요"}, ensure_ascii=False
+        ).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,121 @@
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable
+
+
+def sliding_window_decision(
+    previous: float, current: float, limit: int, window_seconds: float, elapsed: float, cost: int
+) -> tuple[bool, float]:
+    """
+    슬라이딩 윈도 카운터로 허용 여부와 다시 시도할 수 있을 때까지의 시간(초)을 계산한다.
+
+    직전 고정 윈도 카운트를 현재 윈도와 겹치는 비율만큼만 반영해 윈도 경계의 몰림을 막는다:
+    estimated = previous * (1 - elapsed / window) + current
+    """
+    fraction = elapsed / window_seconds
+    if previous * (1 - fraction) + current + cost <= limit:
+        return True, 0.0
+
+    if current + cost <= limit:
+        # 직전 윈도 비중이 줄어들 때까지 기다린다
+        needed_fraction = 1 - (limit - current - cost) / previous
+        return False, max(0.0, (needed_fraction - fraction) * window_seconds)
+
+    # 현재 윈도가 가득 찼으면 다음 윈도에서 지금 카운트의 비중이 충분히 줄어들 때까지 기다린다
+    needed_fraction = max(0.0, 1 - (limit - cost) / current) if current else 0.0
+    return False, (window_seconds - elapsed) + needed_fraction * window_seconds
+
+
+class RateLimitStore(ABC):
+    """요청 수 제한 카운터 저장소 포트 (인메모리/Redis 호환 구현 교체 가능)"""
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> tuple[bool, float]:
+        """
+        key의 현재 윈도에 cost만큼 기록한다.
+
+        Returns:
+            (허용 여부, 거부 시 다시 시도할 수 있을 때까지의 초). 거부된 요청은 기록하지 않는다.
+        """
+        pass
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """
+    프로세스 내 슬라이딩 윈도 카운터 저장소.
+
+    key마다 (윈도 번호, 현재 윈도 카운트, 직전 윈도 카운트)만 보관하므로 요청 수와 무관하게 메모리가 일정하다.
+    key 수가 max_keys에 닿으면 지난 key를 먼저 지우고, 그래도 가득 차 있으면 가장 오래 쓰지 않은 key를 지운다.
+    여러 프로세스가 한도를 공유해야 하면 RedisRateLimitStore를 사용한다.
+    """
+
+    DEFAULT_MAX_KEYS = 100_000
+
+    def __init__(self, max_keys: int | None = None, clock: Callable[[], float] = time.time):
+        self._max_keys = max_keys if max_keys is not None else self.DEFAULT_MAX_KEYS
+        self._clock = clock
+        self._windows: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> tuple[bool, float]:
+        now = self._clock()
+        window = int(now // window_seconds)
+        with self._lock:
+            index, current, previous = self._windows.get(key, (window, 0, 0))
+            if index != window:
+                previous = current if index == window - 1 else 0
+                current = 0
+            allowed, retry_after = sliding_window_decision(
+                previous, current, limit, window_seconds, now - window * window_seconds, cost
+            )
+            if allowed:
+                current += cost
+            if len(self._windows) >= self._max_keys and key not in self._windows:
+                self._evict(window)
+            self._windows[key] = (window, current, previous)
+            self._windows.move_to_end(key)
+            return allowed, retry_after
+
+    def _evict(self, window: int) -> None:
+        """더 이상 계산에 쓰이지 않는(두 윈도 이상 지난) key를 지우고, 그래도 가득 차 있으면 LRU key를 지운다"""
+        expired = [key for key, (index, _, _) in self._windows.items() if index < window - 1]
+        for key in expired:
+            del self._windows[key]
+        while len(self._windows) >= self._max_keys:
+            self._windows.popitem(last=False)
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    Redis 호환 서버(redis.asyncio 클라이언트 API)를 사용하는 슬라이딩 윈도 카운터 저장소.
+
+    윈도마다 `<prefix><key>:<윈도 번호>` 카운터를 두고 두 윈도가 지나면 만료시킨다.
+    조회와 기록이 한 번의 원자적 연산은 아니므로 여러 프로세스가 동시에 경계에 닿으면 한도를 약간 넘을 수 있다.
+    """
+
+    DEFAULT_KEY_PREFIX = "ratelimit:"
+
+    def __init__(self, client, key_prefix: str | None = None, clock: Callable[[], float] = time.time):
+        self._client = client
+        self._key_prefix = key_prefix if key_prefix is not None else self.DEFAULT_KEY_PREFIX
+        self._clock = clock
+
+    async def hit(self, key: str, limit: int, window_seconds: int, cost: int = 1) -> tuple[bool, float]:
+        now = self._clock()
+        window = int(now // window_seconds)
+        current_key = f"{self._key_prefix}{key}:{window}"
+        previous_key = f"{self._key_prefix}{key}:{window - 1}"
+
+        previous, current = await self._client.mget(previous_key, current_key)
+        allowed, retry_after = sliding_window_decision(
+            int(previous or 0), int(current or 0), limit, window_seconds, now - window * window_seconds, cost
+        )
+        if allowed:
+            pipeline = self._client.pipeline()
+            pipeline.incrby(current_key, cost)
+            pipeline.expire(current_key, math.ceil(window_seconds * 2))
+            await pipeline.execute()
+        return allowed, retry_after
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from typing import AsyncIterator, Callable
+
+
+def format_sse_event(
+    data: str,
+    event: str | None = None,
+    id: str | None = None,
+    retry: int | None = None,
+) -> str:
+    """
+    SSE 프레임 하나를 만든다.
+
+    data의 줄바꿈(\\n, \\r\\n, \\r)은 여러 data: 줄로 나눠 보내므로,
+    클라이언트(EventSource)는 원래 텍스트를 \\n으로 이어 붙여 그대로 복원한다.
+    """
+    lines = []
+    if event is not None:
+        lines.append(f"event: {event}")
+    if id is not None:
+        lines.append(f"id: {id}")
+    if retry is not None:
+        lines.append(f"retry: {retry}")
+    normalized = data.replace("\r\n", "\n").replace("\r", "\n")
+    lines.extend(f"data: {line}" for line in normalized.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+async def coalesce_chunks(
+    chunks: AsyncIterator[str],
+    window_seconds: float,
+    max_bytes: int,
+    clock: Callable[[], float] = time.monotonic,
+) -> AsyncIterator[str]:
+    """
+    작은 스트리밍 조각을 묶어서 내보낸다.
+
+    첫 조각을 받은 뒤 window_seconds가 지나거나 모인 크기가 max_bytes(UTF-8)에
+    이르면 그때까지의 조각을 하나로 합쳐 반환한다. 업스트림이 멈춰 있어도 창이
+    끝나면 모인 조각을 바로 내보낸다. 업스트림에서 오류가 나면 모인 조각을 내보낸 뒤
+    오류를 다시 발생시킨다. window_seconds가 0 이하이면 묶지 않는다.
+
+    이 제너레이터를 닫아도 chunks는 닫지 않는다 (업스트림 정리는 호출자 몫).
+    """
+    if window_seconds <= 0:
+        async for chunk in chunks:
+            yield chunk
+        return
+
+    iterator = chunks.__aiter__()
+    pending: asyncio.Task | None = None
+    batch: list[str] = []
+    batch_bytes = 0
+    deadline = 0.0
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+            timeout = max(deadline - clock(), 0) if batch else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                # 창이 끝났는데 다음 조각이 아직 없다
+                yield "".join(batch)
+                batch, batch_bytes = [], 0
+                continue
+
+            task, pending = pending, None
+            try:
+                chunk = task.result()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # 오류 전에 받은 조각은 먼저 내보내고 오류를 전달한다
+                if batch:
+                    yield "".join(batch)
+                raise
+
+            if not batch:
+                deadline = clock() + window_seconds
+            batch.append(chunk)
+            batch_bytes += len(chunk.encode("utf-8"))
+            if batch_bytes >= max_bytes or clock() >= deadline:
+                yield "".join(batch)
+                batch, batch_bytes = [], 0
+
+        if batch:
+            yield "".join(batch)
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except (asyncio.CancelledError, StopAsyncIteration):
+                pass
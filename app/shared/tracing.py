@@ -0,0 +1,229 @@
+import functools
+import inspect
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Any, Callable, Iterator
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """요청 안의 한 구간 (이름, 시작 시각, 소요 시간, 부모 구간, 속성)"""
+
+    __slots__ = ("name", "parent", "attributes", "start_ns", "duration", "_started")
+
+    def __init__(self, name: str, parent: "Span | None", attributes: dict[str, Any]):
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.duration: float | None = None  # 초, 끝나기 전에는 None
+        self._started = time.perf_counter()
+
+    @property
+    def end_ns(self) -> int | None:
+        if self.duration is None:
+            return None
+        return self.start_ns + int(self.duration * 1e9)
+
+    def elapsed(self) -> float:
+        """끝났으면 소요 시간, 아직 진행 중이면 지금까지 걸린 시간 (초)"""
+        return self.duration if self.duration is not None else time.perf_counter() - self._started
+
+    def finish(self) -> None:
+        self.duration = time.perf_counter() - self._started
+
+
+class Trace:
+    """요청 하나에서 끝난 구간 모음 (스레드풀에서 실행되는 동기 코드도 같은 Trace에 기록한다)"""
+
+    def __init__(self):
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def server_timing(self, total: Span | None = None) -> str:
+        """
+        Server-Timing 헤더 값을 만든다 (같은 이름의 구간은 합산, 처음 나온 순서).
+
+        total이 있으면 그 구간의 지금까지 소요 시간을 total 항목으로 붙인다.
+        """
+        durations: dict[str, float] = {}
+        for span in self.spans:
+            if span is not total:
+                durations[span.name] = durations.get(span.name, 0.0) + span.elapsed()
+        if total is not None:
+            durations["total"] = total.elapsed()
+        return ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in durations.items())
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_trace() -> Trace | None:
+    return _current_trace.get()
+
+
+@contextmanager
+def start_trace() -> Iterator[Trace]:
+    """새 Trace를 현재 컨텍스트에 설정한다 (요청 단위)"""
+    trace = Trace()
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        yield trace
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+def untraced_context() -> Context:
+    """
+    현재 컨텍스트에서 요청 Trace만 뺀 복사본 (요청 안에서 만드는 백그라운드 태스크용).
+
+    요청 Trace는 응답이 끝나면 내보내지므로, 그 뒤까지 이어지는 작업이 같은 Trace에
+    구간을 쌓으면 아무 데도 전달되지 않는다. asyncio.create_task(..., context=untraced_context())로 쓴다.
+    """
+    context = copy_context()
+    context.run(_current_trace.set, None)
+    context.run(_current_span.set, None)
+    return context
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """
+    현재 요청의 Trace에 구간을 기록한다.
+
+    요청 밖(Trace가 없는 백그라운드 작업 등)에서는 아무것도 기록하지 않는다.
+    토큰을 같은 컨텍스트에서 되돌려야 하므로 async generator의 yield를 가로질러 쓰지 않는다.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    current = Span(name, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.attributes["error"] = type(e).__name__
+        raise
+    finally:
+        current.finish()
+        _current_span.reset(token)
+        trace.add(current)
+
+
+def traced(name: str) -> Callable:
+    """함수(동기/비동기) 실행 전체를 name 구간으로 기록하는 데코레이터"""
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+class SpanExporter(ABC):
+    """요청이 끝난 뒤 구간을 외부 수집기로 내보내는 포트"""
+
+    @abstractmethod
+    def export(self, spans: list[Span]) -> None:
+        pass
+
+
+class NoOpSpanExporter(SpanExporter):
+    """아무 데도 내보내지 않는다 (기본값, Server-Timing 헤더만 사용)"""
+
+    def export(self, spans: list[Span]) -> None:
+        pass
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """
+    OpenTelemetry API로 구간을 다시 기록해 설정된 OTel SDK/exporter로 내보낸다.
+
+    opentelemetry-api 패키지가 필요하다 (config.tracing에서 설치 여부를 확인한다).
+    """
+
+    def __init__(self, tracer=None):
+        from opentelemetry import trace as otel_trace
+
+        self._otel_trace = otel_trace
+        self._tracer = tracer or otel_trace.get_tracer("hexa-ai")
+
+    def export(self, spans: list[Span]) -> None:
+        otel_spans: dict[int, Any] = {}
+        # 부모가 먼저 만들어지도록 시작 시각 순으로 기록한다
+        for span_ in sorted(spans, key=lambda s: s.start_ns):
+            parent = otel_spans.get(id(span_.parent)) if span_.parent is not None else None
+            context = self._otel_trace.set_span_in_context(parent) if parent is not None else None
+            otel_span = self._tracer.start_span(
+                span_.name, context=context, start_time=span_.start_ns, attributes=span_.attributes
+            )
+            otel_span.end(end_time=span_.end_ns)
+            otel_spans[id(span_)] = otel_span
+
+
+class TracingMiddleware:
+    """
+    요청마다 Trace를 시작하고 Server-Timing 헤더로 구간별 소요 시간을 알려주는 ASGI 미들웨어.
+
+    헤더는 응답 시작 시점에 만들어지므로 스트리밍 응답은 첫 바이트 전까지의 구간만 담긴다.
+    전체 구간은 요청이 끝난 뒤 exporter로 내보낸다.
+    server_timing이 False면 헤더는 붙이지 않고 내보내기만 한다 (내부 구간 이름을 외부에 노출하지 않음).
+    """
+
+    def __init__(self, app: ASGIApp, exporter: SpanExporter | None = None, server_timing: bool = True):
+        self.app = app
+        self._exporter = exporter or NoOpSpanExporter()
+        self._server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with start_trace() as trace:
+            with span("request", method=scope["method"], path=scope["path"]) as root:
+
+                async def send_with_timing(message) -> None:
+                    if message["type"] == "http.response.start" and self._server_timing:
+                        headers = list(message.get("headers", []))
+                        headers.append((b"server-timing", trace.server_timing(total=root).encode("latin-1")))
+                        message = {**message, "headers": headers}
+                    await send(message)
+
+                await self.app(scope, receive, send_with_timing)
+
+        try:
+            self._exporter.export(trace.spans)
+        except Exception as e:
+            logger.warning("구간 내보내기에 실패했습니다: %r", e)
@@ -0,0 +1,140 @@
+import importlib.util
+import logging
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from app.shared.llm.circuit_breaker import CircuitBreaker
+from app.shared.llm.gateway import (
+    OPERATION_ANALYSIS,
+    OPERATION_CONVERT,
+    OPERATION_GREETING,
+    OPERATION_RESPONSE,
+    AsyncLLMGateway,
+    LLMGateway,
+)
+from app.shared.llm.rate_scheduler import LLMRateScheduler
+from app.shared.llm.retry_policy import RetryPolicy
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 사용 여부 (설정 + h2 패키지 설치 여부)"""
+    if not get_settings().OPENAI_HTTP2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("OPENAI_HTTP2가 설정되었지만 h2 패키지가 없어 HTTP/1.1을 사용합니다")
+        return False
+    return True
+
+
+def _limits() -> httpx.Limits:
+    """OpenAI HTTP 커넥션 풀 제한"""
+    settings = get_settings()
+    return httpx.Limits(
+        max_connections=settings.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+@lru_cache()
+def get_openai_client() -> OpenAI:
+    """프로세스 전역 OpenAI 클라이언트 반환 (커넥션 풀/keep-alive 재사용, 재시도는 게이트웨이가 담당)"""
+    return OpenAI(
+        api_key=get_settings().OPENAI_API_KEY,
+        max_retries=0,
+        http_client=DefaultHttpxClient(limits=_limits(), http2=_http2_enabled()),
+    )
+
+
+@lru_cache()
+def get_async_openai_client() -> AsyncOpenAI:
+    """프로세스 전역 AsyncOpenAI 클라이언트 반환 (커넥션 풀/keep-alive 재사용, 재시도는 게이트웨이가 담당)"""
+    return AsyncOpenAI(
+        api_key=get_settings().OPENAI_API_KEY,
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(limits=_limits(), http2=_http2_enabled()),
+    )
+
+
+@lru_cache()
+def get_openai_circuit_breaker() -> CircuitBreaker:
+    """동기/비동기 게이트웨이가 공유하는 서킷 브레이커 (같은 업스트림이므로 오류율을 함께 센다)"""
+    settings = get_settings()
+    return CircuitBreaker(
+        window_size=settings.OPENAI_BREAKER_WINDOW_SIZE,
+        min_calls=settings.OPENAI_BREAKER_MIN_CALLS,
+        failure_rate=settings.OPENAI_BREAKER_FAILURE_RATE,
+        open_seconds=settings.OPENAI_BREAKER_OPEN_SECONDS,
+    )
+
+
+@lru_cache()
+def get_llm_rate_scheduler() -> LLMRateScheduler | None:
+    """동기/비동기 게이트웨이가 공유하는 RPM/TPM 스케줄러 (한도 미설정 시 None)"""
+    settings = get_settings()
+    if settings.OPENAI_RPM_LIMIT <= 0 or settings.OPENAI_TPM_LIMIT <= 0:
+        return None
+    return LLMRateScheduler(
+        requests_per_minute=settings.OPENAI_RPM_LIMIT,
+        tokens_per_minute=settings.OPENAI_TPM_LIMIT,
+    )
+
+
+def _retry_policy() -> RetryPolicy:
+    settings = get_settings()
+    return RetryPolicy(
+        max_retries=settings.OPENAI_MAX_RETRIES,
+        base_delay_seconds=settings.OPENAI_RETRY_BASE_DELAY_SECONDS,
+        max_delay_seconds=settings.OPENAI_RETRY_MAX_DELAY_SECONDS,
+    )
+
+
+def _deadlines() -> dict[str, float]:
+    settings = get_settings()
+    return {
+        OPERATION_GREETING: settings.OPENAI_DEADLINE_GREETING_SECONDS,
+        OPERATION_RESPONSE: settings.OPENAI_DEADLINE_RESPONSE_SECONDS,
+        OPERATION_ANALYSIS: settings.OPENAI_DEADLINE_ANALYSIS_SECONDS,
+        OPERATION_CONVERT: settings.OPENAI_DEADLINE_CONVERT_SECONDS,
+    }
+
+
+@lru_cache()
+def get_llm_gateway() -> LLMGateway:
+    """프로세스 전역 OpenAI 클라이언트를 감싼 LLM 게이트웨이"""
+    return LLMGateway(
+        get_openai_client(),
+        retry_policy=_retry_policy(),
+        circuit_breaker=get_openai_circuit_breaker(),
+        deadlines=_deadlines(),
+        scheduler=get_llm_rate_scheduler(),
+    )
+
+
+@lru_cache()
+def get_async_llm_gateway() -> AsyncLLMGateway:
+    """프로세스 전역 AsyncOpenAI 클라이언트를 감싼 LLM 게이트웨이"""
+    return AsyncLLMGateway(
+        get_async_openai_client(),
+        retry_policy=_retry_policy(),
+        circuit_breaker=get_openai_circuit_breaker(),
+        deadlines=_deadlines(),
+        scheduler=get_llm_rate_scheduler(),
+    )
+
+
+async def close_openai_clients() -> None:
+    """생성된 OpenAI 클라이언트의 커넥션 풀을 닫는다 (애플리케이션 종료 시)"""
+    get_llm_gateway.cache_clear()
+    get_async_llm_gateway.cache_clear()
+    if get_openai_client.cache_info().currsize:
+        get_openai_client().close()
+        get_openai_client.cache_clear()
+    if get_async_openai_client.cache_info().currsize:
+        await get_async_openai_client().close()
+        get_async_openai_client.cache_clear()
@@ -0,0 +1,36 @@
+import importlib.util
+import logging
+
+from app.shared.rate_limit.middleware import RateLimitRule
+from app.shared.rate_limit.store import InMemoryRateLimitStore, RateLimitStore, RedisRateLimitStore
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_rate_limit_rules() -> list[RateLimitRule]:
+    """LLM을 호출하는 엔드포인트별 요청 수 제한 규칙"""
+    settings = get_settings()
+    converter_limit = settings.RATE_LIMIT_CONVERTER_CALLS_PER_MINUTE
+    consult_limit = settings.RATE_LIMIT_CONSULT_MESSAGES_PER_MINUTE
+    return [
+        RateLimitRule(name="converter", path_pattern=r"/converter/convert", limit=converter_limit),
+        RateLimitRule(
+            name="converter", path_pattern=r"/converter/convert-three-tones", limit=converter_limit, cost=3
+        ),
+        RateLimitRule(name="consult-message", path_pattern=r"/consult/[^/]+/message(/stream)?", limit=consult_limit),
+    ]
+
+
+def get_rate_limit_store() -> RateLimitStore:
+    """요청 수 제한 저장소 (RATE_LIMIT_REDIS_URL이 있고 redis 패키지가 설치된 경우 Redis)"""
+    redis_url = get_settings().RATE_LIMIT_REDIS_URL
+    if not redis_url:
+        return InMemoryRateLimitStore()
+    if importlib.util.find_spec("redis") is None:
+        logger.warning("RATE_LIMIT_REDIS_URL이 설정되었지만 redis 패키지가 없어 인메모리 저장소를 사용합니다")
+        return InMemoryRateLimitStore()
+
+    import redis.asyncio
+
+    return RedisRateLimitStore(redis.asyncio.from_url(redis_url))
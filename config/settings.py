@@ -18,6 +18,72 @@ class Settings(BaseSettings):
     # OpenAI Settings (필수)
     OPENAI_API_KEY: str
 
+    # OpenAI HTTP 커넥션 풀 (프로세스 전역 클라이언트)
+    OPENAI_MAX_CONNECTIONS: int = 100
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    OPENAI_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    OPENAI_HTTP2: bool = False  # h2 패키지가 설치된 경우에만 적용
+
+    # OpenAI 호출 정책 (LLM 게이트웨이: 재시도, 작업별 마감 시간, 서킷 브레이커)
+    OPENAI_MAX_RETRIES: int = 2
+    OPENAI_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    OPENAI_RETRY_MAX_DELAY_SECONDS: float = 8.0
+    OPENAI_DEADLINE_GREETING_SECONDS: float = 10.0
+    OPENAI_DEADLINE_RESPONSE_SECONDS: float = 30.0
+    OPENAI_DEADLINE_ANALYSIS_SECONDS: float = 60.0
+    OPENAI_DEADLINE_CONVERT_SECONDS: float = 20.0
+    OPENAI_BREAKER_WINDOW_SIZE: int = 20  # 오류율을 계산할 최근 호출 수
+    OPENAI_BREAKER_MIN_CALLS: int = 10
+    OPENAI_BREAKER_FAILURE_RATE: float = 0.5
+    OPENAI_BREAKER_OPEN_SECONDS: float = 30.0
+
+    # OpenAI 계정 호출 한도 (프로세스 전역 스케줄러, 둘 중 하나라도 0이면 스케줄러 미사용)
+    OPENAI_RPM_LIMIT: int = 500
+    OPENAI_TPM_LIMIT: int = 200000
+
+    # Converter: 3가지 톤을 한 번의 요청으로 변환 (실패한 톤만 톤별 변환)
+    CONVERTER_BATCH_MODE: bool = True
+
+    # Converter 결과 캐시 (인메모리 LRU + 선택적 DB 영속 계층)
+    CONVERTER_CACHE_ENABLED: bool = True
+    CONVERTER_CACHE_MAX_SIZE: int = 5000
+    CONVERTER_CACHE_TTL_SECONDS: int = 60 * 60 * 24
+    CONVERTER_CACHE_PERSISTENT: bool = False
+    CONVERTER_CACHE_PERSISTENT_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    CONVERTER_CACHE_PURGE_INTERVAL_SECONDS: int = 60 * 60  # 만료된 영속 캐시 삭제 주기
+
+    # Consult: (MBTI, 성별) 조합마다 미리 생성해 둘 인사말 수 (0이면 풀 미사용)
+    CONSULT_GREETING_POOL_SIZE: int = 3
+
+    # Consult: 마지막 턴의 분석을 백그라운드에서 생성 (False면 응답과 함께 동기 생성)
+    CONSULT_BACKGROUND_ANALYSIS: bool = True
+
+    # Consult: 최근 턴만 원문으로 보내고 오래된 턴은 누적 요약으로 대체 (프롬프트 크기 제한)
+    # 5턴 세션 안에서도 턴이 길어 TOKEN_BUDGET을 넘으면 오래된 턴을 요약한다 (응답 전 요약 호출이 한 번 추가됨)
+    CONSULT_CONTEXT_KEEP_TURNS: int = 5
+    CONSULT_CONTEXT_TOKEN_BUDGET: int = 3000
+
+    # Consult: 스트리밍 응답 SSE 프레임 묶기 (COALESCE_MS가 0이면 조각마다 전송)
+    CONSULT_STREAM_COALESCE_MS: int = 30
+    CONSULT_STREAM_COALESCE_MAX_BYTES: int = 512
+    CONSULT_STREAM_RETRY_MS: int = 3000  # 재연결 대기 시간 (SSE retry 필드)
+
+    # Consult: 끊긴 스트림 이어 받기 (Last-Event-ID)
+    CONSULT_STREAM_REPLAY_MAX_EVENTS: int = 256  # 스트림당 보관할 최근 이벤트 수
+    CONSULT_STREAM_REPLAY_TTL_SECONDS: float = 60.0  # 끝난 스트림 보관 시간
+    CONSULT_STREAM_RESUME_GRACE_SECONDS: float = 5.0  # 연결이 끊긴 뒤 생성을 유지하는 시간
+
+    # 사용자별 요청 수 제한 (분당, 사용자 → 세션 → 클라이언트 IP 순으로 구분)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_CONVERTER_CALLS_PER_MINUTE: int = 30  # 톤 변환 LLM 호출 수 (3톤 변환은 3회)
+    RATE_LIMIT_CONSULT_MESSAGES_PER_MINUTE: int = 20
+    RATE_LIMIT_REDIS_URL: str | None = None  # 설정 시 프로세스 간 한도 공유 (redis 패키지 필요)
+
+    # 요청 구간 추적 (Server-Timing 헤더, EXPORTER="otel"이면 OpenTelemetry로도 내보냄)
+    # 운영 환경에서는 내부 구간 이름이 노출되지 않도록 Server-Timing 헤더를 붙이지 않는다
+    TRACING_ENABLED: bool = True
+    TRACING_EXPORTER: str = "none"  # "none" or "otel" (opentelemetry-api 패키지 필요)
+
     # Environment
     ENV: str = "development"  # "development" or "production"
 
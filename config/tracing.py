@@ -0,0 +1,17 @@
+import importlib.util
+import logging
+
+from app.shared.tracing import NoOpSpanExporter, OpenTelemetrySpanExporter, SpanExporter
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_span_exporter() -> SpanExporter:
+    """요청 구간 exporter (TRACING_EXPORTER="otel"이고 opentelemetry가 설치된 경우 OpenTelemetry)"""
+    if get_settings().TRACING_EXPORTER != "otel":
+        return NoOpSpanExporter()
+    if importlib.util.find_spec("opentelemetry") is None:
+        logger.warning("TRACING_EXPORTER=otel이 설정되었지만 opentelemetry 패키지가 없어 내보내지 않습니다")
+        return NoOpSpanExporter()
+    return OpenTelemetrySpanExporter()
@@ -1,5 +1,7 @@
 """Converter Router API 테스트"""
 
+import asyncio
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -19,6 +21,16 @@ def test_app():
     return app
 
 
+@pytest.fixture(autouse=True)
+def clear_tone_cache():
+    """테스트 간 톤 변환 캐시 공유 방지"""
+    from app.converter.adapter.input.web.converter_router import get_tone_conversion_cache
+
+    get_tone_conversion_cache().clear()
+    yield
+    get_tone_conversion_cache().clear()
+
+
 @pytest.fixture
 def client(test_app):
     """FastAPI 테스트 클라이언트"""
@@ -235,3 +247,160 @@ class TestConverterRouterThreeTones:
         assert call_args.kwargs["original_message"] == "테스트 메시지"
         assert call_args.kwargs["sender_mbti"].value == "INTJ"
         assert call_args.kwargs["receiver_mbti"].value == "ESTP"
+
+    @patch("app.converter.adapter.input.web.converter_router.OpenAIMessageConverter")
+    @patch("app.converter.adapter.input.web.converter_router.ConvertMessageUseCase")
+    def test_should_return_502_when_all_tones_fail(
+        self, mock_use_case_class, mock_converter_class, client
+    ):
+        """모든 톤 변환이 실패하면 502를 반환해야 함"""
+        # Given
+        mock_use_case = Mock()
+        mock_use_case.execute.side_effect = RuntimeError("모든 톤 변환에 실패했습니다")
+        mock_use_case_class.return_value = mock_use_case
+
+        request_body = {
+            "original_message": "테스트",
+            "sender_mbti": "INTJ",
+            "receiver_mbti": "ESTP",
+        }
+
+        # When
+        response = client.post("/converter/convert-three-tones", json=request_body)
+
+        # Then
+        assert response.status_code == 502
+
+
+class TestSharedOpenAIClient:
+    """프로세스 전역 OpenAI 클라이언트 재사용 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_clients(self):
+        """테스트마다 전역 클라이언트 초기화"""
+        from config.openai_client import close_openai_clients
+
+        asyncio.run(close_openai_clients())
+        yield
+        asyncio.run(close_openai_clients())
+
+    @patch("app.converter.adapter.input.web.converter_router.ConvertMessageUseCase")
+    def test_should_reuse_same_client_across_requests(self, mock_use_case_class, client):
+        """여러 요청이 같은 OpenAI 클라이언트(커넥션 풀)를 공유해야 함"""
+        # Given
+        from config.openai_client import get_openai_client
+
+        mock_use_case_class.return_value.execute.return_value = []
+        request_body = {
+            "original_message": "테스트",
+            "sender_mbti": "INTJ",
+            "receiver_mbti": "ESTP",
+        }
+
+        # When
+        for _ in range(5):
+            client.post("/converter/convert-three-tones", json=request_body)
+
+        # Then
+        clients = {
+            id(call.kwargs["converter"]._converter.client)
+            for call in mock_use_case_class.call_args_list
+        }
+        assert len(mock_use_case_class.call_args_list) == 5
+        assert clients == {id(get_openai_client())}
+
+    def test_should_close_and_recreate_client(self):
+        """종료 시 클라이언트를 닫고 다음 호출에서 새로 생성해야 함"""
+        # Given
+        from config.openai_client import close_openai_clients, get_openai_client
+
+        first = get_openai_client()
+
+        # When
+        asyncio.run(close_openai_clients())
+
+        # Then
+        assert first.is_closed()
+        assert get_openai_client() is not first
+
+    def test_should_not_create_client_per_request(self):
+        """워밍업 이후의 요청은 OpenAI 클라이언트를 새로 생성하지 않아야 함"""
+        # Given
+        from app.converter.adapter.input.web.converter_router import get_message_converter
+
+        get_message_converter()  # 공유 클라이언트 워밍업
+
+        # When
+        with patch("config.openai_client.OpenAI") as config_openai, patch(
+            "app.converter.infrastructure.service.openai_message_converter.OpenAI"
+        ) as converter_openai:
+            for _ in range(50):
+                get_message_converter()
+
+        # Then
+        config_openai.assert_not_called()
+        converter_openai.assert_not_called()
+
+
+class TestConverterCacheHeader:
+    """X-Cache 헤더 테스트"""
+
+    @patch("app.converter.adapter.input.web.converter_router.OpenAIMessageConverter")
+    def test_should_return_cache_hit_header_on_repeated_request(
+        self, mock_converter_class, client, mock_converter
+    ):
+        """같은 요청을 반복하면 LLM 호출 없이 X-Cache: HIT를 반환해야 함"""
+        # Given
+        mock_converter_class.return_value = mock_converter
+        request_body = {
+            "original_message": "내일 회의 시간 바꿀 수 있어?",
+            "sender_mbti": "INTJ",
+            "receiver_mbti": "ESTP",
+            "tone": "공손한",
+        }
+
+        # When
+        first = client.post("/converter/convert", json=request_body)
+        second = client.post("/converter/convert", json=request_body)
+
+        # Then
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == first.json()
+        assert mock_converter.convert.call_count == 1
+
+    @patch("app.converter.adapter.input.web.converter_router.OpenAIMessageConverter")
+    def test_should_return_partial_header_when_some_tones_cached(
+        self, mock_converter_class, client
+    ):
+        """일부 톤만 캐시된 경우 X-Cache: PARTIAL을 반환해야 함"""
+        # Given
+        converter = Mock()
+        converter.convert.side_effect = lambda **kwargs: ToneMessage(
+            tone=kwargs["tone"], content="변환", explanation="설명"
+        )
+        converter.convert_batch.side_effect = lambda **kwargs: [
+            ToneMessage(tone=tone, content="변환", explanation="설명")
+            for tone in kwargs["tones"]
+        ]
+        mock_converter_class.return_value = converter
+        client.post(
+            "/converter/convert",
+            json={
+                "original_message": "테스트",
+                "sender_mbti": "INTJ",
+                "receiver_mbti": "ESTP",
+                "tone": "공손한",
+            },
+        )
+
+        # When
+        response = client.post(
+            "/converter/convert-three-tones",
+            json={"original_message": "테스트", "sender_mbti": "INTJ", "receiver_mbti": "ESTP"},
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == "PARTIAL"
+        assert len(response.json()["tones"]) == 3
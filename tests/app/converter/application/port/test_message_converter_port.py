@@ -58,3 +58,31 @@ class TestMessageConverterPort:
         # Then
         assert isinstance(result, ToneMessage)
         assert result.tone == "공손한"
+
+    def test_convert_batch_default_calls_convert_for_each_tone(self):
+        """convert_batch 기본 구현은 톤마다 convert를 호출해야 함"""
+        # Given
+        from app.converter.application.port.message_converter_port import MessageConverterPort
+        from app.shared.vo.mbti import MBTI
+
+        class FakeMessageConverter(MessageConverterPort):
+            def __init__(self):
+                self.called_tones = []
+
+            def convert(self, original_message, sender_mbti, receiver_mbti, tone):
+                self.called_tones.append(tone)
+                return ToneMessage(tone=tone, content="변환된 메시지", explanation="설명")
+
+        converter = FakeMessageConverter()
+
+        # When
+        results = converter.convert_batch(
+            original_message="테스트",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+            tones=["공손한", "간결한"],
+        )
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "간결한"]
+        assert converter.called_tones == ["공손한", "간결한"]
@@ -1,5 +1,7 @@
 """ConvertMessageUseCase 테스트"""
 
+import threading
+
 import pytest
 from unittest.mock import Mock
 
@@ -17,24 +19,26 @@ class TestConvertMessageUseCase:
             ConvertMessageUseCase,
         )
 
-        mock_converter = Mock()
-        mock_converter.convert.side_effect = [
-            ToneMessage(
+        tone_messages = {
+            "공손한": ToneMessage(
                 tone="공손한",
                 content="안녕하세요, 내일 회의 시간을 조정해주실 수 있을까요?",
                 explanation="공손한 표현이 효과적입니다.",
             ),
-            ToneMessage(
+            "캐주얼한": ToneMessage(
                 tone="캐주얼한",
                 content="내일 회의 시간 바꿀 수 있어?",
                 explanation="캐주얼한 표현이 효과적입니다.",
             ),
-            ToneMessage(
+            "간결한": ToneMessage(
                 tone="간결한",
                 content="회의 시간 변경 가능?",
                 explanation="간결한 표현이 효과적입니다.",
             ),
-        ]
+        }
+        # 톤 변환은 동시에 실행되므로 호출 순서가 아닌 톤으로 응답을 결정한다
+        mock_converter = Mock()
+        mock_converter.convert.side_effect = lambda **kwargs: tone_messages[kwargs["tone"]]
 
         use_case = ConvertMessageUseCase(converter=mock_converter)
 
@@ -114,3 +118,239 @@ class TestConvertMessageUseCase:
         assert first_call.kwargs["sender_mbti"] == sender_mbti
         assert first_call.kwargs["receiver_mbti"] == receiver_mbti
         assert first_call.kwargs["original_message"] == "테스트"
+
+    def test_should_convert_tones_concurrently(self):
+        """3가지 톤 변환이 동시에 실행되어야 함"""
+        # Given: 세 호출이 모두 도착해야 통과하는 장벽에서 기다리는 converter (순차 실행이면 장벽이 깨진다)
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def convert(**kwargs):
+            barrier.wait()
+            return ToneMessage(tone=kwargs["tone"], content="변환된 메시지", explanation="설명")
+
+        mock_converter = Mock()
+        mock_converter.convert.side_effect = convert
+        use_case = ConvertMessageUseCase(converter=mock_converter, tone_timeout=10)
+
+        # When
+        results = use_case.execute(
+            original_message="테스트",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+        )
+
+        # Then: 세 톤이 모두 장벽을 통과했고 톤 순서는 유지된다
+        assert not barrier.broken
+        assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+
+    def test_should_return_successful_tones_when_some_fail(self):
+        """일부 톤 변환이 실패해도 성공한 톤은 반환해야 함"""
+        # Given: 캐주얼한 톤만 실패하는 converter
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        def convert(**kwargs):
+            if kwargs["tone"] == "캐주얼한":
+                raise ValueError("JSON 파싱 실패")
+            return ToneMessage(tone=kwargs["tone"], content="변환된 메시지", explanation="설명")
+
+        mock_converter = Mock()
+        mock_converter.convert.side_effect = convert
+        use_case = ConvertMessageUseCase(converter=mock_converter)
+
+        # When
+        results = use_case.execute(
+            original_message="테스트",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+        )
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "간결한"]
+
+    def test_should_drop_tone_exceeding_timeout(self):
+        """제한 시간을 넘긴 톤은 기다리지 않고 제외해야 함"""
+        # Given: 간결한 톤만 변환이 끝난 뒤에야 풀려나는 converter
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        release = threading.Event()
+
+        def convert(**kwargs):
+            if kwargs["tone"] == "간결한":
+                release.wait(5)
+            return ToneMessage(tone=kwargs["tone"], content="변환된 메시지", explanation="설명")
+
+        mock_converter = Mock()
+        mock_converter.convert.side_effect = convert
+        use_case = ConvertMessageUseCase(converter=mock_converter, tone_timeout=0.5)
+
+        # When
+        try:
+            results = use_case.execute(
+                original_message="테스트",
+                sender_mbti=MBTI("INTJ"),
+                receiver_mbti=MBTI("ESTP"),
+            )
+        finally:
+            release.set()
+
+        # Then: 간결한 톤이 끝나기를 기다리지 않고 나머지만 반환한다
+        assert [r.tone for r in results] == ["공손한", "캐주얼한"]
+
+    def test_should_raise_when_all_tones_fail(self):
+        """모든 톤 변환이 실패하면 에러를 발생시켜야 함"""
+        # Given
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        mock_converter = Mock()
+        mock_converter.convert.side_effect = RuntimeError("upstream error")
+        use_case = ConvertMessageUseCase(converter=mock_converter)
+
+        # When & Then
+        with pytest.raises(RuntimeError, match="모든 톤 변환에 실패했습니다"):
+            use_case.execute(
+                original_message="테스트",
+                sender_mbti=MBTI("INTJ"),
+                receiver_mbti=MBTI("ESTP"),
+            )
+
+    def test_batch_mode_should_convert_all_tones_in_single_call(self):
+        """batch_mode면 convert_batch 한 번으로 모든 톤을 변환해야 함"""
+        # Given
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        mock_converter = Mock()
+        mock_converter.convert_batch.return_value = [
+            ToneMessage(tone=tone, content="변환된 메시지", explanation="설명")
+            for tone in ["간결한", "공손한", "캐주얼한"]
+        ]
+        use_case = ConvertMessageUseCase(converter=mock_converter, batch_mode=True)
+
+        # When
+        results = use_case.execute(
+            original_message="테스트",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+        )
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+        assert mock_converter.convert_batch.call_count == 1
+        assert mock_converter.convert.call_count == 0
+
+    def test_batch_mode_should_fill_missing_tones_with_per_tone_calls(self):
+        """batch 결과에서 누락된 톤만 톤별 변환으로 보완해야 함"""
+        # Given
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        mock_converter = Mock()
+        mock_converter.convert_batch.return_value = [
+            ToneMessage(tone="공손한", content="변환된 메시지", explanation="설명")
+        ]
+        mock_converter.convert.side_effect = lambda **kwargs: ToneMessage(
+            tone=kwargs["tone"], content="톤별 메시지", explanation="설명"
+        )
+        use_case = ConvertMessageUseCase(converter=mock_converter, batch_mode=True)
+
+        # When
+        results = use_case.execute(
+            original_message="테스트",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+        )
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+        called_tones = sorted(call.kwargs["tone"] for call in mock_converter.convert.call_args_list)
+        assert called_tones == sorted(["캐주얼한", "간결한"])
+
+    def test_batch_mode_should_fall_back_when_batch_output_is_malformed(self):
+        """batch 응답이 잘못되면 모든 톤을 톤별 변환으로 처리해야 함"""
+        # Given
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        mock_converter = Mock()
+        mock_converter.convert_batch.side_effect = ValueError("일괄 변환 응답 형식이 올바르지 않습니다")
+        mock_converter.convert.side_effect = lambda **kwargs: ToneMessage(
+            tone=kwargs["tone"], content="톤별 메시지", explanation="설명"
+        )
+        use_case = ConvertMessageUseCase(converter=mock_converter, batch_mode=True)
+
+        # When
+        results = use_case.execute(
+            original_message="테스트",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+        )
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+        assert mock_converter.convert.call_count == 3
+
+    def test_batch_mode_should_not_fall_back_after_batch_exhausts_timeout(self):
+        """batch가 제한 시간을 다 쓰면 톤별 변환에 새 제한 시간을 주지 않아야 함"""
+        # Given: 제한 시간보다 오래 걸리는 batch
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        release = threading.Event()
+        mock_converter = Mock()
+        mock_converter.convert_batch.side_effect = lambda **kwargs: release.wait(5) and []
+        use_case = ConvertMessageUseCase(
+            converter=mock_converter, tone_timeout=0.1, batch_mode=True
+        )
+
+        # When & Then: 남은 시간이 없으므로 톤별 변환 없이 실패한다
+        try:
+            with pytest.raises(RuntimeError, match="모든 톤 변환에 실패했습니다"):
+                use_case.execute(
+                    original_message="테스트",
+                    sender_mbti=MBTI("INTJ"),
+                    receiver_mbti=MBTI("ESTP"),
+                )
+        finally:
+            release.set()
+        mock_converter.convert.assert_not_called()
+
+    def test_should_record_per_tone_llm_spans_in_request_trace(self):
+        """톤별 변환 스레드에서 남긴 LLM 구간도 요청 Trace에 기록되어야 함"""
+        # Given: 변환마다 llm.convert 구간을 남기는 converter
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+        from app.shared.tracing import span, start_trace
+
+        def convert(**kwargs):
+            with span("llm.convert"):
+                return ToneMessage(tone=kwargs["tone"], content="변환된 메시지", explanation="설명")
+
+        mock_converter = Mock()
+        mock_converter.convert.side_effect = convert
+        use_case = ConvertMessageUseCase(converter=mock_converter)
+
+        # When
+        with start_trace() as trace:
+            use_case.execute(
+                original_message="테스트",
+                sender_mbti=MBTI("INTJ"),
+                receiver_mbti=MBTI("ESTP"),
+            )
+
+        # Then
+        assert [s.name for s in trace.spans] == ["llm.convert"] * 3
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.cache.tone_conversion_cache import (
+    ToneConversionCache,
+    build_cache_key,
+)
+from app.shared.vo.mbti import MBTI
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.current = datetime(2024, 1, 1, 12, 0, 0)
+
+    def __call__(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: int) -> None:
+        self.current += timedelta(seconds=seconds)
+
+
+def _message(content: str = "내일 회의 시간 조정 가능할까요?") -> ToneMessage:
+    return ToneMessage(tone="공손한", content=content, explanation="ESTP는 직설적인 걸 좋아해")
+
+
+def test_cache_key_ignores_whitespace_differences():
+    """앞뒤/연속 공백만 다른 메시지는 같은 키를 가진다"""
+    key1 = build_cache_key("내일  회의 시간 바꿀 수 있어?", MBTI("INTJ"), MBTI("ESTP"), "공손한", "1")
+    key2 = build_cache_key(" 내일 회의 시간 바꿀 수 있어?\n", MBTI("INTJ"), MBTI("ESTP"), "공손한", "1")
+
+    assert key1 == key2
+    assert len(key1) == 64
+
+
+def test_cache_key_differs_by_tone_receiver_and_prompt_version():
+    """톤/수신자 MBTI/프롬프트 버전이 다르면 키가 달라진다"""
+    base = build_cache_key("안녕", MBTI("INTJ"), MBTI("ESTP"), "공손한", "1")
+
+    assert base != build_cache_key("안녕", MBTI("INTJ"), MBTI("ESTP"), "간결한", "1")
+    assert base != build_cache_key("안녕", MBTI("INTJ"), MBTI("INFP"), "공손한", "1")
+    assert base != build_cache_key("안녕", MBTI("INTJ"), MBTI("ESTP"), "공손한", "2")
+
+
+def test_put_and_get_returns_tone_message():
+    """저장한 변환 결과를 조회할 수 있다"""
+    cache = ToneConversionCache()
+    cache.put("key-1", _message())
+
+    assert cache.get("key-1") == _message()
+    assert cache.get("unknown") is None
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_entry_expires_after_ttl():
+    """TTL이 지나면 캐시 항목이 만료된다"""
+    clock = FakeClock()
+    cache = ToneConversionCache(ttl_seconds=60, now=clock)
+    cache.put("key-1", _message())
+
+    clock.advance(61)
+
+    assert cache.get("key-1") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_evicts_least_recently_used_entry_when_full():
+    """용량을 넘으면 가장 오래 사용되지 않은 항목을 제거한다"""
+    cache = ToneConversionCache(max_size=2)
+    cache.put("key-1", _message("첫번째"))
+    cache.put("key-2", _message("두번째"))
+    cache.get("key-1")  # key-1을 최근 사용으로 갱신
+
+    cache.put("key-3", _message("세번째"))
+
+    assert cache.get("key-2") is None
+    assert cache.get("key-1").content == "첫번째"
+    assert cache.get("key-3").content == "세번째"
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.repository.sql_tone_conversion_store import (
+    SqlToneConversionStore,
+)
+from config.database import Base
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.current = datetime(2024, 1, 1, 12, 0, 0)
+
+    def __call__(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: int) -> None:
+        self.current += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def session_factory():
+    """테스트용 인메모리 SQLite 세션 팩토리 (연결 공유)"""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _message(content: str = "확인 부탁드려요") -> ToneMessage:
+    return ToneMessage(tone="간결한", content=content, explanation="ESTJ는 결론을 먼저 원해")
+
+
+def test_put_and_get_persists_tone_message(session_factory):
+    """저장한 변환 결과를 새 세션에서 조회할 수 있다"""
+    store = SqlToneConversionStore(session_factory)
+
+    store.put("key-1", _message())
+
+    assert store.get("key-1") == _message()
+    assert store.get("unknown") is None
+
+
+def test_put_overwrites_existing_key(session_factory):
+    """같은 키로 저장하면 결과가 갱신된다"""
+    store = SqlToneConversionStore(session_factory)
+    store.put("key-1", _message("이전 결과"))
+
+    store.put("key-1", _message("새 결과"))
+
+    assert store.get("key-1").content == "새 결과"
+
+
+def test_expired_entries_are_ignored_and_purged(session_factory):
+    """만료된 항목은 조회되지 않고 purge_expired로 삭제된다"""
+    clock = FakeClock()
+    store = SqlToneConversionStore(session_factory, ttl_seconds=60, now=clock)
+    store.put("key-1", _message())
+
+    clock.advance(61)
+
+    assert store.get("key-1") is None
+    assert store.purge_expired() == 1
@@ -0,0 +1,122 @@
+"""CachedMessageConverter 테스트"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.cache.tone_conversion_cache import ToneConversionCache
+from app.converter.infrastructure.service.cached_message_converter import (
+    CachedMessageConverter,
+)
+from app.shared.vo.mbti import MBTI
+
+
+def _tone_message(tone: str) -> ToneMessage:
+    return ToneMessage(tone=tone, content=f"{tone} 메시지", explanation=f"{tone} 설명")
+
+
+@pytest.fixture
+def inner():
+    """실제 변환기 역할의 Mock"""
+    converter = Mock()
+    converter.convert.side_effect = lambda **kwargs: _tone_message(kwargs["tone"])
+    converter.convert_batch.side_effect = lambda **kwargs: [
+        _tone_message(tone) for tone in kwargs["tones"]
+    ]
+    return converter
+
+
+@pytest.fixture
+def cached_converter(inner):
+    return CachedMessageConverter(inner, cache=ToneConversionCache(), prompt_version="1")
+
+
+def _convert(converter, message="내일 회의 시간 바꿀 수 있어?", tone="공손한"):
+    return converter.convert(
+        original_message=message,
+        sender_mbti=MBTI("INTJ"),
+        receiver_mbti=MBTI("ESTP"),
+        tone=tone,
+    )
+
+
+class TestCachedMessageConverter:
+    """CachedMessageConverter 테스트"""
+
+    def test_should_return_cached_result_without_calling_llm(self, cached_converter, inner):
+        """같은 요청을 반복하면 두 번째부터 캐시 결과를 반환해야 함"""
+        # Given
+        first = _convert(cached_converter)
+
+        # When
+        second = _convert(cached_converter, message="  내일 회의 시간 바꿀 수 있어? ")
+
+        # Then
+        assert inner.convert.call_count == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second == first
+
+    def test_should_not_share_cache_between_tones(self, cached_converter, inner):
+        """톤이 다르면 캐시를 공유하지 않아야 함"""
+        # When
+        _convert(cached_converter, tone="공손한")
+        result = _convert(cached_converter, tone="간결한")
+
+        # Then
+        assert inner.convert.call_count == 2
+        assert result.tone == "간결한"
+        assert result.cached is False
+
+    def test_should_request_only_missing_tones_in_batch(self, cached_converter, inner):
+        """일괄 변환 시 캐시에 없는 톤만 요청해야 함"""
+        # Given
+        _convert(cached_converter, tone="캐주얼한")
+
+        # When
+        results = cached_converter.convert_batch(
+            original_message="내일 회의 시간 바꿀 수 있어?",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+            tones=["공손한", "캐주얼한", "간결한"],
+        )
+
+        # Then
+        assert inner.convert_batch.call_args.kwargs["tones"] == ["공손한", "간결한"]
+        assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+        assert [r.cached for r in results] == [False, True, False]
+
+    def test_should_fill_memory_cache_from_persistent_store(self, inner):
+        """영속 캐시에 있으면 변환 없이 반환하고 인메모리 캐시에 채워야 함"""
+        # Given
+        store = Mock()
+        store.get.return_value = _tone_message("공손한")
+        cache = ToneConversionCache()
+        converter = CachedMessageConverter(inner, cache=cache, prompt_version="1", store=store)
+
+        # When
+        first = _convert(converter)
+        second = _convert(converter)
+
+        # Then
+        inner.convert.assert_not_called()
+        assert store.get.call_count == 1
+        assert first.cached is True and second.cached is True
+
+    def test_should_convert_when_persistent_store_fails(self, inner):
+        """영속 캐시 오류가 발생해도 변환 결과를 반환해야 함"""
+        # Given
+        store = Mock()
+        store.get.side_effect = RuntimeError("db down")
+        store.put.side_effect = RuntimeError("db down")
+        converter = CachedMessageConverter(
+            inner, cache=ToneConversionCache(), prompt_version="1", store=store
+        )
+
+        # When
+        result = _convert(converter)
+
+        # Then
+        assert result.content == "공손한 메시지"
+        assert inner.convert.call_count == 1
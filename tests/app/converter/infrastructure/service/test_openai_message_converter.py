@@ -146,3 +146,91 @@ class TestOpenAIMessageConverter:
         # 최소 2개 이상의 차원 특성이 언급되어야 함
         dimension_count = sum([has_ei_dimension, has_sn_dimension, has_tf_dimension, has_jp_dimension])
         assert dimension_count >= 2, f"프롬프트에 MBTI 차원 특성이 충분히 포함되지 않았습니다. 포함된 차원 수: {dimension_count}"
+
+
+class TestOpenAIMessageConverterBatch:
+    """OpenAIMessageConverter 일괄 변환 테스트"""
+
+    TONES = ["공손한", "캐주얼한", "간결한"]
+
+    def _converter_with_content(self, mock_openai_class, content: str):
+        from app.converter.infrastructure.service.openai_message_converter import (
+            OpenAIMessageConverter,
+        )
+
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content=content))]
+        mock_client.chat.completions.create.return_value = mock_response
+        return OpenAIMessageConverter(), mock_client
+
+    @patch("app.converter.infrastructure.service.openai_message_converter.OpenAI")
+    def test_should_convert_all_tones_in_single_call(self, mock_openai_class):
+        """한 번의 API 호출로 모든 톤을 변환해야 함"""
+        # Given
+        converter, mock_client = self._converter_with_content(
+            mock_openai_class,
+            '{"tones": ['
+            '{"tone": "간결한", "content": "시간 변경 가능?", "explanation": "ESTP는 직설적이야"},'
+            '{"tone": "공손한", "content": "혹시 시간 바꿔줄 수 있어?", "explanation": "ESTP는 존중받길 원해"},'
+            '{"tone": "캐주얼한", "content": "야 시간 바꿀래?", "explanation": "ESTP는 편한 걸 좋아해"}'
+            ']}',
+        )
+
+        # When
+        results = converter.convert_batch(
+            original_message="내일 회의 시간 바꿀 수 있어?",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+            tones=self.TONES,
+        )
+
+        # Then: 요청한 톤 순서대로 반환되고 API는 한 번만 호출된다
+        assert [r.tone for r in results] == self.TONES
+        assert mock_client.chat.completions.create.call_count == 1
+
+        # 수신자 MBTI 특성은 프롬프트에 한 번만 포함된다
+        prompt_text = mock_client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert prompt_text.count("외향적 (Extrovert)") == 1
+        for tone in self.TONES:
+            assert f"[{tone} 스타일]" in prompt_text
+
+    @patch("app.converter.infrastructure.service.openai_message_converter.OpenAI")
+    def test_should_skip_invalid_tone_items(self, mock_openai_class):
+        """형식이 잘못된 톤 항목은 결과에서 제외해야 함"""
+        # Given: 캐주얼한 톤의 content가 비어 있고 간결한 톤은 누락된 응답
+        converter, _ = self._converter_with_content(
+            mock_openai_class,
+            '{"tones": ['
+            '{"tone": "공손한", "content": "혹시 시간 바꿔줄 수 있어?", "explanation": "설명"},'
+            '{"tone": "캐주얼한", "content": "", "explanation": "설명"},'
+            '"잘못된 항목"'
+            ']}',
+        )
+
+        # When
+        results = converter.convert_batch(
+            original_message="테스트",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+            tones=self.TONES,
+        )
+
+        # Then
+        assert [r.tone for r in results] == ["공손한"]
+
+    @patch("app.converter.infrastructure.service.openai_message_converter.OpenAI")
+    def test_should_raise_value_error_on_malformed_json(self, mock_openai_class):
+        """JSON 형식이 아니면 ValueError를 발생시켜야 함"""
+        # Given
+        converter, _ = self._converter_with_content(mock_openai_class, "죄송하지만 변환할 수 없어요")
+
+        # When & Then
+        with pytest.raises(ValueError):
+            converter.convert_batch(
+                original_message="테스트",
+                sender_mbti=MBTI("INTJ"),
+                receiver_mbti=MBTI("ESTP"),
+                tones=self.TONES,
+            )
@@ -81,3 +81,132 @@ class TestAuthDependency:
         )
 
         assert response.status_code == 401
+
+
+class TestAuthDependencyCache:
+    """DB 세션 저장소 + 세션 캐시 테스트"""
+
+    @pytest.fixture
+    def db_session_factory(self):
+        """테스트용 인메모리 SQLite 세션 팩토리"""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+
+        from config.database import Base
+
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        yield sessionmaker(bind=engine)
+        engine.dispose()
+
+    @pytest.fixture
+    def db_client(self, monkeypatch, db_session_factory):
+        """주입된 저장소 없이 DB 저장소를 사용하는 클라이언트"""
+        from app.auth.adapter.input.web import auth_dependency
+        from app.auth.infrastructure.cache.session_cache import session_cache
+        from app.user.infrastructure.model.user_model import UserModel
+
+        opened = []
+
+        def fake_get_db_session():
+            db = db_session_factory()
+            opened.append(db)
+            return db
+
+        monkeypatch.setattr(auth_dependency, "_session_repository", None)
+        monkeypatch.setattr(auth_dependency, "get_db_session", fake_get_db_session)
+        session_cache.clear()
+
+        with db_session_factory() as db:
+            db.add(UserModel(id="user-456", email="test@example.com"))
+            db.commit()
+
+        test_app = FastAPI()
+
+        @test_app.get("/protected")
+        def protected_route(user_id: str = Depends(get_current_user_id)):
+            return {"user_id": user_id}
+
+        yield TestClient(test_app), opened
+        session_cache.clear()
+
+    def test_두번째_요청은_DB를_조회하지_않는다(self, db_client, db_session_factory):
+        """캐시된 세션은 DB 조회 없이 user_id를 반환한다"""
+        from app.auth.infrastructure.cache.session_cache import session_cache
+        from app.auth.infrastructure.repository.mysql_session_repository import (
+            MySqlSessionRepository,
+        )
+
+        client, opened = db_client
+        with db_session_factory() as db:
+            MySqlSessionRepository(db).save(Session(session_id="db-session", user_id="user-456"))
+
+        headers = {"Authorization": "Bearer db-session"}
+        first = client.get("/protected", headers=headers)
+        second = client.get("/protected", headers=headers)
+
+        assert first.json()["user_id"] == "user-456"
+        assert second.json()["user_id"] == "user-456"
+        assert len(opened) == 1
+        assert session_cache.stats()["hits"] == 1
+
+    def test_세션_삭제시_캐시가_무효화된다(self, db_client, db_session_factory):
+        """로그아웃(세션 삭제) 후에는 캐시된 세션도 401이 된다"""
+        from app.auth.infrastructure.repository.mysql_session_repository import (
+            MySqlSessionRepository,
+        )
+
+        client, _ = db_client
+        with db_session_factory() as db:
+            MySqlSessionRepository(db).save(Session(session_id="db-session", user_id="user-456"))
+
+        headers = {"Authorization": "Bearer db-session"}
+        assert client.get("/protected", headers=headers).status_code == 200
+
+        with db_session_factory() as db:
+            MySqlSessionRepository(db).delete("db-session")
+
+        assert client.get("/protected", headers=headers).status_code == 401
+
+
+class TestRateLimitIdentity:
+    """요청 수 제한 식별자 테스트"""
+
+    @staticmethod
+    def _scope(headers: list[tuple[bytes, bytes]] | None = None) -> dict:
+        return {"type": "http", "headers": headers or [], "client": ("203.0.113.7", 5000)}
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from app.auth.infrastructure.cache.session_cache import session_cache
+
+        session_cache.clear()
+        yield
+        session_cache.clear()
+
+    def test_캐시에_검증된_세션은_user_id로_구분한다(self):
+        from app.auth.adapter.input.web.auth_dependency import rate_limit_identity
+        from app.auth.infrastructure.cache.session_cache import session_cache
+
+        # Given
+        session_cache.put("session-1", "user-1")
+
+        # When / Then
+        assert rate_limit_identity(self._scope([(b"authorization", b"Bearer session-1")])) == "user:user-1"
+        assert rate_limit_identity(self._scope([(b"cookie", b"session_id=session-1")])) == "user:user-1"
+
+    def test_검증되지_않은_세션은_클라이언트_IP로_구분한다(self):
+        from app.auth.adapter.input.web.auth_dependency import rate_limit_identity
+
+        assert rate_limit_identity(self._scope([(b"authorization", b"Bearer unknown-1")])) == "ip:203.0.113.7"
+        assert rate_limit_identity(self._scope([(b"cookie", b"session_id=unknown-2")])) == "ip:203.0.113.7"
+
+    def test_세션이_없으면_클라이언트_IP로_구분한다(self):
+        from app.auth.adapter.input.web.auth_dependency import rate_limit_identity
+
+        assert rate_limit_identity(self._scope()) == "ip:203.0.113.7"
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+from app.auth.infrastructure.cache.session_cache import SessionCache
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.current = datetime(2024, 1, 1, 12, 0, 0)
+
+    def __call__(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: int) -> None:
+        self.current += timedelta(seconds=seconds)
+
+
+def test_put_and_get_returns_user_id():
+    """저장한 세션의 user_id를 조회할 수 있다"""
+    cache = SessionCache()
+
+    cache.put("session-1", "user-1")
+
+    assert cache.get("session-1") == "user-1"
+    assert cache.get("unknown") is None
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_entry_expires_after_ttl():
+    """TTL이 지나면 캐시 항목이 만료된다"""
+    clock = FakeClock()
+    cache = SessionCache(ttl_seconds=60, now=clock)
+    cache.put("session-1", "user-1")
+
+    clock.advance(61)
+
+    assert cache.get("session-1") is None
+
+
+def test_entry_expires_at_session_expiry_before_ttl():
+    """세션 만료 시각이 TTL보다 빠르면 세션 만료 시각에 만료된다"""
+    clock = FakeClock()
+    cache = SessionCache(ttl_seconds=60, now=clock)
+    cache.put("session-1", "user-1", expires_at=clock.current + timedelta(seconds=10))
+
+    clock.advance(11)
+
+    assert cache.get("session-1") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    """최대 크기를 넘으면 가장 오래 사용되지 않은 항목이 제거된다"""
+    cache = SessionCache(max_size=2)
+    cache.put("session-1", "user-1")
+    cache.put("session-2", "user-2")
+    cache.get("session-1")
+
+    cache.put("session-3", "user-3")
+
+    assert cache.get("session-1") == "user-1"
+    assert cache.get("session-2") is None
+    assert cache.get("session-3") == "user-3"
+
+
+def test_invalidate_removes_entry():
+    """invalidate한 세션은 더 이상 조회되지 않는다"""
+    cache = SessionCache()
+    cache.put("session-1", "user-1")
+
+    cache.invalidate("session-1")
+    cache.invalidate(None)
+
+    assert cache.get("session-1") is None
@@ -12,6 +12,7 @@ from tests.auth.fixtures.fake_session_repository import FakeSessionRepository
 from tests.consult.fixtures.fake_consult_repository import FakeConsultRepository
 from tests.consult.fixtures.fake_ai_counselor import FakeAICounselor
 from app.consult.domain.consult_session import ConsultSession
+from app.consult.infrastructure.cache.stream_replay_registry import StreamReplayBuffer, StreamReplayRegistry
 
 
 @pytest.fixture
@@ -56,6 +57,8 @@ def client(app, user_repo, session_repo, consult_repo, ai_counselor):
     router_module._user_repository = user_repo
     router_module._consult_repository = consult_repo
     router_module._ai_counselor = ai_counselor
+    router_module._analysis_queue = None
+    router_module._stream_registry = StreamReplayRegistry()
     auth_dependency._session_repository = session_repo
 
     return TestClient(app)
@@ -171,6 +174,29 @@ def test_send_message_returns_ai_response(client, user_repo, session_repo, consu
     assert data["response"] == "AI 응답입니다"
 
 
+def test_send_message_reports_server_timing_breakdown(app, client, user_repo, session_repo, consult_repo):
+    """추적 미들웨어를 붙이면 메시지 전송 응답에 인증/유스케이스 구간이 Server-Timing으로 담긴다"""
+    # Given: 로그인한 사용자의 상담 세션
+    from app.shared.tracing import TracingMiddleware
+
+    app.add_middleware(TracingMiddleware)
+    user_repo.save(User(id="user-123", email="test@example.com", mbti=MBTI("INTJ"), gender=Gender("MALE")))
+    session_repo.save(Session(session_id="valid-session-123", user_id="user-123"))
+    consult_repo.save(ConsultSession(id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")))
+
+    # When
+    response = client.post(
+        "/consult/consult-session-123/message",
+        headers={"Authorization": "Bearer valid-session-123"},
+        json={"content": "안녕하세요"}
+    )
+
+    # Then
+    assert response.status_code == 200
+    names = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+    assert names == ["auth", "consult.send_message", "total"]
+
+
 def test_send_message_without_auth_returns_401(client, consult_repo):
     """인증 없이 메시지를 보내면 401을 반환한다"""
     # Given: 상담 세션
@@ -456,3 +482,833 @@ def test_send_message_returns_is_completed_false_before_5th_turn(client, user_re
     data = response.json()
     assert data["is_completed"] is False
     assert "analysis" not in data
+
+
+def _login(user_repo, session_repo):
+    user_repo.save(User(id="user-123", email="test@example.com", mbti=MBTI("INTJ"), gender=Gender("MALE")))
+    session_repo.save(Session(session_id="valid-session-123", user_id="user-123"))
+    return {"Authorization": "Bearer valid-session-123"}
+
+
+def test_send_message_waits_for_llm_concurrently_and_runs_db_calls_off_event_loop(
+    app, client, user_repo, session_repo, consult_repo
+):
+    """메시지 API는 한 이벤트 루프에서 여러 LLM 응답을 동시에 기다리고, DB 호출은 이벤트 루프 밖에서 실행한다 (부하 테스트)"""
+    import asyncio
+    import threading
+
+    import httpx
+    from app.consult.adapter.input.web import consult_router as router_module
+
+    concurrency = 50
+    repository_threads = []
+
+    class ThreadRecordingRepository(type(consult_repo)):
+        def find_by_id(self, session_id):
+            repository_threads.append(threading.get_ident())
+            return super().find_by_id(session_id)
+
+        def save(self, session):
+            repository_threads.append(threading.get_ident())
+            super().save(session)
+
+    class GatedCounselor(FakeAICounselor):
+        """concurrency건이 모두 응답을 기다리는 중이 되어야 응답하는 상담사"""
+
+        def __init__(self):
+            super().__init__()
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.all_waiting = asyncio.Event()
+
+        async def generate_response(self, session, user_message):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if self.in_flight == concurrency:
+                self.all_waiting.set()
+            await self.all_waiting.wait()
+            self.in_flight -= 1
+            return "응답"
+
+    # Given: 한 사용자의 상담 세션 concurrency개
+    headers = _login(user_repo, session_repo)
+    repository = ThreadRecordingRepository()
+    for i in range(concurrency):
+        repository.save(ConsultSession(
+            id=f"consult-session-{i}", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+        ))
+    repository_threads.clear()
+    counselor = GatedCounselor()
+    router_module._consult_repository = repository
+    router_module._ai_counselor = counselor
+
+    async def send_all():
+        loop_thread = threading.get_ident()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as http:
+            responses = await asyncio.wait_for(asyncio.gather(*[
+                http.post(f"/consult/consult-session-{i}/message", headers=headers, json={"content": "안녕"})
+                for i in range(concurrency)
+            ]), timeout=30)
+        return loop_thread, responses
+
+    # When: concurrency건을 동시에 보내면
+    loop_thread, responses = asyncio.run(send_all())
+
+    # Then: 모든 요청이 동시에 LLM 응답을 기다렸고, 조회/저장은 모두 이벤트 루프 밖에서 실행됐다
+    assert [r.status_code for r in responses] == [200] * concurrency
+    assert counselor.max_in_flight == concurrency
+    assert len(repository_threads) == concurrency * 2
+    assert loop_thread not in repository_threads
+
+
+def test_send_message_on_5th_turn_returns_pending_when_analysis_queue_configured(
+    client, user_repo, session_repo, consult_repo
+):
+    """분석 큐가 설정되면 5턴째 응답은 분석을 기다리지 않고 pending을 반환한다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+    from app.consult.domain.message import Message
+    from tests.consult.fixtures.fake_analysis_queue import FakeAnalysisQueue
+
+    # Given: 분석 큐와 4턴 진행된 상담 세션
+    queue = FakeAnalysisQueue()
+    router_module._analysis_queue = queue
+    headers = _login(user_repo, session_repo)
+    consult_session = ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    for i in range(4):
+        consult_session.add_message(Message(role="user", content=f"질문 {i+1}"))
+        consult_session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+    consult_repo.save(consult_session)
+
+    # When: 5번째 메시지 전송 후 분석을 조회하면
+    response = client.post(
+        "/consult/consult-session-123/message", headers=headers, json={"content": "마지막 질문"}
+    )
+    analysis_response = client.get("/consult/consult-session-123/analysis", headers=headers)
+
+    # Then: 응답은 pending이고, 분석 조회도 pending + Retry-After를 반환한다
+    assert response.status_code == 200
+    assert response.json()["analysis_status"] == "pending"
+    assert "analysis" not in response.json()
+    assert queue.enqueued == ["consult-session-123"]
+    assert analysis_response.status_code == 200
+    assert analysis_response.json()["status"] == "pending"
+    assert analysis_response.json()["analysis"] is None
+    assert analysis_response.headers["Retry-After"] == "2"
+
+
+def test_get_analysis_returns_ready_analysis(client, user_repo, session_repo, consult_repo):
+    """분석이 완료된 세션은 ready와 분석 결과를 반환한다"""
+    # Given: 분석이 완료된 세션
+    headers = _login(user_repo, session_repo)
+    consult_session = ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    consult_session.complete_with_analysis({"situation": "상황"})
+    consult_repo.save(consult_session)
+
+    # When
+    response = client.get("/consult/consult-session-123/analysis", headers=headers)
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "session_id": "consult-session-123",
+        "status": "ready",
+        "analysis": {"situation": "상황"},
+    }
+
+
+def test_get_analysis_of_others_session_returns_403(client, user_repo, session_repo, consult_repo):
+    """다른 사용자의 세션 분석은 조회할 수 없다"""
+    # Given: 다른 사용자의 세션
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="other-session", user_id="other-user", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+
+    # When & Then
+    assert client.get("/consult/other-session/analysis", headers=headers).status_code == 403
+    assert client.get("/consult/missing-session/analysis", headers=headers).status_code == 404
+
+
+def _completed_session(consult_repo, session_id="consult-session-123") -> ConsultSession:
+    from app.consult.domain.message import Message
+
+    consult_session = ConsultSession(
+        id=session_id, user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    for i in range(5):
+        consult_session.add_message(Message(role="user", content=f"질문 {i+1}"))
+        consult_session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+    consult_repo.save(consult_session)
+    return consult_session
+
+
+def _sse_events(text: str) -> list[tuple[str, dict]]:
+    import json
+
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_analysis_generates_sections_and_saves(client, user_repo, session_repo, consult_repo):
+    """분석이 없는 완료 세션은 섹션 단위로 생성해 전송하고 저장한다"""
+    # Given: 분석 없이 완료된 세션 (동기 모드 스트리밍 상담)
+    headers = _login(user_repo, session_repo)
+    consult_session = _completed_session(consult_repo)
+
+    # When
+    response = client.get("/consult/consult-session-123/analysis/stream", headers=headers)
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(response.text)
+    assert [e for e, _ in events] == ["section", "section", "section", "section", "done"]
+    assert events[0][1] == {"section": "situation", "content": "테스트 상황 분석"}
+    assert consult_session.get_analysis_status() == "ready"
+    assert consult_session.get_analysis()["cautions"] == "테스트 주의사항"
+
+
+def test_stream_analysis_reports_error_when_generation_is_truncated(
+    client, user_repo, session_repo, consult_repo
+):
+    """분석 응답이 중간에 끊기면 받은 섹션 뒤에 error 이벤트를 보내고 저장하지 않는다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+
+    # Given: 섹션 하나를 보낸 뒤 응답이 끊기는 AI 상담사
+    headers = _login(user_repo, session_repo)
+    consult_session = _completed_session(consult_repo)
+
+    class TruncatedCounselor(FakeAICounselor):
+        async def generate_analysis_stream(self, session):
+            yield "situation", "상황"
+            raise ValueError("분석 응답이 중간에 끊겼습니다")
+
+    router_module._ai_counselor = TruncatedCounselor()
+
+    # When
+    response = client.get("/consult/consult-session-123/analysis/stream", headers=headers)
+
+    # Then
+    events = _sse_events(response.text)
+    assert [e for e, _ in events] == ["section", "error"]
+    assert consult_session.get_analysis_status() is None
+
+
+def test_stream_analysis_replays_saved_analysis(client, user_repo, session_repo, consult_repo):
+    """이미 생성된 분석은 저장된 결과를 섹션 순서대로 전송한다"""
+    headers = _login(user_repo, session_repo)
+    consult_session = _completed_session(consult_repo)
+    consult_session.complete_with_analysis(
+        {"situation": "상황", "traits": "특성", "solutions": "해결", "cautions": "주의", "scripts": "대본"}
+    )
+
+    response = client.get("/consult/consult-session-123/analysis/stream", headers=headers)
+
+    events = _sse_events(response.text)
+    assert [data.get("section") for _, data in events[:-1]] == [
+        "situation", "traits", "solutions", "scripts", "cautions"
+    ]
+    assert events[-1] == ("done", {"status": "ready"})
+
+
+def test_stream_analysis_reports_pending_without_local_job(client, user_repo, session_repo, consult_repo):
+    """다른 곳에서 생성 중인 분석은 pending 이벤트로 폴링을 안내한다"""
+    headers = _login(user_repo, session_repo)
+    _completed_session(consult_repo).request_analysis()
+
+    response = client.get("/consult/consult-session-123/analysis/stream", headers=headers)
+
+    assert _sse_events(response.text) == [("pending", {"retry_after": 2})]
+
+
+def test_stream_analysis_reports_pending_when_local_job_defers_to_another_worker(
+    client, user_repo, session_repo, consult_repo
+):
+    """구독한 작업이 다른 워커가 맡은 작업이면 오류가 아닌 pending 이벤트로 폴링을 안내한다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+    from app.consult.application.port.analysis_queue_port import AnalysisPendingElsewhereError
+    from tests.consult.fixtures.fake_analysis_queue import FakeAnalysisQueue
+
+    class DeferringQueue(FakeAnalysisQueue):
+        def subscribe(self, session_id):
+            async def sections():
+                raise AnalysisPendingElsewhereError(session_id)
+                yield
+
+            return sections()
+
+    headers = _login(user_repo, session_repo)
+    _completed_session(consult_repo).request_analysis()
+    router_module._analysis_queue = DeferringQueue()
+
+    response = client.get("/consult/consult-session-123/analysis/stream", headers=headers)
+
+    assert _sse_events(response.text) == [("pending", {"retry_after": 2})]
+
+
+def test_stream_analysis_of_incomplete_session_returns_400(client, user_repo, session_repo, consult_repo):
+    """완료되지 않은 상담의 분석은 스트리밍할 수 없다"""
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+
+    response = client.get("/consult/consult-session-123/analysis/stream", headers=headers)
+
+    assert response.status_code == 400
+
+
+def _completed_session_at(consult_repo, session_id: str, created_at) -> ConsultSession:
+    consult_session = ConsultSession(
+        id=session_id,
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+        created_at=created_at,
+    )
+    consult_session.complete_with_analysis({"situation": f"{session_id} 분석"})
+    consult_repo.save(consult_session)
+    return consult_session
+
+
+def test_get_history_paginates_with_cursor(client, user_repo, session_repo, consult_repo):
+    """히스토리는 limit 단위로 나뉘고 next_cursor로 다음 페이지를 조회한다"""
+    from datetime import datetime
+
+    # Given: 완료된 세션 3개
+    headers = _login(user_repo, session_repo)
+    for day in (1, 2, 3):
+        _completed_session_at(consult_repo, f"session-{day}", datetime(2024, 1, day, 12, 0))
+
+    # When: 2개씩 조회하면
+    first = client.get("/consult/history?limit=2", headers=headers).json()
+    second = client.get(
+        f"/consult/history?limit=2&cursor={first['next_cursor']}", headers=headers
+    ).json()
+
+    # Then: 최신순으로 나뉘어 조회되고 마지막 페이지에는 커서가 없다
+    assert [s["id"] for s in first["sessions"]] == ["session-3", "session-2"]
+    assert first["next_cursor"] is not None
+    assert [s["id"] for s in second["sessions"]] == ["session-1"]
+    assert second["next_cursor"] is None
+
+
+def test_get_history_returns_summary_without_analysis(client, user_repo, session_repo, consult_repo):
+    """히스토리는 분석 본문 대신 분석 상태만 반환한다"""
+    from datetime import datetime
+
+    # Given: 분석이 완료된 세션
+    headers = _login(user_repo, session_repo)
+    _completed_session_at(consult_repo, "session-1", datetime(2024, 1, 1, 12, 0))
+
+    # When: 히스토리를 조회하면
+    response = client.get("/consult/history", headers=headers)
+
+    # Then: 요약 필드만 반환된다
+    assert response.status_code == 200
+    assert response.json()["sessions"] == [{
+        "id": "session-1",
+        "created_at": "2024-01-01T12:00:00",
+        "mbti": "INTJ",
+        "gender": "MALE",
+        "analysis_status": "ready",
+    }]
+
+
+def test_get_history_with_invalid_cursor_returns_400(client, user_repo, session_repo):
+    """잘못된 커서로 히스토리를 조회하면 400을 반환한다"""
+    headers = _login(user_repo, session_repo)
+
+    response = client.get("/consult/history?cursor=not-a-cursor", headers=headers)
+
+    assert response.status_code == 400
+
+
+def test_get_history_with_out_of_range_limit_returns_422(client, user_repo, session_repo):
+    """허용 범위를 벗어난 limit은 거부된다"""
+    headers = _login(user_repo, session_repo)
+
+    response = client.get("/consult/history?limit=0", headers=headers)
+
+    assert response.status_code == 422
+
+
+class _InterruptedCounselor(FakeAICounselor):
+    """응답 일부를 보낸 뒤 스트림이 끊기는 AI 상담사"""
+
+    async def generate_response_stream(self, session, user_message):
+        yield "부분 "
+        yield "응답"
+        raise RuntimeError("upstream disconnected")
+
+
+def test_send_message_stream_persists_turn_after_stream(client, user_repo, session_repo, consult_repo):
+    """스트림이 끝나면 사용자 메시지와 AI 응답이 함께 저장된다"""
+    # Given: 로그인한 사용자와 상담 세션
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+
+    # When: 스트리밍 API를 호출하면
+    response = client.post(
+        "/consult/consult-session-123/message/stream",
+        headers=headers,
+        json={"content": "안녕하세요"},
+    )
+
+    # Then: 한 턴이 저장된다
+    assert response.status_code == 200
+    messages = consult_repo.find_by_id("consult-session-123").get_messages()
+    assert [(m.role, m.content) for m in messages] == [
+        ("user", "안녕하세요"),
+        ("assistant", "AI 응답입니다"),
+    ]
+
+
+def test_send_message_stream_does_not_hold_repository_while_streaming(
+    app, client, user_repo, session_repo, consult_repo
+):
+    """스트리밍 중에는 저장소 스코프를 열지 않고, 조회/저장 때만 짧게 연다"""
+    from contextlib import contextmanager
+    from app.consult.adapter.input.web import consult_router as router_module
+
+    # Given: 열린 저장소 스코프 수를 기록하는 의존성
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+    open_scopes = []
+    open_during_stream = []
+
+    @contextmanager
+    def scope():
+        open_scopes.append(1)
+        try:
+            yield consult_repo
+        finally:
+            open_scopes.pop()
+
+    class ObservingCounselor(FakeAICounselor):
+        async def generate_response_stream(self, session, user_message):
+            for chunk in ("관찰", "중"):
+                open_during_stream.append(len(open_scopes))
+                yield chunk
+
+    router_module._ai_counselor = ObservingCounselor()
+    app.dependency_overrides[router_module.get_consult_repository_scope] = lambda: scope
+
+    # When: 스트리밍 API를 호출하면
+    try:
+        response = client.post(
+            "/consult/consult-session-123/message/stream",
+            headers=headers,
+            json={"content": "안녕하세요"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    # Then: 스트리밍 동안 열린 스코프가 없고 응답은 저장된다
+    assert response.status_code == 200
+    assert open_during_stream == [0, 0]
+    assert consult_repo.find_by_id("consult-session-123").get_messages()[-1].content == "관찰중"
+
+
+def test_send_message_stream_persists_partial_response_when_interrupted(
+    client, user_repo, session_repo, consult_repo
+):
+    """스트림이 중간에 끊겨도 받은 만큼의 응답을 저장한다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+
+    # Given: 응답 도중 끊기는 AI 상담사
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+    router_module._ai_counselor = _InterruptedCounselor()
+
+    # When: 스트리밍 API를 호출하면
+    response = client.post(
+        "/consult/consult-session-123/message/stream",
+        headers=headers,
+        json={"content": "안녕하세요"},
+    )
+
+    # Then: 받은 조각을 보낸 뒤 error 이벤트로 끝나고, 사용자 메시지와 부분 응답이 저장된다
+    assert response.status_code == 200
+    *text_blocks, error_block = response.text.strip().split("\n\n")
+    assert "".join(data for _, data in _frames_of("\n\n".join(text_blocks))) == "부분 응답"
+    assert _sse_events(error_block) == [("error", {"detail": "응답 생성에 실패했습니다"})]
+    messages = consult_repo.find_by_id("consult-session-123").get_messages()
+    assert [(m.role, m.content) for m in messages] == [
+        ("user", "안녕하세요"),
+        ("assistant", "부분 응답"),
+    ]
+
+
+def test_send_message_stream_returns_503_before_streaming_when_llm_unavailable(
+    client, user_repo, session_repo, consult_repo
+):
+    """회로가 열려 LLM을 호출할 수 없으면 스트림을 시작하지 않고 503과 Retry-After를 돌려준다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+    from app.shared.llm.circuit_breaker import CircuitOpenError
+
+    # Given: 첫 조각을 보내기 전에 회로 열림으로 실패하는 AI 상담사
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+
+    class UnavailableCounselor(FakeAICounselor):
+        async def generate_response_stream(self, session, user_message):
+            raise CircuitOpenError(retry_after=12.5)
+            yield
+
+    router_module._ai_counselor = UnavailableCounselor()
+
+    # When: 스트리밍 API를 호출하면
+    response = client.post(
+        "/consult/consult-session-123/message/stream",
+        headers=headers,
+        json={"content": "안녕하세요"},
+    )
+
+    # Then: SSE가 아닌 503 응답이다
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "13"
+    assert not response.headers["content-type"].startswith("text/event-stream")
+
+
+def test_concurrent_send_message_stream_starts_single_upstream(
+    app, user_repo, session_repo, consult_repo
+):
+    """첫 조각을 기다리는 동안 같은 세션에 들어온 두 번째 요청은 LLM을 호출하지 않고 409를 받는다"""
+    import asyncio
+    from app.consult.adapter.input.web import consult_router as router_module
+
+    # Given: 첫 조각을 보내기 전에 멈춰 있는 AI 상담사
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+
+    class GatedCounselor(FakeAICounselor):
+        def __init__(self):
+            super().__init__()
+            self.calls = 0
+            self.started = asyncio.Event()
+            self.gate = asyncio.Event()
+
+        async def generate_response_stream(self, session, user_message):
+            self.calls += 1
+            self.started.set()
+            await self.gate.wait()
+            yield "응답"
+
+    async def run():
+        counselor = GatedCounselor()
+        router_module._ai_counselor = counselor
+        first = asyncio.create_task(_call_stream(app, headers))
+        await counselor.started.wait()
+
+        # When: 첫 요청이 첫 조각을 기다리는 동안 같은 세션에 다시 요청하면
+        second = await _call_stream(app, headers)
+        counselor.gate.set()
+        return counselor, await first, second
+
+    counselor, first, second = asyncio.run(run())
+
+    # Then: 두 번째 요청은 409이고 업스트림은 한 번만 시작된다
+    assert first[0] == 200
+    assert second[0] == 409
+    assert counselor.calls == 1
+
+
+class _EndlessCounselor(FakeAICounselor):
+    """닫힐 때까지 응답 조각을 계속 만드는 AI 상담사"""
+
+    def __init__(self):
+        super().__init__()
+        self.produced = 0
+        self.closed = False
+
+    async def generate_response_stream(self, session, user_message):
+        import asyncio
+
+        try:
+            while True:
+                await asyncio.sleep(0.01)
+                self.produced += 1
+                yield "말"
+        finally:
+            self.closed = True
+
+
+def test_send_message_stream_stops_upstream_when_client_disconnects(
+    app, client, user_repo, session_repo, consult_repo
+):
+    """클라이언트 연결이 끊기면 업스트림 생성을 멈추고 부분 응답을 저장하며 중단 메트릭을 남긴다"""
+    import asyncio
+    import json
+    from app.consult.adapter.input.web import consult_router as router_module
+    from app.shared.metrics import get_metrics
+
+    # Given: 끝없이 응답하는 AI 상담사
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+    counselor = _EndlessCounselor()
+    router_module._ai_counselor = counselor
+    # 이어 받기 유예 없이 연결이 끊기면 바로 생성을 중단한다
+    router_module._stream_registry = StreamReplayRegistry(grace_seconds=0)
+    aborted_before = get_metrics().get(router_module.METRIC_STREAM_ABORTED)
+
+    # When: 첫 응답 조각을 받은 직후 클라이언트가 연결을 끊으면
+    async def run():
+        disconnected = asyncio.Event()
+        pending = [{
+            "type": "http.request",
+            "body": json.dumps({"content": "안녕하세요"}).encode(),
+            "more_body": False,
+        }]
+
+        async def receive():
+            if pending:
+                return pending.pop(0)
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                disconnected.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/consult/consult-session-123/message/stream",
+            "raw_path": b"/consult/consult-session-123/message/stream",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"authorization", headers["Authorization"].encode()),
+                (b"content-type", b"application/json"),
+            ],
+            "client": ("127.0.0.1", 12345),
+            "server": ("testserver", 80),
+        }
+        await asyncio.wait_for(app(scope, receive, send), timeout=5)
+
+    asyncio.run(run())
+
+    # Then: 업스트림이 닫히고, 받은 만큼만 저장되며, 중단 메트릭이 증가한다
+    assert counselor.closed is True
+    assert counselor.produced < 10
+    messages = consult_repo.find_by_id("consult-session-123").get_messages()
+    assert messages[0].content == "안녕하세요"
+    assert messages[-1].role == "assistant"
+    assert set(messages[-1].content) == {"말"}
+    assert get_metrics().get(router_module.METRIC_STREAM_ABORTED) == aborted_before + 1
+
+
+async def _call_stream(app, headers: dict, extra_headers: dict | None = None, disconnect_after: int | None = None):
+    """메시지 스트림 API를 ASGI로 직접 호출한다 (disconnect_after개의 프레임을 받으면 연결을 끊는다)"""
+    import asyncio
+    import json
+
+    disconnected = asyncio.Event()
+    pending = [{
+        "type": "http.request",
+        "body": json.dumps({"content": "안녕하세요"}).encode(),
+        "more_body": False,
+    }]
+    status_codes = []
+    bodies = []
+
+    async def receive():
+        if pending:
+            return pending.pop(0)
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status_codes.append(message["status"])
+        if message["type"] == "http.response.body" and message.get("body"):
+            if disconnected.is_set():
+                return
+            bodies.append(message["body"].decode())
+            if disconnect_after is not None and len(bodies) >= disconnect_after:
+                disconnected.set()
+
+    raw_headers = [(b"content-type", b"application/json")]
+    for name, value in {**headers, **(extra_headers or {})}.items():
+        raw_headers.append((name.lower().encode(), value.encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/consult/consult-session-123/message/stream",
+        "raw_path": b"/consult/consult-session-123/message/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+    return status_codes[0], "".join(bodies)
+
+
+def _frames_of(body: str) -> list[tuple[str, str]]:
+    """SSE 본문을 (id, data) 목록으로 나눈다"""
+    frames = []
+    for block in filter(None, body.split("\n\n")):
+        fields = dict(line.split(": ", 1) for line in block.split("\n") if ": " in line)
+        frames.append((fields.get("id"), fields.get("data")))
+    return frames
+
+
+class _SlowCounselor(FakeAICounselor):
+    """조각을 천천히 만들고 호출 횟수를 기록하는 AI 상담사"""
+
+    def __init__(self, chunks: list[str]):
+        super().__init__()
+        self._chunks = chunks
+        self.calls = 0
+
+    async def generate_response_stream(self, session, user_message):
+        import asyncio
+
+        self.calls += 1
+        for chunk in self._chunks:
+            await asyncio.sleep(0.05)
+            yield chunk
+
+
+def test_send_message_stream_resumes_with_last_event_id(
+    app, client, user_repo, session_repo, consult_repo
+):
+    """끊긴 스트림은 Last-Event-ID로 새 생성 없이 이어서 받는다"""
+    import asyncio
+    from app.consult.adapter.input.web import consult_router as router_module
+
+    # Given: 조각을 천천히 만드는 AI 상담사와 유예 시간이 있는 재전송 버퍼
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+    counselor = _SlowCounselor(["첫 ", "번째 ", "응답 ", "끝"])
+    router_module._ai_counselor = counselor
+    router_module._stream_registry = StreamReplayRegistry(grace_seconds=5)
+
+    async def scenario():
+        # When: 첫 프레임만 받고 연결이 끊긴 뒤
+        first_status, first_body = await _call_stream(app, headers, disconnect_after=1)
+        last_id = _frames_of(first_body)[-1][0]
+
+        # 생성 중에 Last-Event-ID 없이 다시 보내면 거부되고
+        conflict_status, _ = await _call_stream(app, headers)
+
+        # Last-Event-ID로 다시 연결하면
+        resume_status, resume_body = await _call_stream(
+            app, headers, extra_headers={"Last-Event-ID": last_id}
+        )
+        return first_status, first_body, last_id, conflict_status, resume_status, resume_body
+
+    first_status, first_body, last_id, conflict_status, resume_status, resume_body = asyncio.run(scenario())
+
+    # Then: 이어 받은 프레임과 합치면 전체 응답이 되고, LLM은 한 번만 호출된다
+    assert first_status == 200
+    assert last_id == "1-1"
+    assert conflict_status == 409
+    assert resume_status == 200
+    first_frames = _frames_of(first_body)
+    resumed_frames = _frames_of(resume_body)
+    assert resumed_frames[0][0] == "1-2"
+    assert "".join(data for _, data in first_frames + resumed_frames) == "첫 번째 응답 끝"
+    assert counselor.calls == 1
+
+    # Then: 응답 전체가 한 번 저장된다
+    messages = consult_repo.find_by_id("consult-session-123").get_messages()
+    assert [(m.role, m.content) for m in messages] == [
+        ("user", "안녕하세요"),
+        ("assistant", "첫 번째 응답 끝"),
+    ]
+
+
+def test_send_message_stream_with_stale_last_event_id_processes_message(
+    client, user_repo, session_repo, consult_repo
+):
+    """Last-Event-ID의 턴에 해당하는 스트림이 없으면 본문을 새 메시지로 처리한다"""
+    # Given: 이전 턴의 스트림이 이미 정리된 세션
+    headers = _login(user_repo, session_repo)
+    consult_repo.save(ConsultSession(
+        id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+
+    # When: 이전 턴의 오래된 ID와 함께 새 메시지를 보내면
+    response = client.post(
+        "/consult/consult-session-123/message/stream",
+        headers={**headers, "Last-Event-ID": "1-3"},
+        json={"content": "안녕하세요"},
+    )
+
+    # Then: 메시지가 버려지지 않고 새 턴으로 저장된다
+    assert response.status_code == 200
+    messages = consult_repo.find_by_id("consult-session-123").get_messages()
+    assert [(m.role, m.content) for m in messages] == [
+        ("user", "안녕하세요"),
+        ("assistant", "AI 응답입니다"),
+    ]
+
+
+def test_send_message_stream_with_evicted_last_event_id_returns_404(
+    client, user_repo, session_repo, consult_repo
+):
+    """같은 턴의 스트림이 있어도 재전송 버퍼에서 밀려난 이벤트부터는 이어 받을 수 없다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+
+    # Given: 이벤트를 2개만 보관하는 재전송 버퍼에 4개 이벤트가 쌓인 채 끝난 1턴 스트림
+    headers = _login(user_repo, session_repo)
+    buffer = StreamReplayBuffer("user-123", turn=1, max_events=2)
+    for data in ("가", "나", "다", "라"):
+        buffer.append(data)
+    buffer.finish()
+    router_module._stream_registry._buffers["consult-session-123"] = buffer
+
+    # When: 첫 이벤트 다음부터 이어 받으려 하면
+    response = client.post(
+        "/consult/consult-session-123/message/stream",
+        headers={**headers, "Last-Event-ID": "1-1"},
+        json={"content": "안녕하세요"},
+    )
+
+    # Then
+    assert response.status_code == 404
+
+
+def test_send_message_stream_with_malformed_last_event_id_returns_400(client, user_repo, session_repo):
+    """형식이 잘못된 Last-Event-ID는 400을 반환한다"""
+    headers = _login(user_repo, session_repo)
+
+    response = client.post(
+        "/consult/consult-session-123/message/stream",
+        headers={**headers, "Last-Event-ID": "abc"},
+        json={"content": "안녕하세요"},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,123 @@
+"""요청 단위 DB 세션 동시성 스트레스 테스트 (SQLite 대체 DB)"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.auth.domain.session import Session
+from app.consult.adapter.input.web.consult_router import consult_router
+from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel
+from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel
+from app.user.adapter.input.web.user_router import user_router
+from app.user.infrastructure.model.user_model import UserModel
+from config.database import Base, get_db
+from tests.auth.fixtures.fake_session_repository import FakeSessionRepository
+from tests.consult.fixtures.fake_ai_counselor import FakeAICounselor
+
+USER_COUNT = 16
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """스레드 간 공유 가능한 파일 기반 SQLite 세션 팩토리"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'stress.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def opened_sessions():
+    """요청마다 열린 DB 세션 기록"""
+    return []
+
+
+@pytest.fixture
+def client(monkeypatch, session_factory, opened_sessions):
+    """실제 SQL 저장소를 요청마다 생성하는 테스트 클라이언트"""
+    from app.consult.adapter.input.web import consult_router as consult_router_module
+    from app.user.adapter.input.web import user_router as user_router_module
+    from app.auth.adapter.input.web import auth_dependency
+
+    # 주입된 fake 저장소를 제거하여 get_db 기반 저장소를 사용하게 한다
+    monkeypatch.setattr(consult_router_module, "_user_repository", None)
+    monkeypatch.setattr(consult_router_module, "_consult_repository", None)
+    monkeypatch.setattr(user_router_module, "_user_repository", None)
+    monkeypatch.setattr(consult_router_module, "_ai_counselor", FakeAICounselor())
+    monkeypatch.setattr(consult_router_module, "_analysis_queue", None)
+
+    session_repo = FakeSessionRepository()
+    monkeypatch.setattr(auth_dependency, "_session_repository", session_repo)
+
+    with session_factory() as db:
+        for i in range(USER_COUNT):
+            db.add(UserModel(id=f"user-{i}", email=f"user{i}@example.com"))
+            session_repo.save(Session(session_id=f"auth-{i}", user_id=f"user-{i}"))
+        db.commit()
+
+    def override_get_db():
+        db = session_factory()
+        opened_sessions.append(db)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(consult_router, prefix="/consult")
+    app.include_router(user_router, prefix="/user")
+    app.dependency_overrides[get_db] = override_get_db
+
+    return TestClient(app)
+
+
+def _run_user_flow(client: TestClient, index: int) -> list[int]:
+    """프로필 저장 → 상담 시작 → 메시지 2회 전송"""
+    headers = {"Authorization": f"Bearer auth-{index}"}
+    status_codes = []
+
+    response = client.put(
+        "/user/profile", headers=headers, json={"mbti": "INTJ", "gender": "MALE"}
+    )
+    status_codes.append(response.status_code)
+
+    response = client.post("/consult/start", headers=headers)
+    status_codes.append(response.status_code)
+    consult_session_id = response.json()["session_id"]
+
+    for turn in range(2):
+        response = client.post(
+            f"/consult/{consult_session_id}/message",
+            headers=headers,
+            json={"content": f"user-{index} 질문 {turn}"},
+        )
+        status_codes.append(response.status_code)
+
+    return status_codes
+
+
+def test_concurrent_requests_use_isolated_db_sessions(client, session_factory, opened_sessions):
+    """동시에 들어온 요청들이 각자의 DB 세션으로 처리되고 모든 쓰기가 반영된다"""
+    # When: 여러 사용자가 동시에 상담 흐름을 진행하면
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda i: _run_user_flow(client, i), range(USER_COUNT)))
+
+    # Then: 모든 요청이 성공한다
+    assert all(code == 200 for codes in results for code in codes)
+
+    # 요청마다 별도의 DB 세션이 사용된다 (사용자당 4요청)
+    assert len(opened_sessions) == USER_COUNT * 4
+    assert len({id(db) for db in opened_sessions}) == len(opened_sessions)
+
+    # 모든 세션과 메시지가 유실 없이 저장된다
+    with session_factory() as db:
+        assert db.query(ConsultSessionModel).count() == USER_COUNT
+        assert db.query(ConsultMessageModel).count() == USER_COUNT * 4
+        assert db.query(UserModel).filter(UserModel.mbti == "INTJ").count() == USER_COUNT
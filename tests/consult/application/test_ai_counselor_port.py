@@ -18,4 +18,46 @@ class TestAICounselorPort:
 
     def test_ai_counselor_port_has_generate_analysis_method(self):
         """AICounselorPort는 generate_analysis 메서드를 가진다"""
-        assert hasattr(AICounselorPort, "generate_analysis")
\ No newline at end of file
+        assert hasattr(AICounselorPort, "generate_analysis")
+
+class TestAsyncAICounselorPort:
+    """AsyncAICounselorPort 인터페이스 테스트"""
+
+    def test_async_ai_counselor_port_is_abstract(self):
+        """AsyncAICounselorPort는 추상 클래스다"""
+        from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+
+        assert issubclass(AsyncAICounselorPort, ABC)
+
+    def test_async_ai_counselor_port_methods_are_coroutines(self):
+        """generate_response_stream을 제외한 메서드는 코루틴이다"""
+        import inspect
+
+        from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+
+        assert inspect.iscoroutinefunction(AsyncAICounselorPort.generate_greeting)
+        assert inspect.iscoroutinefunction(AsyncAICounselorPort.generate_response)
+        assert inspect.iscoroutinefunction(AsyncAICounselorPort.generate_analysis)
+
+    def test_default_analysis_stream_yields_sections_of_generate_analysis(self):
+        """generate_analysis_stream 기본 구현은 분석 결과를 섹션 단위로 반환한다"""
+        import asyncio
+
+        from app.consult.domain.consult_session import ConsultSession
+        from app.shared.vo.gender import Gender
+        from app.shared.vo.mbti import MBTI
+        from tests.consult.fixtures.fake_ai_counselor import FakeAICounselor
+
+        session = ConsultSession(id="s-1", user_id="u-1", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+
+        async def collect():
+            return [item async for item in FakeAICounselor().generate_analysis_stream(session)]
+
+        sections = asyncio.run(collect())
+
+        assert sections == [
+            ("situation", "테스트 상황 분석"),
+            ("traits", "테스트 특성 분석"),
+            ("solutions", "테스트 해결책"),
+            ("cautions", "테스트 주의사항"),
+        ]
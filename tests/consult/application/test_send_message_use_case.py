@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from app.consult.domain.consult_session import ConsultSession
@@ -6,6 +8,41 @@ from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
 from tests.consult.fixtures.fake_consult_repository import FakeConsultRepository
 from tests.consult.fixtures.fake_ai_counselor import FakeAICounselor
+from tests.consult.fixtures.fake_analysis_queue import FakeAnalysisQueue
+
+
+class OverlappingAICounselor(FakeAICounselor):
+    """응답/분석 호출이 둘 다 시작될 때까지 서로 기다리는 Fake AI 상담사 (동시 호출 수와 분석 시점의 메시지 수 기록)"""
+
+    def __init__(self, fail_analysis: bool = False):
+        super().__init__(response="마무리 응답")
+        self.fail_analysis = fail_analysis
+        self.analysis_message_count = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._both_started = asyncio.Event()
+
+    async def _wait_for_other_call(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self.in_flight == 2:
+            self._both_started.set()
+        try:
+            # 두 호출이 순차 실행되면 다른 호출이 시작되지 않아 시간 초과로 실패한다
+            await asyncio.wait_for(self._both_started.wait(), timeout=5)
+        finally:
+            self.in_flight -= 1
+
+    async def generate_response(self, session, user_message):
+        await self._wait_for_other_call()
+        return await super().generate_response(session, user_message)
+
+    async def generate_analysis(self, session):
+        self.analysis_message_count = len(session.get_messages())
+        await self._wait_for_other_call()
+        if self.fail_analysis:
+            raise RuntimeError("분석 실패")
+        return await super().generate_analysis(session)
 
 
 class TestSendMessageUseCase:
@@ -28,11 +65,11 @@ class TestSendMessageUseCase:
     def test_send_message_returns_ai_response(self):
         """메시지 전송 시 AI 응답을 반환한다"""
         # When
-        result = self.use_case.execute(
+        result = asyncio.run(self.use_case.execute(
             session_id="session-123",
             user_id="user-456",
             content="안녕하세요"
-        )
+        ))
 
         # Then
         assert result["response"] == "AI 응답입니다"
@@ -40,11 +77,11 @@ class TestSendMessageUseCase:
     def test_send_message_saves_user_message(self):
         """사용자 메시지가 세션에 저장된다"""
         # When
-        self.use_case.execute(
+        asyncio.run(self.use_case.execute(
             session_id="session-123",
             user_id="user-456",
             content="안녕하세요"
-        )
+        ))
 
         # Then
         session = self.repository.find_by_id("session-123")
@@ -56,11 +93,11 @@ class TestSendMessageUseCase:
     def test_send_message_saves_ai_response(self):
         """AI 응답이 세션에 저장된다"""
         # When
-        self.use_case.execute(
+        asyncio.run(self.use_case.execute(
             session_id="session-123",
             user_id="user-456",
             content="안녕하세요"
-        )
+        ))
 
         # Then
         session = self.repository.find_by_id("session-123")
@@ -73,21 +110,21 @@ class TestSendMessageUseCase:
         """세션 소유자가 아니면 에러를 발생시킨다"""
         # When & Then
         with pytest.raises(PermissionError, match="세션에 접근할 권한이 없습니다"):
-            self.use_case.execute(
+            asyncio.run(self.use_case.execute(
                 session_id="session-123",
                 user_id="other-user",
                 content="안녕하세요"
-            )
+            ))
 
     def test_send_message_rejects_nonexistent_session(self):
         """존재하지 않는 세션이면 에러를 발생시킨다"""
         # When & Then
         with pytest.raises(ValueError, match="세션을 찾을 수 없습니다"):
-            self.use_case.execute(
+            asyncio.run(self.use_case.execute(
                 session_id="nonexistent",
                 user_id="user-456",
                 content="안녕하세요"
-            )
+            ))
 
     def test_send_message_rejects_when_session_completed(self):
         """5턴 완료된 세션에 메시지를 보내면 에러를 발생시킨다"""
@@ -101,11 +138,11 @@ class TestSendMessageUseCase:
 
         # When & Then: 6번째 메시지 전송 시 에러
         with pytest.raises(ValueError, match="상담이 완료되었습니다"):
-            self.use_case.execute(
+            asyncio.run(self.use_case.execute(
                 session_id="session-123",
                 user_id="user-456",
                 content="추가 질문"
-            )
+            ))
 
     def test_send_message_returns_analysis_on_5th_turn(self):
         """5턴째 메시지 전송 시 분석 결과를 반환한다"""
@@ -118,11 +155,11 @@ class TestSendMessageUseCase:
         self.repository.save(self.session)
 
         # When: 5번째 메시지 전송
-        result = self.use_case.execute(
+        result = asyncio.run(self.use_case.execute(
             session_id="session-123",
             user_id="user-456",
             content="마지막 질문"
-        )
+        ))
 
         # Then: 분석 결과가 포함됨
         assert "analysis" in result
@@ -131,6 +168,34 @@ class TestSendMessageUseCase:
         assert result["analysis"]["solutions"] == "테스트 해결책"
         assert result["analysis"]["cautions"] == "테스트 주의사항"
 
+    def test_send_message_enqueues_analysis_on_5th_turn_when_queue_configured(self):
+        """분석 큐가 있으면 5턴째에 분석을 기다리지 않고 pending 상태로 반환한다"""
+        from app.consult.domain.message import Message
+
+        # Given: 분석 큐를 사용하는 유스케이스와 4턴 진행된 세션
+        queue = FakeAnalysisQueue()
+        use_case = SendMessageUseCase(self.repository, self.ai_counselor, queue)
+        for i in range(4):
+            self.session.add_message(Message(role="user", content=f"질문 {i+1}"))
+            self.session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+        self.repository.save(self.session)
+
+        # When: 5번째 메시지 전송
+        result = asyncio.run(use_case.execute(
+            session_id="session-123",
+            user_id="user-456",
+            content="마지막 질문"
+        ))
+
+        # Then: 분석 없이 pending 상태로 반환되고, 세션은 pending으로 저장된 뒤 큐에 등록된다
+        assert result["is_completed"] is True
+        assert result["analysis_status"] == "pending"
+        assert "analysis" not in result
+        assert queue.enqueued == ["session-123"]
+        saved = self.repository.find_by_id("session-123")
+        assert saved.get_analysis_status() == "pending"
+        assert saved.get_analysis() is None
+
     def test_send_message_returns_is_completed_true_on_5th_turn(self):
         """5턴째 메시지 전송 시 is_completed가 true이다"""
         from app.consult.domain.message import Message
@@ -142,11 +207,11 @@ class TestSendMessageUseCase:
         self.repository.save(self.session)
 
         # When: 5번째 메시지 전송
-        result = self.use_case.execute(
+        result = asyncio.run(self.use_case.execute(
             session_id="session-123",
             user_id="user-456",
             content="마지막 질문"
-        )
+        ))
 
         # Then: is_completed가 true
         assert result["is_completed"] is True
@@ -155,12 +220,74 @@ class TestSendMessageUseCase:
     def test_send_message_returns_is_completed_false_before_5th_turn(self):
         """5턴 전에는 is_completed가 false이다"""
         # When: 첫 번째 메시지 전송
-        result = self.use_case.execute(
+        result = asyncio.run(self.use_case.execute(
             session_id="session-123",
             user_id="user-456",
             content="첫 질문"
-        )
+        ))
 
         # Then: is_completed가 false
         assert result["is_completed"] is False
-        assert "analysis" not in result
\ No newline at end of file
+        assert "analysis" not in result
+
+class TestSpeculativeAnalysis:
+    """마지막 턴 응답/분석 동시 생성 테스트"""
+
+    def setup_method(self):
+        from app.consult.domain.message import Message
+
+        self.repository = FakeConsultRepository()
+        self.session = ConsultSession(
+            id="session-123",
+            user_id="user-456",
+            mbti=MBTI("INTJ"),
+            gender=Gender("MALE")
+        )
+        for i in range(4):
+            self.session.add_message(Message(role="user", content=f"질문 {i+1}"))
+            self.session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+        self.repository.save(self.session)
+
+    def test_final_turn_generates_response_and_analysis_concurrently(self):
+        """마지막 턴은 응답과 분석을 동시에 생성해야 한다 (대기 시간 = 두 호출 중 긴 쪽)"""
+        # Given: 응답/분석 호출이 둘 다 시작될 때까지 끝나지 않는 상담사
+        counselor = OverlappingAICounselor()
+        use_case = SendMessageUseCase(self.repository, counselor)
+
+        # When: 5번째 메시지 전송
+        result = asyncio.run(use_case.execute(
+            session_id="session-123",
+            user_id="user-456",
+            content="마지막 질문"
+        ))
+
+        # Then: 두 호출이 겹쳐 실행되고, 분석은 사용자 마지막 메시지까지의 히스토리로 생성된다
+        assert counselor.max_in_flight == 2
+        assert result["response"] == "마무리 응답"
+        assert result["analysis"]["situation"] == "테스트 상황 분석"
+        assert counselor.analysis_message_count == 9
+
+        saved = self.repository.find_by_id("session-123")
+        assert saved.get_messages()[-1].content == "마무리 응답"
+        assert saved.get_analysis_status() == "ready"
+
+    def test_final_turn_saves_nothing_when_analysis_fails(self):
+        """분석이 실패하면 응답도 저장하지 않아 마지막 메시지를 다시 보낼 수 있다"""
+        # Given: 분석이 실패하는 상담사와 저장 횟수를 기록하는 저장소
+        counselor = OverlappingAICounselor(fail_analysis=True)
+        use_case = SendMessageUseCase(self.repository, counselor)
+        saves = []
+        original_save = self.repository.save
+        self.repository.save = lambda session: (saves.append(session.id), original_save(session))
+
+        # When & Then: 예외가 전파되고
+        with pytest.raises(RuntimeError, match="분석 실패"):
+            asyncio.run(use_case.execute(
+                session_id="session-123",
+                user_id="user-456",
+                content="마지막 질문"
+            ))
+
+        # Then: 세션은 저장되지 않았다
+        assert saves == []
+        assert self.session.get_analysis() is None
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from app.consult.application.use_case.start_consult_use_case import StartConsultUseCase
@@ -33,7 +35,7 @@ def test_start_consult_creates_session(use_case, repository):
     gender = Gender("MALE")
 
     # When: 상담을 시작하면
-    result = use_case.execute(user_id=user_id, mbti=mbti, gender=gender)
+    result = asyncio.run(use_case.execute(user_id=user_id, mbti=mbti, gender=gender))
 
     # Then: 세션 ID가 반환되고
     assert "session_id" in result
@@ -56,8 +58,8 @@ def test_start_consult_generates_unique_session_ids(use_case):
     gender = Gender("MALE")
 
     # When: 상담을 2번 시작하면
-    result1 = use_case.execute(user_id=user_id, mbti=mbti, gender=gender)
-    result2 = use_case.execute(user_id=user_id, mbti=mbti, gender=gender)
+    result1 = asyncio.run(use_case.execute(user_id=user_id, mbti=mbti, gender=gender))
+    result2 = asyncio.run(use_case.execute(user_id=user_id, mbti=mbti, gender=gender))
 
     # Then: 각각 다른 세션 ID가 생성된다
     assert result1["session_id"] != result2["session_id"]
@@ -71,7 +73,7 @@ def test_start_consult_returns_ai_greeting(use_case):
     gender = Gender("FEMALE")
 
     # When: 상담을 시작하면
-    result = use_case.execute(user_id=user_id, mbti=mbti, gender=gender)
+    result = asyncio.run(use_case.execute(user_id=user_id, mbti=mbti, gender=gender))
 
     # Then: greeting 필드가 포함되어 있고
     assert "greeting" in result
@@ -215,3 +215,122 @@ def test_is_completed_returns_true_when_5_turns_reached():
 
     # When & Then: 완료됨
     assert session.is_completed() is True
+
+
+def test_get_unsaved_messages_returns_messages_added_after_mark_persisted():
+    """mark_persisted() 이후 추가된 메시지만 저장 대상이 된다"""
+    from app.consult.domain.message import Message
+
+    # Given: 메시지 2개가 저장된 세션
+    session = ConsultSession(
+        id="session-123",
+        user_id="user-456",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE")
+    )
+    session.add_message(Message(role="user", content="질문 1"))
+    session.add_message(Message(role="assistant", content="답변 1"))
+    assert len(session.get_unsaved_messages()) == 2
+    session.mark_persisted()
+
+    # When: 새 메시지를 추가하면
+    session.add_message(Message(role="user", content="질문 2"))
+
+    # Then: 새 메시지만 반환된다
+    assert session.is_persisted() is True
+    unsaved = session.get_unsaved_messages()
+    assert len(unsaved) == 1
+    assert unsaved[0].content == "질문 2"
+
+
+def test_request_analysis_marks_session_pending():
+    """분석을 요청하면 세션이 완료되고 분석 상태가 pending이 된다"""
+    from app.consult.domain.consult_session import AnalysisStatus
+
+    # Given: 새 세션
+    session = ConsultSession(
+        id="session-123",
+        user_id="user-456",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE")
+    )
+    assert session.get_analysis_status() is None
+
+    # When: 분석을 요청하면
+    session.request_analysis()
+
+    # Then: 완료 + pending, 분석 결과는 아직 없다
+    assert session.is_completed() is True
+    assert session.get_analysis_status() == AnalysisStatus.PENDING
+    assert session.get_analysis() is None
+
+    # When: 분석이 완료되면
+    session.complete_with_analysis({"situation": "상황"})
+
+    # Then: ready
+    assert session.get_analysis_status() == AnalysisStatus.READY
+
+
+def test_analysis_status_defaults_to_ready_when_analysis_given():
+    """분석 결과와 함께 생성된 세션의 분석 상태는 ready이다 (기존 데이터 호환)"""
+    session = ConsultSession(
+        id="session-123",
+        user_id="user-456",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+        completed=True,
+        analysis={"situation": "상황"},
+    )
+
+    assert session.get_analysis_status() == "ready"
+
+
+def test_invalid_analysis_status_raises_error():
+    """잘못된 분석 상태는 거부한다"""
+    with pytest.raises(ValueError):
+        ConsultSession(
+            id="session-123",
+            user_id="user-456",
+            mbti=MBTI("INTJ"),
+            gender=Gender("MALE"),
+            analysis_status="unknown",
+        )
+
+
+def _session_with_messages(count: int) -> ConsultSession:
+    from app.consult.domain.message import Message
+
+    session = ConsultSession(
+        id="session-123", user_id="user-456", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    for i in range(count):
+        session.add_message(Message(role="user" if i % 2 == 0 else "assistant", content=f"메시지 {i}"))
+    return session
+
+
+def test_update_history_summary_moves_summarized_messages_out_of_raw_history():
+    """누적 요약을 갱신하면 요약된 앞쪽 메시지는 원문 히스토리에서 빠진다"""
+    # Given: 메시지 6개가 있는 세션
+    session = _session_with_messages(6)
+
+    # When: 앞쪽 4개를 요약으로 대체하면
+    session.update_history_summary("앞선 대화 요약", 4)
+
+    # Then: 요약과 나머지 원문 메시지가 남는다
+    assert session.get_history_summary() == "앞선 대화 요약"
+    assert session.get_summarized_message_count() == 4
+    assert [m.content for m in session.get_unsummarized_messages()] == ["메시지 4", "메시지 5"]
+    assert len(session.get_messages()) == 6
+
+
+def test_update_history_summary_rejects_invalid_range():
+    """요약 범위는 줄어들거나 메시지 수를 넘을 수 없다"""
+    session = _session_with_messages(4)
+    session.update_history_summary("요약", 2)
+
+    with pytest.raises(ValueError):
+        session.update_history_summary("요약", 1)
+    with pytest.raises(ValueError):
+        session.update_history_summary("요약", 5)
+    with pytest.raises(ValueError):
+        session.update_history_summary(" ", 3)
@@ -1,13 +1,13 @@
-from typing import Iterator
+from typing import AsyncIterator
 
-from app.consult.application.port.ai_counselor_port import AICounselorPort
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
 from app.consult.domain.consult_session import ConsultSession
 from app.consult.domain.analysis import Analysis
 from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
 
 
-class FakeAICounselor(AICounselorPort):
+class FakeAICounselor(AsyncAICounselorPort):
     """테스트용 Fake AI 상담사"""
 
     def __init__(self, response: str = "AI 응답입니다"):
@@ -19,18 +19,21 @@ class FakeAICounselor(AICounselorPort):
             cautions="테스트 주의사항"
         )
 
-    def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
         """간단한 고정 인사말을 반환한다"""
         return f"안녕하세요! {mbti.value} 유형이시군요. 어떤 관계 고민이 있으세요?"
 
-    def generate_response(self, session: ConsultSession, user_message: str) -> str:
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
         return self._response
 
-    def generate_response_stream(self, session: ConsultSession, user_message: str) -> Iterator[str]:
+    async def generate_response_stream(
+        self, session: ConsultSession, user_message: str
+    ) -> AsyncIterator[str]:
         """스트리밍 응답을 생성한다 (테스트용: 한 글자씩)"""
         for char in self._response:
             yield char
-    def generate_analysis(self, session: ConsultSession) -> Analysis:
+
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
         """테스트용 고정 분석 결과를 반환한다"""
         return self._analysis
 
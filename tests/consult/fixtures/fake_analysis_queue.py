@@ -0,0 +1,11 @@
+from app.consult.application.port.analysis_queue_port import AnalysisQueuePort
+
+
+class FakeAnalysisQueue(AnalysisQueuePort):
+    """테스트용 Fake 분석 작업 큐 (등록된 세션 id만 기록)"""
+
+    def __init__(self):
+        self.enqueued: list[str] = []
+
+    def enqueue(self, session_id: str) -> None:
+        self.enqueued.append(session_id)
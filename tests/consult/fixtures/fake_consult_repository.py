@@ -1,5 +1,8 @@
+from datetime import datetime
+
 from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
-from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.consult_session import AnalysisStatus, ConsultSession
+from app.consult.domain.consult_session_summary import ConsultSessionSummary
 
 
 class FakeConsultRepository(ConsultRepositoryPort):
@@ -7,6 +10,7 @@ class FakeConsultRepository(ConsultRepositoryPort):
 
     def __init__(self):
         self._sessions: dict[str, ConsultSession] = {}
+        self._analysis_claims: dict[str, datetime] = {}
 
     def save(self, session: ConsultSession) -> None:
         self._sessions[session.id] = session
@@ -14,8 +18,48 @@ class FakeConsultRepository(ConsultRepositoryPort):
     def find_by_id(self, session_id: str) -> ConsultSession | None:
         return self._sessions.get(session_id)
 
-    def find_completed_by_user_id(self, user_id: str) -> list[ConsultSession]:
+    def find_completed_summaries_by_user_id(
+        self,
+        user_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[ConsultSessionSummary]:
+        sessions = sorted(
+            (
+                session for session in self._sessions.values()
+                if session.user_id == user_id and session.is_completed()
+            ),
+            key=lambda session: (session.created_at, session.id),
+            reverse=True,
+        )
+        if after is not None:
+            sessions = [s for s in sessions if (s.created_at, s.id) < after]
+        return [
+            ConsultSessionSummary(
+                id=session.id,
+                created_at=session.created_at,
+                mbti=session.mbti,
+                gender=session.gender,
+                analysis_status=session.get_analysis_status(),
+            )
+            for session in sessions[:limit]
+        ]
+
+    def find_pending_analysis_session_ids(self) -> list[str]:
         return [
-            session for session in self._sessions.values()
-            if session.user_id == user_id and session.is_completed()
+            session.id for session in self._sessions.values()
+            if session.get_analysis_status() == AnalysisStatus.PENDING
         ]
+
+    def claim_pending_analysis(self, session_id: str, claimed_at: datetime, stale_before: datetime) -> bool:
+        session = self._sessions.get(session_id)
+        if session is None or session.get_analysis_status() != AnalysisStatus.PENDING:
+            return False
+        previous = self._analysis_claims.get(session_id)
+        if previous is not None and previous >= stale_before:
+            return False
+        self._analysis_claims[session_id] = claimed_at
+        return True
+
+    def release_analysis_claim(self, session_id: str) -> None:
+        self._analysis_claims.pop(session_id, None)
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+class FakeOpenAIServer:
+    """
+    테스트용 로컬 OpenAI Chat Completions 호환 서버.
+
+    실제 네트워크 I/O(HTTP/커넥션 풀)를 거치도록 AsyncOpenAI/OpenAI 클라이언트의
+    base_url을 이 서버로 지정해 사용한다.
+    """
+
+    def __init__(
+        self,
+        content: str = "AI 응답입니다",
+        delay: float = 0.0,
+        chunk_delay: float = 0.0,
+        cached_tokens: int = 0,
+    ):
+        self.content = content
+        self.cached_tokens = cached_tokens
+        self.delay = delay
+        self.chunk_delay = chunk_delay
+        self.requests: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.streams_closed_early = 0
+        self._lock = threading.Lock()
+        self._port = self._find_free_port()
+        self._server = uvicorn.Server(
+            uvicorn.Config(self._build_app(), host="127.0.0.1", port=self._port, log_level="warning")
+        )
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._port}/v1"
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread.start()
+        deadline = time.monotonic() + 5
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Fake OpenAI 서버가 시작되지 않았습니다")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+
+    def _find_free_port(self) -> int:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def _enter(self, body: dict) -> None:
+        with self._lock:
+            self.requests.append(body)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.post("/v1/chat/completions")
+        async def chat_completions(request: Request):
+            body = await request.json()
+            self._enter(body)
+            try:
+                await asyncio.sleep(self.delay)
+            finally:
+                if not body.get("stream"):
+                    self._exit()
+
+            if body.get("stream"):
+                include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+                return StreamingResponse(self._stream(include_usage), media_type="text/event-stream")
+
+            return JSONResponse({
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.content},
+                    "finish_reason": "stop",
+                }],
+                "usage": self._usage(),
+            })
+
+        return app
+
+    def _usage(self) -> dict:
+        return {
+            "prompt_tokens": 10,
+            "completion_tokens": 5,
+            "total_tokens": 15,
+            "prompt_tokens_details": {"cached_tokens": self.cached_tokens},
+        }
+
+    async def _stream(self, include_usage: bool = False):
+        completed = False
+        try:
+            for char in self.content:
+                await asyncio.sleep(self.chunk_delay)
+                chunk = {
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": "gpt-4o-mini",
+                    "choices": [{"index": 0, "delta": {"content": char}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+            if include_usage:
+                usage_chunk = {
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": "gpt-4o-mini",
+                    "choices": [],
+                    "usage": self._usage(),
+                }
+                yield f"data: {json.dumps(usage_chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+            completed = True
+        finally:
+            if not completed:
+                with self._lock:
+                    self.streams_closed_early += 1
+            self._exit()
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from app.consult.infrastructure.service.analysis_stream_parser import IncrementalJSONObjectParser
+
+
+def _feed_chars(parser: IncrementalJSONObjectParser, text: str) -> list[tuple[int, str, object]]:
+    """한 글자씩 넣으며 (완성 시점 위치, key, value)를 기록한다"""
+    completed = []
+    for i, char in enumerate(text):
+        for key, value in parser.feed(char):
+            completed.append((i, key, value))
+    return completed
+
+
+def test_emits_each_field_as_soon_as_it_is_complete():
+    """필드 값이 끝나는 즉시(다음 필드를 기다리지 않고) 반환한다"""
+    text = json.dumps(
+        {"situation": "상황 요약", "traits": "특성 분석", "cautions": "주의사항"},
+        ensure_ascii=False,
+    )
+    parser = IncrementalJSONObjectParser()
+
+    completed = _feed_chars(parser, text)
+
+    assert [(key, value) for _, key, value in completed] == [
+        ("situation", "상황 요약"),
+        ("traits", "특성 분석"),
+        ("cautions", "주의사항"),
+    ]
+    assert completed[0][0] == text.index(', "traits"')
+    assert parser.finished is True
+
+
+def test_handles_escaped_quotes_commas_braces_and_arrays():
+    """문자열 안의 따옴표/쉼표/중괄호와 배열 값을 올바르게 처리한다"""
+    value = {
+        "scripts": ['"나 좀 서운해," 라고 말해봐', "{괄호} 도 괜찮아"],
+        "situation": "줄바꿈\n과 \\ 역슬래시",
+    }
+    parser = IncrementalJSONObjectParser()
+
+    completed = _feed_chars(parser, "```json\n" + json.dumps(value, ensure_ascii=False) + "\n```")
+
+    assert dict((key, v) for _, key, v in completed) == value
+
+
+def test_ignores_input_after_object_is_closed():
+    """객체가 닫힌 뒤의 입력은 무시한다"""
+    parser = IncrementalJSONObjectParser()
+
+    assert parser.feed('{"a": 1}') == [("a", 1)]
+    assert parser.feed(', "b": 2}') == []
+
+
+def test_raises_value_error_on_malformed_field():
+    """필드가 올바른 JSON이 아니면 ValueError를 발생시킨다"""
+    parser = IncrementalJSONObjectParser()
+
+    with pytest.raises(ValueError):
+        parser.feed('{"situation": 상황,')
+
+
+def test_close_raises_value_error_when_object_is_truncated():
+    """객체가 닫히기 전에 입력이 끝나면 close()에서 ValueError를 발생시킨다"""
+    parser = IncrementalJSONObjectParser()
+    assert parser.feed('{"situation": "상황", "traits": "특성') == [("situation", "상황")]
+
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_close_accepts_complete_object():
+    """닫힌 객체는 close()에서 오류가 없다"""
+    parser = IncrementalJSONObjectParser()
+    parser.feed('{"situation": "상황"}')
+
+    parser.close()
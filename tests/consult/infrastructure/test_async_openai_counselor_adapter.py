@@ -0,0 +1,242 @@
+import asyncio
+import json
+import time
+
+import pytest
+from openai import AsyncOpenAI
+
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.service.async_openai_counselor_adapter import (
+    AsyncOpenAICounselorAdapter,
+)
+from app.consult.infrastructure.service.conversation_context import ConversationContextWindow
+from app.shared.metrics import get_metrics
+from app.shared.prompt_cache import METRIC_CACHED_PROMPT_TOKENS, METRIC_PROMPT_TOKENS
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+from tests.consult.fixtures.fake_openai_server import FakeOpenAIServer
+
+
+@pytest.fixture
+def fake_server():
+    """로컬 Fake OpenAI 서버"""
+    server = FakeOpenAIServer(content="그랬구나. 그래서 어떻게 됐어?").start()
+    yield server
+    server.stop()
+
+
+def _adapter(server: FakeOpenAIServer) -> AsyncOpenAICounselorAdapter:
+    client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+    return AsyncOpenAICounselorAdapter(client=client)
+
+
+def _session() -> ConsultSession:
+    session = ConsultSession(
+        id="session-1",
+        user_id="user-1",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    )
+    session.add_message(Message(role="user", content="친구랑 싸웠어"))
+    return session
+
+
+def test_async_adapter_implements_async_port():
+    """AsyncOpenAICounselorAdapter는 AsyncAICounselorPort를 구현한다"""
+    assert issubclass(AsyncOpenAICounselorAdapter, AsyncAICounselorPort)
+
+
+def test_generate_response_calls_chat_completions(fake_server):
+    """대화 히스토리를 포함해 응답을 생성한다"""
+    adapter = _adapter(fake_server)
+
+    response = asyncio.run(adapter.generate_response(_session(), "친구랑 싸웠어"))
+
+    assert response == "그랬구나. 그래서 어떻게 됐어?"
+    sent_messages = fake_server.requests[0]["messages"]
+    assert sent_messages[0]["role"] == "system"
+    assert sent_messages[-2] == {"role": "user", "content": "친구랑 싸웠어"}
+    assert sent_messages[-1]["role"] == "system"
+
+
+def test_generate_response_stream_yields_chunks(fake_server):
+    """스트리밍 응답을 조각 단위로 반환한다"""
+    adapter = _adapter(fake_server)
+
+    async def collect():
+        return [chunk async for chunk in adapter.generate_response_stream(_session(), "친구랑 싸웠어")]
+
+    chunks = asyncio.run(collect())
+
+    assert "".join(chunks) == "그랬구나. 그래서 어떻게 됐어?"
+    assert len(chunks) > 1
+
+
+def test_closing_response_stream_closes_upstream_connection():
+    """소비자가 스트림을 중간에 닫으면 업스트림 HTTP 스트림도 닫힌다"""
+    # Given: 응답을 천천히 스트리밍하는 업스트림
+    server = FakeOpenAIServer(content="가" * 200, chunk_delay=0.01).start()
+    try:
+        adapter = _adapter(server)
+
+        async def read_two_chunks_and_close():
+            stream = adapter.generate_response_stream(_session(), "친구랑 싸웠어")
+            chunks = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()
+            return chunks
+
+        # When: 두 조각만 읽고 닫으면
+        chunks = asyncio.run(read_two_chunks_and_close())
+
+        deadline = time.monotonic() + 2
+        while server.streams_closed_early == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        server.stop()
+
+    # Then: 업스트림은 끝까지 생성하지 않고 중단된다
+    assert chunks == ["가", "가"]
+    assert server.streams_closed_early == 1
+
+
+def test_generate_analysis_stream_yields_sections_before_response_ends():
+    """분석 JSON 섹션이 완성될 때마다 전체 응답을 기다리지 않고 반환한다"""
+    # Given: 분석 JSON을 한 글자씩 천천히 스트리밍하는 업스트림
+    analysis_json = json.dumps(
+        {
+            "situation": "친구와 다툰 상황이야",
+            "traits": "INTJ는 논리적이야",
+            "solutions": ["먼저 연락해봐", "감정을 말해봐"],
+            "cautions": "너무 따지지 마",
+        },
+        ensure_ascii=False,
+    )
+    server = FakeOpenAIServer(content=analysis_json, chunk_delay=0.005).start()
+    try:
+        adapter = _adapter(server)
+
+        async def collect():
+            received = []
+            async for section, content in adapter.generate_analysis_stream(_session()):
+                # 업스트림이 아직 응답을 보내는 중인지 함께 기록한다
+                received.append((section, content, server.in_flight))
+            return received
+
+        # When
+        received = asyncio.run(collect())
+    finally:
+        server.stop()
+
+    # Then: 섹션이 순서대로 오고, 첫 섹션은 업스트림 응답이 끝나기 전에 도착한다
+    assert [(section, content) for section, content, _ in received] == [
+        ("situation", "친구와 다툰 상황이야"),
+        ("traits", "INTJ는 논리적이야"),
+        ("solutions", "1. 먼저 연락해봐\n2. 감정을 말해봐"),
+        ("cautions", "너무 따지지 마"),
+    ]
+    assert received[0][2] == 1
+    assert server.requests[0]["stream"] is True
+
+
+def test_generate_analysis_stream_raises_when_response_is_truncated():
+    """분석 JSON이 닫히기 전에 응답이 끝나면 받은 섹션을 보낸 뒤 ValueError를 발생시킨다"""
+    # Given: 마지막 섹션 도중 끊긴 분석 JSON
+    server = FakeOpenAIServer(content='{"situation": "상황", "traits": "특성", "cautions": "주의').start()
+    try:
+        adapter = _adapter(server)
+        received = []
+
+        async def collect():
+            async for section, content in adapter.generate_analysis_stream(_session()):
+                received.append(section)
+
+        # When & Then
+        with pytest.raises(ValueError):
+            asyncio.run(collect())
+    finally:
+        server.stop()
+
+    assert received == ["situation", "traits"]
+
+
+def test_holds_hundreds_of_concurrent_consults_on_one_event_loop(fake_server):
+    """하나의 이벤트 루프에서 수백 건의 상담 응답을 동시에 기다린다 (부하 테스트)"""
+    # Given: 응답에 0.5초가 걸리는 업스트림
+    fake_server.delay = 0.5
+    concurrency = 200
+    adapter = _adapter(fake_server)
+
+    async def run_all():
+        return await asyncio.gather(*[
+            adapter.generate_response(_session(), "친구랑 싸웠어")
+            for _ in range(concurrency)
+        ])
+
+    # When: 200건을 동시에 요청하면
+    responses = asyncio.run(run_all())
+
+    # Then: 스레드 풀(40개) 한계 없이 대부분이 동시에 처리된다
+    assert len(responses) == concurrency
+    assert fake_server.max_in_flight > 40
+
+
+def test_generate_response_summarizes_turns_outside_context_window(fake_server):
+    """창 밖으로 밀려난 턴은 먼저 누적 요약에 반영하고, 응답 프롬프트에는 요약과 최근 턴만 보낸다"""
+    # Given: 최근 2턴만 원문으로 보내는 어댑터와 3번째 턴을 시작한 세션
+    client = AsyncOpenAI(api_key="test-key", base_url=fake_server.base_url, max_retries=0)
+    adapter = AsyncOpenAICounselorAdapter(
+        client=client, context_window=ConversationContextWindow(keep_turns=2)
+    )
+    session = _session()
+    session.add_message(Message(role="assistant", content="무슨 일로 싸웠어?"))
+    session.add_message(Message(role="user", content="약속에 늦었거든"))
+    session.add_message(Message(role="assistant", content="그랬구나"))
+    session.add_message(Message(role="user", content="어떻게 사과하지"))
+
+    # When: 응답을 생성하면
+    asyncio.run(adapter.generate_response(session, "어떻게 사과하지"))
+
+    # Then: 첫 턴이 요약되고, 응답 요청에는 요약과 최근 2턴만 들어간다
+    summary_request, response_request = fake_server.requests
+    assert "친구랑 싸웠어" in summary_request["messages"][-1]["content"]
+    assert session.get_history_summary() == "그랬구나. 그래서 어떻게 됐어?"
+    assert session.get_summarized_message_count() == 2
+    sent = response_request["messages"]
+    assert sent[1]["content"].startswith("지금까지의 대화 요약:")
+    assert [m["content"] for m in sent[2:-1]] == ["약속에 늦었거든", "그랬구나", "어떻게 사과하지"]
+
+
+def test_generate_response_without_overflow_does_not_summarize(fake_server):
+    """창 안에 모두 들어가는 대화는 요약 요청을 보내지 않는다"""
+    adapter = _adapter(fake_server)
+    session = _session()
+
+    asyncio.run(adapter.generate_response(session, "친구랑 싸웠어"))
+
+    assert len(fake_server.requests) == 1
+    assert session.get_history_summary() is None
+
+
+def test_response_stream_records_prompt_cache_usage():
+    """스트리밍 응답의 마지막 usage 청크에서 프롬프트 캐시 적중 토큰을 기록한다"""
+    # Given
+    server = FakeOpenAIServer(content="그랬구나", cached_tokens=8).start()
+    metrics = get_metrics()
+    metrics.reset()
+
+    async def consume():
+        return [chunk async for chunk in _adapter(server).generate_response_stream(_session(), "친구랑 싸웠어")]
+
+    # When
+    try:
+        chunks = asyncio.run(consume())
+    finally:
+        server.stop()
+
+    # Then
+    assert "".join(chunks) == "그랬구나"
+    assert server.requests[0]["stream_options"] == {"include_usage": True}
+    assert metrics.get(METRIC_PROMPT_TOKENS) == 10
+    assert metrics.get(METRIC_CACHED_PROMPT_TOKENS) == 8
@@ -0,0 +1,98 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.consult.infrastructure.model.consult_session_migration import migrate_consult_sessions
+from config.database import Base
+
+
+# 상태 컬럼이 추가되기 전의 consult_sessions 테이블
+_LEGACY_TABLE = """
+CREATE TABLE consult_sessions (
+    id VARCHAR(36) PRIMARY KEY,
+    user_id VARCHAR(255) NOT NULL,
+    mbti VARCHAR(4) NOT NULL,
+    gender VARCHAR(10) NOT NULL,
+    created_at DATETIME NOT NULL,
+    is_completed BOOLEAN NOT NULL,
+    analysis_json TEXT
+)
+"""
+
+
+@pytest.fixture
+def legacy_engine():
+    """새 컬럼이 없는 기존 테이블을 가진 인메모리 SQLite 엔진"""
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text(_LEGACY_TABLE))
+    yield engine
+    engine.dispose()
+
+
+def test_adds_missing_columns_and_indexes_to_existing_table(legacy_engine):
+    """create_all이 건너뛰는 기존 테이블에 빠진 컬럼과 인덱스를 추가한다"""
+    # When
+    applied = migrate_consult_sessions(legacy_engine)
+
+    # Then
+    inspector = inspect(legacy_engine)
+    columns = {column["name"] for column in inspector.get_columns("consult_sessions")}
+    indexes = {index["name"] for index in inspector.get_indexes("consult_sessions")}
+    assert {"analysis_status", "analysis_claimed_at", "history_summary", "summarized_message_count"} <= columns
+    assert {"ix_consult_sessions_analysis_status", "ix_consult_sessions_user_completed_created"} <= indexes
+    assert "column analysis_status" in applied
+
+
+def test_existing_rows_get_zero_summarized_message_count(legacy_engine):
+    """NOT NULL인 summarized_message_count는 기존 row에 0으로 채워진다"""
+    # Given: 마이그레이션 전에 저장된 세션
+    with legacy_engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO consult_sessions (id, user_id, mbti, gender, created_at, is_completed) "
+            "VALUES ('session-1', 'user-1', 'INTJ', 'MALE', '2024-01-15 10:00:00', 0)"
+        ))
+
+    # When
+    migrate_consult_sessions(legacy_engine)
+
+    # Then
+    with legacy_engine.connect() as connection:
+        row = connection.execute(text(
+            "SELECT history_summary, summarized_message_count FROM consult_sessions"
+        )).one()
+    assert row == (None, 0)
+
+
+def test_backfills_status_of_sessions_analyzed_before_status_column(legacy_engine):
+    """상태 컬럼이 생기기 전에 분석이 저장된 세션은 ready로 채운다"""
+    # Given: 분석이 있는 세션과 없는 세션
+    with legacy_engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO consult_sessions (id, user_id, mbti, gender, created_at, is_completed, analysis_json) "
+            "VALUES ('analyzed', 'user-1', 'INTJ', 'MALE', '2024-01-15 10:00:00', 1, '{}'), "
+            "('in-progress', 'user-1', 'INTJ', 'MALE', '2024-01-15 11:00:00', 0, NULL)"
+        ))
+
+    # When
+    applied = migrate_consult_sessions(legacy_engine)
+
+    # Then
+    with legacy_engine.connect() as connection:
+        rows = dict(connection.execute(text("SELECT id, analysis_status FROM consult_sessions")).all())
+    assert rows == {"analyzed": "ready", "in-progress": None}
+    assert "backfill analysis_status of analyzed sessions" in applied
+
+
+def test_migration_is_idempotent(legacy_engine):
+    """두 번째 실행에서는 적용할 변경이 없다"""
+    migrate_consult_sessions(legacy_engine)
+
+    assert migrate_consult_sessions(legacy_engine) == []
+
+
+def test_table_created_from_model_needs_no_migration():
+    """모델로 새로 만든 테이블에는 적용할 변경이 없다"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+
+    assert migrate_consult_sessions(engine) == []
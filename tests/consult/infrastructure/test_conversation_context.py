@@ -0,0 +1,131 @@
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.service.conversation_context import ConversationContextWindow
+from app.consult.infrastructure.service.counselor_prompt_builder import CounselorPromptBuilder
+from app.shared.llm.token_estimate import estimate_message_tokens, estimate_tokens
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+
+
+def _session(turns: int, reply: str = "그랬구나. 그때 기분이 어땠어?") -> ConsultSession:
+    session = ConsultSession(
+        id="session-1", user_id="user-1", mbti=MBTI("INFP"), gender=Gender("FEMALE")
+    )
+    session.add_message(Message(role="assistant", content="안녕! 어떤 고민이 있어?"))
+    for i in range(turns):
+        session.add_message(Message(role="user", content=f"{i}번째 고민인데 친구가 연락을 잘 안 해"))
+        if i < turns - 1:
+            session.add_message(Message(role="assistant", content=reply))
+    return session
+
+
+def _user_turn_index(session: ConsultSession, turn: int) -> int:
+    """turn번째(0부터) 사용자 메시지의 위치"""
+    return [i for i, m in enumerate(session.get_messages()) if m.role == "user"][turn]
+
+
+def test_estimate_tokens_counts_korean_heavier_than_english():
+    """한글은 영문보다 글자당 토큰이 많게 추정된다"""
+    assert estimate_tokens("안녕하세요") > estimate_tokens("hello")
+    assert estimate_tokens("") == 0
+
+
+def test_window_keeps_all_messages_within_keep_turns():
+    """턴 수가 keep_turns 이하면 전체 대화를 원문으로 보낸다"""
+    window = ConversationContextWindow(keep_turns=5)
+    session = _session(turns=5)
+
+    assert window.window_start(session) == 0
+    assert window.pending_messages(session) == []
+
+
+def test_window_starts_at_kth_latest_user_turn():
+    """keep_turns보다 오래된 턴은 창 밖으로 밀려난다"""
+    window = ConversationContextWindow(keep_turns=2, token_budget=100_000)
+    session = _session(turns=6)
+
+    start = window.window_start(session)
+
+    assert start == _user_turn_index(session, 4)
+    assert window.pending_messages(session) == session.get_messages()[:start]
+
+
+def test_window_shrinks_to_fit_token_budget():
+    """최근 턴만으로도 토큰 예산을 넘으면 최신 턴이 남을 때까지 줄인다"""
+    # Given: 응답이 아주 긴 대화
+    window = ConversationContextWindow(keep_turns=5, token_budget=300)
+    session = _session(turns=5, reply="길게 " * 200)
+
+    # When & Then: 가장 최근 턴만 원문으로 남는다
+    assert window.window_start(session) == _user_turn_index(session, 4)
+
+
+def test_default_window_keeps_ordinary_five_turn_session():
+    """기본 설정에서 보통 길이의 5턴 세션은 요약 없이 전체를 원문으로 보낸다"""
+    window = ConversationContextWindow()
+    session = _session(turns=5)
+
+    assert window.pending_messages(session) == []
+
+
+def test_default_window_summarizes_long_turns_within_five_turn_session():
+    """기본 설정에서도 5턴 안의 메시지가 길어 토큰 예산을 넘으면 오래된 턴을 요약으로 넘긴다"""
+    # Given: 응답마다 약 1000토큰인 5턴 세션
+    window = ConversationContextWindow()
+    session = _session(turns=5, reply="길게 " * 500)
+
+    # When
+    pending = window.pending_messages(session)
+
+    # Then: 요약할 메시지가 생기고, 최근 턴은 원문으로 남는다
+    assert pending
+    assert window.window_start(session) > _user_turn_index(session, 0)
+    assert window.window_start(session) <= _user_turn_index(session, 4)
+
+
+def test_pending_messages_exclude_already_summarized_messages():
+    """이미 요약에 반영된 메시지는 다시 요약하지 않는다"""
+    window = ConversationContextWindow(keep_turns=2, token_budget=100_000)
+    session = _session(turns=6)
+    session.update_history_summary("앞선 요약", _user_turn_index(session, 3))
+
+    pending = window.pending_messages(session)
+
+    assert pending == session.get_messages()[_user_turn_index(session, 3):_user_turn_index(session, 4)]
+
+
+def test_build_messages_uses_summary_and_unsummarized_history():
+    """프롬프트에는 누적 요약과 요약되지 않은 대화만 들어간다"""
+    session = _session(turns=6)
+    summarized = _user_turn_index(session, 4)
+    session.update_history_summary("친구와 연락 문제로 고민 중", summarized)
+
+    messages = CounselorPromptBuilder().build_messages(session)
+
+    assert messages[1] == {"role": "system", "content": "지금까지의 대화 요약:\n친구와 연락 문제로 고민 중"}
+    assert [m["content"] for m in messages[2:-1]] == [m.content for m in session.get_messages()[summarized:]]
+
+
+def test_windowed_prompt_size_stays_flat_as_turns_grow():
+    """창+누적 요약 프롬프트는 턴이 늘어도 크기가 일정하다 (벤치마크)"""
+    builder = CounselorPromptBuilder()
+    window = ConversationContextWindow(keep_turns=3, token_budget=3000)
+    summary = "요약 " * 150  # 누적 요약은 길이 상한이 있는 한 덩어리
+
+    def prompt_tokens(turns: int, windowed: bool) -> int:
+        session = _session(turns)
+        if windowed:
+            pending = window.pending_messages(session)
+            if pending:
+                session.update_history_summary(summary, len(pending))
+        return estimate_message_tokens(builder.build_messages(session))
+
+    results = {
+        turns: (prompt_tokens(turns, windowed=False), prompt_tokens(turns, windowed=True))
+        for turns in (5, 20, 50)
+    }
+    # 전체 히스토리는 턴에 비례해 커지지만 창+요약은 일정하다
+    full_growth_per_turn = (results[50][0] - results[20][0]) / 30
+    assert full_growth_per_turn > 20
+    assert results[50][1] == results[20][1]
+    assert results[50][1] < results[50][0] / 2
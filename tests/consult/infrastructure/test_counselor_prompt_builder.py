@@ -0,0 +1,122 @@
+import json
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.service.counselor_prompt_builder import (
+    COUNSEL_SYSTEM_PREFIX,
+    TF_STYLES,
+    TURN_STRATEGIES,
+    CounselorPromptBuilder,
+    _render_system_prompt,
+    _render_turn_guidance,
+    get_system_prompt,
+    get_turn_guidance,
+)
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+
+
+def _session_with_turns(turns: int, mbti: str = "INFP") -> ConsultSession:
+    session = ConsultSession(
+        id="session-1", user_id="user-1", mbti=MBTI(mbti), gender=Gender("FEMALE")
+    )
+    for i in range(turns):
+        session.add_message(Message(role="user", content=f"고민 {i}"))
+        session.add_message(Message(role="assistant", content=f"응답 {i}"))
+    return session
+
+
+def test_system_prompt_contains_user_info_and_style_only():
+    """시스템 프롬프트에는 사용자 정보와 T/F 스타일만 들어가고 턴 정보는 들어가지 않는다"""
+    prompt = get_system_prompt(MBTI("ENTJ"), Gender("MALE"))
+
+    assert "- MBTI: ENTJ" in prompt
+    assert "- 성별: MALE" in prompt
+    assert TF_STYLES["T"] in prompt
+    assert "턴 / 총" not in prompt
+
+
+def test_turn_guidance_contains_progress_and_strategy():
+    """턴 안내에는 진행 상황과 턴별 전략이 들어간다"""
+    guidance = get_turn_guidance(3)
+
+    assert "현재 3턴 / 총 5턴 (남은 턴: 2)" in guidance
+    assert TURN_STRATEGIES[3] in guidance
+
+
+def test_all_system_prompts_share_static_prefix():
+    """모든 조합의 시스템 프롬프트는 같은 고정 앞부분으로 시작한다 (프롬프트 캐시 적중용)"""
+    prompts = [
+        get_system_prompt(MBTI(mbti), Gender(gender))
+        for mbti in ("INTJ", "ESFP")
+        for gender in ("MALE", "FEMALE")
+    ]
+
+    assert all(prompt.startswith(COUNSEL_SYSTEM_PREFIX) for prompt in prompts)
+
+
+def test_system_prompt_is_precomputed_and_reused():
+    """같은 조합은 매번 같은 문자열 객체를 반환한다"""
+    first = get_system_prompt(MBTI("ISFJ"), Gender("FEMALE"))
+    second = get_system_prompt(MBTI("isfj"), Gender("FEMALE"))
+
+    assert first is second
+    assert first == _render_system_prompt("ISFJ", "FEMALE")
+    assert get_turn_guidance(2) is get_turn_guidance(2)
+    assert get_turn_guidance(2) == _render_turn_guidance(2)
+
+
+def test_turns_after_last_use_final_turn_guidance():
+    """5턴 이후는 마지막 턴 안내를 사용한다"""
+    guidance = get_turn_guidance(7)
+
+    assert guidance is get_turn_guidance(5)
+    assert "마지막 턴 - 반드시 마무리만!" in guidance
+
+
+def test_build_messages_puts_turn_guidance_last():
+    """build_messages는 고정 시스템 프롬프트 → 대화 히스토리 → 턴 안내 순으로 쌓는다"""
+    session = _session_with_turns(2)
+
+    messages = CounselorPromptBuilder().build_messages(session)
+
+    assert messages[0]["content"] is get_system_prompt(session.mbti, session.gender)
+    assert [m["role"] for m in messages[1:-1]] == ["user", "assistant", "user", "assistant"]
+    assert messages[-1] == {"role": "system", "content": get_turn_guidance(2)}
+
+
+def test_consecutive_turns_share_byte_identical_prefix():
+    """다음 턴 요청은 이전 턴 요청의 턴 안내를 뺀 앞부분을 바이트 단위로 그대로 포함한다"""
+    builder = CounselorPromptBuilder()
+    session = _session_with_turns(1)
+    previous = builder.build_messages(session)
+
+    session.add_message(Message(role="user", content="고민 1"))
+    session.add_message(Message(role="assistant", content="응답 1"))
+    current = builder.build_messages(session)
+
+    def encode(messages: list[dict]) -> bytes:
+        return json.dumps(messages, ensure_ascii=False).encode("utf-8")
+
+    stable_prefix = encode(previous[:-1])[:-1]
+    assert encode(current).startswith(stable_prefix)
+    assert previous[-1] != current[-1]
+
+
+def test_prompt_lookup_does_not_render_per_request(monkeypatch):
+    """요청마다 프롬프트를 다시 생성하지 않고 미리 생성된 문자열을 그대로 돌려준다"""
+    # Given
+    module = "app.consult.infrastructure.service.counselor_prompt_builder"
+    render_calls = []
+    monkeypatch.setattr(f"{module}._render_system_prompt", lambda *args: render_calls.append(args))
+    monkeypatch.setattr(f"{module}._render_turn_guidance", lambda *args: render_calls.append(args))
+    mbti, gender = MBTI("ENFP"), Gender("FEMALE")
+
+    # When
+    prompts = {id(get_system_prompt(mbti, gender)) for _ in range(100)}
+    guidances = {id(get_turn_guidance(3)) for _ in range(100)}
+
+    # Then
+    assert render_calls == []
+    assert len(prompts) == 1
+    assert len(guidances) == 1
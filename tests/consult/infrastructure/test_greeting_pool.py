@@ -0,0 +1,114 @@
+import asyncio
+
+from app.consult.application.use_case.start_consult_use_case import StartConsultUseCase
+from app.consult.infrastructure.service.greeting_pool import GreetingPoolCounselor
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+from tests.consult.fixtures.fake_ai_counselor import FakeAICounselor
+from tests.consult.fixtures.fake_consult_repository import FakeConsultRepository
+
+
+class CountingCounselor(FakeAICounselor):
+    """인사말 생성 횟수를 세고, gate가 있으면 열릴 때까지 생성을 멈추는 Fake 상담사"""
+
+    def __init__(self, fail: bool = False):
+        super().__init__()
+        self.fail = fail
+        self.greeting_calls = 0
+        self.gate: asyncio.Event | None = None
+
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        self.greeting_calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("LLM 오류")
+        return f"{mbti.value}/{gender.value} 인사말 #{self.greeting_calls}"
+
+
+def test_warm_up_fills_pool_for_all_combinations():
+    """warm-up은 16 MBTI x 2 성별 조합마다 pool_size개의 인사말을 채운다"""
+    counselor = CountingCounselor()
+    pool = GreetingPoolCounselor(counselor, pool_size=2)
+
+    asyncio.run(pool.warm_up())
+
+    assert counselor.greeting_calls == 32 * 2
+    assert pool.size(MBTI("INTJ"), Gender("MALE")) == 2
+    assert pool.size(MBTI("ESFP"), Gender("FEMALE")) == 2
+
+
+def test_serves_greeting_from_pool_and_refills_in_background():
+    """풀에서 인사말을 꺼내 반환하고, 꺼낸 만큼 백그라운드에서 다시 채운다"""
+    counselor = CountingCounselor()
+    pool = GreetingPoolCounselor(counselor, pool_size=2, choice=lambda items: items[0])
+    mbti, gender = MBTI("INFP"), Gender("FEMALE")
+
+    async def scenario():
+        await pool.warm_up()
+        calls_before = counselor.greeting_calls
+        greeting = await pool.generate_greeting(mbti, gender)
+        size_after_take = pool.size(mbti, gender)
+        await asyncio.sleep(0)  # 보충 작업 실행
+        await asyncio.sleep(0)
+        return greeting, calls_before, size_after_take
+
+    greeting, calls_before, size_after_take = asyncio.run(scenario())
+
+    assert greeting.startswith("INFP/FEMALE")
+    assert size_after_take == 1
+    assert pool.size(mbti, gender) == 2
+    assert counselor.greeting_calls == calls_before + 1
+    assert pool.hits == 1 and pool.misses == 0
+
+
+def test_falls_back_to_direct_generation_when_pool_is_empty():
+    """풀이 비어 있으면 직접 생성하고 해당 조합의 풀을 채운다"""
+    counselor = CountingCounselor()
+    pool = GreetingPoolCounselor(counselor, pool_size=3)
+    mbti, gender = MBTI("ENTJ"), Gender("MALE")
+
+    async def scenario():
+        greeting = await pool.generate_greeting(mbti, gender)
+        await pool.close()  # 진행 중인 보충 작업 정리
+        return greeting
+
+    greeting = asyncio.run(scenario())
+
+    assert greeting.startswith("ENTJ/MALE")
+    assert pool.misses == 1
+
+
+def test_refill_failure_does_not_break_greeting():
+    """보충 중 LLM 오류가 나도 풀이 비어 있을 뿐 예외가 전파되지 않는다"""
+    counselor = CountingCounselor(fail=True)
+    pool = GreetingPoolCounselor(counselor, pool_size=2)
+
+    asyncio.run(pool.warm_up())
+
+    assert pool.size(MBTI("INTJ"), Gender("MALE")) == 0
+
+
+def test_pooled_start_consult_does_not_wait_for_llm():
+    """풀이 준비되면 상담 시작이 LLM 지연을 기다리지 않는다"""
+    counselor = CountingCounselor()
+    pool = GreetingPoolCounselor(counselor, pool_size=2)
+    use_case = StartConsultUseCase(FakeConsultRepository(), pool)
+
+    async def scenario():
+        await pool.warm_up()
+        warmed_up_calls = counselor.greeting_calls
+        counselor.gate = asyncio.Event()  # 이후 LLM 호출은 끝나지 않는다
+        # 요청이 LLM 호출을 기다리면 gate가 닫혀 있어 시간 초과로 실패한다
+        result = await asyncio.wait_for(
+            use_case.execute(user_id="user-1", mbti=MBTI("ISTJ"), gender=Gender("MALE")),
+            timeout=5,
+        )
+        await pool.close()
+        return result, warmed_up_calls
+
+    result, warmed_up_calls = asyncio.run(scenario())
+
+    # warm-up에서 만든 인사말(번호가 warm-up 호출 수 이하)을 그대로 받는다
+    assert result["greeting"].startswith("ISTJ/MALE")
+    assert int(result["greeting"].rsplit("#", 1)[1]) <= warmed_up_calls
@@ -0,0 +1,250 @@
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.consult.application.port.analysis_queue_port import AnalysisPendingElsewhereError
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.queue.in_process_analysis_queue import InProcessAnalysisQueue
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+from tests.consult.fixtures.fake_ai_counselor import FakeAICounselor
+from tests.consult.fixtures.fake_consult_repository import FakeConsultRepository
+
+
+class FlakyCounselor(FakeAICounselor):
+    """지정한 횟수만큼 분석 생성에 실패하는 Fake 상담사"""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+        self.analysis_calls = 0
+
+    async def generate_analysis(self, session):
+        self.analysis_calls += 1
+        if self.analysis_calls <= self.failures:
+            raise RuntimeError("LLM 오류")
+        return await super().generate_analysis(session)
+
+
+def _scope(repository):
+    @contextmanager
+    def scope():
+        yield repository
+    return scope
+
+
+def _pending_session(repository, session_id="session-1") -> ConsultSession:
+    session = ConsultSession(
+        id=session_id, user_id="user-1", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    for i in range(5):
+        session.add_message(Message(role="user", content=f"질문 {i+1}"))
+        session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+    session.request_analysis()
+    repository.save(session)
+    return session
+
+
+def test_enqueued_job_generates_and_saves_analysis():
+    """등록된 작업은 분석을 생성해 세션에 ready 상태로 저장한다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    queue = InProcessAnalysisQueue(FakeAICounselor(), _scope(repository))
+
+    async def scenario():
+        queue.enqueue("session-1")
+        await queue.join()
+
+    asyncio.run(scenario())
+
+    session = repository.find_by_id("session-1")
+    assert session.get_analysis_status() == "ready"
+    assert session.get_analysis()["situation"] == "테스트 상황 분석"
+
+
+def test_job_retries_and_marks_failed_after_max_attempts():
+    """분석 생성이 계속 실패하면 failed 상태로 저장한다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    counselor = FlakyCounselor(failures=10)
+    queue = InProcessAnalysisQueue(counselor, _scope(repository), max_attempts=2)
+
+    async def scenario():
+        queue.enqueue("session-1")
+        await queue.join()
+
+    asyncio.run(scenario())
+
+    assert counselor.analysis_calls == 2
+    assert repository.find_by_id("session-1").get_analysis_status() == "failed"
+
+
+def test_job_succeeds_on_retry():
+    """일시적인 실패는 재시도로 복구된다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    counselor = FlakyCounselor(failures=1)
+    queue = InProcessAnalysisQueue(counselor, _scope(repository), max_attempts=2)
+
+    async def scenario():
+        queue.enqueue("session-1")
+        await queue.join()
+
+    asyncio.run(scenario())
+
+    assert repository.find_by_id("session-1").get_analysis_status() == "ready"
+
+
+def test_resume_pending_enqueues_unfinished_jobs():
+    """재시작 시 pending 상태로 남은 세션의 분석을 재개한다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository, "session-1")
+    _pending_session(repository, "session-2")
+    queue = InProcessAnalysisQueue(FakeAICounselor(), _scope(repository))
+
+    async def scenario():
+        resumed = queue.resume_pending()
+        await queue.join()
+        return resumed
+
+    resumed = asyncio.run(scenario())
+
+    assert resumed == 2
+    assert repository.find_pending_analysis_session_ids() == []
+
+
+def test_duplicate_enqueue_runs_once():
+    """같은 세션을 중복 등록해도 분석은 한 번만 생성한다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    counselor = FlakyCounselor(failures=0)
+    queue = InProcessAnalysisQueue(counselor, _scope(repository))
+
+    async def scenario():
+        queue.enqueue("session-1")
+        queue.enqueue("session-1")
+        await queue.join()
+        queue.enqueue("session-1")  # 이미 ready라 건너뜀
+        await queue.join()
+
+    asyncio.run(scenario())
+
+    assert counselor.analysis_calls == 1
+
+
+def test_job_claimed_by_another_worker_is_skipped():
+    """다른 워커가 맡은 작업은 재개하지 않는다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    repository.claim_pending_analysis("session-1", datetime.now(), datetime.now() - timedelta(minutes=10))
+    counselor = FlakyCounselor(failures=0)
+    queue = InProcessAnalysisQueue(counselor, _scope(repository))
+
+    async def scenario():
+        queue.resume_pending()
+        await queue.join()
+
+    asyncio.run(scenario())
+
+    assert counselor.analysis_calls == 0
+    assert repository.find_by_id("session-1").get_analysis_status() == "pending"
+
+
+def test_subscriber_is_told_pending_when_another_worker_holds_claim():
+    """다른 워커가 맡은 작업을 구독하면 실패가 아닌 '다른 곳에서 생성 중'으로 끝난다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    repository.claim_pending_analysis("session-1", datetime.now(), datetime.now() - timedelta(minutes=10))
+    queue = InProcessAnalysisQueue(FlakyCounselor(failures=0), _scope(repository))
+
+    async def scenario():
+        queue.enqueue("session-1")
+        subscription = queue.subscribe("session-1")
+        with pytest.raises(AnalysisPendingElsewhereError):
+            async for _ in subscription:
+                pass
+
+    asyncio.run(scenario())
+
+    assert repository.find_by_id("session-1").get_analysis_status() == "pending"
+
+
+def test_stale_claim_is_taken_over():
+    """맡은 지 claim_timeout_seconds가 지난 작업은 죽은 워커의 것으로 보고 다시 맡는다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    repository.claim_pending_analysis("session-1", datetime.now() - timedelta(hours=1), datetime.min)
+    queue = InProcessAnalysisQueue(FakeAICounselor(), _scope(repository), claim_timeout_seconds=60)
+
+    async def scenario():
+        queue.resume_pending()
+        await queue.join()
+
+    asyncio.run(scenario())
+
+    assert repository.find_by_id("session-1").get_analysis_status() == "ready"
+
+
+def test_close_releases_claim_of_cancelled_job():
+    """종료로 취소된 작업은 맡은 표시를 지워 다음 기동 때 바로 재개된다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    queue = InProcessAnalysisQueue(SteppedCounselor(), _scope(repository))
+
+    async def scenario():
+        queue.enqueue("session-1")
+        await asyncio.sleep(0)
+        await queue.close()
+
+    asyncio.run(scenario())
+
+    assert repository.find_by_id("session-1").get_analysis_status() == "pending"
+    assert repository.claim_pending_analysis("session-1", datetime.now(), datetime.min) is True
+
+
+class SteppedCounselor(FakeAICounselor):
+    """섹션 사이에 지연을 두고 분석을 스트리밍하는 Fake 상담사"""
+
+    async def generate_analysis_stream(self, session):
+        for section, content in (await self.generate_analysis(session)).to_dict().items():
+            await asyncio.sleep(0.01)
+            yield section, content
+
+
+def test_subscriber_receives_sections_while_job_runs():
+    """구독자는 작업이 진행되는 동안 완성된 섹션을 순서대로 받는다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    queue = InProcessAnalysisQueue(SteppedCounselor(), _scope(repository))
+
+    async def scenario():
+        queue.enqueue("session-1")
+        await asyncio.sleep(0.015)  # 첫 섹션 생성 이후 구독
+        subscription = queue.subscribe("session-1")
+        received = [section async for section, _ in subscription]
+        return received
+
+    received = asyncio.run(scenario())
+
+    assert received == ["situation", "traits", "solutions", "cautions"]
+    assert repository.find_by_id("session-1").get_analysis_status() == "ready"
+    assert queue.subscribe("session-1") is None
+
+
+def test_subscriber_gets_error_when_job_fails():
+    """작업이 최종 실패하면 구독 스트림이 예외로 끝난다"""
+    repository = FakeConsultRepository()
+    _pending_session(repository)
+    queue = InProcessAnalysisQueue(FlakyCounselor(failures=10), _scope(repository), max_attempts=1)
+
+    async def scenario():
+        queue.enqueue("session-1")
+        subscription = queue.subscribe("session-1")
+        with pytest.raises(RuntimeError):
+            async for _ in subscription:
+                pass
+
+    asyncio.run(scenario())
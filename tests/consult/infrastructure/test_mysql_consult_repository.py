@@ -1,10 +1,11 @@
 import pytest
 from datetime import datetime
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.consult.domain.consult_session import ConsultSession
 from app.consult.domain.message import Message
+from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel
 from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel
 from app.consult.infrastructure.repository.mysql_consult_repository import MySQLConsultRepository
 from app.shared.vo.mbti import MBTI
@@ -13,9 +14,16 @@ from config.database import Base
 
 
 @pytest.fixture(scope="function")
-def db_session():
-    """테스트용 인메모리 SQLite DB 세션"""
+def engine():
+    """테스트용 인메모리 SQLite 엔진"""
     engine = create_engine("sqlite:///:memory:")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_session(engine):
+    """테스트용 인메모리 SQLite DB 세션"""
     Base.metadata.create_all(bind=engine)
     SessionLocal = sessionmaker(bind=engine)
     session = SessionLocal()
@@ -190,3 +198,378 @@ def test_message_order_preserved(repository):
     assert len(messages) == 5
     for i, msg in enumerate(messages):
         assert msg.content == f"메시지 {i}"
+
+
+def _count_writes(engine, fn) -> int:
+    """fn 실행 중 발생한 INSERT/UPDATE/DELETE 문 개수를 센다"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE")):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+def test_save_after_find_inserts_only_new_messages(repository):
+    """조회한 세션을 저장하면 기존 메시지는 유지되고 새 메시지만 추가된다"""
+    # Given: 메시지 2개가 저장된 세션
+    session = ConsultSession(
+        id="session-append",
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    )
+    session.add_message(Message(role="user", content="질문 1"))
+    session.add_message(Message(role="assistant", content="답변 1"))
+    repository.save(session)
+
+    # When: 조회 후 새 메시지를 추가하여 두 번 저장하면
+    found = repository.find_by_id("session-append")
+    found.add_message(Message(role="user", content="질문 2"))
+    repository.save(found)
+    repository.save(found)
+
+    # Then: 메시지가 중복 없이 저장된다
+    messages = repository.find_by_id("session-append").get_messages()
+    assert [m.content for m in messages] == ["질문 1", "답변 1", "질문 2"]
+
+
+def test_save_updates_completion_and_analysis(repository):
+    """저장된 세션의 완료 상태와 분석 결과가 갱신된다"""
+    # Given: 저장된 세션
+    session = ConsultSession(
+        id="session-analysis",
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    )
+    repository.save(session)
+
+    # When: 분석 결과와 함께 완료 처리 후 저장하면
+    session.complete_with_analysis({"situation": "상황"})
+    repository.save(session)
+
+    # Then: 갱신된 값이 조회된다
+    found = repository.find_by_id("session-analysis")
+    assert found.is_completed() is True
+    assert found.get_analysis() == {"situation": "상황"}
+
+
+def test_save_write_cost_is_constant_per_turn(engine, repository):
+    """턴이 늘어나도 턴당 쓰기 문 개수는 일정하다 (벤치마크)"""
+    # Given: 저장된 빈 세션
+    repository.save(ConsultSession(
+        id="session-bench",
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    ))
+
+    def play_turn(turn: int):
+        found = repository.find_by_id("session-bench")
+        found.add_message(Message(role="user", content=f"질문 {turn}"))
+        found.add_message(Message(role="assistant", content=f"답변 {turn}"))
+        repository.save(found)
+
+    # When: 50턴을 진행하며 턴마다 쓰기 문 개수를 측정하면
+    write_counts = [
+        _count_writes(engine, lambda turn=turn: play_turn(turn))
+        for turn in range(1, 51)
+    ]
+
+    # Then: 첫 턴과 마지막 턴의 쓰기 비용이 같다
+    assert write_counts[0] == write_counts[-1]
+    assert len(set(write_counts)) == 1
+    assert len(repository.find_by_id("session-bench").get_messages()) == 100
+
+
+def test_save_persists_analysis_status_and_finds_pending_sessions(repository):
+    """분석 상태가 저장되고, pending 세션 id를 조회할 수 있다"""
+    # Given: 분석 대기 세션과 분석 완료 세션
+    pending = ConsultSession(
+        id="session-pending", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    pending.request_analysis()
+    repository.save(pending)
+
+    ready = ConsultSession(
+        id="session-ready", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    ready.complete_with_analysis({"situation": "상황"})
+    repository.save(ready)
+
+    # When & Then: pending 세션만 조회된다
+    assert repository.find_pending_analysis_session_ids() == ["session-pending"]
+    assert repository.find_by_id("session-pending").get_analysis_status() == "pending"
+
+    # When: 분석이 완료되어 다시 저장되면
+    found = repository.find_by_id("session-pending")
+    found.complete_with_analysis({"situation": "상황"})
+    repository.save(found)
+
+    # Then: 더 이상 pending이 아니다
+    assert repository.find_pending_analysis_session_ids() == []
+    assert repository.find_by_id("session-pending").get_analysis_status() == "ready"
+
+
+def test_claim_pending_analysis_succeeds_once_until_stale(repository):
+    """대기 중인 분석 작업은 한 번만 맡을 수 있고, 맡은 표시가 오래되면 다시 맡을 수 있다"""
+    # Given: 분석 대기 중인 세션
+    session = ConsultSession(
+        id="session-pending", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    session.request_analysis()
+    repository.save(session)
+    claimed_at = datetime(2024, 1, 15, 10, 0, 0)
+
+    # When & Then: 처음 맡으면 성공하고, 다른 워커의 두 번째 시도는 실패한다
+    assert repository.claim_pending_analysis("session-pending", claimed_at, datetime(2024, 1, 15, 9, 50)) is True
+    assert repository.claim_pending_analysis("session-pending", claimed_at, datetime(2024, 1, 15, 9, 50)) is False
+
+    # When & Then: 맡은 시각이 stale_before보다 이르면 다시 맡을 수 있다
+    assert repository.claim_pending_analysis(
+        "session-pending", datetime(2024, 1, 15, 10, 20), datetime(2024, 1, 15, 10, 10)
+    ) is True
+
+    # When & Then: 내려놓으면 바로 다시 맡을 수 있다
+    repository.release_analysis_claim("session-pending")
+    assert repository.claim_pending_analysis("session-pending", claimed_at, datetime(2024, 1, 15, 9, 50)) is True
+
+
+def test_claim_pending_analysis_fails_when_not_pending(repository):
+    """대기 중이 아닌 세션의 분석 작업은 맡을 수 없다"""
+    session = ConsultSession(
+        id="session-ready", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    session.complete_with_analysis({"situation": "상황"})
+    repository.save(session)
+
+    assert repository.claim_pending_analysis(
+        "session-ready", datetime(2024, 1, 15, 10, 0), datetime(2024, 1, 15, 9, 50)
+    ) is False
+
+
+def _count_selects(engine, fn) -> int:
+    """fn 실행 중 발생한 SELECT 문 개수를 센다"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+def _save_session_with_messages(repository, session_id: str, message_count: int) -> None:
+    session = ConsultSession(
+        id=session_id,
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    )
+    for i in range(message_count):
+        role = "user" if i % 2 == 0 else "assistant"
+        session.add_message(Message(role=role, content=f"메시지 {i}"))
+    repository.save(session)
+
+
+def _legacy_find_by_id(db_session, session_id: str) -> ConsultSession:
+    """세션/메시지를 ORM 엔티티로 따로 조회하던 이전 방식 (벤치마크 기준선)"""
+    session_model = db_session.query(ConsultSessionModel).filter(
+        ConsultSessionModel.id == session_id
+    ).first()
+    message_models = db_session.query(ConsultMessageModel).filter(
+        ConsultMessageModel.session_id == session_id
+    ).order_by(ConsultMessageModel.id).all()
+    return ConsultSession(
+        id=session_model.id,
+        user_id=session_model.user_id,
+        mbti=MBTI(session_model.mbti),
+        gender=Gender(session_model.gender),
+        created_at=session_model.created_at,
+        messages=[
+            Message(role=m.role, content=m.content, timestamp=m.created_at)
+            for m in message_models
+        ],
+        completed=session_model.is_completed,
+    )
+
+
+def test_find_by_id_without_messages_returns_empty_history(repository):
+    """메시지가 없는 세션도 JOIN 조회로 찾을 수 있다"""
+    # Given: 메시지가 없는 세션
+    _save_session_with_messages(repository, "session-empty", 0)
+
+    # When: 조회하면
+    found = repository.find_by_id("session-empty")
+
+    # Then: 빈 메시지 목록으로 조회된다
+    assert found is not None
+    assert found.get_messages() == []
+    assert found.is_persisted() is True
+
+
+@pytest.mark.parametrize("message_count", [5, 20, 50])
+def test_find_by_id_issues_single_select(engine, repository, message_count):
+    """메시지 개수와 무관하게 세션 조회는 SELECT 한 번으로 끝난다 (벤치마크)"""
+    # Given: 메시지가 message_count개 저장된 세션
+    _save_session_with_messages(repository, "session-join", message_count)
+
+    # When: 조회 시 SELECT 문 개수를 측정하면
+    found = []
+    select_count = _count_selects(
+        engine, lambda: found.append(repository.find_by_id("session-join"))
+    )
+
+    # Then: SELECT는 한 번이고 메시지는 순서대로 모두 조회된다
+    assert select_count == 1
+    messages = found[0].get_messages()
+    assert [m.content for m in messages] == [f"메시지 {i}" for i in range(message_count)]
+    assert messages[0].role == "user"
+
+
+@pytest.mark.parametrize("message_count", [5, 20, 50])
+def test_find_by_id_matches_two_query_orm_load_with_fewer_selects(
+    engine, db_session, repository, message_count
+):
+    """JOIN + row 매핑 조회는 ORM 2회 조회와 같은 세션을 SELECT 절반으로 만든다"""
+    # Given: 메시지가 message_count개 저장된 세션
+    _save_session_with_messages(repository, "session-bench-read", message_count)
+
+    # When: 두 방식으로 조회하며 SELECT 문 개수를 세면
+    legacy, joined = [], []
+    legacy_selects = _count_selects(
+        engine, lambda: legacy.append(_legacy_find_by_id(db_session, "session-bench-read"))
+    )
+    db_session.expunge_all()
+    joined_selects = _count_selects(
+        engine, lambda: joined.append(repository.find_by_id("session-bench-read"))
+    )
+
+    # Then: 같은 세션과 메시지를 더 적은 SELECT로 조회한다
+    assert (legacy_selects, joined_selects) == (2, 1)
+    assert joined[0].id == legacy[0].id
+    assert joined[0].is_completed() == legacy[0].is_completed()
+    assert [(m.role, m.content, m.timestamp) for m in joined[0].get_messages()] == [
+        (m.role, m.content, m.timestamp) for m in legacy[0].get_messages()
+    ]
+
+
+def _save_completed_session(repository, session_id: str, created_at: datetime, user_id="user-123"):
+    session = ConsultSession(
+        id=session_id,
+        user_id=user_id,
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+        created_at=created_at,
+    )
+    session.complete_with_analysis({"situation": f"{session_id} 분석"})
+    repository.save(session)
+
+
+def test_find_completed_summaries_paginates_with_keyset(repository):
+    """완료 세션 요약을 (created_at, id) 키 기준 최신순으로 페이지 단위 조회한다"""
+    # Given: 같은 시각에 만들어진 세션을 포함한 완료 세션 5개와 미완료/타인 세션
+    same_time = datetime(2024, 1, 3, 12, 0)
+    _save_completed_session(repository, "session-a", datetime(2024, 1, 1, 12, 0))
+    _save_completed_session(repository, "session-b", datetime(2024, 1, 2, 12, 0))
+    _save_completed_session(repository, "session-c", same_time)
+    _save_completed_session(repository, "session-d", same_time)
+    _save_completed_session(repository, "session-e", datetime(2024, 1, 4, 12, 0))
+    _save_completed_session(repository, "session-other", same_time, user_id="user-999")
+    repository.save(ConsultSession(
+        id="session-ongoing", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    ))
+
+    # When: 2개씩 커서를 넘기며 조회하면
+    pages = []
+    after = None
+    while True:
+        page = repository.find_completed_summaries_by_user_id("user-123", limit=2, after=after)
+        if not page:
+            break
+        pages.append([summary.id for summary in page])
+        after = (page[-1].created_at, page[-1].id)
+
+    # Then: 중복/누락 없이 최신순으로 조회된다
+    assert pages == [["session-e", "session-d"], ["session-c", "session-b"], ["session-a"]]
+
+
+def test_find_completed_summaries_returns_lightweight_fields(repository):
+    """완료 세션 요약에는 분석 본문 없이 분석 상태만 담긴다"""
+    # Given: 분석이 완료된 세션
+    _save_completed_session(repository, "session-summary", datetime(2024, 1, 1, 12, 0))
+
+    # When: 요약을 조회하면
+    summaries = repository.find_completed_summaries_by_user_id("user-123", limit=10)
+
+    # Then: 가벼운 필드만 채워진다
+    assert len(summaries) == 1
+    summary = summaries[0]
+    assert summary.id == "session-summary"
+    assert summary.created_at == datetime(2024, 1, 1, 12, 0)
+    assert summary.mbti.value == "INTJ"
+    assert summary.gender.value == "MALE"
+    assert summary.analysis_status == "ready"
+    assert not hasattr(summary, "analysis")
+
+
+def test_find_completed_summaries_uses_composite_index(engine, repository):
+    """히스토리 조회는 (user_id, is_completed, created_at) 복합 인덱스를 탄다"""
+    # Given: 완료 세션
+    _save_completed_session(repository, "session-index", datetime(2024, 1, 1, 12, 0))
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    # When: 커서를 주고 조회한 SQL의 실행 계획을 확인하면
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        repository.find_completed_summaries_by_user_id(
+            "user-123", limit=2, after=(datetime(2024, 1, 2), "session-z")
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    statement, parameters = statements[0]
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+
+    # Then: 복합 인덱스를 사용한다
+    assert any("ix_consult_sessions_user_completed_created" in str(row) for row in plan)
+
+
+def test_save_persists_history_summary(repository):
+    """대화 누적 요약과 요약된 메시지 수가 저장/갱신된다"""
+    # Given: 요약이 있는 새 세션을 저장하고
+    _save_session_with_messages(repository, "session-summary-history", 4)
+    found = repository.find_by_id("session-summary-history")
+    found.update_history_summary("첫 요약", 2)
+    repository.save(found)
+
+    # When: 다시 조회해 요약을 갱신하면
+    reloaded = repository.find_by_id("session-summary-history")
+    assert reloaded.get_history_summary() == "첫 요약"
+    assert reloaded.get_summarized_message_count() == 2
+    reloaded.update_history_summary("갱신된 요약", 4)
+    repository.save(reloaded)
+
+    # Then: 갱신된 요약이 조회된다
+    latest = repository.find_by_id("session-summary-history")
+    assert latest.get_history_summary() == "갱신된 요약"
+    assert latest.get_summarized_message_count() == 4
+    assert latest.get_unsummarized_messages() == []
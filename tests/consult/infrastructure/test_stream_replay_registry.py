@@ -0,0 +1,191 @@
+import asyncio
+
+import pytest
+
+from app.consult.infrastructure.cache.stream_replay_registry import (
+    StreamReplayBuffer,
+    StreamReplayRegistry,
+)
+
+
+async def _frames(texts: list[str], interval: float = 0.0, state: dict | None = None):
+    try:
+        for text in texts:
+            await asyncio.sleep(interval)
+            yield text
+    finally:
+        if state is not None:
+            state["closed"] = True
+
+
+async def _collect(iterator) -> list[tuple[int, str]]:
+    return [event async for event in iterator]
+
+
+def test_buffer_replays_events_after_given_id():
+    """버퍼는 after_id 다음 이벤트부터 번호와 함께 전달한다"""
+    async def scenario():
+        buffer = StreamReplayBuffer("user-123", turn=1, max_events=10)
+        for text in ("가", "나", "다"):
+            buffer.append(text)
+        buffer.finish()
+        return await _collect(buffer.follow(after_id=1))
+
+    assert asyncio.run(scenario()) == [(2, "나"), (3, "다")]
+
+
+def test_buffer_keeps_only_recent_events():
+    """버퍼는 최근 max_events개만 보관하고, 잘려 나간 범위로는 이어 받을 수 없다"""
+    async def scenario():
+        buffer = StreamReplayBuffer("user-123", turn=1, max_events=2)
+        for text in ("가", "나", "다"):
+            buffer.append(text)
+        return buffer
+
+    buffer = asyncio.run(scenario())
+
+    assert buffer.can_resume_from(0) is False
+    assert buffer.can_resume_from(1) is True
+    assert buffer.can_resume_from(3) is True
+    assert buffer.can_resume_from(4) is False
+
+
+def test_buffer_raises_generation_error_to_subscriber():
+    """생성 오류로 끝난 스트림은 남은 이벤트를 전달한 뒤 오류를 던진다"""
+    async def scenario():
+        buffer = StreamReplayBuffer("user-123", turn=1, max_events=10)
+        buffer.append("가")
+        buffer.finish(RuntimeError("upstream failed"))
+        received = []
+        with pytest.raises(RuntimeError):
+            async for event in buffer.follow():
+                received.append(event)
+        return received
+
+    assert asyncio.run(scenario()) == [(1, "가")]
+
+
+def test_live_subscriber_receives_events_as_produced():
+    """생성 중인 스트림을 구독하면 이벤트가 만들어지는 대로 받는다"""
+    async def scenario():
+        registry = StreamReplayRegistry()
+        stream = registry.start("session-1", "user-123", 1, _frames(["가", "나", "다"], 0.01))
+        return await _collect(registry.subscribe(stream))
+
+    assert asyncio.run(scenario()) == [(1, "가"), (2, "나"), (3, "다")]
+
+
+def test_start_rejects_second_active_stream_for_same_key():
+    """같은 세션에 생성 중인 스트림이 있으면 새 스트림을 시작하지 않는다"""
+    async def scenario():
+        registry = StreamReplayRegistry()
+        registry.start("session-1", "user-123", 1, _frames(["가"], 0.05))
+        with pytest.raises(ValueError):
+            registry.start("session-1", "user-123", 1, _frames(["나"]))
+        await registry.close()
+
+    asyncio.run(scenario())
+
+
+def test_reservation_blocks_new_stream_until_cancelled():
+    """예약된 스트림은 생성 전에도 같은 세션의 새 스트림을 막고, 예약을 취소하면 풀린다"""
+    async def scenario():
+        registry = StreamReplayRegistry()
+        reserved = registry.reserve("session-1", "user-123", 1)
+        with pytest.raises(ValueError):
+            registry.reserve("session-1", "user-123", 1)
+
+        registry.cancel_reservation("session-1", reserved)
+        active_after_cancel = registry.is_active("session-1")
+        buffer = registry.start("session-1", "user-123", 1, _frames(["가"]))
+        events = await _collect(registry.subscribe(buffer))
+        await registry.close()
+        return reserved, active_after_cancel, events
+
+    reserved, active_after_cancel, events = asyncio.run(scenario())
+
+    assert reserved.finished is True
+    assert active_after_cancel is False
+    assert events == [(1, "가")]
+
+
+def test_generation_is_cancelled_when_last_subscriber_leaves_without_grace():
+    """유예 시간이 없으면 마지막 구독자가 떠날 때 생성을 취소한다"""
+    async def scenario():
+        state = {}
+        registry = StreamReplayRegistry(grace_seconds=0)
+        stream = registry.start("session-1", "user-123", 1, _frames(["가"] * 100, 0.01, state))
+        subscription = registry.subscribe(stream)
+        await subscription.__anext__()
+        await subscription.aclose()
+        return state, stream
+
+    state, stream = asyncio.run(scenario())
+
+    assert state["closed"] is True
+    assert stream.finished is True
+
+
+def test_reconnecting_within_grace_resumes_without_new_generation():
+    """유예 시간 안에 다시 구독하면 생성이 이어지고 빠짐없이 이어 받는다"""
+    async def scenario():
+        produced = []
+
+        async def frames():
+            for text in ("가", "나", "다", "라"):
+                await asyncio.sleep(0.02)
+                produced.append(text)
+                yield text
+
+        registry = StreamReplayRegistry(grace_seconds=1.0)
+        stream = registry.start("session-1", "user-123", 1, frames())
+
+        # 첫 연결: 한 이벤트만 받고 끊긴다
+        first = registry.subscribe(stream)
+        first_event = await first.__anext__()
+        await first.aclose()
+
+        # 재연결: 마지막으로 받은 번호 다음부터 이어 받는다
+        await asyncio.sleep(0.03)
+        rest = await _collect(registry.subscribe(stream, after_id=first_event[0]))
+        return first_event, rest, produced
+
+    first_event, rest, produced = asyncio.run(scenario())
+
+    assert first_event == (1, "가")
+    assert rest == [(2, "나"), (3, "다"), (4, "라")]
+    assert produced == ["가", "나", "다", "라"]
+
+
+def test_abandoned_stream_is_cancelled_after_grace():
+    """유예 시간이 지나도록 아무도 다시 붙지 않으면 생성을 취소한다"""
+    async def scenario():
+        state = {}
+        registry = StreamReplayRegistry(grace_seconds=0.05)
+        stream = registry.start("session-1", "user-123", 1, _frames(["가"] * 100, 0.01, state))
+        subscription = registry.subscribe(stream)
+        await subscription.__anext__()
+        await subscription.aclose()
+        await asyncio.sleep(0.2)
+        return state, stream
+
+    state, stream = asyncio.run(scenario())
+
+    assert state["closed"] is True
+    assert stream.finished is True
+
+
+def test_finished_stream_is_discarded_after_retention():
+    """끝난 스트림은 보관 시간이 지나면 레지스트리에서 제거된다"""
+    async def scenario():
+        registry = StreamReplayRegistry(retention_seconds=0.05)
+        stream = registry.start("session-1", "user-123", 1, _frames(["가"]))
+        await _collect(registry.subscribe(stream))
+        kept = registry.get("session-1")
+        await asyncio.sleep(0.1)
+        return stream, kept, registry.get("session-1")
+
+    stream, kept, discarded = asyncio.run(scenario())
+
+    assert kept is stream
+    assert discarded is None
@@ -0,0 +1,138 @@
+import asyncio
+from contextlib import contextmanager
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.repository.stream_write_behind import StreamWriteBehindBuffer
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from tests.consult.fixtures.fake_analysis_queue import FakeAnalysisQueue
+from tests.consult.fixtures.fake_consult_repository import FakeConsultRepository
+
+
+class CountingRepository(FakeConsultRepository):
+    """save 호출 횟수를 기록하는 Fake 저장소"""
+
+    def __init__(self):
+        super().__init__()
+        self.save_count = 0
+
+    def save(self, session: ConsultSession) -> None:
+        self.save_count += 1
+        super().save(session)
+
+
+class CountingScope:
+    """저장소 스코프를 연 횟수를 기록한다"""
+
+    def __init__(self, repository):
+        self.repository = repository
+        self.opened = 0
+
+    @contextmanager
+    def __call__(self):
+        self.opened += 1
+        yield self.repository
+
+
+def _session_with_user_message(user_turns: int = 1) -> ConsultSession:
+    session = ConsultSession(
+        id="session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")
+    )
+    for i in range(user_turns - 1):
+        session.add_message(Message(role="user", content=f"질문 {i}"))
+        session.add_message(Message(role="assistant", content=f"답변 {i}"))
+    session.mark_persisted()
+    session.add_message(Message(role="user", content="새 질문"))
+    return session
+
+
+def test_buffer_does_not_touch_repository_until_flush():
+    """스트리밍 중에는 저장소를 열지 않는다"""
+    # Given: 버퍼
+    scope = CountingScope(CountingRepository())
+    buffer = StreamWriteBehindBuffer(_session_with_user_message(), scope)
+
+    # When: 응답 조각을 쌓으면
+    buffer.append("안녕")
+    buffer.append("하세요")
+
+    # Then: 저장소 스코프는 열리지 않고 내용만 누적된다
+    assert scope.opened == 0
+    assert buffer.content == "안녕하세요"
+
+
+def test_flush_saves_user_and_assistant_messages_in_single_save():
+    """flush하면 사용자 메시지와 AI 응답을 한 번의 저장으로 기록한다"""
+    # Given: 응답이 쌓인 버퍼
+    repository = CountingRepository()
+    scope = CountingScope(repository)
+    session = _session_with_user_message()
+    buffer = StreamWriteBehindBuffer(session, scope)
+    buffer.append("AI ")
+    buffer.append("응답")
+
+    # When: 두 번 flush하면
+    async def flush_twice():
+        await buffer.flush()
+        await buffer.flush()
+
+    asyncio.run(flush_twice())
+
+    # Then: 한 번만 저장되고 두 메시지가 모두 기록된다
+    assert scope.opened == 1
+    assert repository.save_count == 1
+    messages = repository.find_by_id("session-123").get_messages()
+    assert [(m.role, m.content) for m in messages] == [("user", "새 질문"), ("assistant", "AI 응답")]
+
+
+def test_flush_without_output_does_not_use_up_turn():
+    """응답 없이 스트림이 끝나면 사용자 메시지도 저장하지 않아 턴이 소모되지 않는다"""
+    # Given: 응답이 비어 있는 버퍼
+    repository = CountingRepository()
+    scope = CountingScope(repository)
+    buffer = StreamWriteBehindBuffer(_session_with_user_message(), scope)
+    buffer.append("  ")
+
+    # When: flush하면
+    asyncio.run(buffer.flush())
+
+    # Then: 저장소를 열지 않는다
+    assert scope.opened == 0
+    assert repository.save_count == 0
+
+
+def test_flush_without_output_on_final_turn_does_not_complete_session():
+    """마지막 턴에 응답을 받지 못하면 세션을 완료하거나 분석을 요청하지 않는다"""
+    # Given: 5번째 사용자 메시지가 추가된 세션과 작업 큐
+    repository = CountingRepository()
+    queue = FakeAnalysisQueue()
+    session = _session_with_user_message(user_turns=5)
+    buffer = StreamWriteBehindBuffer(session, CountingScope(repository), queue)
+
+    # When: 응답 없이 flush하면
+    asyncio.run(buffer.flush())
+
+    # Then
+    assert repository.save_count == 0
+    assert session.get_analysis_status() is None
+    assert queue.enqueued == []
+
+
+def test_flush_on_final_turn_requests_background_analysis():
+    """마지막 턴을 flush하면 분석 생성을 요청하고 작업 큐에 등록한다"""
+    # Given: 5번째 사용자 메시지가 추가된 세션과 작업 큐
+    repository = CountingRepository()
+    queue = FakeAnalysisQueue()
+    buffer = StreamWriteBehindBuffer(
+        _session_with_user_message(user_turns=5), CountingScope(repository), queue
+    )
+    buffer.append("마지막 답변")
+
+    # When: flush하면
+    asyncio.run(buffer.flush())
+
+    # Then: 분석 대기 상태로 저장되고 큐에 등록된다
+    saved = repository.find_by_id("session-123")
+    assert saved.get_analysis_status() == "pending"
+    assert queue.enqueued == ["session-123"]
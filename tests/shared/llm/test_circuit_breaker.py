@@ -0,0 +1,87 @@
+import pytest
+
+from app.shared.llm.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock) -> CircuitBreaker:
+    return CircuitBreaker(window_size=10, min_calls=4, failure_rate=0.5, open_seconds=30, clock=clock)
+
+
+def test_opens_when_failure_rate_exceeds_threshold():
+    """최근 호출 오류율이 기준 이상이면 회로를 열고 바로 실패시킨다"""
+    # Given
+    clock = _Clock()
+    breaker = _breaker(clock)
+
+    # When
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+
+    # Then
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now = 10
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after == 20
+
+
+def test_does_not_open_before_min_calls():
+    """기록된 호출이 min_calls보다 적으면 모두 실패해도 열지 않는다"""
+    breaker = _breaker(_Clock())
+
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+def test_half_open_allows_single_probe_and_closes_on_success():
+    """open_seconds가 지나면 시험 호출 하나만 보내고, 성공하면 회로를 닫는다"""
+    # Given
+    clock = _Clock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+    clock.now = 30
+
+    # When
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+
+    # Then
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+def test_half_open_probe_failure_reopens():
+    """시험 호출이 실패하면 다시 open_seconds 동안 연다"""
+    # Given
+    clock = _Clock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+    clock.now = 30
+
+    # When
+    breaker.before_call()
+    breaker.record_failure()
+
+    # Then
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now = 59
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
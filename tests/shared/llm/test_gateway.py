@@ -0,0 +1,307 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from app.shared.llm.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.shared.llm.gateway import (
+    OPERATION_CONVERT,
+    OPERATION_RESPONSE,
+    OUTCOME_FAILURE,
+    OUTCOME_REJECTED,
+    OUTCOME_RETRY,
+    OUTCOME_SUCCESS,
+    OUTCOME_TIMEOUT,
+    PRIORITY_CONSULT_TURN,
+    AsyncLLMGateway,
+    LLMGateway,
+    metric_name,
+)
+from app.shared.llm.rate_scheduler import LLMRateScheduler, SchedulerTimeoutError
+from app.shared.llm.retry_policy import RetryPolicy
+from app.shared.metrics import MetricsRegistry
+from app.shared.tracing import start_trace
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def _rate_limited(retry_after: str | None = None) -> openai.RateLimitError:
+    headers = {"retry-after": retry_after} if retry_after is not None else {}
+    response = httpx.Response(429, headers=headers, request=_REQUEST)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+def _bad_request() -> openai.BadRequestError:
+    response = httpx.Response(400, request=_REQUEST)
+    return openai.BadRequestError("bad request", response=response, body=None)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _ScriptedClient:
+    """chat.completions.create 호출마다 준비된 결과(예외면 raise)를 차례로 돌려주는 가짜 클라이언트"""
+
+    def __init__(self, outcomes: list):
+        self.calls: list[dict] = []
+        self._outcomes = list(outcomes)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class _AsyncScriptedClient(_ScriptedClient):
+    async def _create(self, **kwargs):
+        return super()._create(**kwargs)
+
+
+def _gateway(client, clock: _Clock, metrics: MetricsRegistry, **kwargs) -> LLMGateway:
+    slept: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        slept.append(seconds)
+        clock.now += seconds
+
+    gateway = LLMGateway(
+        client,
+        retry_policy=kwargs.pop("retry_policy", RetryPolicy(max_retries=2, base_delay_seconds=1.0, rng=lambda: 0.5)),
+        metrics=metrics,
+        sleep=sleep,
+        clock=clock,
+        **kwargs,
+    )
+    gateway.slept = slept
+    return gateway
+
+
+def test_retries_transient_errors_and_records_metrics():
+    """429는 jitter 백오프로 재시도하고 결과별 메트릭을 남긴다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    client = _ScriptedClient([_rate_limited(), _rate_limited(), "ok"])
+    gateway = _gateway(client, clock, metrics)
+
+    # When
+    result = gateway.create(OPERATION_CONVERT, model="gpt-4o-mini", messages=[])
+
+    # Then
+    assert result == "ok"
+    assert gateway.slept == [0.5, 1.0]
+    assert len(client.calls) == 3
+    assert metrics.get(metric_name(OPERATION_CONVERT, OUTCOME_RETRY)) == 2
+    assert metrics.get(metric_name(OPERATION_CONVERT, OUTCOME_SUCCESS)) == 1
+
+
+def test_honors_retry_after_header():
+    """Retry-After가 있으면 그 시간만큼 기다린 뒤 재시도한다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    gateway = _gateway(_ScriptedClient([_rate_limited("3"), "ok"]), clock, metrics)
+
+    # When
+    gateway.create(OPERATION_CONVERT)
+
+    # Then
+    assert gateway.slept == [3.0]
+
+
+def test_passes_remaining_deadline_as_request_timeout():
+    """시도마다 작업 마감 시각까지 남은 시간을 요청 타임아웃으로 넘긴다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    client = _ScriptedClient([_rate_limited("2"), "ok"])
+    gateway = _gateway(client, clock, metrics, deadlines={OPERATION_CONVERT: 10.0})
+
+    # When
+    gateway.create(OPERATION_CONVERT)
+
+    # Then
+    assert [call["timeout"] for call in client.calls] == [10.0, 8.0]
+
+
+def test_gives_up_when_retry_would_pass_deadline():
+    """재시도 대기가 마감 시각을 넘기면 기다리지 않고 바로 실패한다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    client = _ScriptedClient([_rate_limited("30"), "ok"])
+    gateway = _gateway(client, clock, metrics, deadlines={OPERATION_CONVERT: 10.0})
+
+    # When / Then
+    with pytest.raises(openai.RateLimitError):
+        gateway.create(OPERATION_CONVERT)
+    assert gateway.slept == []
+    assert metrics.get(metric_name(OPERATION_CONVERT, OUTCOME_FAILURE)) == 1
+
+
+def test_does_not_retry_client_errors():
+    """잘못된 요청(400)은 재시도하지 않고 서킷 브레이커의 실패로 세지 않는다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    breaker = CircuitBreaker(window_size=2, min_calls=1, failure_rate=0.5)
+    client = _ScriptedClient([_bad_request()])
+    gateway = _gateway(client, clock, metrics, circuit_breaker=breaker)
+
+    # When / Then
+    with pytest.raises(openai.BadRequestError):
+        gateway.create(OPERATION_CONVERT)
+    assert len(client.calls) == 1
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_records_timeouts():
+    """타임아웃은 별도 메트릭으로 남기고 재시도 후 실패로 끝난다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    timeouts = [openai.APITimeoutError(request=_REQUEST) for _ in range(3)]
+    gateway = _gateway(_ScriptedClient(timeouts), clock, metrics)
+
+    # When / Then
+    with pytest.raises(openai.APITimeoutError):
+        gateway.create(OPERATION_CONVERT)
+    assert metrics.get(metric_name(OPERATION_CONVERT, OUTCOME_TIMEOUT)) == 3
+    assert metrics.get(metric_name(OPERATION_CONVERT, OUTCOME_RETRY)) == 2
+    assert metrics.get(metric_name(OPERATION_CONVERT, OUTCOME_FAILURE)) == 1
+
+
+def test_open_circuit_fails_fast_without_calling_upstream():
+    """오류율이 높아 회로가 열리면 업스트림을 호출하지 않고 바로 실패한다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    breaker = CircuitBreaker(window_size=4, min_calls=2, failure_rate=0.5, open_seconds=30, clock=clock)
+    client = _ScriptedClient([_rate_limited(), _rate_limited()])
+    gateway = _gateway(client, clock, metrics, circuit_breaker=breaker)
+
+    # When
+    with pytest.raises(CircuitOpenError):
+        gateway.create(OPERATION_CONVERT)
+    with pytest.raises(CircuitOpenError):
+        gateway.create(OPERATION_CONVERT)
+
+    # Then
+    assert len(client.calls) == 2
+    assert metrics.get(metric_name(OPERATION_CONVERT, OUTCOME_REJECTED)) == 2
+
+
+def test_cancelled_half_open_probe_releases_probe_slot():
+    """half_open 시험 호출이 취소되면 시험 호출 자리를 돌려주어 다음 호출이 다시 시험 호출이 된다"""
+    # Given: 회로가 열렸다가 open_seconds가 지나 half_open이 된 상태
+    clock, metrics = _Clock(), MetricsRegistry()
+    breaker = CircuitBreaker(window_size=2, min_calls=1, failure_rate=0.5, open_seconds=30, clock=clock)
+    breaker.before_call()
+    breaker.record_failure()
+    clock.now += 30
+    hung = asyncio.Event()
+
+    class _HangingThenOkClient(_AsyncScriptedClient):
+        async def _create(self, **kwargs):
+            if not self.calls:
+                self.calls.append(kwargs)
+                hung.set()
+                await asyncio.Event().wait()
+            return await super()._create(**kwargs)
+
+    client = _HangingThenOkClient(["ok"])
+    gateway = AsyncLLMGateway(client, metrics=metrics, clock=clock, circuit_breaker=breaker)
+
+    async def scenario():
+        probe = asyncio.create_task(gateway.create(OPERATION_RESPONSE))
+        await hung.wait()
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        return await gateway.create(OPERATION_RESPONSE)
+
+    # When
+    result = asyncio.run(scenario())
+
+    # Then
+    assert result == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_async_gateway_applies_same_policy():
+    """비동기 게이트웨이도 같은 정책으로 재시도한다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    client = _AsyncScriptedClient([_rate_limited("1"), "ok"])
+    slept: list[float] = []
+
+    async def sleep(seconds: float) -> None:
+        slept.append(seconds)
+        clock.now += seconds
+
+    gateway = AsyncLLMGateway(
+        client,
+        retry_policy=RetryPolicy(rng=lambda: 0.0),
+        metrics=metrics,
+        sleep=sleep,
+        clock=clock,
+    )
+
+    # When
+    result = asyncio.run(gateway.create(OPERATION_RESPONSE, stream=True))
+
+    # Then
+    assert result == "ok"
+    assert slept == [1.0]
+    assert client.calls[1]["stream"] is True
+    assert metrics.get(metric_name(OPERATION_RESPONSE, OUTCOME_SUCCESS)) == 1
+
+
+def test_scheduler_timeout_fails_without_calling_upstream():
+    """호출 한도 대기가 마감 시간을 넘기면 업스트림을 호출하지 않고 실패한다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    scheduler = LLMRateScheduler(requests_per_minute=1, tokens_per_minute=100000, metrics=metrics)
+    scheduler.acquire(priority=PRIORITY_CONSULT_TURN, cost=1)
+    client = _ScriptedClient(["ok"])
+    gateway = _gateway(client, clock, metrics, scheduler=scheduler, deadlines={OPERATION_CONVERT: 0.01})
+
+    # When / Then
+    with pytest.raises(SchedulerTimeoutError):
+        gateway.create(OPERATION_CONVERT, messages=[], max_tokens=10)
+    assert client.calls == []
+
+
+def test_scheduler_receives_estimated_cost_and_is_settled_with_usage():
+    """추정 토큰으로 차례를 받고, 응답의 실제 사용량으로 남은 한도를 돌려받는다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    scheduler = LLMRateScheduler(requests_per_minute=100, tokens_per_minute=1000, metrics=metrics)
+    response = SimpleNamespace(usage=SimpleNamespace(total_tokens=100))
+    gateway = _gateway(_ScriptedClient([response]), clock, metrics, scheduler=scheduler)
+
+    # When
+    gateway.create(OPERATION_RESPONSE, messages=[], max_tokens=1000)
+
+    # Then: 1000토큰을 잡았지만 100토큰만 썼으므로 900토큰을 바로 다시 쓸 수 있다
+    scheduler.acquire(priority=PRIORITY_CONSULT_TURN, cost=900, timeout=0)
+
+
+def test_records_llm_and_queue_spans_in_current_trace():
+    """요청 안에서 호출하면 LLM 호출 구간과 호출 한도 대기 구간을 기록한다"""
+    # Given
+    clock, metrics = _Clock(), MetricsRegistry()
+    scheduler = LLMRateScheduler(requests_per_minute=100, tokens_per_minute=100000, metrics=metrics)
+    gateway = _gateway(_ScriptedClient(["ok"]), clock, metrics, scheduler=scheduler)
+
+    # When
+    with start_trace() as trace:
+        gateway.create(OPERATION_CONVERT, messages=[], max_tokens=10)
+
+    # Then
+    spans = {s.name: s for s in trace.spans}
+    assert set(spans) == {"llm.convert", "llm.queue"}
+    assert spans["llm.queue"].parent is spans["llm.convert"]
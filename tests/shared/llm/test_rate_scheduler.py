@@ -0,0 +1,189 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.shared.llm.rate_scheduler import (
+    METRIC_ADMITTED,
+    METRIC_QUEUE_DEPTH,
+    METRIC_TIMED_OUT,
+    LLMRateScheduler,
+    SchedulerTimeoutError,
+)
+from app.shared.llm.token_estimate import DEFAULT_COMPLETION_TOKENS, estimate_request_tokens
+from app.shared.metrics import MetricsRegistry
+
+
+def test_estimate_request_tokens_adds_prompt_and_max_tokens():
+    """요청 토큰 추정치는 프롬프트 추정치 + max_tokens (없으면 기본값)이다"""
+    messages = [{"role": "user", "content": "a" * 40}]
+
+    assert estimate_request_tokens({"messages": messages, "max_tokens": 200}) == 10 + 4 + 200
+    assert estimate_request_tokens({"messages": messages}) == 10 + 4 + DEFAULT_COMPLETION_TOKENS
+
+
+def test_admits_calls_within_budget_immediately():
+    """한도 안의 호출은 기다리지 않고 들어가고 메트릭을 남긴다"""
+    # Given
+    metrics = MetricsRegistry()
+    scheduler = LLMRateScheduler(requests_per_minute=60, tokens_per_minute=60000, metrics=metrics)
+
+    # When
+    for _ in range(3):
+        scheduler.acquire(priority=1, cost=100, timeout=0)
+
+    # Then
+    assert metrics.get(METRIC_ADMITTED) == 3
+    assert metrics.get(METRIC_QUEUE_DEPTH) == 0
+    assert scheduler.queue_depth == 0
+
+
+def test_waits_for_token_budget_to_refill():
+    """TPM 한도를 다 쓰면 토큰이 다시 찰 때까지 들여보내지 않는다"""
+    # Given: 초당 100토큰, 가짜 시계로 한도를 다 쓴 스케줄러
+    now = [0.0]
+    scheduler = LLMRateScheduler(
+        requests_per_minute=600, tokens_per_minute=6000, metrics=MetricsRegistry(), clock=lambda: now[0]
+    )
+    scheduler.acquire(priority=1, cost=6000)
+
+    # When: 토큰이 차기 전에 호출하면
+    with pytest.raises(SchedulerTimeoutError) as exc_info:
+        scheduler.acquire(priority=1, cost=20, timeout=0)
+
+    # Then: 20토큰이 찰 때까지 남은 0.2초를 알려 준다
+    assert exc_info.value.retry_after == pytest.approx(0.2)
+    assert scheduler.queue_depth == 0
+
+    # When: 0.2초가 지나면
+    now[0] += 0.2
+    scheduler.acquire(priority=1, cost=20, timeout=0)
+
+    # Then: 기다리지 않고 들어가 찬 만큼의 토큰을 모두 쓴다
+    assert scheduler._tokens.available() == pytest.approx(0)
+
+
+def test_burst_is_capped_at_requests_per_minute():
+    """한꺼번에 몰린 호출은 RPM 한도만큼만 들어가고 나머지는 대기하다 마감 시간에 실패한다"""
+    # Given
+    metrics = MetricsRegistry()
+    scheduler = LLMRateScheduler(requests_per_minute=5, tokens_per_minute=60000, metrics=metrics)
+
+    # When
+    admitted, rejected = 0, 0
+    for _ in range(10):
+        try:
+            scheduler.acquire(priority=1, cost=10, timeout=0.01)
+            admitted += 1
+        except SchedulerTimeoutError as e:
+            assert e.retry_after > 0
+            rejected += 1
+
+    # Then
+    assert (admitted, rejected) == (5, 5)
+    assert metrics.get(METRIC_TIMED_OUT) == 5
+    assert scheduler.queue_depth == 0
+
+
+def test_consult_turns_are_admitted_before_lower_priority_calls():
+    """대기 중에는 먼저 온 낮은 우선순위 호출보다 높은 우선순위 호출이 먼저 들어간다"""
+    # Given: 토큰 한도를 다 써서 다음 호출부터는 기다려야 한다
+    scheduler = LLMRateScheduler(requests_per_minute=600, tokens_per_minute=6000, metrics=MetricsRegistry())
+    scheduler.acquire(priority=1, cost=6000)
+    admitted: list[str] = []
+
+    async def call(name: str, priority: int) -> None:
+        await scheduler.acquire_async(priority=priority, cost=10, timeout=2)
+        admitted.append(name)
+
+    async def scenario() -> None:
+        greeting = asyncio.create_task(call("greeting", 1))
+        await asyncio.sleep(0.01)
+        turn = asyncio.create_task(call("consult-turn", 0))
+        await asyncio.sleep(0.01)
+        assert scheduler.queue_depth == 2
+        await asyncio.gather(greeting, turn)
+
+    # When
+    asyncio.run(scenario())
+
+    # Then
+    assert admitted == ["consult-turn", "greeting"]
+
+
+def test_waiter_behind_head_without_timeout_keeps_waiting():
+    """timeout 없이 맨 앞이 아닌 호출은 한도를 쓰지 않고 돌아오지 않고, 앞 호출이 들어간 뒤 차례대로 들어간다"""
+    # Given: 가짜 시계로 토큰 한도를 다 쓴 스케줄러
+    now = [0.0]
+    scheduler = LLMRateScheduler(
+        requests_per_minute=600, tokens_per_minute=60000, metrics=MetricsRegistry(), clock=lambda: now[0]
+    )
+    scheduler.acquire(priority=1, cost=60000)
+    admitted: list[str] = []
+
+    def call(name: str, priority: int) -> None:
+        scheduler.acquire(priority=priority, cost=100)
+        admitted.append(name)
+
+    head = threading.Thread(target=call, args=("head", 0), daemon=True)
+    head.start()
+    while scheduler.queue_depth < 1:
+        time.sleep(0.001)
+    behind = threading.Thread(target=call, args=("behind", 1), daemon=True)
+    behind.start()
+
+    # When: 한도가 차기 전에는
+    behind.join(timeout=0.05)
+
+    # Then: 두 호출 모두 대기열에 남아 있다
+    assert behind.is_alive()
+    assert admitted == []
+    assert scheduler.queue_depth == 2
+
+    # When: 한도가 다시 차면
+    now[0] += 1.0
+    head.join(timeout=5)
+    behind.join(timeout=5)
+
+    # Then: 대기열 순서대로 들어간다
+    assert admitted == ["head", "behind"]
+    assert scheduler.queue_depth == 0
+
+
+def test_cancelled_waiter_leaves_queue():
+    """기다리다 취소된 호출은 대기열에서 빠져 다음 호출을 막지 않는다"""
+    # Given
+    scheduler = LLMRateScheduler(requests_per_minute=600, tokens_per_minute=6000, metrics=MetricsRegistry())
+    scheduler.acquire(priority=1, cost=6000)
+
+    async def scenario() -> None:
+        waiter = asyncio.create_task(scheduler.acquire_async(priority=0, cost=5000))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.queue_depth == 0
+        await scheduler.acquire_async(priority=1, cost=10, timeout=1)
+
+    # When / Then
+    asyncio.run(scenario())
+
+
+def test_settle_refunds_overestimated_tokens():
+    """실제 사용량이 추정보다 적으면 차이만큼 토큰 한도를 돌려준다"""
+    # Given
+    scheduler = LLMRateScheduler(requests_per_minute=600, tokens_per_minute=6000, metrics=MetricsRegistry())
+    scheduler.acquire(priority=1, cost=6000)
+
+    # When
+    scheduler.settle(estimated_tokens=6000, actual_tokens=1000)
+
+    # Then
+    scheduler.acquire(priority=1, cost=4000, timeout=0)
+
+
+def test_rejects_non_positive_limits():
+    """한도가 0 이하면 생성할 수 없다"""
+    with pytest.raises(ValueError):
+        LLMRateScheduler(requests_per_minute=0, tokens_per_minute=1000)
@@ -0,0 +1,58 @@
+from email.utils import formatdate
+
+import httpx
+import openai
+
+from app.shared.llm.retry_policy import RetryPolicy, is_retryable, retry_after_seconds
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def _status_error(status_code: int, headers: dict | None = None) -> openai.APIStatusError:
+    response = httpx.Response(status_code, headers=headers or {}, request=_REQUEST)
+    return openai.APIStatusError("error", response=response, body=None)
+
+
+def test_transient_errors_are_retryable():
+    """연결 실패, 타임아웃, 408/409/429, 5xx는 재시도 대상이다"""
+    assert is_retryable(openai.APIConnectionError(request=_REQUEST))
+    assert is_retryable(openai.APITimeoutError(request=_REQUEST))
+    for status_code in (408, 409, 429, 500, 503):
+        assert is_retryable(_status_error(status_code))
+
+
+def test_client_errors_are_not_retryable():
+    """요청이 잘못된 4xx와 그 외 예외는 재시도하지 않는다"""
+    for status_code in (400, 401, 404, 422):
+        assert not is_retryable(_status_error(status_code))
+    assert not is_retryable(ValueError("bad"))
+
+
+def test_retry_after_supports_seconds_millis_and_http_date():
+    """Retry-After를 초, retry-after-ms, HTTP 날짜 형식 모두 해석한다"""
+    assert retry_after_seconds(_status_error(429, {"retry-after": "3"})) == 3.0
+    assert retry_after_seconds(_status_error(429, {"retry-after-ms": "250"})) == 0.25
+
+    now = 1_700_000_000.0
+    dated = _status_error(503, {"retry-after": formatdate(now + 5, usegmt=True)})
+    assert retry_after_seconds(dated, now=lambda: now) == 5.0
+
+    assert retry_after_seconds(_status_error(429)) is None
+    assert retry_after_seconds(_status_error(429, {"retry-after": "soon"})) is None
+
+
+def test_backoff_grows_exponentially_with_jitter_and_cap():
+    """대기 시간 상한은 2배씩 늘다가 max_delay에서 멈추고, 실제 값은 jitter로 그 아래에서 고른다"""
+    policy = RetryPolicy(base_delay_seconds=0.5, max_delay_seconds=3.0, rng=lambda: 1.0)
+    assert [policy.backoff(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    jittered = RetryPolicy(base_delay_seconds=0.5, max_delay_seconds=3.0, rng=lambda: 0.25)
+    assert jittered.backoff(2) == 0.5
+
+
+def test_delay_honors_retry_after():
+    """Retry-After가 백오프보다 길면 Retry-After만큼 기다린다"""
+    policy = RetryPolicy(base_delay_seconds=0.5, rng=lambda: 1.0)
+
+    assert policy.delay_for(0, _status_error(429, {"retry-after": "4"})) == 4.0
+    assert policy.delay_for(0, _status_error(429, {"retry-after": "0"})) == 0.5
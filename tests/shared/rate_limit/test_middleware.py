@@ -0,0 +1,69 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.shared.metrics import get_metrics
+from app.shared.rate_limit.middleware import METRIC_RATE_LIMITED, RateLimitMiddleware, RateLimitRule
+from app.shared.rate_limit.store import InMemoryRateLimitStore
+
+
+def _client(calls: list[str]) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/converter/convert-three-tones")
+    def convert():
+        calls.append("convert")
+        return {"ok": True}
+
+    @app.get("/consult/history")
+    def history():
+        calls.append("history")
+        return {"ok": True}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=[RateLimitRule(name="converter", path_pattern=r"/converter/convert-three-tones", limit=6, cost=3)],
+        identify=lambda scope: dict(scope["headers"]).get(b"x-user", b"anonymous").decode(),
+        store=InMemoryRateLimitStore(),
+    )
+    return TestClient(app)
+
+
+def test_returns_429_with_retry_after_before_handler_runs():
+    """한도를 넘은 요청은 핸들러를 실행하지 않고 429와 Retry-After로 응답한다"""
+    # Given
+    calls: list[str] = []
+    client = _client(calls)
+    get_metrics().reset()
+
+    # When
+    responses = [client.post("/converter/convert-three-tones", headers={"x-user": "a"}) for _ in range(3)]
+
+    # Then
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert int(responses[2].headers["retry-after"]) >= 1
+    assert calls == ["convert", "convert"]
+    assert get_metrics().get(f"{METRIC_RATE_LIMITED}.converter") == 1
+
+
+def test_limits_each_identity_separately_and_ignores_other_routes():
+    """요청자마다 따로 제한하고 규칙에 없는 경로는 제한하지 않는다"""
+    # Given
+    calls: list[str] = []
+    client = _client(calls)
+    for _ in range(2):
+        client.post("/converter/convert-three-tones", headers={"x-user": "a"})
+
+    # When
+    other_user = client.post("/converter/convert-three-tones", headers={"x-user": "b"})
+    unlimited = [client.get("/consult/history", headers={"x-user": "a"}) for _ in range(5)]
+
+    # Then
+    assert other_user.status_code == 200
+    assert all(r.status_code == 200 for r in unlimited)
+
+
+def test_rule_rejects_cost_over_limit():
+    """요청 하나의 cost가 limit보다 크면 규칙을 만들 수 없다"""
+    with pytest.raises(ValueError):
+        RateLimitRule(name="converter", path_pattern=r"/x", limit=2, cost=3)
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from app.shared.rate_limit.store import (
+    InMemoryRateLimitStore,
+    RedisRateLimitStore,
+    sliding_window_decision,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeRedis:
+    """mget/pipeline(incrby, expire)만 지원하는 Redis 호환 가짜 클라이언트"""
+
+    def __init__(self):
+        self.values: dict[str, int] = {}
+        self.expires: dict[str, int] = {}
+
+    async def mget(self, *keys):
+        return [str(self.values[key]).encode() if key in self.values else None for key in keys]
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis):
+        self._redis = redis
+        self._commands = []
+
+    def incrby(self, key, amount):
+        self._commands.append(("incrby", key, amount))
+
+    def expire(self, key, seconds):
+        self._commands.append(("expire", key, seconds))
+
+    async def execute(self):
+        for command, key, value in self._commands:
+            if command == "incrby":
+                self._redis.values[key] = self._redis.values.get(key, 0) + value
+            else:
+                self._redis.expires[key] = value
+
+
+def _hit(store, key="user:1", limit=3, window_seconds=60, cost=1):
+    return asyncio.run(store.hit(key, limit, window_seconds, cost))
+
+
+def test_decision_weights_previous_window_by_overlap():
+    """직전 윈도 카운트는 현재 윈도와 겹치는 비율만큼만 반영된다"""
+    # 직전 윈도 10회, 현재 윈도 절반 경과 → 추정 5회
+    assert sliding_window_decision(10, 0, 6, 60, 30, 1) == (True, 0.0)
+    allowed, retry_after = sliding_window_decision(10, 0, 5, 60, 30, 1)
+    assert not allowed
+    assert retry_after == pytest.approx(6.0)
+
+
+@pytest.mark.parametrize("store_factory", [
+    lambda clock: InMemoryRateLimitStore(clock=clock),
+    lambda clock: RedisRateLimitStore(_FakeRedis(), clock=clock),
+])
+def test_store_rejects_over_limit_and_recovers_as_window_slides(store_factory):
+    """한도를 넘으면 거부하고 Retry-After 이후에는 다시 허용한다 (인메모리/Redis 동일)"""
+    # Given
+    clock = _Clock(now=600.0)
+    store = store_factory(clock)
+
+    # When
+    results = [_hit(store)[0] for _ in range(4)]
+    allowed, retry_after = _hit(store)
+
+    # Then
+    assert results == [True, True, True, False]
+    assert not allowed
+    assert 60 < retry_after <= 120
+
+    clock.now += retry_after
+    assert _hit(store)[0] is True
+
+
+def test_store_counts_cost_and_separates_keys():
+    """cost만큼 한도를 차지하고 key마다 따로 센다"""
+    # Given
+    store = InMemoryRateLimitStore(clock=_Clock())
+
+    # When / Then
+    assert _hit(store, key="user:1", limit=3, cost=3)[0] is True
+    assert _hit(store, key="user:1", limit=3, cost=1)[0] is False
+    assert _hit(store, key="user:2", limit=3, cost=3)[0] is True
+
+
+def test_in_memory_store_evicts_stale_keys():
+    """key 수가 상한에 닿으면 두 윈도 이상 지난 key를 지운다"""
+    # Given
+    clock = _Clock()
+    store = InMemoryRateLimitStore(max_keys=2, clock=clock)
+    _hit(store, key="a")
+    _hit(store, key="b")
+
+    # When
+    clock.now = 180.0
+    _hit(store, key="c")
+
+    # Then
+    assert set(store._windows) == {"c"}
+
+
+def test_in_memory_store_caps_keys_by_evicting_least_recently_used():
+    """지난 key가 없어도 key 수가 상한을 넘지 않도록 가장 오래 쓰지 않은 key를 지운다"""
+    # Given: 같은 윈도에서 a, b를 기록하고 a를 다시 사용한다
+    clock = _Clock()
+    store = InMemoryRateLimitStore(max_keys=2, clock=clock)
+    _hit(store, key="a")
+    _hit(store, key="b")
+    _hit(store, key="a")
+
+    # When
+    _hit(store, key="c")
+
+    # Then
+    assert set(store._windows) == {"a", "c"}
+
+
+def test_redis_store_expires_window_keys():
+    """Redis 카운터는 두 윈도 뒤 만료되도록 설정한다"""
+    redis = _FakeRedis()
+    store = RedisRateLimitStore(redis, clock=_Clock(now=125.0))
+
+    _hit(store, key="user:1", window_seconds=60)
+
+    assert redis.values == {"ratelimit:user:1:2": 1}
+    assert redis.expires == {"ratelimit:user:1:2": 120}
@@ -0,0 +1,38 @@
+from app.shared.metrics import MetricsRegistry, get_metrics
+
+
+def test_increment_accumulates_counter():
+    """카운터는 증가분을 누적하고, 기록된 적 없는 이름은 0이다"""
+    metrics = MetricsRegistry()
+
+    metrics.increment("stream.aborted")
+    metrics.increment("stream.aborted", 2)
+
+    assert metrics.get("stream.aborted") == 3
+    assert metrics.get("unknown") == 0
+    assert metrics.snapshot() == {"stream.aborted": 3}
+
+
+def test_set_overwrites_gauge():
+    """게이지는 마지막으로 설정한 값을 유지한다"""
+    metrics = MetricsRegistry()
+
+    metrics.set("queue.depth", 3)
+    metrics.set("queue.depth", 1)
+
+    assert metrics.get("queue.depth") == 1
+
+
+def test_reset_clears_counters():
+    """reset하면 모든 카운터가 지워진다"""
+    metrics = MetricsRegistry()
+    metrics.increment("stream.aborted")
+
+    metrics.reset()
+
+    assert metrics.snapshot() == {}
+
+
+def test_get_metrics_returns_shared_registry():
+    """get_metrics는 프로세스 공용 인스턴스를 반환한다"""
+    assert get_metrics() is get_metrics()
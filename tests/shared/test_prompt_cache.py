@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+from app.shared.metrics import MetricsRegistry
+from app.shared.prompt_cache import (
+    METRIC_CACHED_PROMPT_TOKENS,
+    METRIC_PROMPT_TOKENS,
+    prompt_cache_hit_ratio,
+    record_prompt_usage,
+)
+
+
+def _usage(prompt_tokens: int, cached_tokens: int | None) -> SimpleNamespace:
+    details = None if cached_tokens is None else SimpleNamespace(cached_tokens=cached_tokens)
+    return SimpleNamespace(prompt_tokens=prompt_tokens, prompt_tokens_details=details)
+
+
+def test_record_prompt_usage_accumulates_cached_tokens():
+    """프롬프트 토큰과 캐시 적중 토큰을 누적해 적중률을 계산한다"""
+    # Given
+    metrics = MetricsRegistry()
+
+    # When
+    record_prompt_usage(_usage(2000, 0), metrics)
+    record_prompt_usage(_usage(2000, 1536), metrics)
+
+    # Then
+    assert metrics.get(METRIC_PROMPT_TOKENS) == 4000
+    assert metrics.get(METRIC_CACHED_PROMPT_TOKENS) == 1536
+    assert prompt_cache_hit_ratio(metrics) == 1536 / 4000
+
+
+def test_record_prompt_usage_treats_missing_details_as_miss():
+    """prompt_tokens_details가 없으면 캐시 미적중으로 센다"""
+    # Given
+    metrics = MetricsRegistry()
+
+    # When
+    record_prompt_usage(_usage(100, None), metrics)
+    record_prompt_usage(None, metrics)
+
+    # Then
+    assert metrics.get(METRIC_PROMPT_TOKENS) == 100
+    assert metrics.get(METRIC_CACHED_PROMPT_TOKENS) == 0
+
+
+def test_hit_ratio_is_zero_without_requests():
+    """보낸 프롬프트가 없으면 적중률은 0이다"""
+    assert prompt_cache_hit_ratio(MetricsRegistry()) == 0.0
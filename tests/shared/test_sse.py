@@ -0,0 +1,163 @@
+import asyncio
+
+from app.shared.sse import coalesce_chunks, format_sse_event
+
+
+async def _deltas(chunks: list[str], interval: float = 0.0):
+    for chunk in chunks:
+        await asyncio.sleep(interval)
+        yield chunk
+
+
+async def _collect(iterator) -> list[str]:
+    return [item async for item in iterator]
+
+
+def test_format_sse_event_with_event_id_and_retry():
+    """event/id/retry 필드를 포함한 SSE 프레임을 만든다"""
+    frame = format_sse_event("안녕", event="message", id="3", retry=3000)
+
+    assert frame == "event: message\nid: 3\nretry: 3000\ndata: 안녕\n\n"
+
+
+def test_format_sse_event_splits_newlines_into_data_lines():
+    """내용의 줄바꿈은 여러 data: 줄로 나눠 프레임이 깨지지 않는다"""
+    frame = format_sse_event("첫 줄\n둘째 줄\r\n\n넷째 줄")
+
+    assert frame == "data: 첫 줄\ndata: 둘째 줄\ndata: \ndata: 넷째 줄\n\n"
+    # 클라이언트 규칙대로 data 줄을 \n으로 이으면 원문(줄바꿈 정규화)이 복원된다
+    data_lines = [line[len("data: "):] for line in frame.strip("\n").split("\n")]
+    assert "\n".join(data_lines) == "첫 줄\n둘째 줄\n\n넷째 줄"
+
+
+def test_coalesce_with_zero_window_passes_chunks_through():
+    """창이 0이면 조각을 묶지 않는다"""
+    chunks = asyncio.run(_collect(coalesce_chunks(_deltas(["가", "나", "다"]), 0, 512)))
+
+    assert chunks == ["가", "나", "다"]
+
+
+def test_coalesce_batches_chunks_within_time_window():
+    """시간 창 안에 도착한 조각은 하나로 묶인다"""
+    # Given: 창보다 훨씬 빠르게 도착하는 조각
+    source = _deltas(["가"] * 10)
+
+    # When: 큰 창으로 묶으면
+    chunks = asyncio.run(_collect(coalesce_chunks(source, window_seconds=1.0, max_bytes=10_000)))
+
+    # Then: 스트림이 끝날 때 한 번에 나온다
+    assert chunks == ["가" * 10]
+
+
+def test_coalesce_flushes_when_batch_reaches_max_bytes():
+    """모인 크기가 max_bytes에 이르면 창이 끝나기 전에 내보낸다"""
+    # Given: 3바이트짜리 한글 조각 6개
+    source = _deltas(["가"] * 6)
+
+    # When: 6바이트 단위로 묶으면
+    chunks = asyncio.run(_collect(coalesce_chunks(source, window_seconds=10.0, max_bytes=6)))
+
+    # Then: 두 글자씩 나온다
+    assert chunks == ["가가", "가가", "가가"]
+
+
+def test_coalesce_flushes_after_window_even_if_upstream_stalls():
+    """업스트림이 멈춰 있어도 창이 끝나면 모인 조각을 내보낸다"""
+    async def read_while_stalled():
+        released = asyncio.Event()
+
+        async def stalled():
+            yield "앞"
+            yield "부분"
+            await released.wait()
+            yield "뒷부분"
+
+        iterator = coalesce_chunks(stalled(), window_seconds=0.03, max_bytes=10_000)
+        # 창이 끝나도 내보내지 않으면 업스트림이 풀리지 않아 여기서 시간 초과가 난다
+        first = await asyncio.wait_for(iterator.__anext__(), timeout=1)
+        released.set()
+        rest = await _collect(iterator)
+        return first, rest
+
+    first, rest = asyncio.run(read_while_stalled())
+
+    assert first == "앞부분"
+    assert rest == ["뒷부분"]
+
+
+def test_coalesce_flushes_batch_before_upstream_error():
+    """업스트림 오류가 나도 그 전에 모인 조각은 내보낸 뒤 오류를 전달한다"""
+    async def failing():
+        yield "가"
+        yield "나"
+        raise RuntimeError("upstream failed")
+
+    async def read_until_error():
+        received = []
+        try:
+            async for text in coalesce_chunks(failing(), window_seconds=10.0, max_bytes=10_000):
+                received.append(text)
+        except RuntimeError as e:
+            return received, e
+        return received, None
+
+    received, error = asyncio.run(read_until_error())
+
+    assert received == ["가나"]
+    assert str(error) == "upstream failed"
+
+
+def test_closing_coalescer_cancels_pending_upstream_read():
+    """묶음 스트림을 닫으면 대기 중인 업스트림 읽기를 취소한다"""
+    state = {"closed": False}
+
+    async def slow():
+        try:
+            yield "가"
+            await asyncio.sleep(10)
+            yield "나"
+        finally:
+            state["closed"] = True
+
+    async def read_first_and_close():
+        iterator = coalesce_chunks(slow(), window_seconds=0.01, max_bytes=10_000)
+        first = await iterator.__anext__()
+        await asyncio.wait_for(iterator.aclose(), timeout=1)
+        return first
+
+    assert asyncio.run(read_first_and_close()) == "가"
+    assert state["closed"] is True
+
+
+def test_coalescing_reduces_frames_and_bytes_per_response():
+    """음절 단위 델타를 30ms 창으로 묶으면 응답당 프레임/바이트가 크게 준다"""
+    # Given: 1ms 간격으로 도착하는 300개의 한 음절 델타 (가짜 시계로 시간을 흘린다)
+    syllables = ["말"] * 300
+
+    def frames_for(window_seconds: float) -> list[str]:
+        now = [0.0]
+
+        async def source():
+            for syllable in syllables:
+                now[0] += 0.001
+                yield syllable
+
+        texts = asyncio.run(
+            _collect(coalesce_chunks(source(), window_seconds, max_bytes=512, clock=lambda: now[0]))
+        )
+        return [format_sse_event(text, id=str(i)) for i, text in enumerate(texts, start=1)]
+
+    # When: 묶지 않은 경우와 30ms로 묶은 경우를 비교하면
+    raw = frames_for(0)
+    coalesced = frames_for(0.03)
+    raw_bytes = sum(len(frame.encode("utf-8")) for frame in raw)
+    coalesced_bytes = sum(len(frame.encode("utf-8")) for frame in coalesced)
+
+    # Then: 내용은 같고 프레임 수와 바이트 수가 줄어든다
+    def payload(frames):
+        return "".join(line[len("data: "):] for f in frames for line in f.split("\n") if line.startswith("data: "))
+
+    assert payload(coalesced) == payload(raw) == "말" * 300
+    assert len(raw) == 300
+    assert len(coalesced) <= len(raw) / 5
+    assert coalesced_bytes < raw_bytes / 2
@@ -0,0 +1,202 @@
+import asyncio
+import re
+import time
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from opentelemetry import trace as otel_trace
+
+from app.shared.tracing import (
+    OpenTelemetrySpanExporter,
+    SpanExporter,
+    TracingMiddleware,
+    current_trace,
+    span,
+    start_trace,
+    traced,
+    untraced_context,
+)
+
+
+class _RecordingExporter(SpanExporter):
+    def __init__(self):
+        self.exported = []
+
+    def export(self, spans):
+        self.exported.append(spans)
+
+
+def test_span_outside_trace_records_nothing():
+    """요청 밖에서는 구간을 기록하지 않는다"""
+    with span("db.consult.find_by_id") as current:
+        assert current is None
+    assert current_trace() is None
+
+
+def test_spans_nest_and_record_errors():
+    """안쪽 구간은 바깥 구간을 부모로 갖고, 예외가 나면 error 속성을 남긴다"""
+    # Given / When
+    with start_trace() as trace:
+        with span("consult.send_message") as outer:
+            with span("db.consult.find_by_id"):
+                pass
+            try:
+                with span("llm.response"):
+                    raise TimeoutError()
+            except TimeoutError:
+                pass
+
+    # Then
+    spans = {s.name: s for s in trace.spans}
+    assert spans["db.consult.find_by_id"].parent is outer
+    assert spans["llm.response"].attributes["error"] == "TimeoutError"
+    assert all(s.duration is not None and s.end_ns >= s.start_ns for s in trace.spans)
+
+
+def test_traced_decorator_supports_sync_and_async_functions():
+    """traced는 동기/비동기 함수 모두 구간으로 기록하고 반환값을 그대로 돌려준다"""
+    @traced("db.user.find_by_id")
+    def find(user_id):
+        return user_id
+
+    @traced("consult.start")
+    async def start():
+        return find("user-1")
+
+    with start_trace() as trace:
+        result = asyncio.run(start())
+
+    assert result == "user-1"
+    assert [s.name for s in trace.spans] == ["db.user.find_by_id", "consult.start"]
+    assert trace.spans[0].parent is trace.spans[1]
+
+
+def test_background_task_started_with_untraced_context_records_nothing_in_request_trace():
+    """요청 안에서 만든 백그라운드 태스크는 untraced_context로 실행하면 요청 Trace에 구간을 남기지 않는다"""
+    async def background():
+        with span("llm.analysis") as current:
+            return current, current_trace()
+
+    async def request():
+        with start_trace() as trace:
+            task = asyncio.create_task(background(), context=untraced_context())
+            with span("consult.send_message"):
+                pass
+        return trace, await task
+
+    trace, (background_span, background_trace) = asyncio.run(request())
+
+    assert [s.name for s in trace.spans] == ["consult.send_message"]
+    assert background_span is None
+    assert background_trace is None
+
+
+def test_server_timing_sums_spans_with_same_name():
+    """같은 이름의 구간은 합산해 Server-Timing 항목 하나로 만든다"""
+    with start_trace() as trace:
+        with span("request") as root:
+            for _ in range(2):
+                with span("db.consult.save"):
+                    time.sleep(0.002)
+            header = trace.server_timing(total=root)
+
+    entries = dict(re.findall(r"([\w.]+);dur=([\d.]+)", header))
+    assert list(entries) == ["db.consult.save", "total"]
+    assert float(entries["db.consult.save"]) >= 4.0
+    assert float(entries["total"]) >= float(entries["db.consult.save"])
+
+
+def test_middleware_adds_server_timing_header_and_exports_spans():
+    """미들웨어는 의존성/핸들러 구간을 Server-Timing 헤더로 알려주고 요청이 끝나면 내보낸다"""
+    # Given: 스레드풀에서 실행되는 동기 의존성과 비동기 핸들러
+    exporter = _RecordingExporter()
+    app = FastAPI()
+
+    @traced("auth")
+    def current_user() -> str:
+        return "user-1"
+
+    @app.post("/consult/{session_id}/message")
+    async def send_message(session_id: str, user_id: str = Depends(current_user)):
+        with span("llm.response"):
+            await asyncio.sleep(0.001)
+        return {"user_id": user_id}
+
+    app.add_middleware(TracingMiddleware, exporter=exporter)
+
+    # When
+    response = TestClient(app).post("/consult/session-1/message")
+
+    # Then
+    assert response.json() == {"user_id": "user-1"}
+    names = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+    assert names == ["auth", "llm.response", "total"]
+    [spans] = exporter.exported
+    assert {s.name for s in spans} == {"auth", "llm.response", "request"}
+    root = next(s for s in spans if s.name == "request")
+    assert root.attributes == {"method": "POST", "path": "/consult/session-1/message"}
+    assert all(s.parent is root for s in spans if s is not root)
+
+
+def test_middleware_without_server_timing_only_exports_spans():
+    """server_timing=False면 Server-Timing 헤더 없이 구간만 내보낸다"""
+    exporter = _RecordingExporter()
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        with span("db.consult.find_by_id"):
+            pass
+        return {"status": "healthy"}
+
+    app.add_middleware(TracingMiddleware, exporter=exporter, server_timing=False)
+
+    response = TestClient(app).get("/health")
+
+    assert "server-timing" not in response.headers
+    [spans] = exporter.exported
+    assert {s.name for s in spans} == {"db.consult.find_by_id", "request"}
+
+
+class _FakeOtelSpan(otel_trace.NonRecordingSpan):
+    def __init__(self, name, start_time, attributes, parent):
+        super().__init__(otel_trace.INVALID_SPAN_CONTEXT)
+        self.name = name
+        self.start_time = start_time
+        self.attributes = attributes
+        self.parent = parent
+        self.end_time = None
+
+    def end(self, end_time=None):
+        self.end_time = end_time
+
+
+class _FakeTracer:
+    def __init__(self):
+        self.started: list[_FakeOtelSpan] = []
+
+    def start_span(self, name, context=None, start_time=None, attributes=None):
+        parent = otel_trace.get_current_span(context) if context is not None else None
+        otel_span = _FakeOtelSpan(name, start_time, attributes, parent)
+        self.started.append(otel_span)
+        return otel_span
+
+
+def test_opentelemetry_exporter_keeps_parent_and_timestamps():
+    """OpenTelemetry로 내보낼 때 부모 관계와 시작/종료 시각을 유지한다"""
+    # Given
+    with start_trace() as trace:
+        with span("request"):
+            with span("db.consult.find_by_id", rows=3):
+                pass
+    tracer = _FakeTracer()
+
+    # When
+    OpenTelemetrySpanExporter(tracer=tracer).export(trace.spans)
+
+    # Then
+    root, child = tracer.started
+    assert (root.name, child.name) == ("request", "db.consult.find_by_id")
+    assert child.parent is root
+    assert child.attributes == {"rows": 3}
+    assert root.start_time <= child.start_time <= child.end_time <= root.end_time